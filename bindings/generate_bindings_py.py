@@ -1,4 +1,5 @@
 import os
+import re
 import typing
 
 import swagger_parser
@@ -112,6 +113,32 @@ def dump(anno: SwaggerType, val: Code, omit_unset: Code) -> Code:
     assert_never(anno)
 
 
+def is_plain(anno: SwaggerType, seen: typing.Optional[typing.Set[str]] = None) -> bool:
+    """
+    Whether the json of a type is always plain JSON, which any encoder writes the same way.
+
+    Only free-form values can hold things like numpy scalars or nan, which need
+    det.util.json_encode; floats in typed fields are already made safe by dump_float.
+    """
+    seen = set() if seen is None else seen
+    if isinstance(anno, swagger_parser.Any):
+        return False
+    if isinstance(anno, (no_parse_types, swagger_parser.Float, swagger_parser.Enum)):
+        return True
+    if isinstance(anno, swagger_parser.Ref):
+        if anno.defn is None or anno.name in seen:
+            return True
+        seen.add(anno.name)
+        return is_plain(anno.defn, seen)
+    if isinstance(anno, swagger_parser.Dict):
+        return is_plain(anno.values, seen)
+    if isinstance(anno, swagger_parser.Sequence):
+        return is_plain(anno.items, seen)
+    if isinstance(anno, swagger_parser.Class):
+        return all(is_plain(p.type, seen) for p in anno.params.values())
+    assert_never(anno)
+
+
 def gen_init_param(param: swagger_parser.Parameter) -> Code:
     if param.required:
         typestr = annotation(param.type)
@@ -267,19 +294,21 @@ def gen_function(func: swagger_parser.Function) -> Code:
             out += [f"    if type({param.name}) == str:"]
             out += [f"        {param.name} = parse.quote({param.name})"]
 
+    bodystr = datastr = "None"
     if "body" in func.params:
         # It is important that request bodies omit unset values so that PATCH request bodies
         # do not include extraneous None values.
         body_param = func.params["body"]
         bodystr = dump(body_param.type, body_param.name, "True")
-    else:
-        bodystr = "None"
+        # Bodies of plain JSON skip the session's general-purpose encoder.
+        if is_plain(body_param.type):
+            bodystr, datastr = "None", f"dumps({bodystr})"
     out += ["    _resp = session._do_request("]
     out += [f'        method="{func.method.upper()}",']
     out += [f"        path={pathstr},"]
     out += ["        params=_params,"]
     out += [f"        json={bodystr},"]
-    out += ["        data=None,"]
+    out += [f"        data={datastr},"]
     out += ["        headers=None,"]
     out += ["        timeout=None,"]
     out += [f"        stream={func.streaming},"]
@@ -295,7 +324,7 @@ def gen_function(func: swagger_parser.Function) -> Code:
             if is_none:
                 out += ["        return"]
             else:
-                out += [f'        return {load(returntype, "_resp.json()")}']
+                out += [f'        return {load(returntype, "loads(_resp.content)")}']
         else:
             assert not is_none, "unable to stream empty result class: {func}"
             # Too many quotes to do it inline:
@@ -303,7 +332,7 @@ def gen_function(func: swagger_parser.Function) -> Code:
             out += [
                 f"        try:",
                 f"            for _line in _resp.iter_lines(chunk_size=1024 * 1024):",
-                f"                _j = json.loads(_line)",
+                f"                _j = loads(_line)",
                 f'                if "error" in _j:',
                 f"                    raise APIHttpStreamError(",
                 f'                        "{func.operation_name_sc()}",',
@@ -326,8 +355,12 @@ def gen_class(klass: swagger_parser.Class) -> Code:
     out = [f"class {klass.name}(Printable):"]
     if klass.description:
         out += [TAB + line if line else "" for line in description_to_docstring(klass.description)]
+    out += ["    __slots__ = ("]
+    for k, _ in required + optional:
+        out += [f'        "{k}",']
+    out += ["    )"]
     for k, v in optional:
-        out += [f'    {k}: "typing.Optional[{annotation(v.type, prequoted=True)}]" = None']
+        out += [f'    {k}: "typing.Optional[{annotation(v.type, prequoted=True)}]"']
     out += [""]
     out += ["    def __init__("]
     out += ["        self,"]
@@ -341,16 +374,16 @@ def gen_class(klass: swagger_parser.Class) -> Code:
         out += [f"        if not isinstance({k}, Unset):"]
         out += [f"            self.{k} = {k}"]
     out += [""]
+    # from_json fills in the slots directly, rather than building the arguments for __init__.
     out += ["    @classmethod"]
     out += [f'    def from_json(cls, obj: Json) -> "{klass.name}":']
-    out += ['        kwargs: "typing.Dict[str, typing.Any]" = {']
+    out += ["        out = cls.__new__(cls)"]
     for k, v in required:
         if need_parse(v.type):
             parsed = load(v.type, f'obj["{k}"]')
         else:
             parsed = f'obj["{k}"]'
-        out += [f'            "{k}": {parsed},']
-    out += ["        }"]
+        out += [f"        out.{k} = {parsed}"]
     for k, v in optional:
         if need_parse(v.type):
             parsed = load(v.type, f'obj["{k}"]')
@@ -358,8 +391,8 @@ def gen_class(klass: swagger_parser.Class) -> Code:
         else:
             parsed = f'obj["{k}"]'
         out += [f'        if "{k}" in obj:']
-        out += [f'            kwargs["{k}"] = {parsed}']
-    out += ["        return cls(**kwargs)"]
+        out += [f"            out.{k} = {parsed}"]
+    out += ["        return out"]
     out += [""]
     out += ["    def to_json(self, omit_unset: bool = False) -> typing.Dict[str, typing.Any]:"]
     out += ['        out: "typing.Dict[str, typing.Any]" = {']
@@ -376,7 +409,7 @@ def gen_class(klass: swagger_parser.Class) -> Code:
             parsed = f"None if self.{k} is None else {parsed}"
         else:
             parsed = f"self.{k}"
-        out += [f'        if not omit_unset or "{k}" in vars(self):']
+        out += [f'        if not omit_unset or self._is_set("{k}"):']
         out += [f'            out["{k}"] = {parsed}']
     out += ["        return out"]
 
@@ -430,25 +463,63 @@ def skip_defn(defn: swagger_parser.TypeDef):
     )
 
 
-def pybindings(swagger: swagger_parser.ParseResult) -> str:
-    prefix = """
+HEADER = """
 # Code generated by generate_bindings.py. DO NOT EDIT.
+# isort: skip_file
+# flake8: noqa
+""".lstrip()
+
+# _base holds the helpers which every other module uses.
+BASE = """
 import enum
 import json
 import math
 import os
 import typing
-from urllib import parse
 
 import requests
 
+try:
+    import orjson
+    _have_orjson = True
+except ImportError:
+    _have_orjson = False
+
 if typing.TYPE_CHECKING:
-    from determined.common import api
+    from .{stream_error_module} import runtimeStreamError
 
-# flake8: noqa
 Json = typing.Any
 
 
+def loads(data: typing.Union[str, bytes]) -> Json:
+    # orjson, when it is installed, parses large responses several times faster than json.
+    if _have_orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Let json accept or reject what orjson does not, like integers beyond 64 bits.
+            pass
+    return json.loads(data)
+
+
+def _encode_default(obj: typing.Any) -> typing.Any:
+    # Values of the wrong type, like numpy scalars, are encoded as det.util.json_encode does.
+    from determined import util
+    return json.loads(util.json_encode(obj))
+
+
+def dumps(obj: Json) -> bytes:
+    # Encode the output of to_json() for a type whose json is plain JSON.
+    if _have_orjson:
+        try:
+            out: bytes = orjson.dumps(obj, default=_encode_default)
+            return out
+        except orjson.JSONEncodeError:
+            # Let json handle what orjson does not, like lone surrogates in strings.
+            pass
+    return json.dumps(obj, default=_encode_default).encode("utf8")
+
+
 # Unset is a type to distinguish between things not set and things set to None.
 class Unset:
     pass
@@ -471,7 +542,7 @@ class APIHttpError(Exception):
         self.response = response
         self.operation_name = operation_name
         self.message = (
-            f"API Error: {operation_name} failed: {response.reason}."
+            f"API Error: {{operation_name}} failed: {{response.reason}}."
         )
 
     def __str__(self) -> str:
@@ -484,7 +555,7 @@ class APIHttpStreamError(APIHttpError):
         self.operation_name = operation_name
         self.error = error
         self.message = (
-            f"Stream Error during {operation_name}: {error.message}"
+            f"Stream Error during {{operation_name}}: {{error.message}}"
         )
 
     def __str__(self) -> str:
@@ -494,7 +565,7 @@ class APIHttpStreamError(APIHttpError):
 class DetEnum(enum.Enum):
     def __str__(self) -> str:
         skip = len(self.prefix())
-        return f"{self.value[skip:]}"
+        return f"{{self.value[skip:]}}"
     @classmethod
     def prefix(cls) -> str:
         prefix: str = os.path.commonprefix([e.value for e in cls])
@@ -502,41 +573,258 @@ class DetEnum(enum.Enum):
 
 
 class Printable:
-    # A mixin to provide a __str__ method for classes with attributes.
+    # The base of the generated classes, which list their fields in __slots__.  An optional field
+    # which was never set is an empty slot; it reads as None, and to_json(omit_unset=True) skips it.
+    __slots__: typing.Tuple[str, ...] = ()
+
+    if not typing.TYPE_CHECKING:
+        def __getattr__(self, name: str) -> typing.Any:
+            # Only called when normal lookup fails, as it does for an empty slot.
+            if name in type(self).__slots__:
+                return None
+            raise AttributeError(f"{{type(self).__name__!r}} object has no attribute {{name!r}}")
+
+    def _is_set(self, name: str) -> bool:
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
+
+    # Pickle and copy only the fields which are set, so unset fields stay unset.
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        return {{k: getattr(self, k) for k in self.__slots__ if self._is_set(k)}}
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        for k, v in state.items():
+            setattr(self, k, v)
+
     def __str__(self) -> str:
         allowed_types = (str, int, float, bool, DetEnum)
         attrs = []
-        for k, v in self.__dict__.items():
+        for k in self.__slots__:
+            v = getattr(self, k)
             if v is None: continue
             if isinstance(v, list):
                 vals = [str(x) if isinstance(x, allowed_types) else "..." for x in v]
-                attrs.append(f'{k}=[{", ".join(vals)}]')
+                attrs.append(f'{{k}}=[{{", ".join(vals)}}]')
             elif isinstance(v, allowed_types):
-                attrs.append(f'{k}={v}')
+                attrs.append(f'{{k}}={{v}}')
             else:
-                attrs.append(f'{k}=...')
+                attrs.append(f'{{k}}=...')
         attrs_str = ', '.join(attrs)
-        return f'{self.__class__.__name__}({attrs_str})'
+        return f'{{self.__class__.__name__}}({{attrs_str}})'
+"""
+
+BASE_NAMES = [
+    "APIHttpError",
+    "APIHttpStreamError",
+    "DetEnum",
+    "Json",
+    "Printable",
+    "Unset",
+    "_unset",
+    "dump_float",
+    "dumps",
+    "loads",
+]
+
+MODULE_IMPORTS = """
+import typing
+from urllib import parse
 
+import requests
 
-""".lstrip()
+from ._base import {base_names}
+""".format(
+    base_names=", ".join(BASE_NAMES)
+)
 
-    out = [prefix]
+INIT = '''
+"""
+Generated bindings for the Determined REST API.
 
-    for _, defn in sorted(swagger.defs.items()):
+The bindings are split into one module per API tag, plus ``_shared`` for the types used by more
+than one tag.  Each module is only imported the first time one of its names is accessed, so that
+importing the package stays cheap; ``bindings.X`` and ``from ...bindings import X`` work as usual.
+"""
+import importlib
+import sys
+import typing
+
+from ._base import {base_names}
+
+if typing.TYPE_CHECKING or sys.version_info < (3, 7):
+{imports}
+else:
+    _MODULES = {{
+{modules}
+    }}
+
+    def __getattr__(name: str) -> typing.Any:
+        module = _MODULES.get(name)
+        if module is None:
+            raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> typing.List[str]:
+        return sorted(set(globals()) | set(_MODULES))
+'''
+
+SHARED_MODULE = "_shared"
+ENUMS_MODULE = "_enums"
+PAGINATED_MODULE = "_paginated"
+
+
+def module_name(tag: str) -> str:
+    return "_" + "".join(c if c.isalnum() else "_" for c in tag).lower()
+
+
+def references(code: Code, names: typing.Iterable[str]) -> typing.Set[str]:
+    """Return the names which appear as identifiers in some code."""
+    return set(re.findall(r"\b[A-Za-z_]\w*\b", code)).intersection(names)
+
+
+def assign_modules(
+    defs: typing.Dict[str, Code],
+    enums: typing.Set[str],
+    ops: typing.Dict[str, Code],
+    tags: typing.Dict[str, str],
+) -> typing.Dict[str, str]:
+    """
+    Decide which module each def and op is generated into.
+
+    Enums, which are small and often used at import time by the rest of the harness, all go into
+    _enums.  Ops go into the module of their tag.  Any other def goes into the module of the one tag
+    whose ops use it, directly or through other defs, or into _shared if it is used by several tags
+    or by none.  Imports between modules therefore only ever point into _shared or _enums.
+    """
+    uses = {name: references(code, defs) - {name} for name, code in {**defs, **ops}.items()}
+
+    def closure(name: str) -> typing.Set[str]:
+        seen: typing.Set[str] = set()
+        todo = list(uses[name])
+        while todo:
+            n = todo.pop()
+            if n not in seen:
+                seen.add(n)
+                todo += uses[n]
+        return seen
+
+    users: typing.Dict[str, typing.Set[str]] = {name: set() for name in defs}
+    for op in ops:
+        for d in closure(op):
+            users[d].add(tags[op])
+
+    out = {op: module_name(tags[op]) for op in ops}
+    for d, d_tags in users.items():
+        if d in enums:
+            out[d] = ENUMS_MODULE
+        else:
+            out[d] = module_name(d_tags.pop()) if len(d_tags) == 1 else SHARED_MODULE
+    # Defs which no op uses may still use defs of a single tag; those move to _shared as well.
+    shared = [d for d in defs if out[d] == SHARED_MODULE]
+    while shared:
+        for d in uses[shared.pop()]:
+            if out[d] not in (SHARED_MODULE, ENUMS_MODULE):
+                out[d] = SHARED_MODULE
+                shared.append(d)
+    return out
+
+
+def gen_module(
+    names: typing.List[str], code: typing.Dict[str, Code], modules: typing.Dict[str, str]
+) -> Code:
+    this = modules[names[0]]
+    imports: typing.Dict[str, typing.Set[str]] = {}
+    for name in names:
+        for ref in references(code[name], modules):
+            if modules[ref] != this:
+                imports.setdefault(modules[ref], set()).add(ref)
+
+    out = [HEADER + MODULE_IMPORTS.rstrip()]
+    for module, refs in sorted(imports.items()):
+        out += [f"from .{module} import ("]
+        out += [f"    {ref}," for ref in sorted(refs)]
+        out += [")"]
+    out += ["", "if typing.TYPE_CHECKING:", "    from determined.common import api", "", ""]
+    for name in names:
+        out += [code[name], "", ""]
+    return "\n".join(out).strip() + "\n"
+
+
+def gen_init(modules: typing.Dict[str, str]) -> Code:
+    by_module: typing.Dict[str, typing.List[str]] = {}
+    for name, module in sorted(modules.items()):
+        by_module.setdefault(module, []).append(name)
+
+    imports = []
+    for module, names in sorted(by_module.items()):
+        imports += [f"    from .{module} import ("]
+        imports += [f"        {name}," for name in names]
+        imports += ["    )"]
+    entries = [f'        "{name}": ".{module}",' for name, module in sorted(modules.items())]
+
+    return HEADER + INIT.format(
+        base_names=", ".join(BASE_NAMES),
+        imports="\n".join(imports),
+        modules="\n".join(entries),
+    )
+
+
+def gen_package(
+    defs: typing.Dict[str, Code],
+    enums: typing.Set[str],
+    ops: typing.Dict[str, Code],
+    tags: typing.Dict[str, str],
+    paginated: typing.List[str],
+) -> typing.Dict[str, Code]:
+    """
+    Lay out the generated code for each def and op as a package, returning the source of each file.
+    """
+    code = {**defs, **ops}
+    modules = assign_modules(defs, enums, ops, tags)
+    # Paginated names every paginated response type, so it gets a module of its own rather than
+    # making _shared import every other module.
+    if paginated:
+        code["Paginated"] = "\n".join(paginated)
+        modules["Paginated"] = PAGINATED_MODULE
+
+    # Keep the order in which the defs and ops were generated within each module.
+    by_module: typing.Dict[str, typing.List[str]] = {}
+    for name in code:
+        by_module.setdefault(modules[name], []).append(name)
+
+    files = {f"{m}.py": gen_module(names, code, modules) for m, names in by_module.items()}
+    files["__init__.py"] = gen_init(modules)
+    stream_error_module = modules.get("runtimeStreamError", SHARED_MODULE)
+    files["_base.py"] = HEADER + BASE.format(stream_error_module=stream_error_module)
+    return files
+
+
+def pybindings(swagger: swagger_parser.ParseResult) -> typing.Dict[str, Code]:
+    defs = {}
+    enums = set()
+    for name, defn in sorted(swagger.defs.items()):
         if defn is None or skip_defn(defn):
             continue
-        out += [gen_def(defn)]
-        out += [""]
+        defs[name] = gen_def(defn)
+        if isinstance(defn, swagger_parser.Enum):
+            enums.add(name)
 
+    ops = {}
+    tags = {}
     for _, op in sorted(swagger.ops.items()):
-        out += [gen_function(op)]
-        out += [""]
+        name = op.operation_name_sc()
+        ops[name] = gen_function(op)
+        tags[name] = min(op.tags) if op.tags else "shared"
 
     # Also generate a list of Paginated response types.
-    out += gen_paginated(swagger.defs)
+    paginated = gen_paginated(swagger.defs)
 
-    return "\n".join(out).strip()
+    return gen_package(defs, enums, ops, tags, paginated)
 
 
 if __name__ == "__main__":
@@ -544,10 +832,18 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--input", "-i", action="store", default=SWAGGER, help="input swagger file")
-    parser.add_argument("--output", "-o", action="store", required=True, help="output file")
+    parser.add_argument(
+        "--output", "-o", action="store", required=True, help="output package directory"
+    )
     args = parser.parse_args()
 
     swagger = swagger_parser.parse(args.input)
     bindings = pybindings(swagger)
-    with open(args.output, "w") as f:
-        print(bindings, file=f)
+    os.makedirs(args.output, exist_ok=True)
+    # Remove modules for tags which no longer exist.
+    for stale in os.listdir(args.output):
+        if stale.endswith(".py") and stale not in bindings:
+            os.remove(os.path.join(args.output, stale))
+    for filename, code in sorted(bindings.items()):
+        with open(os.path.join(args.output, filename), "w") as f:
+            f.write(code)
@@ -1,8 +1,9 @@
 import contextlib
+import importlib
 import os
 import sys
 from importlib import machinery
-from typing import Iterator, Set, no_type_check
+from typing import Any, Callable, Dict, Iterator, Set, no_type_check
 
 
 class NoCachePathFinder(machinery.PathFinder):
@@ -133,3 +134,33 @@ def import_from_path(path: os.PathLike) -> Iterator:
         sys.path = old_sys_path
         # Restore local directory modules to sys.modules.
         sys.modules.update(popped_modules)
+
+
+def lazy_getattr(package: str, names: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Return a module-level __getattr__ (PEP 562) for a package, so that the package can offer names
+    and submodules without importing them until they are first accessed.
+
+    Arguments:
+        package: The name of the package.
+        names: The module to import each name from.  Any other name is imported as a submodule of
+            the package, if there is one.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = names.get(name)
+        if module is not None:
+            value = getattr(importlib.import_module(module), name)
+        else:
+            try:
+                value = importlib.import_module(f"{package}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}":
+                    raise
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -1,39 +1,62 @@
-from determined.cli._util import (
-    output_format_args,
-    make_pagination_args,
-    default_pagination_args,
-    unauth_session,
-    setup_session,
-    require_feature_flag,
-    print_launch_warnings,
-    wait_ntsc_ready,
-    warn,
-)
-from determined.cli import (
-    agent,
-    checkpoint,
-    cli,
-    ntsc,
-    command,
-    experiment,
-    master,
-    model,
-    notebook,
-    project,
-    rbac,
-    render,
-    resources,
-    shell,
-    template,
-    tensorboard,
-    trial,
-    user,
-    workspace,
-)
+import sys as _sys
+import typing as _typing
 
-from determined.common.api import certs as _certs
-from typing import Optional as _Optional
+from determined._import import lazy_getattr as _lazy_getattr
+
+# The modules of the CLI, and the helpers they share, are imported the first time they are used, so
+# that running one command does not import the modules of every other command.
+if _typing.TYPE_CHECKING or _sys.version_info < (3, 7):
+    from determined.cli._util import (
+        output_format_args,
+        make_pagination_args,
+        default_pagination_args,
+        unauth_session,
+        setup_session,
+        require_feature_flag,
+        print_launch_warnings,
+        wait_ntsc_ready,
+        warn,
+    )
+    from determined.cli import (
+        agent,
+        checkpoint,
+        cli,
+        ntsc,
+        command,
+        experiment,
+        master,
+        model,
+        notebook,
+        project,
+        rbac,
+        render,
+        resources,
+        shell,
+        template,
+        tensorboard,
+        trial,
+        user,
+        workspace,
+    )
+else:
+    __getattr__ = _lazy_getattr(
+        __name__,
+        {
+            "output_format_args": "determined.cli._util",
+            "make_pagination_args": "determined.cli._util",
+            "default_pagination_args": "determined.cli._util",
+            "unauth_session": "determined.cli._util",
+            "setup_session": "determined.cli._util",
+            "require_feature_flag": "determined.cli._util",
+            "print_launch_warnings": "determined.cli._util",
+            "wait_ntsc_ready": "determined.cli._util",
+            "warn": "determined.cli._util",
+        },
+    )
+
+if _typing.TYPE_CHECKING:
+    from determined.common.api import certs as _certs
 
 # cert is a singleton that we configure very early in the cli's main() function, before any cli
 # subcommand handlers are invoked.
-cert: _Optional[_certs.Cert] = None
+cert: "_typing.Optional[_certs.Cert]" = None
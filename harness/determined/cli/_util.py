@@ -113,7 +113,7 @@ def require_feature_flag(feature_flag: str, error_message: str) -> Callable[...,
     return decorator
 
 
-def print_launch_warnings(warnings: Sequence[bindings.v1LaunchWarning]) -> None:
+def print_launch_warnings(warnings: Sequence["bindings.v1LaunchWarning"]) -> None:
     for warning in warnings:
         print(termcolor.colored(api.WARNING_MESSAGE_MAP[warning], "yellow"), file=sys.stderr)
 
@@ -1,7 +1,5 @@
-import hashlib
+import importlib
 import os
-import socket
-import ssl
 import sys
 from argparse import (
     ArgumentDefaultsHelpFormatter,
@@ -10,48 +8,12 @@ from argparse import (
     FileType,
     Namespace,
 )
-from typing import List, Sequence, Union, cast
-from urllib import parse
-
-import argcomplete
-import argcomplete.completers
-import requests
-import tabulate
-from OpenSSL import SSL, crypto
-from termcolor import colored
+from typing import List, Optional, Sequence, Union, cast
 
 import determined as det
-import determined.errors
 from determined import cli
-from determined.cli import errors, render
-from determined.cli.agent import args_description as agent_args_description
-from determined.cli.checkpoint import args_description as checkpoint_args_description
-from determined.cli.command import args_description as command_args_description
-from determined.cli.dev import args_description as dev_args_description
-from determined.cli.experiment import args_description as experiment_args_description
-from determined.cli.job import args_description as job_args_description
-from determined.cli.master import args_description as master_args_description
-from determined.cli.model import args_description as model_args_description
-from determined.cli.notebook import args_description as notebook_args_description
-from determined.cli.oauth import args_description as oauth_args_description
-from determined.cli.project import args_description as project_args_description
-from determined.cli.rbac import args_description as rbac_args_description
-from determined.cli.resource_pool import args_description as resource_pool_args_description
-from determined.cli.resources import args_description as resources_args_description
-from determined.cli.shell import args_description as shell_args_description
-from determined.cli.sso import args_description as auth_args_description
-from determined.cli.task import args_description as task_args_description
-from determined.cli.template import args_description as template_args_description
-from determined.cli.tensorboard import args_description as tensorboard_args_description
-from determined.cli.top_arg_descriptions import deploy_cmd
-from determined.cli.trial import args_description as trial_args_description
-from determined.cli.user import args_description as user_args_description
-from determined.cli.user_groups import args_description as user_groups_args_description
-from determined.cli.version import args_description as version_args_description
-from determined.cli.version import check_version
-from determined.cli.workspace import args_description as workspace_args_description
-from determined.common import api, util, yaml
-from determined.common.api import bindings, certs
+from determined.cli.top_arg_descriptions import lazy_cmds
+from determined.common import api
 from determined.common.declarative_argparse import (
     Arg,
     ArgsDescription,
@@ -60,8 +22,16 @@ from determined.common.declarative_argparse import (
     generate_aliases,
 )
 
+# Modules and their heavy dependencies, like tabulate, termcolor and OpenSSL, are only imported once
+# we know which command is being run, so that listing or completing commands stays fast.
+
 
 def preview_search(args: Namespace) -> None:
+    import tabulate
+    from termcolor import colored
+
+    from determined.common import util, yaml
+
     sess = cli.setup_session(args)
     experiment_config = util.safe_load_yaml_with_exceptions(args.config_file)
     args.config_file.close()
@@ -142,36 +112,61 @@ args_description = [
         "preview search",
         [Arg("config_file", type=FileType("r"), help="experiment config file (.yaml)")],
     ),
-    deploy_cmd,
 ]  # type: ArgsDescription
 
-all_args_description: ArgsDescription = (
-    args_description
-    + experiment_args_description
-    + checkpoint_args_description
-    + master_args_description
-    + model_args_description
-    + agent_args_description
-    + notebook_args_description
-    + job_args_description
-    + resources_args_description
-    + resource_pool_args_description
-    + project_args_description
-    + shell_args_description
-    + task_args_description
-    + template_args_description
-    + tensorboard_args_description
-    + trial_args_description
-    + command_args_description
-    + user_args_description
-    + user_groups_args_description
-    + rbac_args_description
-    + version_args_description
-    + workspace_args_description
-    + auth_args_description
-    + oauth_args_description
-    + dev_args_description
-)
+
+def command_words(args: List[str]) -> List[str]:
+    """
+    Return the words of the command line, which when completing come from the shell instead.
+    """
+    if "_ARGCOMPLETE" not in os.environ:
+        return args
+    import argcomplete
+
+    comp_line = os.environ.get("COMP_LINE", "")
+    comp_point = int(os.environ.get("COMP_POINT", len(comp_line)))
+    # The words before the one being completed, starting with the program name.
+    words: List[str] = argcomplete.split_line(comp_line, comp_point)[3]
+    return words[1:]
+
+
+def find_command_module(words: List[str]) -> Optional[str]:
+    """
+    Return the module which implements the top-level command in the given words, if there is one.
+    """
+    takes_value = [
+        opt
+        for arg in args_description
+        if isinstance(arg, Arg) and arg.kwargs.get("action") is None
+        for opt in arg.args
+    ]
+    modules = {}
+    for module, cmds in lazy_cmds.items():
+        for cmd in cmds:
+            main_name, aliases = generate_aliases(cmd.name)
+            modules.update({name: module for name in [main_name, *aliases]})
+
+    it = iter(words)
+    for word in it:
+        if not word.startswith("-"):
+            return modules.get(word)
+        # Skip the values of options, including abbreviated ones, which argparse accepts too.
+        abbreviated = len(word) > 2 and any(opt.startswith(word) for opt in takes_value)
+        if word in takes_value or (word.startswith("--") and "=" not in word and abbreviated):
+            next(it, None)
+    return None
+
+
+def command_args_description(module: Optional[str]) -> ArgsDescription:
+    """
+    Describe the top-level commands: in full for the given module, and as stubs otherwise.
+    """
+    if module is None:
+        return [cmd for cmds in lazy_cmds.values() for cmd in cmds]
+    description = importlib.import_module(module).args_description
+    if isinstance(description, Cmd):
+        return [description]
+    return cast(ArgsDescription, description)
 
 
 def make_parser() -> ArgumentParser:
@@ -181,6 +176,10 @@ def make_parser() -> ArgumentParser:
 
 
 def die(message: str, always_print_traceback: bool = False, exit_code: int = 1) -> None:
+    from termcolor import colored
+
+    from determined.common import util
+
     if always_print_traceback or util.debug_mode():
         import traceback
 
@@ -197,20 +196,18 @@ def main(
         # Magic incantation to make a Windows 10 cmd.exe process color-related ANSI escape codes.
         os.system("")
 
-    # TODO: we lazily import "det deploy" but in the future we'd want to lazily import everything.
+    # Only the module of the command being run or completed is imported; every other command is
+    # described by its stub.
     parser = make_parser()
-
-    full_cmd, aliases = generate_aliases(deploy_cmd.name)
-    is_deploy_cmd = len(args) > 0 and any(args[0] == alias for alias in [*aliases, full_cmd])
-    if is_deploy_cmd:
-        from determined.deploy.cli import args_description as deploy_args_description
-
-        add_args(parser, [deploy_args_description])
-    else:
-        add_args(parser, all_args_description)
+    module = find_command_module(command_words(args))
+    is_deploy_cmd = module == "determined.deploy.cli"
+    add_args(parser, args_description + command_args_description(module))
 
     try:
-        argcomplete.autocomplete(parser)
+        if "_ARGCOMPLETE" in os.environ:
+            import argcomplete
+
+            argcomplete.autocomplete(parser)
 
         parsed_args = parser.parse_args(args)
 
@@ -219,6 +216,13 @@ def main(
             parser.print_usage()
             parser.exit(2, "{}: no subcommand specified\n".format(parser.prog))
 
+        import requests
+
+        from determined.cli import errors, render
+        from determined.cli.version import check_version
+        from determined.common import util
+        from determined.common.api import bindings, certs
+
         try:
             # For `det deploy`, skip interaction with master.
             if is_deploy_cmd:
@@ -235,6 +239,13 @@ def main(
                 # cert, so allow the user to store and trust the current cert. (It could also mean
                 # that we tried to talk HTTPS on the HTTP port, but distinguishing that based on the
                 # exception is annoying, and we'll figure that out in the next step anyway.)
+                import hashlib
+                import socket
+                import ssl
+                from urllib import parse
+
+                from OpenSSL import SSL, crypto
+
                 addr = parse.urlparse(parsed_args.master)
                 try:
                     ctx = SSL.Context(SSL.TLSv1_2_METHOD)
@@ -691,7 +691,7 @@ def is_number(value: Any) -> bool:
 
 
 def scalar_training_metrics_names(
-    workloads: Sequence[bindings.v1WorkloadContainer],
+    workloads: Sequence["bindings.v1WorkloadContainer"],
 ) -> Set[str]:
     """
     Given an experiment history, return the names of training metrics
@@ -712,7 +712,7 @@ def scalar_training_metrics_names(
 
 
 def scalar_validation_metrics_names(
-    workloads: Sequence[bindings.v1WorkloadContainer],
+    workloads: Sequence["bindings.v1WorkloadContainer"],
 ) -> Set[str]:
     for workload in workloads:
         if workload.validation:
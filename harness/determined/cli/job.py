@@ -11,8 +11,8 @@ from determined.common.util import parse_protobuf_timestamp
 
 
 def parse_jobv2_resp(
-    resp: bindings.v1GetJobsV2Response,
-) -> List[Union[bindings.v1Job, bindings.v1LimitedJob]]:
+    resp: "bindings.v1GetJobsV2Response",
+) -> List[Union["bindings.v1Job", "bindings.v1LimitedJob"]]:
     jobs_nullable = [j.full if j.full is not None else j.limited for j in resp.jobs]
     jobs: List[Union[bindings.v1Job, bindings.v1LimitedJob]] = []
     for j in jobs_nullable:
@@ -127,7 +127,7 @@ def _single_update(
     bindings.post_UpdateJobQueue(session, body=bindings.v1UpdateJobQueueRequest(updates=[update]))
 
 
-def check_is_priority(pools: bindings.v1GetResourcePoolsResponse, resource_pool: str) -> bool:
+def check_is_priority(pools: "bindings.v1GetResourcePoolsResponse", resource_pool: str) -> bool:
     if pools.resourcePools is None:
         raise ValueError(f"No resource pools found checking scheduler type of {resource_pool}")
 
@@ -56,7 +56,7 @@ def get_master(args: Namespace) -> None:
         print(util.yaml_safe_dump(resp.to_json(), default_flow_style=False))
 
 
-def format_log_entry(log: bindings.v1LogEntry) -> str:
+def format_log_entry(log: "bindings.v1LogEntry") -> str:
     """Format v1LogEntry for printing."""
     log_level = log.level if log.level else ""
     return f"{log.timestamp} [{log_level}]: {log.message}"
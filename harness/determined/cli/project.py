@@ -12,7 +12,7 @@ from determined.common.declarative_argparse import Arg, Cmd
 from .workspace import list_workspace_projects, pagination_args
 
 
-def render_experiments(args: Namespace, experiments: Sequence[bindings.v1Experiment]) -> None:
+def render_experiments(args: Namespace, experiments: Sequence["bindings.v1Experiment"]) -> None:
     def format_experiment(e: bindings.v1Experiment) -> List[Any]:
         result = [
             e.id,
@@ -46,7 +46,7 @@ def render_experiments(args: Namespace, experiments: Sequence[bindings.v1Experim
     render.tabulate_or_csv(headers, values, False)
 
 
-def render_project(project: bindings.v1Project) -> None:
+def render_project(project: "bindings.v1Project") -> None:
     values = [
         project.id,
         project.name,
@@ -60,7 +60,7 @@ def render_project(project: bindings.v1Project) -> None:
 
 def project_by_name(
     sess: api.Session, workspace_name: str, project_name: str
-) -> Tuple[bindings.v1Workspace, bindings.v1Project]:
+) -> Tuple["bindings.v1Workspace", "bindings.v1Project"]:
     w = api.workspace_by_name(sess, workspace_name)
     p = bindings.get_GetWorkspaceProjects(sess, id=w.id, name=project_name).projects
     if len(p) == 0:
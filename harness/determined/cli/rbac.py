@@ -130,8 +130,8 @@ def list_roles(args: Namespace) -> None:
 
 def role_with_assignment_to_dict(
     session: api.Session,
-    r: bindings.v1RoleWithAssignments,
-    assignment: bindings.v1RoleAssignment,
+    r: "bindings.v1RoleWithAssignments",
+    assignment: "bindings.v1RoleAssignment",
 ) -> Dict[str, Any]:
     scope_cluster = assignment.scopeCluster
     workspace_id = assignment.scopeWorkspaceId
@@ -311,7 +311,7 @@ def describe_role(args: Namespace) -> None:
 def make_assign_req(
     session: api.Session,
     args: Namespace,
-) -> Tuple[List[bindings.v1UserRoleAssignment], List[bindings.v1GroupRoleAssignment]]:
+) -> Tuple[List["bindings.v1UserRoleAssignment"], List["bindings.v1GroupRoleAssignment"]]:
     """
     A helper for assign_role and unassign_role, which take the same command line flags.
     """
@@ -10,18 +10,17 @@ from determined import cli
 from determined.cli import ntsc, render
 from determined.common import api, context, util
 from determined.common.api import bindings
-from determined.common.api.bindings import v1AllocationSummary, v1CreateGenericTaskResponse
 from determined.common.declarative_argparse import Arg, Cmd, Group
 
 
-def render_tasks(args: Namespace, tasks: Dict[str, v1AllocationSummary]) -> None:
+def render_tasks(args: Namespace, tasks: Dict[str, "bindings.v1AllocationSummary"]) -> None:
     """Render tasks for JSON, tabulate or csv output.
 
     The tasks parameter requires a map from allocation IDs to v1AllocationSummary
     describing individual tasks.
     """
 
-    def agent_info(t: v1AllocationSummary) -> Union[str, List[str]]:
+    def agent_info(t: bindings.v1AllocationSummary) -> Union[str, List[str]]:
         if t.resources is None:
             return "unassigned"
         agents = [a for r in t.resources for a in (r.agentDevices or {})]
@@ -120,7 +119,7 @@ def kill(args: Namespace) -> None:
 
 
 def task_creation_output(
-    session: api.Session, task_resp: v1CreateGenericTaskResponse, follow: bool
+    session: api.Session, task_resp: "bindings.v1CreateGenericTaskResponse", follow: bool
 ) -> None:
     print(f"Created task {task_resp.taskId}")
 
@@ -20,21 +20,21 @@ from .checkpoint import render_checkpoint
 
 
 def _workload_container_unpack(
-    container: bindings.v1WorkloadContainer,
-) -> Union[bindings.v1MetricsWorkload, bindings.v1CheckpointWorkload]:
+    container: "bindings.v1WorkloadContainer",
+) -> Union["bindings.v1MetricsWorkload", "bindings.v1CheckpointWorkload"]:
     result = container.training or container.validation or container.checkpoint
     assert result is not None
     return result
 
 
-def _format_validation(validation: Optional[bindings.v1MetricsWorkload]) -> Optional[str]:
+def _format_validation(validation: Optional["bindings.v1MetricsWorkload"]) -> Optional[str]:
     if not validation:
         return None
 
     return json.dumps(validation.metrics.to_json(), indent=4)
 
 
-def _format_checkpoint(checkpoint: Optional[bindings.v1CheckpointWorkload]) -> List[Any]:
+def _format_checkpoint(checkpoint: Optional["bindings.v1CheckpointWorkload"]) -> List[Any]:
     if not checkpoint:
         return [None, None, None]
 
@@ -54,7 +54,7 @@ def _format_checkpoint(checkpoint: Optional[bindings.v1CheckpointWorkload]) -> L
 
 
 def _workloads_tabulate(
-    workloads: Sequence[bindings.v1WorkloadContainer], metrics: bool
+    workloads: Sequence["bindings.v1WorkloadContainer"], metrics: bool
 ) -> Tuple[List[str], List[List[Any]]]:
     # Print information about individual steps.
     headers = [
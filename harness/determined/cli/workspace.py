@@ -50,7 +50,7 @@ def get_workspace_names(session: api.Session) -> Dict[int, str]:
 
 
 def render_workspaces(
-    workspaces: Sequence[bindings.v1Workspace], from_list_api: bool = False
+    workspaces: Sequence["bindings.v1Workspace"], from_list_api: bool = False
 ) -> None:
     values = []
     for w in workspaces:
@@ -149,7 +149,7 @@ def list_pools(args: Namespace) -> None:
     )
 
 
-def _parse_agent_user_group_args(args: Namespace) -> Optional[bindings.v1AgentUserGroup]:
+def _parse_agent_user_group_args(args: Namespace) -> Optional["bindings.v1AgentUserGroup"]:
     if args.agent_uid or args.agent_gid or args.agent_user or args.agent_group:
         return bindings.v1AgentUserGroup(
             agentUid=args.agent_uid,
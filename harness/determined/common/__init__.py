@@ -1,9 +1,19 @@
-try:
-    from ruamel import yaml
-except ModuleNotFoundError:
-    # Inexplicably, sometimes ruamel.yaml is pacakged as ruamel_yaml instead.
-    import ruamel_yaml as yaml  # type: ignore
+import sys as _sys
+import typing as _typing
 
-from determined.common import util
-from determined.common import api, check, constants, context, requests, storage
-from determined.common._logging import set_logger
+from determined._import import lazy_getattr as _lazy_getattr
+
+if _typing.TYPE_CHECKING or _sys.version_info < (3, 7):
+    from determined.common._yaml import yaml
+    from determined.common import util
+    from determined.common import api, check, constants, context, requests, storage
+    from determined.common._logging import set_logger
+else:
+    # Submodules are imported the first time they are used.
+    __getattr__ = _lazy_getattr(
+        __name__,
+        {
+            "yaml": "determined.common._yaml",
+            "set_logger": "determined.common._logging",
+        },
+    )
@@ -0,0 +1,5 @@
+try:
+    from ruamel import yaml  # noqa: F401
+except ModuleNotFoundError:
+    # Inexplicably, sometimes ruamel.yaml is pacakged as ruamel_yaml instead.
+    import ruamel_yaml as yaml  # type: ignore # noqa: F401
@@ -1,29 +1,71 @@
-from determined.common.api import authentication, errors, metric, bindings
-from determined.common.api._session import BaseSession, UnauthSession, Session
-from determined.common.api._util import (
-    PageOpts,
-    get_ntsc_details,
-    canonicalize_master_url,
-    get_default_master_url,
-    read_paginated,
-    WARNING_MESSAGE_MAP,
-    wait_for_ntsc_state,
-    wait_for_task_ready,
-    NTSC_Kind,
-    AnyNTSC,
-)
-from determined.common.api._rbac import (
-    role_name_to_role_id,
-    create_user_assignment_request,
-    create_group_assignment_request,
-    usernames_to_user_ids,
-    group_name_to_group_id,
-    workspace_by_name,
-    not_found_errs,
-)
-from determined.common.api.authentication import UsernameTokenPair, salt_and_hash
-from determined.common.api.logs import (
-    pprint_logs,
-    trial_logs,
-    task_logs,
-)
+import sys as _sys
+import typing as _typing
+
+from determined._import import lazy_getattr as _lazy_getattr
+
+if _typing.TYPE_CHECKING or _sys.version_info < (3, 7):
+    from determined.common.api import authentication, errors, metric, bindings
+    from determined.common.api._session import BaseSession, UnauthSession, Session
+    from determined.common.api._multiplex import MultiplexedSession
+    from determined.common.api._master_url import canonicalize_master_url, get_default_master_url
+    from determined.common.api._util import (
+        PageOpts,
+        PAGE_CONCURRENCY,
+        get_ntsc_details,
+        read_paginated,
+        WARNING_MESSAGE_MAP,
+        wait_for_ntsc_state,
+        wait_for_task_ready,
+        NTSC_Kind,
+        AnyNTSC,
+    )
+    from determined.common.api._rbac import (
+        role_name_to_role_id,
+        create_user_assignment_request,
+        create_group_assignment_request,
+        usernames_to_user_ids,
+        group_name_to_group_id,
+        workspace_by_name,
+        not_found_errs,
+    )
+    from determined.common.api.authentication import UsernameTokenPair, salt_and_hash
+    from determined.common.api.logs import (
+        pprint_logs,
+        trial_logs,
+        task_logs,
+    )
+else:
+    # Submodules, and the names below, are imported the first time they are used, so that reading
+    # the master url, say, does not import requests.
+    __getattr__ = _lazy_getattr(
+        __name__,
+        {
+            "BaseSession": "determined.common.api._session",
+            "UnauthSession": "determined.common.api._session",
+            "Session": "determined.common.api._session",
+            "MultiplexedSession": "determined.common.api._multiplex",
+            "canonicalize_master_url": "determined.common.api._master_url",
+            "get_default_master_url": "determined.common.api._master_url",
+            "PageOpts": "determined.common.api._util",
+            "PAGE_CONCURRENCY": "determined.common.api._util",
+            "get_ntsc_details": "determined.common.api._util",
+            "read_paginated": "determined.common.api._util",
+            "WARNING_MESSAGE_MAP": "determined.common.api._util",
+            "wait_for_ntsc_state": "determined.common.api._util",
+            "wait_for_task_ready": "determined.common.api._util",
+            "NTSC_Kind": "determined.common.api._util",
+            "AnyNTSC": "determined.common.api._util",
+            "role_name_to_role_id": "determined.common.api._rbac",
+            "create_user_assignment_request": "determined.common.api._rbac",
+            "create_group_assignment_request": "determined.common.api._rbac",
+            "usernames_to_user_ids": "determined.common.api._rbac",
+            "group_name_to_group_id": "determined.common.api._rbac",
+            "workspace_by_name": "determined.common.api._rbac",
+            "not_found_errs": "determined.common.api._rbac",
+            "UsernameTokenPair": "determined.common.api.authentication",
+            "salt_and_hash": "determined.common.api.authentication",
+            "pprint_logs": "determined.common.api.logs",
+            "trial_logs": "determined.common.api.logs",
+            "task_logs": "determined.common.api.logs",
+        },
+    )
@@ -0,0 +1,65 @@
+import os
+from urllib import parse
+
+
+def canonicalize_master_url(url: str) -> str:
+    """
+    Read a user-provided master url and convert it to a canonical master url.
+
+    It is expected that user inputs are canonicalized once right when the user passes them in, and
+    that the master_url remains unchanged throughout the internals of the system.
+
+    A canonical master has the following properties:
+      - explicit scheme
+      - nonempty host
+      - explicit port
+      - path does not end in a '/', if it is present at all
+      - no username, password, query, or fragment
+      - a full url can be trivially formed a la f"{master_url}/path/to/resource"
+
+    In addition to validation, canonicalization is important for the authentication cache, because
+    it helps to prevent situations where a use creates multiple sessions for a single master
+    instance.  It's not bulletproof though, if they do things like connect to the master as both
+    localhost and as 127.0.0.1; we can't help those cases without an inappropriate amount of
+    guesswork.
+    """
+
+    # We need to prepend a scheme first, because urlparse() doesn't handle that case well.
+    if url.startswith("https://"):
+        default_port = 443
+    elif url.startswith("http://"):
+        default_port = 80
+    else:
+        url = f"http://{url}"
+        default_port = 8080
+
+    parsed = parse.urlparse(url)
+
+    if not parsed.hostname:
+        raise ValueError(f"invalid master url {url}; master url must contain a nonempty hostname")
+
+    if parsed.username or parsed.password or parsed.query or parsed.fragment:
+        raise ValueError(
+            f"invalid master url {url}; master url must not contain username, password, query, or "
+            "fragment"
+        )
+
+    port = parsed.port or default_port
+    netloc = f"{parsed.hostname}:{port}"
+    return parse.urlunparse((parsed.scheme, netloc, parsed.path, "", "", "")).rstrip("/")
+
+
+def get_default_master_url() -> str:
+    """
+    Read supported environment variables for a master address, or pick localhost:8080.
+
+    Note that the result is not canonicalized; that is ok because there's no usage pattern where
+    you wouldn't be taking a user-provided value or this value, and you'd need to call
+    canonicalize_master_url() afterwards anyway.
+
+    Example:
+
+        master_url = user_requested_master or get_default_master_url()
+        master_url = canonicalize_master_url(master_url)
+    """
+    return os.environ.get("DET_MASTER", os.environ.get("DET_MASTER_ADDR", "localhost:8080"))
@@ -0,0 +1,233 @@
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Pattern, Tuple, Union
+
+import requests
+
+from determined.common import requests as det_requests
+from determined.common.api import _session, authentication, errors
+
+logger = logging.getLogger("determined.common.api")
+
+# Requests to these endpoints only carry the latest value of something, so a request which is still
+# waiting to be sent is replaced by a newer one to the same endpoint.
+LATEST_WINS = [
+    ("POST", re.compile(r"api/v1/trials/\d+/progress$")),
+]  # type: List[Tuple[str, Pattern]]
+
+# Requests to these endpoints can be repeated without changing the outcome, so identical requests
+# which are waiting to be sent are sent only once.  GET requests are always treated this way.
+IDEMPOTENT = [
+    ("PATCH", re.compile(r"api/v1/trials/\d+$")),
+]  # type: List[Tuple[str, Pattern]]
+
+INITIAL_BACKOFF = 1.0
+MAX_BACKOFF = 32.0
+
+
+def _endpoint(method: str, path: str) -> str:
+    """
+    Return the endpoint a request is counted under, which is its path with ids left out.
+    """
+    return f"{method} /" + re.sub(r"(?<=/)\d+(?=/|$)", "{id}", path.lstrip("/"))
+
+
+def _is_unavailable(e: Exception) -> bool:
+    if isinstance(e, errors.MasterNotFoundException):
+        return True
+    return isinstance(e, errors.APIException) and e.status_code >= 500
+
+
+class _Call:
+    """
+    _Call is one request which is sent once on behalf of every caller coalesced into it.
+    """
+
+    def __init__(self, args: Tuple) -> None:
+        self.args = args
+        self.done = False
+        self.response = None  # type: Optional[requests.Response]
+        self.error = None  # type: Optional[Exception]
+
+    def result(self) -> requests.Response:
+        if self.error is not None:
+            raise self.error
+        assert self.response is not None
+        return self.response
+
+
+class _Slot:
+    """
+    _Slot tracks the request in flight for one coalescing key, and the one waiting behind it.
+    """
+
+    def __init__(self) -> None:
+        self.inflight = None  # type: Optional[_Call]
+        self.queued = None  # type: Optional[_Call]
+
+
+class _EndpointStats:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.coalesced = 0
+        self.errors = 0
+
+
+class MultiplexedSession(_session.Session):
+    """
+    MultiplexedSession is a Session meant to be shared by every thread of a process which talks to
+    the master, like the heartbeat, log, profiler, progress and preemption threads of a trial.
+
+    Compared to handing each thread the same plain Session, it:
+
+    -  Sends every request over one pool of keep-alive connections, even if the Session it wraps
+       was created with ``keep_alive=False``.
+    -  Coalesces requests which are waiting behind an identical request to the same endpoint, and
+       replaces a waiting progress report with a newer one, so that each endpoint has at most one
+       request in flight and one waiting for it.
+    -  Backs off as a whole when the master is unreachable or failing, so that many threads do not
+       retry against a recovering master independently.  The errors are still raised to the caller.
+    -  Counts requests by endpoint; see :meth:`stats`.
+
+    Arguments:
+        session: The Session whose master, credentials and retry policy to use.
+        pool_size: The number of connections to keep open to the master.
+    """
+
+    def __init__(
+        self, session: _session.Session, pool_size: int = det_requests.DEFAULT_POOL_SIZE
+    ) -> None:
+        super().__init__(
+            session.master,
+            authentication.UsernameTokenPair(session.username, session.token),
+            session.cert,
+            session._max_retries,
+            keep_alive=True,
+            pool_size=pool_size,
+        )
+        self._lock = threading.Condition()
+        self._slots = {}  # type: Dict[Hashable, _Slot]
+        self._stats = {}  # type: Dict[str, _EndpointStats]
+        self._started = time.time()
+        self._backoff = 0.0
+        self._backoff_until = 0.0
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return, for every endpoint, how many requests were sent and how many were coalesced into
+        other requests, how many failed, and the rate at which requests were sent.
+        """
+        with self._lock:
+            elapsed = max(time.time() - self._started, 1e-9)
+            return {
+                endpoint: {
+                    "requests": s.requests,
+                    "coalesced": s.coalesced,
+                    "errors": s.errors,
+                    "requests_per_second": s.requests / elapsed,
+                }
+                for endpoint, s in self._stats.items()
+            }
+
+    def _coalesce_key(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json_: Any,
+        data: Optional[Union[str, bytes]],
+        headers: Optional[Dict[str, Any]],
+        stream: bool,
+    ) -> Optional[Hashable]:
+        if stream:
+            return None
+        relpath = path.lstrip("/")
+        request = (
+            method,
+            relpath,
+            json.dumps(params, sort_keys=True, default=str),
+            json.dumps(headers, sort_keys=True, default=str),
+        )
+        if any(m == method and p.match(relpath) for m, p in LATEST_WINS):
+            return request
+        if method == "GET" or any(m == method and p.match(relpath) for m, p in IDEMPOTENT):
+            return request + (json.dumps(json_, sort_keys=True, default=str), data)
+        return None
+
+    def _do_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Any,
+        data: Optional[Union[str, bytes]],
+        headers: Optional[Dict[str, Any]],
+        timeout: Optional[int],
+        stream: bool,
+    ) -> requests.Response:
+        args = (method, path, params, json, data, headers, timeout, stream)
+        endpoint = _endpoint(method, path)
+        key = self._coalesce_key(method, path, params, json, data, headers, stream)
+        if key is None:
+            return self._send(endpoint, args)
+
+        with self._lock:
+            slot = self._slots.setdefault(key, _Slot())
+            if slot.inflight is None and slot.queued is None:
+                call = slot.inflight = _Call(args)
+            else:
+                if slot.queued is None:
+                    slot.queued = _Call(args)
+                else:
+                    # Either an identical request, or an older value of the same thing.
+                    slot.queued.args = args
+                    self._stats.setdefault(endpoint, _EndpointStats()).coalesced += 1
+                call = slot.queued
+                while slot.inflight is not None and not call.done:
+                    self._lock.wait()
+                if call.done:
+                    return call.result()
+                # The request ahead of this one finished; this caller sends for everyone waiting.
+                slot.queued = None
+                slot.inflight = call
+
+        try:
+            call.response = self._send(endpoint, call.args)
+        except Exception as e:
+            call.error = e
+        with self._lock:
+            call.done = True
+            slot.inflight = None
+            if slot.queued is None:
+                del self._slots[key]
+            self._lock.notify_all()
+        return call.result()
+
+    def _send(self, endpoint: str, args: Tuple) -> requests.Response:
+        with self._lock:
+            delay = self._backoff_until - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            response = super()._do_request(*args)
+        except Exception as e:
+            with self._lock:
+                stats = self._stats.setdefault(endpoint, _EndpointStats())
+                stats.requests += 1
+                stats.errors += 1
+                now = time.time()
+                if _is_unavailable(e) and now >= self._backoff_until:
+                    self._backoff = min(max(self._backoff * 2, INITIAL_BACKOFF), MAX_BACKOFF)
+                    self._backoff_until = now + self._backoff
+                    logger.debug(f"{endpoint} failed; holding requests for {self._backoff}s")
+            raise
+
+        with self._lock:
+            self._stats.setdefault(endpoint, _EndpointStats()).requests += 1
+            self._backoff = 0.0
+            self._backoff_until = 0.0
+        return response
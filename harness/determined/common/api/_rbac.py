@@ -16,7 +16,7 @@ def role_name_to_role_id(session: api.Session, role_name: str) -> int:
 
 def create_user_assignment_request(
     session: api.Session, user: str, role: str, workspace: Optional[str] = None
-) -> List[bindings.v1UserRoleAssignment]:
+) -> List["bindings.v1UserRoleAssignment"]:
     role_obj = bindings.v1Role(roleId=role_name_to_role_id(session, role))
     workspace_id = None
     if workspace is not None:
@@ -28,7 +28,7 @@ def create_user_assignment_request(
 
 def create_group_assignment_request(
     session: api.Session, group: str, role: str, workspace: Optional[str] = None
-) -> List[bindings.v1GroupRoleAssignment]:
+) -> List["bindings.v1GroupRoleAssignment"]:
     role_obj = bindings.v1Role(roleId=role_name_to_role_id(session, role))
     workspace_id = None
     if workspace is not None:
@@ -69,7 +69,7 @@ def group_name_to_group_id(session: api.Session, group_name: str) -> int:
     return groups[0].group.groupId
 
 
-def workspace_by_name(session: api.Session, name: str) -> bindings.v1Workspace:
+def workspace_by_name(session: api.Session, name: str) -> "bindings.v1Workspace":
     assert name, "workspace name cannot be empty"
     w = bindings.get_GetWorkspaces(session, nameCaseSensitive=name).workspaces
     assert len(w) <= 1, "workspace name is assumed to be unique."
@@ -27,11 +27,12 @@ def _do_request(
     max_retries: Optional[GeneralizedRetry],
     params: Optional[Dict[str, Any]] = None,
     json: Any = None,
-    data: Optional[str] = None,
+    data: Optional[Union[str, bytes]] = None,
     headers: Optional[Dict[str, str]] = None,
     cert: Optional[certs.Cert] = None,
     timeout: Optional[Union[Tuple, float]] = None,
     stream: bool = False,
+    transport: Optional[requests.Session] = None,
 ) -> requests.Response:
     # Allow the json to come pre-encoded, if we need custom encoding.
     if json is not None and data is not None:
@@ -43,18 +44,31 @@ def _do_request(
     relpath = path.lstrip("/")
 
     try:
-        r = det_requests.request(
-            method,
-            f"{host}/{relpath}",
-            params=params,
-            data=data,
-            headers=headers,
-            verify=cert.bundle if cert else None,
-            stream=stream,
-            timeout=timeout,
-            server_hostname=cert.name if cert else None,
-            max_retries=max_retries,
-        )
+        if transport is not None:
+            # A long-lived transport already has the server name and retries mounted.
+            r = transport.request(
+                method,
+                f"{host}/{relpath}",
+                params=params,
+                data=data,
+                headers=headers,
+                verify=cert.bundle if cert else None,
+                stream=stream,
+                timeout=timeout,
+            )
+        else:
+            r = det_requests.request(
+                method,
+                f"{host}/{relpath}",
+                params=params,
+                data=data,
+                headers=headers,
+                verify=cert.bundle if cert else None,
+                stream=stream,
+                timeout=timeout,
+                server_hostname=cert.name if cert else None,
+                max_retries=max_retries,
+            )
     except requests.exceptions.SSLError:
         raise
     except requests.exceptions.ConnectionError as e:
@@ -85,6 +99,21 @@ def _do_request(
     return r
 
 
+def _pooled_transport(
+    master: str,
+    cert: Optional[certs.Cert],
+    max_retries: Optional[GeneralizedRetry],
+    pool_size: int,
+) -> requests.Session:
+    return det_requests.pooled_session(
+        master,
+        cert.bundle if cert else None,
+        cert.name if cert else None,
+        max_retries,
+        pool_size,
+    )
+
+
 class BaseSession(metaclass=abc.ABCMeta):
     """
     BaseSession is a requests-like interface that hides master url, master cert, and authz info.
@@ -98,6 +127,9 @@ class BaseSession(metaclass=abc.ABCMeta):
     master: str
     cert: Optional[certs.Cert]
     _max_retries: Optional[GeneralizedRetry]
+    # A long-lived requests.Session to send requests through; when None, every request opens its
+    # own connection.
+    _transport: Optional[requests.Session] = None
 
     @abc.abstractmethod
     def _do_request(
@@ -106,7 +138,7 @@ class BaseSession(metaclass=abc.ABCMeta):
         path: str,
         params: Optional[Dict[str, Any]],
         json: Any,
-        data: Optional[str],
+        data: Optional[Union[str, bytes]],
         headers: Optional[Dict[str, Any]],
         timeout: Optional[int],
         stream: bool,
@@ -140,7 +172,7 @@ class BaseSession(metaclass=abc.ABCMeta):
         *,
         params: Optional[Dict[str, Any]] = None,
         json: Any = None,
-        data: Optional[str] = None,
+        data: Optional[Union[str, bytes]] = None,
         headers: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
     ) -> requests.Response:
@@ -152,7 +184,7 @@ class BaseSession(metaclass=abc.ABCMeta):
         *,
         params: Optional[Dict[str, Any]] = None,
         json: Any = None,
-        data: Optional[str] = None,
+        data: Optional[Union[str, bytes]] = None,
         headers: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
     ) -> requests.Response:
@@ -164,7 +196,7 @@ class BaseSession(metaclass=abc.ABCMeta):
         *,
         params: Optional[Dict[str, Any]] = None,
         json: Any = None,
-        data: Optional[str] = None,
+        data: Optional[Union[str, bytes]] = None,
         headers: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
     ) -> requests.Response:
@@ -174,6 +206,9 @@ class BaseSession(metaclass=abc.ABCMeta):
 class UnauthSession(BaseSession):
     """
     UnauthSession is mostly only useful to log in or unathenticated endpoints like /info.
+
+    Like Session, it sends requests over a shared pool of keep-alive connections unless
+    ``keep_alive`` is False.
     """
 
     def __init__(
@@ -181,6 +216,8 @@ class UnauthSession(BaseSession):
         master: str,
         cert: Optional[certs.Cert],
         max_retries: Optional[GeneralizedRetry] = DEFAULT_MAX_RETRIES,
+        keep_alive: bool = True,
+        pool_size: int = det_requests.DEFAULT_POOL_SIZE,
     ) -> None:
         if master != api.canonicalize_master_url(master):
             # This check is targeting developers of Determined, not users of Determined.
@@ -192,6 +229,8 @@ class UnauthSession(BaseSession):
         self.master = master
         self.cert = cert
         self._max_retries = max_retries
+        if keep_alive:
+            self._transport = _pooled_transport(master, cert, max_retries, pool_size)
 
     def _do_request(
         self,
@@ -199,7 +238,7 @@ class UnauthSession(BaseSession):
         path: str,
         params: Optional[Dict[str, Any]],
         json: Any,
-        data: Optional[str],
+        data: Optional[Union[str, bytes]],
         headers: Optional[Dict[str, Any]],
         timeout: Optional[int],
         stream: bool,
@@ -216,6 +255,7 @@ class UnauthSession(BaseSession):
             cert=self.cert,
             timeout=timeout,
             stream=stream,
+            transport=self._transport,
         )
 
 
@@ -224,6 +264,12 @@ class Session(BaseSession):
     Session authenticates every request it makes.
 
     By far, most BaseSessions in the codebase will be this Session subclass.
+
+    Requests are sent over a pool of keep-alive connections, which is shared by every session in
+    the process with the same master, cert, retry policy and ``pool_size``, so that each request
+    does not pay for a new TCP connection and TLS handshake.  ``pool_size`` is the number of
+    connections the pool keeps open.  With ``keep_alive=False``, every request opens its own
+    connection instead.
     """
 
     def __init__(
@@ -232,6 +278,8 @@ class Session(BaseSession):
         utp: authentication.UsernameTokenPair,
         cert: Optional[certs.Cert],
         max_retries: Optional[GeneralizedRetry] = DEFAULT_MAX_RETRIES,
+        keep_alive: bool = True,
+        pool_size: int = det_requests.DEFAULT_POOL_SIZE,
     ) -> None:
         if master != api.canonicalize_master_url(master):
             # This check is targeting developers of Determined, not users of Determined.
@@ -245,6 +293,8 @@ class Session(BaseSession):
         self.token = utp.token
         self.cert = cert
         self._max_retries = max_retries
+        if keep_alive:
+            self._transport = _pooled_transport(master, cert, max_retries, pool_size)
 
     def _do_request(
         self,
@@ -252,7 +302,7 @@ class Session(BaseSession):
         path: str,
         params: Optional[Dict[str, Any]],
         json: Any,
-        data: Optional[str],
+        data: Optional[Union[str, bytes]],
         headers: Optional[Dict[str, Any]],
         timeout: Optional[int],
         stream: bool,
@@ -272,4 +322,5 @@ class Session(BaseSession):
             headers=headers,
             timeout=timeout,
             stream=stream,
+            transport=self._transport,
         )
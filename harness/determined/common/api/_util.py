@@ -1,7 +1,7 @@
+import collections
+import concurrent.futures
 import enum
-import os
-from typing import Callable, Iterator, Optional, Tuple, TypeVar, Union
-from urllib import parse
+from typing import Callable, Deque, Iterator, Optional, Tuple, TypeVar, Union
 
 from determined.common import api, util
 from determined.common.api import bindings
@@ -15,10 +15,13 @@ class PageOpts(str, enum.Enum):
 # Default seconds for an NTSC task to become ready before timeout.
 DEFAULT_NTSC_TIMEOUT = 60 * 5
 
+# How many pages the SDK requests at once when it reads every page of a long list.
+PAGE_CONCURRENCY = 4
+
 
 # Not that read_paginated requires the output of get_with_offset to be a Paginated type to work.
 # The Paginated union type is generated based on response objects with a .pagination attribute.
-T = TypeVar("T", bound=bindings.Paginated)
+T = TypeVar("T", bound="bindings.Paginated")
 
 # Map of launch warnings to the warning message shown to users.
 WARNING_MESSAGE_MAP = {
@@ -29,85 +32,65 @@ WARNING_MESSAGE_MAP = {
 }
 
 
-def canonicalize_master_url(url: str) -> str:
-    """
-    Read a user-provided master url and convert it to a canonical master url.
-
-    It is expected that user inputs are canonicalized once right when the user passes them in, and
-    that the master_url remains unchanged throughout the internals of the system.
-
-    A canonical master has the following properties:
-      - explicit scheme
-      - nonempty host
-      - explicit port
-      - path does not end in a '/', if it is present at all
-      - no username, password, query, or fragment
-      - a full url can be trivially formed a la f"{master_url}/path/to/resource"
-
-    In addition to validation, canonicalization is important for the authentication cache, because
-    it helps to prevent situations where a use creates multiple sessions for a single master
-    instance.  It's not bulletproof though, if they do things like connect to the master as both
-    localhost and as 127.0.0.1; we can't help those cases without an inappropriate amount of
-    guesswork.
-    """
-
-    # We need to prepend a scheme first, because urlparse() doesn't handle that case well.
-    if url.startswith("https://"):
-        default_port = 443
-    elif url.startswith("http://"):
-        default_port = 80
-    else:
-        url = f"http://{url}"
-        default_port = 8080
-
-    parsed = parse.urlparse(url)
-
-    if not parsed.hostname:
-        raise ValueError(f"invalid master url {url}; master url must contain a nonempty hostname")
-
-    if parsed.username or parsed.password or parsed.query or parsed.fragment:
-        raise ValueError(
-            f"invalid master url {url}; master url must not contain username, password, query, or "
-            "fragment"
-        )
-
-    port = parsed.port or default_port
-    netloc = f"{parsed.hostname}:{port}"
-    return parse.urlunparse((parsed.scheme, netloc, parsed.path, "", "", "")).rstrip("/")
-
-
-def get_default_master_url() -> str:
-    """
-    Read supported environment variables for a master address, or pick localhost:8080.
-
-    Note that the result is not canonicalized; that is ok because there's no usage pattern where
-    you wouldn't be taking a user-provided value or this value, and you'd need to call
-    canonicalize_master_url() afterwards anyway.
-
-    Example:
-
-        master_url = user_requested_master or get_default_master_url()
-        master_url = canonicalize_master_url(master_url)
-    """
-    return os.environ.get("DET_MASTER", os.environ.get("DET_MASTER_ADDR", "localhost:8080"))
-
-
 def read_paginated(
     get_with_offset: Callable[[int], T],
     offset: int = 0,
     pages: PageOpts = PageOpts.all,
+    concurrency: int = 1,
 ) -> Iterator[T]:
-    while True:
-        resp = get_with_offset(offset)
-        pagination = resp.pagination
-        assert pagination is not None
-        assert pagination.endIndex is not None
-        assert pagination.total is not None
-        yield resp
-        if pagination.endIndex >= pagination.total or pages == PageOpts.single:
-            break
-        assert pagination.endIndex is not None
-        offset = pagination.endIndex
+    """
+    Yield every page of a paginated response, in order, starting at ``offset``.
+
+    With ``concurrency`` greater than 1, the first page reveals the page size and the total, and
+    the pages after it are requested up to ``concurrency`` at a time, on background threads.  Pages
+    are still yielded in order, and no more than ``concurrency`` pages are held at once, so this
+    streams lists which are too long to keep in memory.  If a page comes back shorter than the
+    first, the pages requested after it are discarded and reading continues from where it ended.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, not {concurrency}")
+
+    # Pages requested ahead of time, with the offset each was requested at.
+    pending = collections.deque()  # type: Deque[Tuple[int, concurrent.futures.Future]]
+    executor = None  # type: Optional[concurrent.futures.ThreadPoolExecutor]
+    next_offset = offset
+    try:
+        while True:
+            if pending:
+                offset, future = pending.popleft()
+                resp = future.result()
+            else:
+                offset = next_offset
+                resp = get_with_offset(offset)
+            pagination = resp.pagination
+            assert pagination is not None
+            assert pagination.endIndex is not None
+            assert pagination.total is not None
+            yield resp
+            if pagination.endIndex >= pagination.total or pages == PageOpts.single:
+                break
+
+            if pending and pending[0][0] != pagination.endIndex:
+                for _, future in pending:
+                    future.cancel()
+                pending.clear()
+            if not pending:
+                next_offset = pagination.endIndex
+
+            page_size = pagination.endIndex - offset
+            if concurrency > 1 and page_size > 0:
+                if executor is None:
+                    executor = concurrent.futures.ThreadPoolExecutor(
+                        concurrency, thread_name_prefix="read-paginated"
+                    )
+                while len(pending) < concurrency and next_offset < pagination.total:
+                    pending.append((next_offset, executor.submit(get_with_offset, next_offset)))
+                    next_offset += page_size
+    finally:
+        for _, future in pending:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
 
 
 # Literal["notebook", "tensorboard", "shell", "command"]
@@ -118,7 +101,9 @@ class NTSC_Kind(enum.Enum):
     command = "command"
 
 
-AnyNTSC = Union[bindings.v1Notebook, bindings.v1Tensorboard, bindings.v1Shell, bindings.v1Command]
+AnyNTSC = Union[
+    "bindings.v1Notebook", "bindings.v1Tensorboard", "bindings.v1Shell", "bindings.v1Command"
+]
 
 
 def get_ntsc_details(session: api.Session, typ: NTSC_Kind, ntsc_id: str) -> AnyNTSC:
@@ -138,9 +123,9 @@ def wait_for_ntsc_state(
     session: api.Session,
     typ: NTSC_Kind,
     ntsc_id: str,
-    predicate: Callable[[bindings.taskv1State], bool],
+    predicate: Callable[["bindings.taskv1State"], bool],
     timeout: int = 10,  # seconds
-) -> bindings.taskv1State:
+) -> "bindings.taskv1State":
     """wait for ntsc to reach a state that satisfies the predicate"""
 
     def get_state() -> Tuple[bool, bindings.taskv1State]:
@@ -5,7 +5,7 @@ from determined.common.api import bindings
 
 
 def pprint_logs(
-    logs: Iterable[Union[bindings.v1TaskLogsResponse, bindings.v1TrialLogsResponse]]
+    logs: Iterable[Union["bindings.v1TaskLogsResponse", "bindings.v1TrialLogsResponse"]]
 ) -> None:
     for log in logs:
         print(log.message, end="")
@@ -22,11 +22,11 @@ def trial_logs(
     rank_ids: Optional[List[int]] = None,
     sources: Optional[List[str]] = None,
     stdtypes: Optional[List[str]] = None,
-    min_level: Optional[bindings.v1LogLevel] = None,
+    min_level: Optional["bindings.v1LogLevel"] = None,
     timestamp_before: Optional[str] = None,
     timestamp_after: Optional[str] = None,
     search_text: Optional[str] = None,
-) -> Iterable[bindings.v1TrialLogsResponse]:
+) -> Iterable["bindings.v1TrialLogsResponse"]:
     if sum((head is not None, tail is not None, follow)) > 1:
         raise ValueError("at most one of head, tail, or follow may be set")
     logs = bindings.get_TrialLogs(
@@ -60,10 +60,10 @@ def task_logs(
     rank_ids: Optional[List[int]] = None,
     sources: Optional[List[str]] = None,
     stdtypes: Optional[List[str]] = None,
-    min_level: Optional[bindings.v1LogLevel] = None,
+    min_level: Optional["bindings.v1LogLevel"] = None,
     timestamp_before: Optional[str] = None,
     timestamp_after: Optional[str] = None,
-) -> Iterable[bindings.v1TaskLogsResponse]:
+) -> Iterable["bindings.v1TaskLogsResponse"]:
     if sum((head is not None, tail is not None, follow)) > 1:
         raise ValueError("at most one of head, tail, or follow may be set")
     logs = bindings.get_TaskLogs(
@@ -87,8 +87,8 @@ def task_logs(
 
 
 def levels_at_or_above(
-    min_level: Optional[bindings.v1LogLevel],
-) -> Optional[List[bindings.v1LogLevel]]:
+    min_level: Optional["bindings.v1LogLevel"],
+) -> Optional[List["bindings.v1LogLevel"]]:
     if min_level is None:
         return min_level
     # This is reliably ordered because Enum.__members__ is an OrderedDict.
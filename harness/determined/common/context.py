@@ -16,7 +16,7 @@ class _Builder:
         self.msg = f"Preparing files to send to master... {util.sizeof_fmt(0)} and 0 files"
         print(self.msg, end="\r", flush=True)
 
-    def add_v1File(self, f: bindings.v1File) -> None:
+    def add_v1File(self, f: "bindings.v1File") -> None:
         self.items.append(f)
         self.size += v1file_utils.v1File_size(f)
         if self.size > self.limit:
@@ -53,7 +53,7 @@ class _Builder:
             self.add_v1File(file)
             self.update_msg()
 
-    def get_items(self) -> List[bindings.v1File]:
+    def get_items(self) -> List["bindings.v1File"]:
         print()
 
         # Check for conflicting root items, which may arise when --include conflicts with either
@@ -72,7 +72,7 @@ def read_v1_context(
     context_root: Optional[pathlib.Path],
     includes: Iterable[pathlib.Path] = (),
     limit: int = constants.MAX_CONTEXT_SIZE,
-) -> List[bindings.v1File]:
+) -> List["bindings.v1File"]:
     """
     Return a list of v1Files suitable for submitting a context directory over the v1 REST API.
 
@@ -3,9 +3,8 @@ import itertools
 from argparse import SUPPRESS, ArgumentDefaultsHelpFormatter, ArgumentParser, Namespace
 from typing import Any, Callable, List, NamedTuple, Optional, Tuple, Union, cast
 
-from termcolor import colored
-
-from determined.common import util
+# termcolor and determined.common.util are imported where they are used, since every CLI invocation
+# imports this module before it knows which command it is running.
 
 
 def make_prefixes(desc: str) -> List[str]:
@@ -39,6 +38,8 @@ ArgsDescription = List[Union["Arg", "Cmd", "Group", "ArgGroup", "BoolOptArg"]]
 
 
 def deprecation_warning(message: str, color: bool = True) -> str:
+    from termcolor import colored
+
     msg = f"DEPRECATED: {message}"
     return colored(msg, "yellow") if color else msg
 
@@ -68,6 +69,8 @@ class Cmd:
         self.func = func
         # wrap the fn in deprecation warning.
         if self.deprecation_message and self.func:
+            from determined.common import util
+
             self.func = util.deprecated(deprecation_warning(self.deprecation_message))(self.func)
 
         if self.func:
@@ -246,4 +249,6 @@ def add_args(parser: ArgumentParser, description: ArgsDescription, depth: int =
 
 def string_to_bool(s: str) -> bool:
     """Converts string values to boolean for flag arguments (e.g. --active=true)"""
+    from determined.common import util
+
     return util.strtobool(s)
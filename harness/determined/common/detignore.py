@@ -48,7 +48,7 @@ def make_shutil_ignore(root_path: pathlib.Path) -> Callable:
 
 def os_walk_to_v1Files(
     root_path: pathlib.Path, entry_prefix: pathlib.Path
-) -> Iterable[bindings.v1File]:
+) -> Iterable["bindings.v1File"]:
     ignore_spec = _build_detignore_pathspec(root_path)
 
     for parent, dirs, files in os.walk(str(root_path)):
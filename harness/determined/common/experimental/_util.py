@@ -14,5 +14,5 @@ class OrderBy(enum.Enum):
     DESCENDING = bindings.v1OrderBy.DESC.value
     DESC = bindings.v1OrderBy.DESC.value
 
-    def _to_bindings(self) -> bindings.v1OrderBy:
+    def _to_bindings(self) -> "bindings.v1OrderBy":
         return bindings.v1OrderBy(self.value)
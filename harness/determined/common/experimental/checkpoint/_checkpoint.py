@@ -1,21 +1,35 @@
+import concurrent.futures
 import dataclasses
 import enum
 import json
 import logging
+import os
 import pathlib
 import shutil
 import tarfile
+import threading
 import warnings
-from typing import Any, Dict, Iterable, List, Optional
+from typing import IO, Any, BinaryIO, Dict, Iterable, List, Optional
+
+import requests
+import urllib3
 
 from determined import errors
 from determined.common import api, constants, storage
 from determined.common.api import bindings
 from determined.common.experimental import metrics
-from determined.common.storage import shared
+from determined.common.storage import shared, transfer
 
 logger = logging.getLogger("determined.client")
 
+# Files in a proxied checkpoint download up to this size are buffered in memory and written to disk
+# by a pool of threads while the archive keeps streaming; larger files are streamed straight to
+# disk.
+_MASTER_DOWNLOAD_BUFFERED_FILE_SIZE = 1024 * 1024
+
+# Number of times a proxied checkpoint download is restarted after the connection fails.
+_MASTER_DOWNLOAD_RETRIES = 3
+
 
 class DownloadMode(enum.Enum):
     """
@@ -70,7 +84,7 @@ class CheckpointOrderBy(enum.Enum):
     ASC = bindings.v1OrderBy.ASC.value
     DESC = bindings.v1OrderBy.DESC.value
 
-    def _to_bindings(self) -> bindings.v1OrderBy:
+    def _to_bindings(self) -> "bindings.v1OrderBy":
         return bindings.v1OrderBy(self.value)
 
 
@@ -84,10 +98,92 @@ class CheckpointSortBy(enum.Enum):
     STATE = bindings.checkpointv1SortBy.STATE.value
     SEARCHER_METRIC = bindings.checkpointv1SortBy.SEARCHER_METRIC.value
 
-    def _to_bindings(self) -> bindings.checkpointv1SortBy:
+    def _to_bindings(self) -> "bindings.checkpointv1SortBy":
         return bindings.checkpointv1SortBy(self.value)
 
 
+def _extract_tar_stream(
+    fileobj: IO[bytes],
+    dst: pathlib.Path,
+    done: Dict[str, int],
+    max_concurrency: Optional[int] = None,
+) -> None:
+    """
+    Extract a (possibly gzipped) tar stream into dst, writing small files on a pool of threads.
+
+    Regular files already listed in ``done`` with the same size are skipped, and each file that is
+    fully written is added to ``done``, so a failed extraction can be resumed from a new stream.
+
+    Checkpoint archives only contain directories and regular files.  Any other member, such as a
+    symlink which a later member could be written through, is rejected, as is any member which
+    would resolve to a path outside of dst.
+    """
+    root = os.path.realpath(dst)
+    workers = max_concurrency or transfer.DEFAULT_MAX_CONCURRENCY
+    # Bound the memory held by files waiting to be written.
+    slots = threading.BoundedSemaphore(workers * 4)
+    futures: List[concurrent.futures.Future] = []
+
+    def write(member: tarfile.TarInfo, path: str, data: bytes) -> None:
+        try:
+            with open(path, "wb") as f:
+                f.write(data)
+            finish(member, path)
+        finally:
+            slots.release()
+
+    def finish(member: tarfile.TarInfo, path: str) -> None:
+        os.chmod(path, member.mode & 0o7777)
+        os.utime(path, (member.mtime, member.mtime))
+        done[member.name] = member.size
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="det-download"
+    ) as pool:
+        try:
+            with tarfile.open(fileobj=fileobj, mode="r|*") as tf:
+                for member in tf:
+                    if not member.isdir() and not member.isfile():
+                        raise errors.ProxiedDownloadFailed(
+                            f"refusing to extract {member.name}, which is not a regular file or "
+                            "directory"
+                        )
+                    # Resolve any symlinks already present in dst, too.
+                    path = os.path.realpath(os.path.join(root, member.name))
+                    if os.path.commonpath([root, path]) != root:
+                        raise errors.ProxiedDownloadFailed(
+                            f"refusing to extract {member.name} outside of {dst}"
+                        )
+                    if member.isdir():
+                        os.makedirs(path, exist_ok=True)
+                    elif done.get(member.name) == member.size:
+                        continue
+                    else:
+                        os.makedirs(os.path.dirname(path), exist_ok=True)
+                        src = tf.extractfile(member)
+                        assert src is not None
+                        if member.size <= _MASTER_DOWNLOAD_BUFFERED_FILE_SIZE:
+                            data = src.read()
+                            slots.acquire()
+                            futures.append(pool.submit(write, member, path, data))
+                        else:
+                            with open(path, "wb") as f:
+                                shutil.copyfileobj(
+                                    src, f, length=_MASTER_DOWNLOAD_BUFFERED_FILE_SIZE
+                                )
+                            finish(member, path)
+                    # Surface write errors promptly rather than after the whole download.
+                    while futures and futures[0].done():
+                        futures.pop(0).result()
+        except BaseException:
+            # Don't write anything else; the pool still finishes in-flight writes on exit.
+            for future in futures:
+                future.cancel()
+            raise
+    for future in futures:
+        future.result()
+
+
 @dataclasses.dataclass
 class CheckpointTrainingMetadata:
     experiment_config: Dict[str, Any]
@@ -98,7 +194,7 @@ class CheckpointTrainingMetadata:
 
     @classmethod
     def _from_bindings(
-        cls, tm: bindings.v1CheckpointTrainingMetadata
+        cls, tm: "bindings.v1CheckpointTrainingMetadata"
     ) -> "Optional[CheckpointTrainingMetadata]":
         if not tm.trialId:
             return None
@@ -255,6 +351,46 @@ class Checkpoint:
 
         return str(local_ckpt_dir)
 
+    def open(
+        self,
+        path: str,
+        block_size: Optional[int] = None,
+        cache_blocks: Optional[int] = None,
+    ) -> BinaryIO:
+        """
+        Open one file of the checkpoint for reading, without downloading the checkpoint.
+
+        For cloud checkpoint storage, only the blocks of the file which are actually read are
+        fetched, using ranged requests.  This is useful for loading a few tensors or a single shard
+        out of a large checkpoint.  Like ``DownloadMode.DIRECT``, this requires direct access to
+        checkpoint storage.
+
+        Arguments:
+            path (string): The path of the file, relative to the checkpoint root.
+            block_size (int, optional): The number of bytes fetched per block. Defaults to 8 MiB.
+            cache_blocks (int, optional): The number of blocks kept in memory. Defaults to 16.
+
+        Example:
+
+        .. code::
+
+           with checkpoint.open("state_dict.pt") as f:
+               state_dict = torch.load(f)
+        """
+        if self.training is None:
+            raise NotImplementedError("Non-training checkpoints cannot be opened")
+
+        checkpoint_storage = self.training.experiment_config["checkpoint_storage"]
+        if checkpoint_storage["type"] == "shared_fs":
+            src_ckpt_dir = self._find_shared_fs_path(checkpoint_storage)
+            return open(src_ckpt_dir.joinpath(path), "rb")
+        elif checkpoint_storage["type"] == "directory":
+            src_ckpt_dir = pathlib.Path(checkpoint_storage["container_path"], self.uuid)
+            return open(src_ckpt_dir.joinpath(path), "rb")
+
+        manager = storage.build(checkpoint_storage, container_path=None)
+        return manager.open(self.uuid, path, block_size=block_size, cache_blocks=cache_blocks)
+
     def _download_auto(
         self, checkpoint_storage: Dict[str, Any], local_ckpt_dir: pathlib.Path
     ) -> None:
@@ -313,23 +449,57 @@ class Checkpoint:
             manager.download(self.uuid, str(local_ckpt_dir))
 
     @staticmethod
-    def _download_via_master(sess: api.Session, uuid: str, local_ckpt_dir: pathlib.Path) -> None:
+    def _download_via_master(
+        sess: api.Session,
+        uuid: str,
+        local_ckpt_dir: pathlib.Path,
+        compressed: bool = False,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
         """Downloads a checkpoint through the master.
+
+        The master streams the checkpoint as a tar archive, uncompressed by default since
+        decompressing on a single thread is usually slower than the network.  Files are written to
+        disk by up to ``max_concurrency`` threads.  If the connection fails partway through, the
+        download is restarted, skipping files which were already written.
+
         Arguments:
             sess (api.Session): a session for the download
             uuid (string): the uuid of the checkpoint to be downloaded
             local_ckpt_dir (Path-like): the local directory where the checkpoint is downloaded
+            compressed (bool): ask the master for a gzipped archive
+            max_concurrency (int, optional): the number of threads writing files
         """
         local_ckpt_dir.mkdir(parents=True, exist_ok=True)
-
-        resp = sess.get(f"/checkpoints/{uuid}", headers={"Accept": "application/gzip"}, stream=True)
-        if not resp.ok:
-            raise errors.ProxiedDownloadFailed(
-                "unable to download checkpoint from master:", resp.status_code, resp.reason
-            )
-        # gunzip and untar. tarfile.open can detect the compression algorithm
-        with tarfile.open(fileobj=resp.raw) as tf:
-            tf.extractall(local_ckpt_dir)
+        mime_type = "application/gzip" if compressed else "application/x-tar"
+
+        done: Dict[str, int] = {}
+        for attempt in range(_MASTER_DOWNLOAD_RETRIES + 1):
+            resp = sess.get(f"/checkpoints/{uuid}", headers={"Accept": mime_type}, stream=True)
+            if not resp.ok:
+                raise errors.ProxiedDownloadFailed(
+                    "unable to download checkpoint from master:", resp.status_code, resp.reason
+                )
+            try:
+                _extract_tar_stream(resp.raw, local_ckpt_dir, done, max_concurrency)
+                return
+            except (
+                tarfile.ReadError,
+                EOFError,
+                ConnectionError,
+                requests.exceptions.RequestException,
+                urllib3.exceptions.HTTPError,
+            ) as e:
+                if attempt == _MASTER_DOWNLOAD_RETRIES:
+                    raise errors.ProxiedDownloadFailed(
+                        f"checkpoint download from master failed after {attempt + 1} attempts"
+                    ) from e
+                logger.warning(
+                    f"Checkpoint download from master was interrupted ({e}); retrying, skipping "
+                    f"{len(done)} files already downloaded"
+                )
+            finally:
+                resp.close()
 
     def write_metadata_file(self, path: str) -> None:
         """
@@ -458,7 +628,7 @@ class Checkpoint:
         else:
             return f"Checkpoint(uuid={self.uuid}, task_id={self.task_id})"
 
-    def _hydrate(self, ckpt: bindings.v1Checkpoint) -> None:
+    def _hydrate(self, ckpt: "bindings.v1Checkpoint") -> None:
         self.task_id = ckpt.taskId
         self.allocation_id = ckpt.allocationId
         self.report_time = ckpt.reportTime
@@ -478,7 +648,7 @@ class Checkpoint:
 
     @classmethod
     def _from_bindings(
-        cls, ckpt_bindings: bindings.v1Checkpoint, session: api.Session
+        cls, ckpt_bindings: "bindings.v1Checkpoint", session: api.Session
     ) -> "Checkpoint":
         ckpt = cls(
             session=session,
@@ -491,7 +661,7 @@ class Checkpoint:
 
 def _metadata_update_request(
     uuid: str, metadata: Dict[str, Any]
-) -> bindings.v1PostCheckpointMetadataRequest:
+) -> "bindings.v1PostCheckpointMetadataRequest":
     """Returns a request for updating checkpoint metadata."""
     # TODO: in a future version of this REST API, an entire, well-formed Checkpoint object.
     return bindings.v1PostCheckpointMetadataRequest(
@@ -33,7 +33,7 @@ class ExperimentState(enum.Enum):
     STARTING = bindings.experimentv1State.STARTING.value
     RUNNING = bindings.experimentv1State.RUNNING.value
 
-    def _to_bindings(self) -> bindings.experimentv1State:
+    def _to_bindings(self) -> "bindings.experimentv1State":
         return bindings.experimentv1State(self.value)
 
 
@@ -54,7 +54,7 @@ class ExperimentSortBy(enum.Enum):
     CHECKPOINT_COUNT = bindings.v1GetExperimentsRequestSortBy.CHECKPOINT_COUNT
     SEARCHER_METRIC_VAL = bindings.v1GetExperimentsRequestSortBy.SEARCHER_METRIC_VAL
 
-    def _to_bindings(self) -> bindings.v1GetExperimentsRequestSortBy:
+    def _to_bindings(self) -> "bindings.v1GetExperimentsRequestSortBy":
         return bindings.v1GetExperimentsRequestSortBy(self.value)
 
 
@@ -78,7 +78,7 @@ class ExperimentOrderBy(enum.Enum):
     ASCENDING = bindings.v1OrderBy.ASC.value
     DESCENDING = bindings.v1OrderBy.DESC.value
 
-    def _to_bindings(self) -> bindings.v1OrderBy:
+    def _to_bindings(self) -> "bindings.v1OrderBy":
         return bindings.v1OrderBy(self.value)
 
 
@@ -136,7 +136,7 @@ class Experiment:
     def id(self) -> int:
         return self._id
 
-    def _hydrate(self, exp: bindings.v1Experiment) -> None:
+    def _hydrate(self, exp: "bindings.v1Experiment") -> None:
         self.config = exp.config
         self.state = ExperimentState(exp.state.value)
         self.archived = exp.archived
@@ -292,13 +292,14 @@ class Experiment:
             order_by: Whether to sort in ascending or descending order. See
                 :class:`~determined.experimental.TrialOrderBy`.
         """
-        return list(self.iter_trials(sort_by, order_by))
+        return list(self.iter_trials(sort_by, order_by, concurrency=api.PAGE_CONCURRENCY))
 
     def iter_trials(
         self,
         sort_by: trial.TrialSortBy = trial.TrialSortBy.ID,
         order_by: OrderBy = OrderBy.ASCENDING,
         limit: Optional[int] = None,
+        concurrency: int = 1,
     ) -> Iterator[trial.Trial]:
         """Generate an iterator of trials of an experiment.
 
@@ -309,6 +310,9 @@ class Experiment:
             limit: Optional field that sets maximum page size of the response from the server.
                 When there are many trials to return, a lower page size can result in shorter
                 latency at the expense of more HTTP requests to the server. Defaults to no maximum.
+            concurrency: How many pages to request from the server at once. Above 1, pages are
+                requested ahead of the one being iterated over, but trials are still yielded in
+                order. Defaults to 1.
 
         Returns:
             This method returns an Iterable of :class:`~determined.experimental.Trial` instances
@@ -325,7 +329,7 @@ class Experiment:
                 sortBy=bindings.v1GetExperimentTrialsRequestSortBy(sort_by.value),
             )
 
-        resps = api.read_paginated(get_with_offset)
+        resps = api.read_paginated(get_with_offset, concurrency=concurrency)
 
         for r in resps:
             for t in r.trials:
@@ -499,6 +503,7 @@ class Experiment:
         resps = api.read_paginated(
             get_with_offset=get_with_offset,
             pages=api.PageOpts.single if max_results else api.PageOpts.all,
+            concurrency=api.PAGE_CONCURRENCY,
         )
 
         return [
@@ -620,7 +625,7 @@ class Experiment:
 
     @classmethod
     def _from_bindings(
-        cls, exp_bindings: bindings.v1Experiment, session: api.Session
+        cls, exp_bindings: "bindings.v1Experiment", session: api.Session
     ) -> "Experiment":
         exp = cls(session=session, experiment_id=exp_bindings.id)
         exp._hydrate(exp_bindings)
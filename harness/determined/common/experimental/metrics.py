@@ -34,7 +34,7 @@ class TrialMetrics:
 
     @classmethod
     def _from_bindings(
-        cls, metric_report: bindings.v1MetricsReport, group: Optional[str]
+        cls, metric_report: "bindings.v1MetricsReport", group: Optional[str]
     ) -> "TrialMetrics":
         key = "validation_metrics" if group == util._LEGACY_VALIDATION else "avg_metrics"
         return cls(
@@ -74,7 +74,7 @@ class TrainingMetrics(TrialMetrics):
     @classmethod
     def _from_bindings(  # type: ignore
         cls,
-        metric_report: bindings.v1MetricsReport,
+        metric_report: "bindings.v1MetricsReport",
     ) -> "TrainingMetrics":
         return cast("TrainingMetrics", super()._from_bindings(metric_report, util._LEGACY_TRAINING))
 
@@ -94,7 +94,7 @@ class ValidationMetrics(TrialMetrics):
 
     @classmethod
     def _from_bindings(  # type: ignore
-        cls, metric_report: bindings.v1MetricsReport
+        cls, metric_report: "bindings.v1MetricsReport"
     ) -> "ValidationMetrics":
         return cast(
             "ValidationMetrics", super()._from_bindings(metric_report, util._LEGACY_VALIDATION)
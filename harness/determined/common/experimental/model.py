@@ -120,7 +120,7 @@ class ModelVersion:
         for d in resp.metrics:
             yield metrics.TrialMetrics._from_bindings(d, group)
 
-    def _hydrate(self, model_version: bindings.v1ModelVersion) -> None:
+    def _hydrate(self, model_version: "bindings.v1ModelVersion") -> None:
         self.checkpoint = checkpoint.Checkpoint._from_bindings(
             model_version.checkpoint, self._session
         )
@@ -139,7 +139,7 @@ class ModelVersion:
 
     @classmethod
     def _from_bindings(
-        cls, version_bindings: bindings.v1ModelVersion, session: api.Session
+        cls, version_bindings: "bindings.v1ModelVersion", session: api.Session
     ) -> "ModelVersion":
         version = cls(
             session,
@@ -169,7 +169,7 @@ class ModelSortBy(enum.Enum):
     NUM_VERSIONS = bindings.v1GetModelsRequestSortBy.NUM_VERSIONS.value
     WORKSPACE = bindings.v1GetModelsRequestSortBy.WORKSPACE.value
 
-    def _to_bindings(self) -> bindings.v1GetModelsRequestSortBy:
+    def _to_bindings(self) -> "bindings.v1GetModelsRequestSortBy":
         return bindings.v1GetModelsRequestSortBy(self.value)
 
 
@@ -196,7 +196,7 @@ class ModelOrderBy(enum.Enum):
     DESCENDING = bindings.v1OrderBy.DESC.value
     DESC = bindings.v1OrderBy.DESC.value
 
-    def _to_bindings(self) -> bindings.v1OrderBy:
+    def _to_bindings(self) -> "bindings.v1OrderBy":
         return bindings.v1OrderBy(self.value)
 
 
@@ -408,7 +408,7 @@ class Model:
             self.model_id, self.name, json.dumps(self.metadata)
         )
 
-    def _hydrate(self, model: bindings.v1Model) -> None:
+    def _hydrate(self, model: "bindings.v1Model") -> None:
         self.model_id = model.id
         self.description = model.description or ""
         self.creation_time = util.parse_protobuf_timestamp(model.creationTime)
@@ -427,7 +427,7 @@ class Model:
         self._hydrate(resp)
 
     @classmethod
-    def _from_bindings(cls, model_bindings: bindings.v1Model, session: api.Session) -> "Model":
+    def _from_bindings(cls, model_bindings: "bindings.v1Model", session: api.Session) -> "Model":
         model = cls(
             session,
             name=model_bindings.name,
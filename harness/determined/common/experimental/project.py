@@ -48,13 +48,13 @@ class Project:
 
     @classmethod
     def _from_bindings(
-        cls, project_bindings: bindings.v1Project, session: api.Session
+        cls, project_bindings: "bindings.v1Project", session: api.Session
     ) -> "Project":
         project = cls(session, project_id=project_bindings.id)
         project._hydrate(project_bindings)
         return project
 
-    def _hydrate(self, project_bindings: bindings.v1Project) -> None:
+    def _hydrate(self, project_bindings: "bindings.v1Project") -> None:
         """Set this object's mutable attributes from those in a bindings object."""
         self.archived = project_bindings.archived
         self.description = project_bindings.description
@@ -28,7 +28,7 @@ class ResourcePool:
 
     @classmethod
     def _from_bindings(
-        cls, resource_pool_bindings: bindings.v1ResourcePool, session: api.Session
+        cls, resource_pool_bindings: "bindings.v1ResourcePool", session: api.Session
     ) -> "ResourcePool":
         resource_pool = cls(session, name=resource_pool_bindings.name)
         return resource_pool
@@ -20,7 +20,7 @@ class LogLevel(enum.Enum):
     ERROR = bindings.v1LogLevel.ERROR.value
     CRITICAL = bindings.v1LogLevel.CRITICAL.value
 
-    def _to_bindings(self) -> bindings.v1LogLevel:
+    def _to_bindings(self) -> "bindings.v1LogLevel":
         return bindings.v1LogLevel(self.value)
 
 
@@ -248,6 +248,7 @@ class Trial:
         resps = api.read_paginated(
             get_with_offset=get_trial_checkpoints,
             pages=api.PageOpts.single if max_results else api.PageOpts.all,
+            concurrency=api.PAGE_CONCURRENCY,
         )
 
         return [
@@ -484,7 +485,7 @@ class Trial:
         """
         return _stream_trials_metrics(self._session, [self.id], group=group)
 
-    def _hydrate(self, trial: bindings.trialv1Trial) -> None:
+    def _hydrate(self, trial: "bindings.trialv1Trial") -> None:
         self.experiment_id = trial.experimentId
         self.hparams = trial.hparams
         self.state = TrialState(trial.state.value)
@@ -525,7 +526,9 @@ class Trial:
         return _stream_validation_metrics(self._session, [self.id])
 
     @classmethod
-    def _from_bindings(cls, trial_bindings: bindings.trialv1Trial, session: api.Session) -> "Trial":
+    def _from_bindings(
+        cls, trial_bindings: "bindings.trialv1Trial", session: api.Session
+    ) -> "Trial":
         trial = cls(trial_bindings.id, session)
         trial._hydrate(trial_bindings)
         return trial
@@ -551,7 +554,7 @@ class TrialSortBy(enum.Enum):
     RESTARTS = _tsb.RESTARTS.value
     CHECKPOINT_SIZE = _tsb.CHECKPOINT_SIZE.value
 
-    def _to_bindings(self) -> bindings.v1GetExperimentTrialsRequestSortBy:
+    def _to_bindings(self) -> "bindings.v1GetExperimentTrialsRequestSortBy":
         return _tsb(self.value)
 
 
@@ -578,7 +581,7 @@ class TrialOrderBy(enum.Enum):
     DESCENDING = bindings.v1OrderBy.DESC.value
     DESC = bindings.v1OrderBy.DESC.value
 
-    def _to_bindings(self) -> bindings.v1OrderBy:
+    def _to_bindings(self) -> "bindings.v1OrderBy":
         return bindings.v1OrderBy(self.value)
 
 
@@ -45,7 +45,7 @@ class User:
         self.agent_group: Optional[str] = None
         self.display_name: Optional[str] = None
 
-    def _hydrate(self, user: bindings.v1User) -> None:
+    def _hydrate(self, user: "bindings.v1User") -> None:
         self.username = user.username
         self.admin = user.admin
         self.remote = user.remote if user.remote is not None else False
@@ -104,7 +104,7 @@ class User:
         self.reload()
 
     @classmethod
-    def _from_bindings(cls, user_bindings: bindings.v1User, session: api.Session) -> "User":
+    def _from_bindings(cls, user_bindings: "bindings.v1User", session: api.Session) -> "User":
         assert user_bindings.id
         user = cls(session=session, user_id=user_bindings.id)
         user._hydrate(user_bindings)
@@ -43,13 +43,13 @@ class Workspace:
 
     @classmethod
     def _from_bindings(
-        cls, workspace_bindings: bindings.v1Workspace, session: api.Session
+        cls, workspace_bindings: "bindings.v1Workspace", session: api.Session
     ) -> "Workspace":
         workspace = cls(session, workspace_id=workspace_bindings.id)
         workspace._hydrate(workspace_bindings)
         return workspace
 
-    def _hydrate(self, workspace_bindings: bindings.v1Workspace) -> None:
+    def _hydrate(self, workspace_bindings: "bindings.v1Workspace") -> None:
         self.id = workspace_bindings.id
         self.name = workspace_bindings.name
 
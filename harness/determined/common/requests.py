@@ -1,11 +1,23 @@
 """
 A drop-in replacement for requests.request() which supports server name overriding.
 """
-from typing import Any, Optional
+import http.cookiejar
+import os
+import socket
+import threading
+from typing import Any, Dict, Hashable, Optional, Union
 
 import requests
 import urllib3
 
+# The default number of connections a pooled Session keeps open to a host.
+DEFAULT_POOL_SIZE = 10
+
+# Detect connections which died while idle in the pool, e.g. behind a load balancer.
+_KEEPALIVE_SOCKET_OPTIONS = urllib3.connection.HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+
 
 class HTTPAdapter(requests.adapters.HTTPAdapter):
     """A new HTTPAdapter which honors the ServerName as a value for the verify arg."""
@@ -21,12 +33,33 @@ class HTTPAdapter(requests.adapters.HTTPAdapter):
             conn.assert_hostname = self.server_hostname
 
 
+class _KeepAliveHTTPAdapter(HTTPAdapter):
+    """An HTTPAdapter whose pooled connections have TCP keep-alive enabled."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
 class Session(requests.sessions.Session):
     def __init__(
-        self, server_hostname: Optional[str], max_retries: Optional[urllib3.util.retry.Retry]
+        self,
+        server_hostname: Optional[str],
+        max_retries: Optional[urllib3.util.retry.Retry],
+        pool_size: Optional[int] = None,
     ) -> None:
         super().__init__()
-        if max_retries is None:
+        if pool_size is not None:
+            # A long-lived session: keep up to pool_size connections open between requests.
+            kwargs = {"pool_maxsize": pool_size}  # type: Dict[str, Any]
+            if max_retries is not None:
+                kwargs["max_retries"] = max_retries
+            self.mount("https://", _KeepAliveHTTPAdapter(server_hostname, **kwargs))
+            self.mount("http://", _KeepAliveHTTPAdapter(None, **kwargs))
+            # Sessions with different credentials may share this one, so nothing may persist
+            # between requests.
+            self.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        elif max_retries is None:
             # Override the https adapter.
             self.mount("https://", HTTPAdapter(server_hostname))
         else:
@@ -40,3 +73,47 @@ def request(method: str, url: str, **kwargs: Any) -> requests.Response:
     with Session(server_hostname, max_retries) as session:
         out = session.request(method=method, url=url, **kwargs)  # type: requests.Response
         return out
+
+
+_pooled_sessions = {}  # type: Dict[Hashable, Session]
+_pooled_sessions_lock = threading.Lock()
+
+
+def _retry_key(max_retries: Optional[Union[urllib3.util.retry.Retry, int]]) -> Hashable:
+    if isinstance(max_retries, urllib3.util.retry.Retry):
+        return tuple(sorted((k, repr(v)) for k, v in vars(max_retries).items()))
+    return max_retries
+
+
+def pooled_session(
+    host: str,
+    verify: Union[None, str, bool],
+    server_hostname: Optional[str],
+    max_retries: Optional[Union[urllib3.util.retry.Retry, int]],
+    pool_size: int = DEFAULT_POOL_SIZE,
+) -> Session:
+    """
+    Return a long-lived Session which keeps connections to host open between requests.
+
+    The Session is shared by every caller in the process which passes the same arguments, and is
+    safe to use from multiple threads.  ``verify`` is only part of the key; requests must still pass
+    it to the Session.
+    """
+    key = (host, verify, server_hostname, _retry_key(max_retries), pool_size)
+    with _pooled_sessions_lock:
+        session = _pooled_sessions.get(key)
+        if session is None:
+            session = Session(server_hostname, max_retries, pool_size)  # type: ignore
+            _pooled_sessions[key] = session
+        return session
+
+
+def _forget_pooled_sessions() -> None:
+    # A forked child must not share the parent's connections; it opens its own.
+    global _pooled_sessions_lock
+    _pooled_sessions.clear()
+    _pooled_sessions_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_pooled_sessions)
@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Union
 
 from determined import errors
 from determined.common import storage, util
+from determined.common.storage import transfer
 
 import posixpath  # isort:skip
 
@@ -18,6 +19,7 @@ class AzureStorageManager(storage.CloudStorageManager):
 
     Checkpoints are stored as a collection of Block Blobs,
     with each block blob corresponding to one checkpoint resource.
+    Blobs are transferred concurrently, up to ``max_concurrency`` at a time.
     """
 
     def __init__(
@@ -27,12 +29,18 @@ class AzureStorageManager(storage.CloudStorageManager):
         account_url: Optional[str] = None,
         credential: Optional[str] = None,
         temp_dir: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(temp_dir if temp_dir is not None else tempfile.gettempdir())
         from determined.common.storage import azure_client
 
+        self.engine = transfer.TransferEngine(max_concurrency)
         self.client = azure_client.AzureStorageClient(
-            container, connection_string, account_url, credential
+            container,
+            connection_string,
+            account_url,
+            credential,
+            max_concurrency=self.engine.max_concurrency,
         )
         self.container = container if not container.endswith("/") else container[:-1]
 
@@ -43,7 +51,8 @@ class AzureStorageManager(storage.CloudStorageManager):
         src = os.fspath(src)
         logger.info(f"Uploading to Azure Blob Storage: {dst}")
         upload_paths = paths if paths is not None else self._list_directory(src)
-        for rel_path in sorted(upload_paths):
+
+        def upload_one(rel_path: str) -> int:
             # Use posixpath so that we always use forward slashes, even on Windows.
             container_blob = posixpath.join(self.container, dst, rel_path)
 
@@ -58,6 +67,9 @@ class AzureStorageManager(storage.CloudStorageManager):
                 logger.debug(f"Uploading blob {blob_base} to container {blob_dir}.")
 
             self.client.put(blob_dir, blob_base, abs_path)
+            return os.path.getsize(abs_path)
+
+        self.engine.run("Uploaded", upload_one, sorted(upload_paths))
 
     @util.preserve_random_state
     def download(
@@ -69,6 +81,7 @@ class AzureStorageManager(storage.CloudStorageManager):
         dst = os.fspath(dst)
         logger.info(f"Downloading {src} from Azure Blob Storage")
         found = False
+        blobs = {}
         for blob in self.client.list_files(self.container, file_prefix=src):
             found = True
             relname = os.path.relpath(blob, src)
@@ -85,14 +98,35 @@ class AzureStorageManager(storage.CloudStorageManager):
                 os.makedirs(_dst, exist_ok=True)
                 continue
 
+            blobs[blob] = _dst
+
+        def download_one(blob: str) -> int:
             # Use posixpath so that we always use forward slashes, even on Windows.
             container_blob = posixpath.join(self.container, blob)
             blob_dir, blob_base = posixpath.split(container_blob)
-            self.client.get(blob_dir, blob_base, _dst)
+            self.client.get(blob_dir, blob_base, blobs[blob])
+            return os.path.getsize(blobs[blob])
+
+        self.engine.run("Downloaded", download_one, blobs)
 
         if not found:
             raise errors.CheckpointNotFound(f"Did not find checkpoint {src} in Azure Blob Storage")
 
+    def _object_size(self, storage_id: str, path: str) -> int:
+        import azure.core.exceptions
+
+        blob_dir, blob_base = posixpath.split(posixpath.join(self.container, storage_id, path))
+        try:
+            return int(self.client.get_size(blob_dir, blob_base))
+        except azure.core.exceptions.ResourceNotFoundError as e:
+            raise errors.CheckpointNotFound(
+                f"Did not find {storage_id}/{path} in Azure Blob Storage"
+            ) from e
+
+    def _read_range(self, storage_id: str, path: str, start: int, length: int) -> bytes:
+        blob_dir, blob_base = posixpath.split(posixpath.join(self.container, storage_id, path))
+        return bytes(self.client.get_range(blob_dir, blob_base, start, length))
+
     @util.preserve_random_state
     def delete(self, tgt: str, globs: List[str]) -> Dict[str, int]:
         storage_prefix = tgt
@@ -108,6 +142,10 @@ class AzureStorageManager(storage.CloudStorageManager):
                     resources[obj.replace(f"{storage_prefix}/", "")] = objects[obj]
                     del objects[obj]
 
-        self.client.delete_files(self.container, list(objects))
+        def delete_one(obj: str) -> int:
+            self.client.delete_files(self.container, [obj])
+            return int(objects[obj])
+
+        self.engine.run("Deleted", delete_one, objects)
 
         return resources
@@ -12,7 +12,12 @@ logger = logging.getLogger("determined.common.storage.azure")
 
 
 class AzureStorageClient(object):
-    """Connects to an Azure Blob Storage service account."""
+    """
+    Connects to an Azure Blob Storage service account.
+
+    The client is safe to share between threads.  ``max_concurrency`` sizes the HTTP connection pool
+    and is also the number of connections used to transfer the blocks of a single large blob.
+    """
 
     def __init__(
         self,
@@ -20,14 +25,27 @@ class AzureStorageClient(object):
         connection_string: Optional[str] = None,
         account_url: Optional[str] = None,
         credential: Optional[str] = None,
+        max_concurrency: int = 1,
     ) -> None:
         import azure.core.exceptions
+        import requests.adapters
+        from azure.core.pipeline import transport
         from azure.storage import blob
 
+        self.max_concurrency = max_concurrency
+        session = requests.Session()
+        pool_size = max(max_concurrency, requests.adapters.DEFAULT_POOLSIZE)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        http_transport = transport.RequestsTransport(session=session, session_owner=False)
+
         if connection_string:
-            self.client = blob.BlobServiceClient.from_connection_string(connection_string)
+            self.client = blob.BlobServiceClient.from_connection_string(
+                connection_string, transport=http_transport
+            )
         elif account_url:
-            self.client = blob.BlobServiceClient(account_url, credential)
+            self.client = blob.BlobServiceClient(account_url, credential, transport=http_transport)
         else:
             raise ValueError("Either 'connection_string' or 'account_url' must be specified.")
 
@@ -55,15 +73,33 @@ class AzureStorageClient(object):
     def put(self, container_name: str, blob_name: str, filename: Union[str, Path]) -> None:
         """Upload a file to the specified blob in the specified container."""
         with open(filename, "rb") as file:
-            self.client.get_blob_client(container_name, blob_name).upload_blob(file, overwrite=True)
+            self.client.get_blob_client(container_name, blob_name).upload_blob(
+                file, overwrite=True, max_concurrency=self.max_concurrency
+            )
 
     @util.preserve_random_state
     def get(self, container_name: str, blob_name: str, filename: str) -> None:
         """Download the specified blob in the specified container to a file."""
         with open(filename, "wb") as file:
-            stream = self.client.get_blob_client(container_name, blob_name).download_blob()
+            stream = self.client.get_blob_client(container_name, blob_name).download_blob(
+                max_concurrency=self.max_concurrency
+            )
             stream.readinto(file)
 
+    @util.preserve_random_state
+    def get_size(self, container_name: str, blob_name: str) -> int:
+        """Return the size of the specified blob in the specified container."""
+        properties = self.client.get_blob_client(container_name, blob_name).get_blob_properties()
+        return int(properties.size)
+
+    @util.preserve_random_state
+    def get_range(self, container_name: str, blob_name: str, offset: int, length: int) -> bytes:
+        """Download ``length`` bytes of the specified blob, starting at ``offset``."""
+        stream = self.client.get_blob_client(container_name, blob_name).download_blob(
+            offset=offset, length=length
+        )
+        return bytes(stream.readall())
+
     @util.preserve_random_state
     def delete_files(self, container_name: str, files: List[str]) -> None:
         """Deletes the specified files from the specified container."""
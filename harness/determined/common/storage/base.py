@@ -1,15 +1,28 @@
 import abc
 import contextlib
-import copy
+import fnmatch
 import glob
+import io
+import itertools
 import os
 import pathlib
-import tempfile
 import urllib
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-from determined import util
 from determined.common import storage
+from determined.common.storage import ranged
 
 # Paths should be a set of paths relative to the checkpoint root that indicate what paths
 # should be uploaded. A directory should always appear in Paths if any subpath under that directory
@@ -140,6 +153,53 @@ class StorageManager(metaclass=abc.ABCMeta):
         """
         pass
 
+    def copy(self, src: str, dst: str, paths: Paths) -> None:
+        """
+        Copy ``paths`` from one stored checkpoint to another within the storage backend, without
+        transferring the data through this process.
+
+        Backends which cannot copy server-side raise NotImplementedError, and callers should fall
+        back to a normal upload.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support server-side copies")
+
+    def open(
+        self,
+        storage_id: str,
+        path: str,
+        block_size: Optional[int] = None,
+        cache_blocks: Optional[int] = None,
+    ) -> BinaryIO:
+        """
+        Open one file of a stored checkpoint for reading, without downloading the checkpoint.
+
+        The returned file is seekable, and only the blocks of ``block_size`` bytes which are
+        actually read are fetched from storage, with up to ``cache_blocks`` of them cached in
+        memory.  See :class:`~determined.common.storage.ranged.RangedReader`.
+        """
+        name = f"{storage_id}/{path}"
+        raw = ranged.RangedReader(
+            name,
+            self._object_size(storage_id, path),
+            lambda start, length: self._read_range(storage_id, path, start, length),
+            block_size=block_size,
+            cache_blocks=cache_blocks,
+        )
+        return io.BufferedReader(raw)
+
+    def _object_size(self, storage_id: str, path: str) -> int:
+        """
+        Return the size of one file of a stored checkpoint.  Backends which support open() must
+        implement this and _read_range().
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support ranged reads")
+
+    def _read_range(self, storage_id: str, path: str, start: int, length: int) -> bytes:
+        """
+        Return ``length`` bytes starting at offset ``start`` of one file of a stored checkpoint.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support ranged reads")
+
     @staticmethod
     def _list_directory(root: Union[str, os.PathLike]) -> Dict[str, int]:
         """
@@ -174,50 +234,127 @@ class StorageManager(metaclass=abc.ABCMeta):
         globs: List[str],
     ) -> Dict[str, int]:
         """
-        Returns remaining resources after glob has been applied. This is mostly a hack to
-        handle weird differences between glob.glob, fmatch.match, and pathlib.match.
-        We create a checkpoint path with empty files to all be able to use glob.glob across
-        all storage backends.
+        Returns remaining resources after glob has been applied.
+
+        The result is what would remain if every resource were created as an empty file (or
+        directory) on disk, then every match of glob.glob(f"{prefix}/{g}", recursive=True) were
+        deleted, recursively for directories.  This papers over the differences between glob.glob,
+        fnmatch.fnmatch, and pathlib.Path.match across storage backends, but the matching happens
+        on an in-memory tree of the resources rather than on disk.
         """
-        file_paths_to_sizes = copy.deepcopy(file_paths_to_sizes)
+        root = _GlobNode(None)
+        for name in file_paths_to_sizes:
+            parts = _canonical_parts(name)
+            if parts is not None:
+                root.add(parts, is_dir=name.endswith("/"))
+
+        prefix_parts = [p for p in prefix.split("/") if p not in ("", ".")]
+        removed: Set[int] = set()
+        for g in globs:
+            dir_only = not g or g.endswith("/")
+            for node in root.glob(prefix_parts + g.split("/"), dir_only=dir_only):
+                removed.add(id(node))
+        if id(root) in removed:
+            return {}
+
+        remaining = {}
+        for name, size in file_paths_to_sizes.items():
+            parts = _canonical_parts(name)
+            if parts is None:
+                # Names which don't map to a unique path on disk never survived the original
+                # temporary filesystem emulation, either.
+                continue
+            node = root
+            for part in parts:
+                node = node.children[part]
+                if id(node) in removed:
+                    break
+            else:
+                remaining[name] = size
+        return remaining
+
+
+def _canonical_parts(name: str) -> Optional[List[str]]:
+    """
+    Split a resource name into path components, or return None if the name is not in the canonical
+    form returned by _list_directory().
+    """
+    parts = (name[:-1] if name.endswith("/") else name).split("/")
+    if any(p in ("", ".", "..") for p in parts):
+        return None
+    return parts
 
-        # Create dummy file system.
-        temp_dir = tempfile.mkdtemp()
-        try:
-            for f in file_paths_to_sizes:
-                path = pathlib.Path(temp_dir).joinpath(f)
-                path.parent.mkdir(parents=True, exist_ok=True)
-                if f.endswith("/"):  # path.is_dir() will return false always.
-                    path.mkdir(exist_ok=True)
-                else:
-                    path.touch()
-
-            # Do deletion so we propogate deletion,
-            # for example deleting `subdir` deletes `sub/text1.txt`.
-            to_delete_dirs = {}
-            to_delete_files = {}
-            for g in globs:
-                for path_str in glob.glob(
-                    f"{pathlib.Path(temp_dir).joinpath(prefix)}/{g}", recursive=True
-                ):
-                    if os.path.isfile(path_str):
-                        to_delete_files[path_str] = True
-                    elif os.path.isdir(path_str):
-                        to_delete_dirs[path_str] = True
-
-            for path_str in to_delete_files:
-                os.remove(path_str)
-            for path_str in to_delete_dirs:
-                util.rmtree_nfs_safe(path_str, ignore_errors=False)
-
-            prefixed_resources = StorageManager._list_directory(temp_dir)
-            for file_path in list(file_paths_to_sizes):
-                if file_path not in prefixed_resources:
-                    del file_paths_to_sizes[file_path]
-        finally:
-            util.rmtree_nfs_safe(temp_dir, ignore_errors=True)
 
-        return file_paths_to_sizes
+class _GlobNode:
+    """
+    A file or directory in an in-memory tree, which can be matched against glob patterns with the
+    same semantics as glob.glob(pattern, recursive=True) on a real filesystem.
+    """
+
+    def __init__(self, parent: Optional["_GlobNode"]) -> None:
+        self.parent = parent
+        self.children: Dict[str, "_GlobNode"] = {}
+        # Directories may be implied by their contents, or named explicitly with a trailing "/".
+        self.is_dir = parent is None
+
+    def add(self, parts: List[str], is_dir: bool) -> None:
+        node = self
+        for part in parts:
+            node.is_dir = True
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _GlobNode(node)
+            node = child
+        node.is_dir = node.is_dir or is_dir
+
+    def _listdir(self, dir_only: bool) -> Iterator[Tuple[str, "_GlobNode"]]:
+        for name, child in self.children.items():
+            if not dir_only or child.is_dir:
+                yield name, child
+
+    def _rlistdir(self, dir_only: bool) -> Iterator["_GlobNode"]:
+        # Like glob's "**", this skips hidden entries and does not descend into them.
+        for name, child in self._listdir(dir_only):
+            if not name.startswith("."):
+                yield child
+                yield from child._rlistdir(dir_only)
+
+    def glob(self, parts: List[str], dir_only: bool) -> List["_GlobNode"]:
+        """
+        Return the nodes matched by a pattern, already split on "/".  With dir_only=True, as for a
+        pattern with a trailing slash, only directories match.
+        """
+        parts = [p for p in parts if p]
+        matches: Dict[int, _GlobNode] = {id(self): self}
+        for i, part in enumerate(parts):
+            # Intermediate components can only match directories.
+            want_dir = dir_only or i < len(parts) - 1
+            found: Dict[int, _GlobNode] = {}
+            for node in matches.values():
+                if not node.is_dir:
+                    continue
+                if part == "**":
+                    candidates: Iterable[_GlobNode] = itertools.chain(
+                        [node], node._rlistdir(want_dir)
+                    )
+                elif glob.has_magic(part):
+                    names = dict(node._listdir(want_dir))
+                    if not part.startswith("."):
+                        names = {k: v for k, v in names.items() if not k.startswith(".")}
+                    candidates = (names[k] for k in fnmatch.filter(names, part))
+                elif part == ".":
+                    candidates = [node]
+                elif part == "..":
+                    candidates = [node.parent] if node.parent is not None else []
+                else:
+                    child = node.children.get(part)
+                    candidates = [child] if child is not None else []
+                for c in candidates:
+                    found[id(c)] = c
+            matches = found
+        if dir_only:
+            return [m for m in matches.values() if m.is_dir]
+        return list(matches.values())
 
 
 def from_string(shortcut: str) -> StorageManager:
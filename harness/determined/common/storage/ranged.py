@@ -0,0 +1,146 @@
+import collections
+import io
+import logging
+import os
+from typing import Callable, Dict, List, Optional
+
+from determined.common import util
+
+logger = logging.getLogger("determined.common.storage")
+
+# Size of each block fetched from storage, and the unit of the block cache.
+DEFAULT_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Number of blocks kept in memory per open file.
+DEFAULT_CACHE_BLOCKS = 16
+
+# A range reader receives a byte offset and a length, and returns exactly that many bytes of the
+# object (fewer only at the end of the object).
+ReadRangeFn = Callable[[int, int], bytes]
+
+
+class RangedReader(io.RawIOBase):
+    """
+    RangedReader is a read-only, seekable file over an object in checkpoint storage.
+
+    Nothing is downloaded up front.  Each read fetches the blocks it touches with ranged requests,
+    coalescing adjacent missing blocks into one request, and the most recently used blocks are kept
+    in memory, so seeking around a large file like a sharded state dict only transfers the parts
+    which are actually read.
+
+    Storage managers construct these via :meth:`StorageManager.open`, which wraps them in an
+    ``io.BufferedReader``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        read_range: ReadRangeFn,
+        block_size: Optional[int] = None,
+        cache_blocks: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        if block_size is None:
+            block_size = DEFAULT_BLOCK_SIZE
+        if cache_blocks is None:
+            cache_blocks = DEFAULT_CACHE_BLOCKS
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1, not {block_size}")
+        if cache_blocks < 1:
+            raise ValueError(f"cache_blocks must be at least 1, not {cache_blocks}")
+        self.name = name
+        self.size = size
+        self._read_range = read_range
+        self._block_size = block_size
+        self._cache_blocks = cache_blocks
+        self._cache = collections.OrderedDict()  # type: collections.OrderedDict[int, bytes]
+        self._pos = 0
+        self.bytes_fetched = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            pos = offset
+        elif whence == os.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == os.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, b: memoryview) -> int:  # type: ignore
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        n = min(len(b), self.size - self._pos)
+        if n <= 0:
+            return 0
+
+        first = self._pos // self._block_size
+        last = (self._pos + n - 1) // self._block_size
+        blocks = self._get_blocks(first, last)
+
+        view = memoryview(b).cast("B")
+        written = 0
+        for i in range(first, last + 1):
+            block = blocks[i]
+            start = self._pos + written - i * self._block_size
+            chunk = block[start : start + n - written]
+            view[written : written + len(chunk)] = chunk
+            written += len(chunk)
+        self._pos += written
+        return written
+
+    def _get_blocks(self, first: int, last: int) -> Dict[int, bytes]:
+        """
+        Return blocks first through last, fetching any that are not cached.
+        """
+        blocks = {}
+        missing = []  # type: List[int]
+        for i in range(first, last + 1):
+            if i in self._cache:
+                self._cache.move_to_end(i)
+                blocks[i] = self._cache[i]
+            else:
+                missing.append(i)
+
+        # Fetch each run of consecutive missing blocks with a single request.
+        runs = []  # type: List[List[int]]
+        for i in missing:
+            if runs and runs[-1][-1] == i - 1:
+                runs[-1].append(i)
+            else:
+                runs.append([i])
+        for run in runs:
+            start = run[0] * self._block_size
+            length = min(len(run) * self._block_size, self.size - start)
+            data = self._read_range(start, length)
+            if len(data) != length:
+                raise IOError(
+                    f"expected {length} bytes at offset {start} of {self.name}, got {len(data)}"
+                )
+            logger.debug(f"Fetched {util.sizeof_fmt(length)} at offset {start} of {self.name}")
+            self.bytes_fetched += length
+            for j, i in enumerate(run):
+                blocks[i] = data[j * self._block_size : (j + 1) * self._block_size]
+                self._cache[i] = blocks[i]
+
+        while len(self._cache) > self._cache_blocks:
+            self._cache.popitem(last=False)
+        return blocks
+
+    def close(self) -> None:
+        self._cache.clear()
+        super().close()
@@ -8,6 +8,7 @@ import requests
 
 from determined import errors
 from determined.common import storage, util
+from determined.common.storage import transfer
 
 logger = logging.getLogger("determined.common.storage.s3")
 
@@ -25,6 +26,9 @@ def normalize_prefix(prefix: Optional[str]) -> str:
 class S3StorageManager(storage.CloudStorageManager):
     """
     Store and load checkpoints from S3.
+
+    Files are transferred concurrently, up to ``max_concurrency`` at a time, and files larger than
+    ``multipart_chunksize`` bytes are split into parts which are also transferred concurrently.
     """
 
     def __init__(
@@ -35,21 +39,40 @@ class S3StorageManager(storage.CloudStorageManager):
         endpoint_url: Optional[str] = None,
         prefix: Optional[str] = None,
         temp_dir: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        multipart_chunksize: Optional[int] = None,
     ) -> None:
         super().__init__(temp_dir if temp_dir is not None else tempfile.gettempdir())
         import boto3
+        import botocore.config
+        from boto3.s3 import transfer as s3transfer
 
         from determined.common.storage import boto3_credential_manager
 
         boto3_credential_manager.initialize_boto3_credential_providers()
+        self.engine = transfer.TransferEngine(max_concurrency)
+        if multipart_chunksize is None:
+            multipart_chunksize = transfer.DEFAULT_MULTIPART_CHUNKSIZE
+        self.transfer_config = s3transfer.TransferConfig(
+            multipart_threshold=multipart_chunksize,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=self.engine.max_concurrency,
+        )
+
         self.bucket_name = bucket
         self.s3 = boto3.resource(
             "s3",
             endpoint_url=endpoint_url,
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
+            # Allow one connection per concurrent transfer, or botocore will discard connections
+            # instead of reusing them.
+            config=botocore.config.Config(max_pool_connections=self.engine.max_concurrency),
         )
         self.bucket = self.s3.Bucket(self.bucket_name)
+        # Boto3 resources are not thread-safe, but the underlying client is.  Transfer threads only
+        # ever use the client.
+        self.client = self.s3.meta.client
 
         self.prefix = normalize_prefix(prefix)
 
@@ -80,25 +103,33 @@ class S3StorageManager(storage.CloudStorageManager):
         prefix = self.get_storage_prefix(dst)
         logger.info(f"Uploading to s3: prefix={prefix}")
         upload_paths = paths if paths is not None else self._list_directory(src)
-        for rel_path in sorted(upload_paths):
+        dirs, files = transfer.split_directories(upload_paths)
+
+        # Create empty S3 keys for each subdirectory to mimic what the S3 console does to represent
+        # empty directories.
+        if not self._use_minio_workaround:
+            for rel_path in dirs:
+                key_name = f"{prefix}/{rel_path}"
+                logger.debug(f"Uploading {rel_path} to s3://{self.bucket_name}/{key_name}")
+                self.client.put_object(Bucket=self.bucket_name, Key=key_name, Body=b"")
+        else:
+            # boto3 will puke on the following MinIO response if you ever create a directory by
+            # uploading an empty blob.  Uploading a normal file in the directory and then deleting
+            # it seems to cause MinIO to prune the empty directory.  The AWS authentication scheme
+            # is complex and not worth the effort for supporting empty directories, so... just
+            # ignore empty directories.
+            pass
+
+        def upload_one(rel_path: str) -> int:
             key_name = f"{prefix}/{rel_path}"
+            abs_path = os.path.join(src, rel_path)
             logger.debug(f"Uploading {rel_path} to s3://{self.bucket_name}/{key_name}")
+            self.client.upload_file(
+                abs_path, self.bucket_name, key_name, Config=self.transfer_config
+            )
+            return os.path.getsize(abs_path)
 
-            if rel_path.endswith("/"):
-                # Create empty S3 keys for each subdirectory to mimic what the S3 console does to
-                # represent empty directories.
-                if not self._use_minio_workaround:
-                    self.bucket.put_object(Key=key_name, Body=b"")
-                else:
-                    # boto3 will puke on the following MinIO response if you ever create a
-                    # directory by uploading an empty blob.  Uploading a normal file in the
-                    # directory and then deleting it seems to cause MinIO to prune the empty
-                    # directory.  The AWS authentication scheme is complex and not worth the
-                    # effort for supporting empty directories, so... just ignore empty directories.
-                    pass
-            else:
-                abs_path = os.path.join(src, rel_path)
-                self.bucket.upload_file(abs_path, key_name)
+        self.engine.run("Uploaded", upload_one, files)
 
     @util.preserve_random_state
     def download(
@@ -115,6 +146,8 @@ class S3StorageManager(storage.CloudStorageManager):
         found = False
 
         try:
+            # Listing is paginated and serial; the downloads themselves are fanned out below.
+            keys = {}
             for obj in self.bucket.objects.filter(Prefix=prefix):
                 found = True
                 relname = os.path.relpath(obj.key, prefix)
@@ -124,10 +157,7 @@ class S3StorageManager(storage.CloudStorageManager):
                 if selector is not None and not selector(relname):
                     continue
                 _dst = os.path.join(dst, relname)
-                dst_dir = os.path.dirname(_dst)
-                os.makedirs(dst_dir, exist_ok=True)
-
-                logger.debug(f"Downloading s3://{self.bucket_name}/{obj.key} to {_dst}")
+                os.makedirs(os.path.dirname(_dst), exist_ok=True)
 
                 # Only create empty directory for keys that end with "/".
                 # See `upload` method for more context.
@@ -135,7 +165,15 @@ class S3StorageManager(storage.CloudStorageManager):
                     os.makedirs(_dst, exist_ok=True)
                     continue
 
-                self.bucket.download_file(obj.key, _dst)
+                keys[obj.key] = _dst
+
+            def download_one(key: str) -> int:
+                _dst = keys[key]
+                logger.debug(f"Downloading s3://{self.bucket_name}/{key} to {_dst}")
+                self.client.download_file(self.bucket_name, key, _dst, Config=self.transfer_config)
+                return os.path.getsize(_dst)
+
+            self.engine.run("Downloaded", download_one, keys)
 
         except botocore.exceptions.ClientError as e:
             if e.response["Error"]["Code"] == "AccessDenied":
@@ -150,6 +188,49 @@ class S3StorageManager(storage.CloudStorageManager):
         if not found:
             raise errors.CheckpointNotFound(f"Did not find {prefix} in S3")
 
+    @util.preserve_random_state
+    def copy(self, src: str, dst: str, paths: storage.Paths) -> None:
+        src_prefix = self.get_storage_prefix(src)
+        dst_prefix = self.get_storage_prefix(dst)
+        logger.info(f"Copying from s3: prefix={src_prefix} to prefix={dst_prefix}")
+
+        def copy_one(rel_path: str) -> int:
+            src_key = f"{src_prefix}/{rel_path}"
+            dst_key = f"{dst_prefix}/{rel_path}"
+            logger.debug(f"Copying s3://{self.bucket_name}/{src_key} to {dst_key}")
+            self.client.copy(
+                {"Bucket": self.bucket_name, "Key": src_key},
+                self.bucket_name,
+                dst_key,
+                Config=self.transfer_config,
+            )
+            # Nothing passes through this process.
+            return 0
+
+        # Directory markers are cheap to recreate by upload(), so only files are copied.
+        _, files = transfer.split_directories(paths)
+        self.engine.run("Copied", copy_one, files)
+
+    @util.preserve_random_state
+    def _object_size(self, storage_id: str, path: str) -> int:
+        import botocore.exceptions
+
+        key = f"{self.get_storage_prefix(storage_id)}/{path}"
+        try:
+            return int(self.client.head_object(Bucket=self.bucket_name, Key=key)["ContentLength"])
+        except botocore.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                raise errors.CheckpointNotFound(f"Did not find {key} in S3") from e
+            raise
+
+    @util.preserve_random_state
+    def _read_range(self, storage_id: str, path: str, start: int, length: int) -> bytes:
+        key = f"{self.get_storage_prefix(storage_id)}/{path}"
+        resp = self.client.get_object(
+            Bucket=self.bucket_name, Key=key, Range=f"bytes={start}-{start + length - 1}"
+        )
+        return bytes(resp["Body"].read())
+
     @util.preserve_random_state
     def delete(self, tgt: str, globs: List[str]) -> Dict[str, int]:
         prefix = self.get_storage_prefix(tgt)
@@ -166,8 +247,17 @@ class S3StorageManager(storage.CloudStorageManager):
                     del objects[obj]
 
         # S3 delete_objects has a limit of 1000 objects.
-        for chunk in util.chunks([{"Key": o} for o in objects], 1000):
+        batches = {
+            str(i): chunk
+            for i, chunk in enumerate(util.chunks([{"Key": o} for o in objects], 1000))
+        }
+
+        def delete_batch(name: str) -> int:
+            chunk = batches[name]
             logger.debug(f"Deleting {len(chunk)} objects from S3")
-            self.bucket.delete_objects(Delete={"Objects": chunk})
+            self.client.delete_objects(Bucket=self.bucket_name, Delete={"Objects": chunk})
+            return sum(objects[o["Key"]] for o in chunk)
+
+        self.engine.run("Deleted", delete_batch, batches, unit="batches")
 
         return resources
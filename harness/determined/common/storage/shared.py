@@ -1,14 +1,16 @@
 import contextlib
+import errno
 import glob
 import logging
 import os
 import pathlib
 import shutil
 import urllib
-from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from determined import errors, util
 from determined.common import check, storage
+from determined.common.storage import transfer
 
 logger = logging.getLogger("determined.common.storage.shared")
 
@@ -19,9 +21,12 @@ logger = logging.getLogger("determined.common.storage.shared")
 # The code is simplified to rely on default values for:
 # symlinks=False,
 # ignore=None,
-# copy_function=shutil.copy2,
 # ignore_dangling_symlinks=False,
 # dirs_exist_ok = True.
+#
+# The traversal only creates directories and plans the work; the files themselves are copied
+# afterwards on a pool of threads, since copies on network filesystems are dominated by per-file
+# latency.  Directory stats are copied last, since copying files into a directory changes it.
 
 
 def _copytree(
@@ -30,8 +35,10 @@ def _copytree(
     dst: str,
     selector: Optional[Callable[[str], bool]],
     src_root: str,
-) -> str:
-    errors = []
+    files: Dict[str, str],
+    dirs: List[Tuple[str, str]],
+    errors: List[Tuple[str, str, str]],
+) -> None:
     have_copied = False
     for srcobj in entries:
         srcname = os.path.join(src, srcobj.name)
@@ -46,12 +53,9 @@ def _copytree(
                 if selector is None or selector(src_relpath + "/"):
                     os.makedirs(dstname, exist_ok=True)
                     have_copied = True
-                copytree(
-                    srcobj,
-                    dstname,
-                    selector,
-                    src_root,
-                )
+                with os.scandir(srcobj) as itr:
+                    sub_entries = list(itr)
+                _copytree(sub_entries, srcname, dstname, selector, src_root, files, dirs, errors)
             else:
                 # If selector is None all files are copied; if selector is not None
                 # then files are copied according to the selector. Before files
@@ -60,23 +64,56 @@ def _copytree(
                 if selector is None or selector(src_relpath):
                     have_copied = True
                     os.makedirs(dst, exist_ok=True)
-                    shutil.copy2(srcobj, dstname)
-        # catch the Error from the recursive copytree so that we can
-        # continue with other files
-        except shutil.Error as err:
-            errors.extend(err.args[0])
+                    files[dstname] = srcname
+        # catch errors from the nested directories so that we can continue with other files
         except OSError as why:
             errors.append((srcname, dstname, str(why)))
     if have_copied:
+        dirs.append((src, dst))
+
+
+def _copyfile(src: str, dst: str) -> None:
+    """
+    Copy the contents of src to dst, letting the kernel move the data where it can.
+
+    copy_file_range() avoids copying data through userspace, lets NFS 4.2 copy server-side, and
+    creates copy-on-write clones on filesystems which support reflinks.  It is unavailable across
+    filesystems on older kernels, in which case this falls back to shutil.copyfile(), which itself
+    uses sendfile() on Linux.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
         try:
-            shutil.copystat(src, dst)
-        except OSError as why:
-            # Copying file access times may fail on Windows
-            if getattr(why, "winerror", None) is None:
-                errors.append((src, dst, str(why)))
-    if errors:
-        raise shutil.Error(errors)
-    return dst
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            if remaining == 0:
+                return
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+    shutil.copyfile(src, dst)
+
+
+def _copy_file(src: str, dst: str, hardlink: bool) -> None:
+    """
+    Copy one file like shutil.copy2, or hard link it if requested and possible.
+    """
+    if hardlink:
+        try:
+            if os.path.lexists(dst):
+                os.remove(dst)
+            os.link(src, dst)
+            return
+        except OSError as e:
+            # Different filesystems, or a filesystem without hard links.
+            logger.debug(f"unable to hard link {src} to {dst}, copying instead: {e}")
+    _copyfile(src, dst)
+    shutil.copystat(src, dst)
 
 
 def copytree(
@@ -84,18 +121,48 @@ def copytree(
     dst: str,
     selector: Optional[Callable[[str], bool]] = None,
     src_root: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    hardlink: bool = False,
 ) -> str:
+    """
+    Copy the directory tree at src to dst, copying up to ``max_concurrency`` files at once.
+
+    With ``hardlink=True``, files are hard linked rather than copied when src and dst are on the
+    same filesystem.  The copy then shares its contents with the original, so modifying a file in
+    place through one path modifies it for both.
+    """
     if src_root is None:
         src_root = src
     with os.scandir(src) as itr:
         entries = list(itr)
-    return _copytree(
-        entries=entries,
-        src=src,
-        dst=dst,
-        selector=selector,
-        src_root=src_root,
-    )
+
+    files: Dict[str, str] = {}
+    dirs: List[Tuple[str, str]] = []
+    errors: List[Tuple[str, str, str]] = []
+    _copytree(entries, src, dst, selector, src_root, files, dirs, errors)
+
+    def copy_one(dstname: str) -> int:
+        srcname = files[dstname]
+        try:
+            _copy_file(srcname, dstname, hardlink)
+            return os.path.getsize(dstname)
+        except OSError as why:
+            # Keep copying other files; list.append is atomic.
+            errors.append((srcname, dstname, str(why)))
+            return 0
+
+    transfer.TransferEngine(max_concurrency).run("Copied", copy_one, files)
+
+    for srcname, dstname in dirs:
+        try:
+            shutil.copystat(srcname, dstname)
+        except OSError as why:
+            # Copying file access times may fail on Windows
+            if getattr(why, "winerror", None) is None:
+                errors.append((srcname, dstname, str(why)))
+    if errors:
+        raise shutil.Error(errors)
+    return dst
 
 
 def _shortcut_to_config(shortcut: str) -> Dict[str, Any]:
@@ -157,11 +224,28 @@ class SharedFSStorageManager(storage.StorageManager):
     `host_path`.
     """
 
+    def __init__(
+        self,
+        base_path: str,
+        max_concurrency: Optional[int] = None,
+        hardlink: Optional[bool] = None,
+    ) -> None:
+        super().__init__(base_path)
+        self._max_concurrency = max_concurrency
+        self._hardlink = bool(hardlink)
+
     @classmethod
     def from_config(
         cls, config: Dict[str, Any], container_path: Optional[str]
     ) -> "SharedFSStorageManager":
-        allowed_keys = {"host_path", "storage_path", "container_path", "propagation"}
+        allowed_keys = {
+            "host_path",
+            "storage_path",
+            "container_path",
+            "propagation",
+            "max_concurrency",
+            "hardlink",
+        }
         for key in config.keys():
             check.is_in(key, allowed_keys, "extra key in shared_fs config")
         check.is_in("host_path", config, "shared_fs config is missing host_path")
@@ -169,7 +253,7 @@ class SharedFSStorageManager(storage.StorageManager):
         base_path = _full_storage_path(
             config["host_path"], config.get("storage_path"), container_path
         )
-        return cls(base_path)
+        return cls(base_path, config.get("max_concurrency"), config.get("hardlink"))
 
     def post_store_path(self, src: Union[str, os.PathLike], dst: str) -> None:
         """
@@ -203,6 +287,24 @@ class SharedFSStorageManager(storage.StorageManager):
             raise errors.CheckpointNotFound(f"Did not find checkpoint {src} in shared_fs storage")
         yield pathlib.Path(storage_dir)
 
+    def open(
+        self,
+        storage_id: str,
+        path: str,
+        block_size: Optional[int] = None,
+        cache_blocks: Optional[int] = None,
+    ) -> BinaryIO:
+        """
+        Files on shared_fs are already directly accessible, so just open the file.
+        """
+        full_path = os.path.join(self._base_path, storage_id, path)
+        try:
+            return open(full_path, "rb")
+        except FileNotFoundError:
+            raise errors.CheckpointNotFound(
+                f"Did not find {storage_id}/{path} in shared_fs storage"
+            ) from None
+
     def delete(self, tgt: str, globs: List[str]) -> Dict[str, int]:
         """
         Delete the stored data from persistent storage.
@@ -259,7 +361,13 @@ class SharedFSStorageManager(storage.StorageManager):
                 return x in paths
 
         dst = os.path.join(self._base_path, dst)
-        copytree(src, dst, selector=selector)
+        copytree(
+            src,
+            dst,
+            selector=selector,
+            max_concurrency=self._max_concurrency,
+            hardlink=self._hardlink,
+        )
 
     def download(
         self,
@@ -271,7 +379,13 @@ class SharedFSStorageManager(storage.StorageManager):
 
         try:
             src = os.path.join(self._base_path, src)
-            copytree(src, dst, selector=selector)
+            copytree(
+                src,
+                dst,
+                selector=selector,
+                max_concurrency=self._max_concurrency,
+                hardlink=self._hardlink,
+            )
         except FileNotFoundError:
             raise errors.CheckpointNotFound(
                 f"Did not find checkpoint {src} in shared_fs storage"
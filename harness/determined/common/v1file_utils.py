@@ -6,14 +6,14 @@ from typing import Any, Dict
 from determined.common.api import bindings
 
 
-def v1File_size(f: bindings.v1File) -> int:
+def v1File_size(f: "bindings.v1File") -> int:
     if f.content:
         # The content is already base64-encoded, and we want the real length.
         return len(f.content) // 4 * 3
     return 0
 
 
-def v1File_to_dict(f: bindings.v1File) -> Dict[str, Any]:
+def v1File_to_dict(f: "bindings.v1File") -> Dict[str, Any]:
     d = {
         "path": f.path,
         "type": f.type,
@@ -28,7 +28,7 @@ def v1File_to_dict(f: bindings.v1File) -> Dict[str, Any]:
     return d
 
 
-def v1File_from_local_file(archive_path: str, path: pathlib.Path) -> bindings.v1File:
+def v1File_from_local_file(archive_path: str, path: pathlib.Path) -> "bindings.v1File":
     with path.open("rb") as f:
         content = base64.b64encode(f.read()).decode("utf8")
     st = path.stat()
@@ -44,7 +44,7 @@ def v1File_from_local_file(archive_path: str, path: pathlib.Path) -> bindings.v1
     )
 
 
-def v1File_from_local_dir(archive_path: str, path: pathlib.Path) -> bindings.v1File:
+def v1File_from_local_dir(archive_path: str, path: pathlib.Path) -> "bindings.v1File":
     st = path.stat()
     return bindings.v1File(
         path=archive_path,
@@ -1,3 +1,4 @@
+import concurrent.futures
 import contextlib
 import datetime
 import enum
@@ -6,11 +7,14 @@ import json
 import logging
 import os
 import pathlib
+import shutil
+import tempfile
+import threading
 import uuid
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from determined import core, tensorboard
-from determined.common import api, storage
+from determined.common import api, storage, util
 from determined.common.api import bindings
 
 logger = logging.getLogger("determined.core")
@@ -168,6 +172,109 @@ def merge_resources(
     return merged, conflicts
 
 
+def _hash_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(4 * 1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def hash_resources(ckpt_dir: str, resources: Dict[str, int]) -> Dict[str, str]:
+    """
+    Return a manifest mapping each file in ``resources`` to a hash of its contents.  Directories
+    are not included.
+    """
+    return {
+        name: _hash_file(os.path.join(ckpt_dir, name))
+        for name in resources
+        if not name.endswith(os.sep)
+    }
+
+
+def _manifest_file(rank: int) -> str:
+    return f"dedup_manifest.{rank}.json"
+
+
+def _is_manifest_file(path: str) -> bool:
+    """
+    Return True for the manifests written into a checkpoint by deduplicated uploads, one per rank.
+    """
+    return path.startswith("dedup_manifest.") and path.endswith(".json") and "/" not in path
+
+
+def _snapshot(ckpt_dir: str, resources: Dict[str, int]) -> str:
+    """
+    Copy ``resources`` from ``ckpt_dir`` into a new temporary directory and return its path.
+    """
+    snapshot = tempfile.mkdtemp(prefix="det-ckpt-")
+    try:
+        for name in sorted(resources):
+            src = os.path.join(ckpt_dir, name)
+            dst = os.path.join(snapshot, name)
+            if name.endswith("/"):
+                os.makedirs(dst, exist_ok=True)
+            else:
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                shutil.copy2(src, dst)
+    except BaseException:
+        shutil.rmtree(snapshot, ignore_errors=True)
+        raise
+    return snapshot
+
+
+class _BackgroundUploader:
+    """
+    _BackgroundUploader uploads and reports checkpoints on a background thread, one at a time, so
+    that training can continue while checkpoints are being uploaded.
+
+    At most ``max_pending`` checkpoints may be pending at once; submitting another blocks until one
+    of them finishes, which bounds the local disk used by checkpoints awaiting upload.  Errors are
+    re-raised in the calling thread by the next call to submit() or wait().
+    """
+
+    def __init__(self, max_pending: int) -> None:
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be at least 1, not {max_pending}")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending: List[Tuple[str, concurrent.futures.Future]] = []
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def submit(self, storage_id: str, fn: Callable[[], None]) -> None:
+        self._raise_errors(block=False)
+        if not self._slots.acquire(blocking=False):
+            logger.info(f"Waiting for a background checkpoint upload before saving {storage_id}")
+            self._slots.acquire()
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="det-checkpoint"
+            )
+        future = self._executor.submit(fn)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append((storage_id, future))
+
+    def wait(self) -> None:
+        self._raise_errors(block=True)
+
+    def _raise_errors(self, block: bool) -> None:
+        """
+        Forget finished uploads, and re-raise the first error among them.  With block=True, wait
+        for every pending upload to finish first.
+        """
+        if block:
+            concurrent.futures.wait([f for _, f in self._pending])
+        finished = [(storage_id, f) for storage_id, f in self._pending if f.done()]
+        self._pending = [(storage_id, f) for storage_id, f in self._pending if not f.done()]
+        first_exc = None
+        for storage_id, future in finished:
+            exc = future.exception()
+            if exc is not None:
+                logger.error(f"Background upload of checkpoint {storage_id} failed: {exc}")
+                first_exc = first_exc or exc
+        if first_exc is not None:
+            raise first_exc
+
+
 class CheckpointContext:
     """
     ``CheckpointContext`` gives access to checkpoint-related features of a Determined cluster.
@@ -183,6 +290,8 @@ class CheckpointContext:
         tbd_sync_mode: core.TensorboardMode,
         tensorboard_manager: Optional[tensorboard.TensorboardManager],
         storage_backend_id: Optional[int],
+        max_background_uploads: int = 2,
+        latest_checkpoint: Optional[str] = None,
     ) -> None:
         self._dist = dist
         self._storage_manager = storage_manager
@@ -194,6 +303,16 @@ class CheckpointContext:
         if tbd_sync_mode != core.TensorboardMode.MANUAL and tensorboard_manager is None:
             raise ValueError("either set TensorboardMode.MANUAL, or pass a tensorboard manager.")
         self._tensorboard_manager = tensorboard_manager
+        # The storage_id and content manifest of the last checkpoint this worker uploaded with
+        # dedup=True, used to skip re-sending unchanged files.  Deduplicated uploads hold
+        # _dedup_lock throughout, so that background and foreground uploads are serialized and each
+        # one only ever copies from a checkpoint which has finished uploading.
+        self._last_manifest: Optional[Tuple[str, Dict[str, str]]] = None
+        self._dedup_lock = threading.Lock()
+        # The checkpoint this task resumed from, whose stored manifests seed _last_manifest at the
+        # first deduplicated upload.
+        self._manifest_source = latest_checkpoint
+        self._background = _BackgroundUploader(max_background_uploads)
 
     def upload(
         self,
@@ -202,6 +321,8 @@ class CheckpointContext:
         *,
         shard: bool = False,
         selector: Optional[Callable[[str], bool]] = None,
+        dedup: bool = False,
+        background: bool = False,
     ) -> str:
         """
         ``upload()`` chooses a random ``storage_id``, then uploads the contents of ``ckpt_dir`` to
@@ -218,6 +339,21 @@ class CheckpointContext:
         Each worker may optionally provide a ``selector`` that accepts a path
         relative to the checkpoint root, and returns True for paths that should be uploaded.
 
+        When ``dedup=True``, each file is hashed and compared against the last checkpoint this
+        worker uploaded with ``dedup=True``, or, before the first such upload, against the
+        checkpoint the trial resumed from.  Files whose contents are unchanged are copied within
+        the storage backend from the previous checkpoint instead of being uploaded again, which
+        saves most of the upload for checkpoints with large unchanging files, like frozen weights or
+        tokenizers.  Every checkpoint remains a complete, independent copy in checkpoint storage.
+        Storage backends without server-side copy support (such as ``shared_fs``) upload
+        everything, as usual.
+
+        When ``background=True``, the selected contents of ``ckpt_dir`` are copied to a temporary
+        directory on local disk and ``upload()`` returns as soon as that copy is complete, while the
+        checkpoint is uploaded and reported to the master on a background thread.  ``ckpt_dir`` may
+        be modified or deleted as soon as ``upload()`` returns.  See :meth:`wait` for waiting on
+        background uploads.  Background uploads are not supported with ``shard=True``.
+
         Returns:  The ``storage_id`` for this checkpoint.
 
         Example:
@@ -231,6 +367,9 @@ class CheckpointContext:
         if ckpt_dir is not None:
             ckpt_dir = os.fspath(ckpt_dir)
 
+        if background and shard:
+            raise ValueError("cannot call .upload(shard=True, background=True)")
+
         # The simple and sharded cases can technically be written as one function but it becomes
         # far more complicated than having two codepaths.
         if not shard:
@@ -244,7 +383,9 @@ class CheckpointContext:
                     "cannot call .upload(ckpt_dir=None, shard=False), which would result in doing "
                     "nothing at all"
                 )
-            return self._upload_single(ckpt_dir, metadata, selector=selector)
+            return self._upload_single(
+                ckpt_dir, metadata, selector=selector, dedup=dedup, background=background
+            )
         else:
             storage_id = None
             if self._dist.rank == 0:
@@ -252,7 +393,9 @@ class CheckpointContext:
             storage_id = self._dist.broadcast(storage_id)
 
             assert storage_id
-            return self._upload_sharded(ckpt_dir, storage_id, metadata, selector=selector)
+            return self._upload_sharded(
+                ckpt_dir, storage_id, metadata, selector=selector, dedup=dedup
+            )
 
     def _upload_single(
         self,
@@ -260,6 +403,8 @@ class CheckpointContext:
         metadata: Optional[Dict[str, Any]] = None,
         *,
         selector: Optional[Callable[[str], bool]] = None,
+        dedup: bool = False,
+        background: bool = False,
     ) -> str:
         logger.debug(
             f"Uploading content from checkpoint directory {ckpt_dir} to storage "
@@ -275,7 +420,35 @@ class CheckpointContext:
             resources = {key: resources[key] for key in resources if selector(key)}
             paths = set(resources)
 
-        self._storage_manager.upload(src=ckpt_dir, dst=storage_id, paths=paths)
+        if background:
+            # Snapshot the selected files, so the caller is free to overwrite ckpt_dir.
+            snapshot = _snapshot(ckpt_dir, resources)
+
+            def finish() -> None:
+                try:
+                    uploaded = resources
+                    if dedup:
+                        uploaded = self._upload_dedup(snapshot, storage_id, resources)
+                    else:
+                        self._storage_manager.upload(src=snapshot, dst=storage_id)
+                    self._report_checkpoint(storage_id, uploaded, metadata, sync_tensorboard=False)
+                finally:
+                    shutil.rmtree(snapshot, ignore_errors=True)
+
+            submitted = False
+            try:
+                # submit() may re-raise the error of an earlier upload.
+                self._background.submit(storage_id, finish)
+                submitted = True
+            finally:
+                if not submitted:
+                    shutil.rmtree(snapshot, ignore_errors=True)
+            return storage_id
+
+        if dedup:
+            resources = self._upload_dedup(ckpt_dir, storage_id, resources)
+        else:
+            self._storage_manager.upload(src=ckpt_dir, dst=storage_id, paths=paths)
         self._report_checkpoint(storage_id, resources, metadata)
         return storage_id
 
@@ -286,6 +459,7 @@ class CheckpointContext:
         metadata: Optional[Dict[str, Any]] = None,
         *,
         selector: Optional[Callable[[str], bool]] = None,
+        dedup: bool = False,
     ) -> str:
         logger.debug(
             f"Uploading sharded content from checkpoint directory {ckpt_dir} to storage "
@@ -342,16 +516,97 @@ class CheckpointContext:
 
         if want_upload:
             assert ckpt_dir
-            paths = set(resources.keys())
-            self._storage_manager.upload(src=ckpt_dir, dst=storage_id, paths=paths)
+            if dedup:
+                resources = self._upload_dedup(ckpt_dir, storage_id, resources)
+            else:
+                paths = set(resources.keys())
+                self._storage_manager.upload(src=ckpt_dir, dst=storage_id, paths=paths)
 
         # Synchronize workers.
-        _ = self._dist.allgather(None)
+        all_uploaded = self._dist.allgather(resources if dedup else None)
+
+        if dedup:
+            # Report the manifests written by each rank along with the rest of the files.
+            merged_resources, _ = merge_resources(all_uploaded)
 
         if self._dist.rank == 0:
             self._report_checkpoint(storage_id, merged_resources, all_metadata)
         return storage_id
 
+    def _upload_dedup(
+        self, ckpt_dir: str, storage_id: str, resources: Dict[str, int]
+    ) -> Dict[str, int]:
+        """
+        Upload ``resources`` from ``ckpt_dir``, copying files which are unchanged since the last
+        deduplicated upload from the previous checkpoint within the storage backend.
+
+        The manifest of the upload is written into the checkpoint, so that a later task resuming
+        from it can do the same.  Returns the resources that were uploaded, including the manifest.
+        """
+        with self._dedup_lock:
+            if self._manifest_source is not None:
+                self._last_manifest = self._read_manifest(self._manifest_source)
+                self._manifest_source = None
+
+            # Manifests left in ckpt_dir by earlier uploads are replaced, not uploaded.
+            resources = {k: v for k, v in resources.items() if not _is_manifest_file(k)}
+            manifest = hash_resources(ckpt_dir, resources)
+            manifest_path = os.path.join(ckpt_dir, _manifest_file(self._dist.rank))
+            with open(manifest_path, "w") as f:
+                json.dump(manifest, f, indent=2)
+            resources[_manifest_file(self._dist.rank)] = os.path.getsize(manifest_path)
+            paths = set(resources)
+
+            unchanged: Set[str] = set()
+            prev_storage_id = None
+            if self._last_manifest is not None:
+                prev_storage_id, prev_manifest = self._last_manifest
+                unchanged = {name for name, h in manifest.items() if prev_manifest.get(name) == h}
+                if unchanged:
+                    try:
+                        self._storage_manager.copy(
+                            src=prev_storage_id, dst=storage_id, paths=unchanged
+                        )
+                    except NotImplementedError:
+                        unchanged = set()
+                    except Exception as e:
+                        # The previous checkpoint may have been deleted; just upload everything.
+                        logger.warning(
+                            f"unable to reuse files from checkpoint {prev_storage_id}, uploading "
+                            f"all files instead: {e}"
+                        )
+                        unchanged = set()
+
+            if unchanged:
+                skipped = sum(resources[name] for name in unchanged)
+                logger.info(
+                    f"Reused {len(unchanged)} unchanged files ({util.sizeof_fmt(skipped)}) from "
+                    f"checkpoint {prev_storage_id}"
+                )
+
+            self._storage_manager.upload(src=ckpt_dir, dst=storage_id, paths=paths - unchanged)
+            self._last_manifest = (storage_id, manifest)
+            return resources
+
+    def _read_manifest(self, storage_id: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Read the manifests stored in a checkpoint by deduplicated uploads.  Returns None if there
+        are none, as for checkpoints which were uploaded without ``dedup=True``.
+        """
+        manifest: Dict[str, str] = {}
+        try:
+            with self._storage_manager.restore_path(storage_id, _is_manifest_file) as path:
+                for name in os.listdir(path):
+                    if _is_manifest_file(name):
+                        with open(os.path.join(path, name)) as f:
+                            manifest.update(json.load(f))
+        except Exception as e:
+            logger.warning(f"unable to read the manifest of checkpoint {storage_id}: {e}")
+            return None
+        if not manifest:
+            return None
+        return storage_id, manifest
+
     def _resolve_conflicts(
         self, resources: Dict[str, int], conflicts: Dict[str, List[int]], ckpt_dir: Optional[str]
     ) -> Dict[str, int]:
@@ -473,7 +728,11 @@ class CheckpointContext:
 
     @contextlib.contextmanager
     def store_path(
-        self, metadata: Optional[Dict[str, Any]] = None, *, shard: bool = False
+        self,
+        metadata: Optional[Dict[str, Any]] = None,
+        *,
+        shard: bool = False,
+        background: bool = False,
     ) -> Iterator[Tuple[pathlib.Path, str]]:
         """
         ``store_path()`` is a context manager which chooses a random path and prepares a directory
@@ -492,6 +751,11 @@ class CheckpointContext:
         When ``shard=True``, ``store_path()`` becomes a synchronization point between workers, so
         all workers must call store_path(), even workers which will not write any checkpoint files.
 
+        When ``background=True``, the context manager exits as soon as the checkpoint has been
+        written, and the checkpoint is uploaded and reported to the master on a background thread.
+        See :meth:`wait` for waiting on background uploads.  Background uploads are not supported
+        with ``shard=True``.
+
         Example:
 
         .. code::
@@ -502,13 +766,16 @@ class CheckpointContext:
                    print(f"done saving checkpoint {storage_id}")
                print(f"done uploading checkpoint {storage_id}")
         """
+        if background and shard:
+            raise ValueError("cannot call .store_path(shard=True, background=True)")
+
         if not shard:
-            return self._store_path_single(metadata)
+            return self._store_path_single(metadata, background=background)
         else:
             return self._store_path_sharded(metadata)
 
     def _store_path_single(
-        self, metadata: Optional[Dict[str, Any]] = None
+        self, metadata: Optional[Dict[str, Any]] = None, background: bool = False
     ) -> Iterator[Tuple[pathlib.Path, str]]:
         logger.debug(f"Getting path for storage (metadata={metadata})")
         if self._dist.rank != 0:
@@ -518,6 +785,32 @@ class CheckpointContext:
             )
 
         storage_id = str(uuid.uuid4())
+        if background:
+            # Nothing else writes to the store path, so it doubles as the snapshot.
+            path = self._storage_manager.pre_store_path(storage_id)
+            submitted = False
+            try:
+                yield path, storage_id
+                self._write_metadata_file(os.fspath(path), metadata or {})
+                resources = self._storage_manager._list_directory(path)
+
+                def finish() -> None:
+                    try:
+                        self._storage_manager.post_store_path(path, storage_id)
+                    except BaseException:
+                        shutil.rmtree(path, ignore_errors=True)
+                        raise
+                    self._report_checkpoint(storage_id, resources, metadata, sync_tensorboard=False)
+
+                # submit() may re-raise the error of an earlier upload.
+                self._background.submit(storage_id, finish)
+                submitted = True
+            finally:
+                # A checkpoint which is never uploaded must not be left behind on disk.
+                if not submitted:
+                    shutil.rmtree(path, ignore_errors=True)
+            return
+
         with self._storage_manager.store_path(storage_id) as path:
             yield path, storage_id
             self._write_metadata_file(os.fspath(path), metadata or {})
@@ -675,12 +968,51 @@ class CheckpointContext:
                 # Tell local chief we're done.
                 _ = self._dist.gather_local(None)
 
+    def open(
+        self,
+        storage_id: str,
+        path: str,
+        *,
+        block_size: Optional[int] = None,
+        cache_blocks: Optional[int] = None,
+    ) -> BinaryIO:
+        """
+        ``open()`` opens one file of a checkpoint for reading, without downloading the checkpoint.
+
+        For cloud storage backends, only the blocks of ``block_size`` bytes which are actually read
+        are fetched from checkpoint storage, with up to ``cache_blocks`` of them cached in memory.
+        Unlike ``restore_path()``, there is no coordination between workers; each worker which
+        calls ``open()`` reads only what it needs.
+
+        Example:
+
+        .. code::
+
+           shard = core_context.distributed.rank
+           with core_context.checkpoint.open(storage_id, f"shard-{shard}.pt") as f:
+               my_model.load_shard(torch.load(f))
+        """
+        return self._storage_manager.open(
+            storage_id, path, block_size=block_size, cache_blocks=cache_blocks
+        )
+
     def delete(self, storage_id: str) -> None:
         """
         Delete a checkpoint from the storage backend.
         """
         self._storage_manager.delete(storage_id, ["**/*"])
 
+    def wait(self) -> None:
+        """
+        ``wait()`` blocks until every checkpoint saved with ``background=True`` has been uploaded
+        and reported to the master, and re-raises the first error from any of those uploads.
+
+        Checkpoints which have not finished uploading are not visible to the master, so call
+        ``wait()`` before exiting after a preemption signal.  Exiting the ``core.Context`` returned
+        by :meth:`core.init() <determined.core.init>` calls ``wait()`` automatically.
+        """
+        self._background.wait()
+
     def _write_metadata_file(self, ckpt_dir: str, metadata: Dict[str, Any]) -> None:
         metadata_path = pathlib.Path(ckpt_dir).joinpath("metadata.json")
         with metadata_path.open("w") as f:
@@ -691,9 +1023,13 @@ class CheckpointContext:
         storage_id: str,
         resources: Optional[Dict[str, int]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        sync_tensorboard: bool = True,
     ) -> None:
         """
         After having uploaded a checkpoint, report its existence to the master.
+
+        Background uploads pass sync_tensorboard=False, leaving tensorboard to be synced by the
+        next sync on the main thread, which is where every other sync happens.
         """
         resources = resources or {}
         metadata = metadata or {}
@@ -719,7 +1055,7 @@ class CheckpointContext:
         logger.info(f"Reported checkpoint to master {storage_id}")
 
         # Also sync tensorboard.
-        if self._tensorboard_mode == core.TensorboardMode.AUTO:
+        if sync_tensorboard and self._tensorboard_mode == core.TensorboardMode.AUTO:
             assert self._tensorboard_manager is not None
             self._tensorboard_manager.sync()
 
@@ -729,15 +1065,22 @@ class DummyCheckpointContext(CheckpointContext):
         self,
         dist: core.DistributedContext,
         storage_manager: storage.StorageManager,
+        max_background_uploads: int = 2,
+        latest_checkpoint: Optional[str] = None,
     ) -> None:
         self._dist = dist
         self._storage_manager = storage_manager
+        self._last_manifest = None
+        self._dedup_lock = threading.Lock()
+        self._manifest_source = latest_checkpoint
+        self._background = _BackgroundUploader(max_background_uploads)
 
     def _report_checkpoint(
         self,
         storage_id: str,
         resources: Optional[Dict[str, int]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        sync_tensorboard: bool = True,
     ) -> None:
         # No master to report to; just log the event.
         logger.info(f"saved checkpoint {storage_id}")
@@ -79,14 +79,18 @@ class Context:
         exc_val: Optional[BaseException] = None,
         exc_tb: Optional[types.TracebackType] = None,
     ) -> None:
-        self.preempt.close()
-        self.distributed.close()
-        if self._tensorboard_manager is not None:
-            self._tensorboard_manager.close()
-        if self._heartbeat is not None:
-            self._heartbeat.close(exc_type, exc_val, exc_tb)
-        if self._log_shipper is not None:
-            self._log_shipper.close(exc_type, exc_val, exc_tb)
+        try:
+            # Finish any background checkpoint uploads before tearing anything else down.
+            self.checkpoint.wait()
+        finally:
+            self.preempt.close()
+            self.distributed.close()
+            if self._tensorboard_manager is not None:
+                self._tensorboard_manager.close()
+            if self._heartbeat is not None:
+                self._heartbeat.close(exc_type, exc_val, exc_tb)
+            if self._log_shipper is not None:
+                self._log_shipper.close(exc_type, exc_val, exc_tb)
 
     def __exit__(
         self,
@@ -228,6 +232,8 @@ def init(
     cert = certs.default_load(info.master_url)
     utp = authentication.login_with_cache(info.master_url, cert=cert)
     session = api.Session(info.master_url, utp, cert, max_retries=util.get_max_retries_config())
+    # Every thread which talks to the master shares one set of connections.
+    session = api.MultiplexedSession(session)
 
     if distributed is None:
         if len(info.container_addrs) > 1 or len(info.slot_ids) > 1:
@@ -300,6 +306,7 @@ def init(
             tensorboard_mode,
             tensorboard_manager,
             run_prepare_response.storageId,
+            latest_checkpoint=info.latest_checkpoint,
         )
 
         preempt = core.PreemptContext(session, info.allocation_id, distributed, preempt_mode)
@@ -332,7 +339,7 @@ def _run_prepare(
     sess: api.Session,
     run_id: int,
     checkpoint_storage: Optional[Union[str, Dict[str, Any]]],
-) -> bindings.v1RunPrepareForReportingResponse:
+) -> "bindings.v1RunPrepareForReportingResponse":
     cs = None
     if isinstance(checkpoint_storage, str):
         cs = shared._shortcut_to_config(checkpoint_storage)
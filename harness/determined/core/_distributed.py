@@ -2,7 +2,7 @@ import logging
 import os
 import socket
 import tempfile
-from typing import Any, Callable, List, Optional, TypeVar
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
 
 from determined import constants, ipc, util
 
@@ -24,6 +24,11 @@ class DistributedContext:
     Additionally, any time that cross_size > 1, you must also provide:
      - chief_ip: the ip address to reach the chief worker (where rank==0)
 
+    When ``hierarchical`` is true, collective operations go through each machine's local chief:
+    workers only talk to their local chief, and only the local chiefs talk to the chief, so the
+    chief handles ``cross_size`` messages per operation instead of ``size``.  This adds a hop for
+    every operation, so it only pays off with many workers per machine across many machines.
+
     .. note::
 
        DistributedContext has ``.allgather()``, ``.gather()``, and ``.broadcast()`` methods, which
@@ -46,6 +51,7 @@ class DistributedContext:
         pull_port: int = constants.INTER_TRAIN_PROCESS_COMM_PORT_2,
         port_offset: int = 0,
         force_tcp: bool = False,
+        hierarchical: bool = False,
     ) -> None:
         rank_args = (rank, size, local_rank, local_size, cross_rank, cross_size)
         if sum(x is not None for x in rank_args) not in (0, 6):
@@ -82,8 +88,14 @@ class DistributedContext:
 
         self._closed = False
 
+        # Initialization always uses the flat topology, since workers find their local chief with
+        # a global allgather.
+        self._hierarchical = False
         self._init_ipc(force_tcp)
 
+        if hierarchical and self.size > 1:
+            self._init_hierarchical()
+
     def _init_ipc(self, force_tcp: bool) -> None:
         if self.size < 2:
             # No broadcasting necessary.
@@ -163,6 +175,22 @@ class DistributedContext:
             self._local_worker_zmq = ipc.ZMQBroadcastClient(pub_url, pull_url)
             self._local_worker_zmq.safe_start()
 
+    def _init_hierarchical(self) -> None:
+        # Hierarchical collectives assume the chief is also the local chief of its machine, which
+        # holds for every launcher we support, but be defensive about it.
+        chief_is_local_chief = self.broadcast(self._is_local_chief)
+        if not chief_is_local_chief:
+            logger.debug("Chief is not a local chief; not using hierarchical collectives.")
+            return
+
+        # Only local chiefs stay connected to the chief; other workers go through their local chief.
+        is_global_client = self.allgather(self._is_local_chief and not self._is_chief)
+        if self._is_chief:
+            self._chief_zmq.set_num_connections(sum(is_global_client))
+        elif not self._is_local_chief:
+            self._worker_zmq.close()
+        self._hierarchical = True
+
     @classmethod
     def from_horovod(cls, hvd: Any, chief_ip: Optional[str] = None) -> "DistributedContext":
         """
@@ -240,7 +268,8 @@ class DistributedContext:
         # Global broadcast server.
         if self._is_chief:
             self._chief_zmq.close()
-        else:
+        elif self._is_local_chief or not self._hierarchical:
+            # Hierarchical workers closed their global client during initialization.
             self._worker_zmq.close()
 
         if self.local_size < 2:
@@ -294,6 +323,8 @@ class DistributedContext:
         """
         if self.size < 2:
             return [stuff]
+        if self._hierarchical:
+            return self._gather_hierarchical(stuff)
         logger.debug(f"Worker {self.get_rank()} beginning zmq gather.")
         if self._is_chief:
             worker_stuff_ranked = self._chief_zmq.gather()
@@ -343,6 +374,8 @@ class DistributedContext:
         """
         if self.size < 2:
             return [stuff]
+        if self._hierarchical:
+            return self._allgather_hierarchical(stuff)
         logger.debug(f"Worker {self.get_rank()} beginning zmq allgather.")
         if self._is_chief:
             worker_stuff_ranked = self._chief_zmq.gather()
@@ -385,6 +418,8 @@ class DistributedContext:
         """
         if self.size < 2:
             return stuff
+        if self._hierarchical:
+            return self._broadcast_from_chief(stuff)
         if self._is_chief:
             self._chief_zmq.broadcast(stuff)
         else:
@@ -406,6 +441,67 @@ class DistributedContext:
             stuff = self._local_worker_zmq.recv()
         return stuff
 
+    def _gather_to_local_chief(self, stuff: Any) -> Optional[List[Tuple[int, Any]]]:
+        """
+        Send (rank, stuff) to the local chief, which returns the pairs for its whole machine.
+        """
+        if not self._is_local_chief:
+            self._local_worker_zmq.send((self.rank, stuff))
+            return None
+        ranked = [(self.rank, stuff)]
+        if self.local_size > 1:
+            ranked.extend(self._local_chief_zmq.gather())
+        return ranked
+
+    def _gather_to_chief(self, ranked: List[Tuple[int, Any]]) -> Optional[List]:
+        """
+        Called by local chiefs: gather every machine's (rank, stuff) pairs to the chief, which
+        returns all of the stuff in rank order.
+        """
+        if not self._is_chief:
+            self._worker_zmq.send(ranked)
+            return None
+        for machine in self._chief_zmq.gather():
+            ranked.extend(machine)
+        ranked.sort(key=lambda x: x[0])
+        return [stuff for _, stuff in ranked]
+
+    def _broadcast_from_chief(self, stuff: Any) -> Any:
+        """
+        Every worker gets the stuff sent by the chief, relayed by its local chief.
+        """
+        if self._is_chief:
+            self._chief_zmq.broadcast(stuff)
+        elif self._is_local_chief:
+            stuff = self._worker_zmq.recv()
+        else:
+            return self._local_worker_zmq.recv()
+        if self.local_size > 1:
+            self._local_chief_zmq.broadcast(stuff)
+        return stuff
+
+    def _gather_hierarchical(self, stuff: Any) -> Optional[List]:
+        logger.debug(f"Worker {self.get_rank()} beginning hierarchical gather.")
+        ranked = self._gather_to_local_chief(stuff)
+        out = None
+        if ranked is not None:
+            out = self._gather_to_chief(ranked)
+        # Synchronize with the chief so that there is no risk of accidentally calling send() for a
+        # future gather before all workers have called send() on this gather.
+        self._broadcast_from_chief(None)
+        logger.debug(f"Worker {self.get_rank()} finished hierarchical gather.")
+        return out
+
+    def _allgather_hierarchical(self, stuff: Any) -> List:
+        logger.debug(f"Worker {self.get_rank()} beginning hierarchical allgather.")
+        ranked = self._gather_to_local_chief(stuff)
+        all_stuff = None
+        if ranked is not None:
+            all_stuff = self._gather_to_chief(ranked)
+        all_stuff = self._broadcast_from_chief(all_stuff)
+        logger.debug(f"Worker {self.get_rank()} finished hierarchical allgather.")
+        return all_stuff  # type: ignore
+
 
 class DummyDistributedContext(DistributedContext):
     def __init__(self) -> None:
@@ -128,7 +128,7 @@ class _UnmanagedTrialHeartbeat(_Heartbeat):
 
         return self
 
-    def _update_state(self, state: bindings.trialv1State) -> None:
+    def _update_state(self, state: "bindings.trialv1State") -> None:
         body = bindings.v1PatchTrialRequest(trialId=self._trial_id, state=state)
         bindings.patch_PatchTrial(session=self._session, body=body, trialId=self._trial_id)
 
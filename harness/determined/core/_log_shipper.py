@@ -1,6 +1,8 @@
 import atexit
 import collections
 import datetime
+import gzip
+import json
 import logging
 import queue
 import sys
@@ -22,7 +24,7 @@ class _LogShipper:
         session: api.Session,
         trial_id: int,
         task_id: str,
-        distributed: Optional[core.DistributedContext] = None
+        distributed: Optional[core.DistributedContext] = None,
     ) -> None:
         self._session = session
         self._trial_id = trial_id
@@ -77,10 +79,25 @@ class _Interceptor:
 
 
 SHIPPER_FLUSH_INTERVAL = 1
+SHIPPER_MAX_FLUSH_INTERVAL = 16
 SHIPPER_FAILURE_BACKOFF_SECONDS = 1
+SHIPPER_MAX_RETRIES = 5
 LOG_BATCH_MAX_SIZE = 1000
+LOG_BATCH_MAX_BYTES = 4 * 1024 * 1024
 SHIP_QUEUE_MAX_SIZE = 3 * LOG_BATCH_MAX_SIZE
 
+# Request bodies smaller than this are sent uncompressed.
+SHIPPER_GZIP_MIN_BYTES = 1024
+
+# Under the "sample" overflow policy, once the queue is half full only one of every
+# SHIPPER_SAMPLE_RATE writes is kept.
+SHIPPER_SAMPLE_RATE = 10
+
+# What to do with writes to stdout or stderr when logs are produced faster than they can be shipped:
+# "block" waits for room in the queue, "drop" discards writes while the queue is full, and "sample"
+# keeps a fraction of writes once the queue starts to fill up and drops the rest when it is full.
+OVERFLOW_POLICIES = ("block", "drop", "sample")
+
 
 class _ShutdownMessage:
     pass
@@ -90,17 +107,60 @@ _QueueElement = Union[str, _ShutdownMessage]
 
 
 class _LogSender(threading.Thread):
-    def __init__(self, session: api.Session, logs_metadata: Dict) -> None:
+    """
+    _LogSender ships everything written to stdout and stderr to the master in batches.
+
+    Each batch is one request in columnar form, where the metadata shared by every line is sent once
+    alongside a list of lines, and larger bodies are gzip-compressed.  When the master is slow or
+    failing the sender backs off and ships less often, so that each request carries a bigger batch.
+    Writes never block the training process unless the overflow policy is "block"; instead, writes
+    which do not fit in the queue are counted and a summary line is shipped in their place.  Lines
+    which the master does not accept even after retries are counted and summarized the same way.
+    """
+
+    def __init__(self, session: api.Session, logs_metadata: Dict, overflow: str = "drop") -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, not {overflow!r}")
         self._queue = queue.Queue(maxsize=SHIP_QUEUE_MAX_SIZE)  # type: queue.Queue[_QueueElement]
-        self._logs = collections.deque()  # type: collections.deque[str]
         self._session = session
         self._logs_metadata = logs_metadata
-        self._buf = ""
+        self._overflow = overflow
+
+        # Complete lines waiting to be shipped, and the pieces of the current partial line.
+        self._lines = collections.deque()  # type: collections.deque[str]
+        self._partial = []  # type: List[str]
+
+        self._flush_interval = float(SHIPPER_FLUSH_INTERVAL)
+        self._failures = 0
+
+        # Counters, which are only updated under self._lock.  Writes are dropped when the queue
+        # overflows, before they are split into lines; lines are dropped when shipping them fails.
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.dropped_writes = 0
+        self.dropped_lines = 0
+        self.shipped = 0
 
         super().__init__(daemon=True, name="LogSenderThread")
 
     def write(self, data: str) -> None:
-        self._queue.put(data)
+        if self._overflow == "block":
+            self._queue.put(data)
+            return
+
+        with self._lock:
+            self._writes += 1
+            if (
+                self._overflow == "sample"
+                and self._queue.qsize() >= SHIP_QUEUE_MAX_SIZE // 2
+                and self._writes % SHIPPER_SAMPLE_RATE
+            ):
+                self.dropped_writes += 1
+                return
+            try:
+                self._queue.put_nowait(data)
+            except queue.Full:
+                self.dropped_writes += 1
 
     def close(self) -> None:
         self._queue.put(_ShutdownMessage())
@@ -126,45 +186,102 @@ class _LogSender(threading.Thread):
 
     def run(self) -> None:
         while True:
-            deadline = time.time() + SHIPPER_FLUSH_INTERVAL
+            deadline = time.time() + self._flush_interval
             for m in self._pop_until_deadline(deadline):
                 if isinstance(m, _ShutdownMessage):
-                    self.ship()
+                    self._append("".join(self._partial), final=True)
+                    self.ship(final=True)
                     return
 
-                self._logs.append(m)
-                if len(self._logs) >= LOG_BATCH_MAX_SIZE:
+                self._append(m)
+                if len(self._lines) >= LOG_BATCH_MAX_SIZE:
                     self.ship()
 
             self.ship()
 
-    def ship(self) -> None:
-        if len(self._logs) == 0:
+    def _append(self, data: str, final: bool = False) -> None:
+        """
+        Split data into lines, carrying any trailing partial line over to the next write.
+        """
+        if "\n" not in data:
+            if final and data:
+                self._lines.append(data)
+            elif data:
+                self._partial.append(data)
             return
 
-        msgs = []
-
-        while len(self._logs):
-            data = self._logs.popleft()
-            self._buf += data
-            while "\n" in self._buf:
-                idx = self._buf.index("\n") + 1
-                line = self._buf[:idx]
-                self._buf = self._buf[idx:]
-
-                msg = dict(self._logs_metadata)
-                msg["log"] = line
-                msgs.append(msg)
-
-            if len(msgs) > LOG_BATCH_MAX_SIZE:
-                self._ship(msgs)
-                msgs = []
-
-        if len(msgs) > 0:
-            self._ship(msgs)
-
-    def _ship(self, msgs: List[Dict]) -> None:
-        self._session.post("task-logs", json=msgs)
+        pieces = data.split("\n")
+        self._partial.append(pieces[0])
+        self._lines.append("".join(self._partial) + "\n")
+        self._lines.extend(p + "\n" for p in pieces[1:-1])
+        self._partial = [pieces[-1]] if pieces[-1] else []
+
+    def ship(self, final: bool = False) -> None:
+        with self._lock:
+            dropped_writes, self.dropped_writes = self.dropped_writes, 0
+            dropped_lines, self.dropped_lines = self.dropped_lines, 0
+        if dropped_writes:
+            self._lines.append(
+                f"[determined] {dropped_writes} writes to stdout/stderr were not shipped because "
+                "logs were produced faster than they could be sent to the master\n"
+            )
+        if dropped_lines:
+            self._lines.append(
+                f"[determined] {dropped_lines} lines of stdout/stderr were not shipped because the "
+                "master did not accept them\n"
+            )
+
+        while self._lines:
+            batch = []  # type: List[str]
+            nbytes = 0
+            while self._lines and len(batch) < LOG_BATCH_MAX_SIZE and nbytes < LOG_BATCH_MAX_BYTES:
+                line = self._lines.popleft()
+                batch.append(line)
+                nbytes += len(line)
+
+            if not self._ship_with_retries(batch, final):
+                # Give up on everything buffered so far rather than blocking the queue forever.
+                with self._lock:
+                    self.dropped_lines += len(batch) + len(self._lines)
+                self._lines.clear()
+                return
+
+    def _ship_with_retries(self, batch: List[str], final: bool) -> bool:
+        retries = 0 if final else SHIPPER_MAX_RETRIES
+        while True:
+            start = time.time()
+            try:
+                self._ship(batch)
+            except Exception as e:
+                self._failures += 1
+                self._flush_interval = min(self._flush_interval * 2, SHIPPER_MAX_FLUSH_INTERVAL)
+                if retries <= 0:
+                    logger.warning(f"Failed to ship {len(batch)} log lines, dropping them: {e}")
+                    return False
+                retries -= 1
+                time.sleep(SHIPPER_FAILURE_BACKOFF_SECONDS * min(2**self._failures, 16))
+                continue
+
+            self._failures = 0
+            with self._lock:
+                self.shipped += len(batch)
+
+            # Ship less often while the master is slow to respond, so that each request carries a
+            # bigger batch, and recover once it is responsive again.
+            elapsed = time.time() - start
+            if elapsed > self._flush_interval / 2:
+                self._flush_interval = min(self._flush_interval * 2, SHIPPER_MAX_FLUSH_INTERVAL)
+            else:
+                self._flush_interval = max(self._flush_interval / 2, SHIPPER_FLUSH_INTERVAL)
+            return True
+
+    def _ship(self, lines: List[str]) -> None:
+        body = json.dumps({"metadata": self._logs_metadata, "logs": lines}).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if len(body) >= SHIPPER_GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        self._session.post("task-logs", data=body, headers=headers)
 
 
 class _UnmanagedTrialLogShipper(_LogShipper):
@@ -55,6 +55,9 @@ def _make_v2_context(
         else:
             session = client._session
 
+    # Every thread which talks to the master shares one set of connections.
+    session = api.MultiplexedSession(session)
+
     # TODO(ilia): we used to require explicit distributed context for distributed training jobs,
     # not anymore.
     distributed = distributed or core.DummyDistributedContext()
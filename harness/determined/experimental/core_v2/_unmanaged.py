@@ -141,7 +141,7 @@ def _start_trial_inner(
     client: experimental.Determined,
     trial_id: int,
     resume: bool,
-) -> bindings.v1StartTrialResponse:
+) -> "bindings.v1StartTrialResponse":
     sess = client._session
     assert sess
 
@@ -156,7 +156,7 @@ def _start_trial(
     trial_id: int,
     resume: bool,
     distributed: Optional[core.DistributedContext] = None,
-) -> bindings.v1StartTrialResponse:
+) -> "bindings.v1StartTrialResponse":
     return core._run_on_rank_0_and_broadcast(
         lambda: _start_trial_inner(client, trial_id, resume), distributed
     )
@@ -1,5 +1,6 @@
 import logging
 import os
+import pickle
 import selectors
 import signal
 import socket
@@ -31,6 +32,32 @@ class _SerialMessage:
         self.payload = payload
 
 
+def _send_obj(socket: Any, obj: Any) -> None:
+    """
+    Send a pickled object as a multipart message.
+
+    With pickle protocol 5, large contiguous buffers (like numpy arrays) are not copied into the
+    pickle at all: they are sent as their own zero-copy frames, and the receiver unpickles directly
+    from the received frames.  Older pythons fall back to a single in-band pickle.
+    """
+    if pickle.HIGHEST_PROTOCOL < 5:
+        socket.send_pyobj(obj)
+        return
+    buffers = []  # type: List[Any]
+    header = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    socket.send_multipart([header, *(b.raw() for b in buffers)], copy=False)
+
+
+def _recv_obj(socket: Any) -> Any:
+    """
+    Receive an object sent by _send_obj().
+    """
+    if pickle.HIGHEST_PROTOCOL < 5:
+        return socket.recv_pyobj()
+    frames = socket.recv_multipart(copy=False)
+    return pickle.loads(frames[0].buffer, buffers=[f.buffer for f in frames[1:]])
+
+
 class ZMQBroadcastServer:
     """
     Similar to ZMQServer except with broadcast/gather semantics on exactly two ports.
@@ -90,6 +117,12 @@ class ZMQBroadcastServer:
         self._send_serial = 0
         self._recv_serial = 0
 
+    def set_num_connections(self, num_connections: int) -> None:
+        """
+        Change how many messages gather() waits for, after some clients have stopped participating.
+        """
+        self._num_connections = num_connections
+
     def safe_start(self) -> None:
         """
         Broadcast Hello messages over and over until all clients respond with a Hello message.
@@ -144,7 +177,8 @@ class ZMQBroadcastServer:
         Broadcast a message object to each connection.
         """
 
-        self._pub_socket.send_pyobj(_SerialMessage(self._send_serial, obj))
+        if self._num_connections > 0:
+            _send_obj(self._pub_socket, _SerialMessage(self._send_serial, obj))
         self._send_serial += 1
 
     def gather(self) -> List[Any]:
@@ -159,7 +193,7 @@ class ZMQBroadcastServer:
         Receive one _SerialMessage from the socket and confirm that it is in-order.
         """
 
-        obj = self._pull_socket.recv_pyobj()
+        obj = _recv_obj(self._pull_socket)
 
         if not isinstance(obj, _SerialMessage):
             raise RuntimeError(f"non-_SerialMessage: {type(obj).__name__}")
@@ -227,10 +261,10 @@ class ZMQBroadcastClient:
     def send(self, obj: Any) -> None:
         message = _SerialMessage(self._send_serial, obj)
         self._send_serial += 1
-        self._push_socket.send_pyobj(message)
+        _send_obj(self._push_socket, message)
 
     def recv(self) -> Any:
-        obj = self._sub_socket.recv_pyobj()
+        obj = _recv_obj(self._sub_socket)
 
         if not isinstance(obj, _SerialMessage):
             raise RuntimeError(f"non-_SerialMessage: {type(obj).__name__}")
@@ -23,6 +23,8 @@ from determined.pytorch._metric_utils import (
     _reduce_metrics,
     _convert_metrics_to_numpy,
     _log_tb_metrics,
+    _TrainingMetricAccumulator,
+    _ValidationMetricAccumulator,
 )
 from determined.pytorch._experimental import PyTorchExperimentalContext
 from determined.pytorch._pytorch_context import PyTorchTrialContext
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 import numpy as np
 import torch
@@ -30,36 +30,78 @@ def _average_training_metrics(
     combined_timeseries: Dict[str, Any], combined_num_batches: List[int]
 ) -> List[Dict[str, Any]]:
     """Average combined training metrics across GPUs"""
-    # If the value for a metric is a single-element array, the averaging process will
-    # change that into just the element. We record what metrics are single-element arrays
-    # so we can wrap them in an array later (for perfect compatibility with non-averaging
-    # codepath).
-    array_metrics = []
-    for metric_name in combined_timeseries.keys():
-        process_batches = combined_timeseries[metric_name]
-        if isinstance(process_batches[0][0], np.ndarray):
-            array_metrics.append(metric_name)
-
     num_batches = combined_num_batches[0]  # num_batches matches across data parallel ranks.
-    num_processes = len(combined_num_batches)
     averaged_metrics_timeseries = {}  # type: Dict[str, List]
 
-    for metric_name in combined_timeseries.keys():
-        averaged_metrics_timeseries[metric_name] = []
-        for batch_idx in range(num_batches):
-            batch = [
-                combined_timeseries[metric_name][process_idx][batch_idx]
-                for process_idx in range(num_processes)
-            ]
-
-            np_batch = np.array(batch)
-            batch_avg = np.mean(np_batch[np_batch != None])  # noqa: E711
-            if metric_name in array_metrics:
-                batch_avg = np.array(batch_avg)
-            averaged_metrics_timeseries[metric_name].append(batch_avg)
+    for metric_name, process_batches in combined_timeseries.items():
+        process_batches = [batches[:num_batches] for batches in process_batches]
+        averages = _stack_and_average(process_batches, num_batches)
+        if averages is None:
+            averages = _average_each_batch(process_batches, num_batches)
+        # If the value for a metric is a single-element array, the averaging process will
+        # change that into just the element. Wrap those averages in an array again, for perfect
+        # compatibility with the non-averaging codepath.
+        if isinstance(process_batches[0][0], np.ndarray):
+            averages = [np.array(avg) for avg in averages]
+        averaged_metrics_timeseries[metric_name] = averages
     return util._dict_to_list(averaged_metrics_timeseries)
 
 
+def _stack_and_average(process_batches: List[List[Any]], num_batches: int) -> Optional[List[Any]]:
+    """
+    Average one metric across processes for every batch at once, by stacking its values into a
+    single (process, batch, element) array and masking out missing (None) values.
+
+    Returns None if the values cannot be stacked, like strings or arrays whose shape differs.
+    """
+    if any(isinstance(v, str) for v in process_batches[0]):
+        # np.asarray() would happily parse numeric strings.
+        return None
+    try:
+        stacked = np.asarray(process_batches, dtype=np.float64)
+    except (TypeError, ValueError):
+        stacked = None
+
+    # np.asarray() turns missing scalars into nan, so only look for them if there are any nans.
+    present = None
+    if stacked is None or np.isnan(stacked).any():
+        present = np.array([[v is not None for v in batches] for batches in process_batches])
+        if not present.any():
+            return [np.float64(np.nan)] * num_batches
+        if not present.all():
+            # Replace missing values with zeros of the same shape as the reported ones.
+            i, j = np.argwhere(present)[0]
+            zeros = np.zeros_like(np.asarray(process_batches[i][j], dtype=np.float64))
+            filled = [[zeros if v is None else v for v in batches] for batches in process_batches]
+            try:
+                stacked = np.asarray(filled, dtype=np.float64)
+            except (TypeError, ValueError):
+                return None
+        elif stacked is None:
+            return None
+    if stacked.ndim < 2 or stacked.shape[:2] != (len(process_batches), num_batches):
+        return None
+
+    stacked = stacked.reshape(stacked.shape[0], num_batches, -1)
+    if present is None or present.all():
+        averages = stacked.mean(axis=(0, 2))
+    else:
+        sums = stacked.sum(axis=(0, 2), where=present[:, :, None])
+        counts = present.sum(axis=0) * stacked.shape[2]
+        # Batches where every process was missing the metric average to nan, like np.mean([]).
+        with np.errstate(invalid="ignore", divide="ignore"):
+            averages = sums / counts
+    return list(averages)
+
+
+def _average_each_batch(process_batches: List[List[Any]], num_batches: int) -> List[Any]:
+    averages = []
+    for batch_idx in range(num_batches):
+        np_batch = np.array([batches[batch_idx] for batches in process_batches])
+        averages.append(np.mean(np_batch[np_batch != None]))  # noqa: E711
+    return averages
+
+
 def _combine_metrics_across_processes(
     context: det.core.DistributedContext, metrics: Dict[str, Any], num_batches: int
 ) -> Tuple[Optional[Dict[str, Any]], Optional[List[int]]]:
@@ -102,6 +144,180 @@ def _combine_and_average_training_metrics(
     return per_batch_metrics
 
 
+def _to_accumulator_dtype(value: torch.Tensor) -> torch.Tensor:
+    # Accumulating in float64 avoids drifting over long reporting periods; MPS lacks it.
+    dtype = torch.float32 if value.device.type == "mps" else torch.float64
+    return value.detach().to(dtype)
+
+
+class _TrainingMetricAccumulator:
+    """
+    Accumulate the training metrics from each batch without copying them off of the device.
+
+    Tensor metrics are added into a running sum on their own device, and are only copied to the
+    host by reduce(), once per reporting period, so training does not wait on a device-to-host copy
+    after every batch.  Every batch_metrics_period-th batch is also kept for batch_metrics; with a
+    period of None no per-batch metrics are kept at all.
+    """
+
+    def __init__(self, batch_metrics_period: Optional[int] = None) -> None:
+        self._period = batch_metrics_period
+        self._num_batches = 0
+        self._sums = {}  # type: Dict[str, Any]
+        self._counts = {}  # type: Dict[str, int]
+        # Metrics which cannot be summed, like strings, are reported with an average of None.
+        self._unsummable = set()  # type: Set[str]
+        self._batches = []  # type: List[Dict[str, Any]]
+
+    def __len__(self) -> int:
+        return self._num_batches
+
+    def add(self, metrics: Dict[str, Any]) -> None:
+        self._num_batches += 1
+        keep = self._period is not None and self._num_batches % self._period == 0
+        for name, value in metrics.items():
+            if isinstance(value, torch.Tensor):
+                value = value.detach()
+            if keep:
+                metrics[name] = value.clone() if isinstance(value, torch.Tensor) else value
+            if value is None or name in self._unsummable:
+                continue
+            if isinstance(value, torch.Tensor):
+                value = _to_accumulator_dtype(value)
+            elif not util.is_numerical_scalar(value) and not isinstance(value, np.ndarray):
+                self._unsummable.add(name)
+                self._sums.pop(name, None)
+                continue
+            try:
+                self._sums[name] = self._sums[name] + value if name in self._sums else value
+            except (RuntimeError, ValueError):
+                # Metrics whose shape changes from batch to batch cannot be averaged.
+                self._unsummable.add(name)
+                self._sums.pop(name, None)
+                continue
+            self._counts[name] = self._counts.get(name, 0) + 1
+        if keep:
+            self._batches.append(metrics)
+
+    def reduce(self, context: det.core.DistributedContext) -> Dict[str, Any]:
+        """
+        Copy the accumulated metrics to the host and combine them across ranks.
+
+        Returns metrics in the format of det.util.make_metrics() on the chief, where avg_metrics
+        is the mean over every batch on every rank, and an empty dict on other ranks.
+        """
+        names = set(self._sums) | self._unsummable
+        sums = {
+            name: (s.cpu().numpy() if isinstance(s, torch.Tensor) else np.asarray(s))
+            for name, s in self._sums.items()
+        }
+        batch_metrics = [_convert_metrics_to_numpy(m) for m in self._batches]
+
+        if context.size > 1:
+            gathered = context.gather((names, sums, self._counts, batch_metrics))
+            if context.rank != 0:
+                return {}
+            assert gathered is not None
+            names = set().union(*(g[0] for g in gathered))
+            # A metric which is unsummable on any rank averages to None, as it would on one rank.
+            unsummable = set().union(*(g[0] - set(g[1]) for g in gathered))
+            totals = {}  # type: Dict[str, Any]
+            counts = {}  # type: Dict[str, int]
+            for _, rank_sums, rank_counts, _ in gathered:
+                for name, s in rank_sums.items():
+                    if name in unsummable:
+                        continue
+                    totals[name] = totals[name] + s if name in totals else s
+                    counts[name] = counts.get(name, 0) + rank_counts[name]
+            sums = totals
+            all_batch_metrics = [(util._list_to_dict(g[3]), len(g[3])) for g in gathered]
+            if batch_metrics:
+                batch_metrics = _average_training_metrics(
+                    *_process_combined_metrics_and_batches(all_batch_metrics)
+                )
+        else:
+            counts = self._counts
+
+        avg_metrics = {}  # type: Dict[str, Optional[float]]
+        for name in sorted(names):
+            avg = None
+            if name in sums:
+                try:
+                    avg = np.mean(sums[name] / counts[name]).item()
+                except (TypeError, ValueError):
+                    pass
+            avg_metrics[name] = avg
+        return {"batch_metrics": batch_metrics, "avg_metrics": avg_metrics}
+
+
+class _ValidationMetricAccumulator:
+    """
+    Reduce the validation metrics from each batch as they are produced, according to the
+    pytorch.Reducer of each metric.
+
+    Tensor metrics are reduced on their own device, and only the per-slot reductions are copied to
+    the host by reduce(), so evaluation does not wait on a device-to-host copy after every batch,
+    and memory use does not grow with the number of batches.
+    """
+
+    def __init__(self, metrics_reducers: Dict[str, pytorch.Reducer]) -> None:
+        self._reducers = metrics_reducers
+        self._num_batches = 0
+        self._values = {}  # type: Dict[str, Any]
+
+    def __len__(self) -> int:
+        return self._num_batches
+
+    def add(self, metrics: Dict[str, Any]) -> None:
+        self._num_batches += 1
+        for name, value in metrics.items():
+            if isinstance(value, torch.Tensor):
+                value = _to_accumulator_dtype(value)
+                lib = torch  # type: Any
+            else:
+                value = np.asarray(value, dtype=np.float64)
+                lib = np
+            old = self._values.get(name)
+            if old is None:
+                self._values[name] = value
+                continue
+            if old.shape != value.shape:
+                # Reducing the batches separately would fail in np.stack(), as well.
+                raise ValueError(
+                    f"Validation metric {name} changed shape from {tuple(old.shape)} to "
+                    f"{tuple(value.shape)}; reducing metrics on device requires every batch to "
+                    "return the same shape."
+                )
+            reducer = self._reducers[name]
+            if reducer in (pytorch.Reducer.AVG, pytorch.Reducer.SUM):
+                self._values[name] = old + value
+            elif reducer == pytorch.Reducer.MAX:
+                self._values[name] = lib.maximum(old, value)
+            elif reducer == pytorch.Reducer.MIN:
+                self._values[name] = lib.minimum(old, value)
+            else:
+                raise NotImplementedError
+
+    def reduce(self, context: det.core.DistributedContext) -> Dict[str, Any]:
+        """
+        Copy the per-slot reductions to the host and combine them across slots, like
+        _reduce_metrics().  Only the chief receives the metrics; other ranks get an empty dict.
+        """
+        metrics = {}  # type: Dict[str, Any]
+        for name, value in self._values.items():
+            if isinstance(value, torch.Tensor):
+                value = value.cpu().numpy()
+            reducer = self._reducers[name]
+            if reducer == pytorch.Reducer.AVG:
+                # The mean of every element of every batch, as np.average() of the stacked batches.
+                metrics[name] = np.mean(value) / self._num_batches
+            else:
+                metrics[name] = pytorch._simple_reduce_metrics(reducer, value)
+        return _combine_reduced_metrics(
+            context, metrics, self._num_batches, self._values.keys(), self._reducers
+        )
+
+
 def _prepare_metrics_reducers(
     reducer: Union[pytorch.Reducer, Dict[str, Any]], keys: Any
 ) -> Dict[str, pytorch.Reducer]:
@@ -151,10 +367,19 @@ def _reduce_metrics(
             for name in keys or []
         }
 
+    return _combine_reduced_metrics(context, metrics, len(batch_metrics), keys, metrics_reducers)
+
+
+def _combine_reduced_metrics(
+    context: det.core.DistributedContext,
+    metrics: Dict[str, Any],
+    num_batches: int,
+    keys: Any,
+    metrics_reducers: Dict[str, pytorch.Reducer],
+) -> Dict[str, Any]:
     if context.size > 1:
         # If using distributed training, combine metrics across all processes.
         # Only the chief process will receive all the metrics.
-        num_batches = len(batch_metrics)
         combined_metrics, batches_per_process = _combine_metrics_across_processes(
             context, metrics, num_batches
         )
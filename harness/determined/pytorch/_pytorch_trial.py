@@ -321,17 +321,29 @@ class _PyTorchTrialController:
         # torch.backends.cudnn.deterministic = True
         # torch.backends.cudnn.benchmark = False
 
-    def _aggregate_training_metrics(self, training_metrics: List[Dict]) -> Dict:
+    def _aggregate_training_metrics(
+        self, training_metrics: Union[List[Dict], "pytorch._TrainingMetricAccumulator"]
+    ) -> Dict:
         # Aggregate and reduce training metrics from all the training processes.
-        if self.context.distributed.size > 1:
+        # When batches were only sampled for batch_metrics, their positions no longer map onto
+        # training steps, so TensorBoard only gets the averages.
+        log_batch_metrics = True
+        if isinstance(training_metrics, pytorch._TrainingMetricAccumulator):
             with self.prof.record_timing("average_training_metrics"):
-                batch_metrics = pytorch._combine_and_average_training_metrics(
-                    self.context.distributed, training_metrics
-                )
+                metrics = training_metrics.reduce(self.context.distributed)
+            metrics.setdefault("avg_metrics", {})
+            metrics.setdefault("batch_metrics", [])
+            log_batch_metrics = self.context.experimental._batch_metrics_period == 1
         else:
-            batch_metrics = training_metrics
+            if self.context.distributed.size > 1:
+                with self.prof.record_timing("average_training_metrics"):
+                    batch_metrics = pytorch._combine_and_average_training_metrics(
+                        self.context.distributed, training_metrics
+                    )
+            else:
+                batch_metrics = training_metrics
 
-        metrics = det.util.make_metrics(None, batch_metrics)
+            metrics = det.util.make_metrics(None, batch_metrics)
 
         # Ignore batch_metrics entirely for custom reducers; there's no guarantee that per-batch
         # metrics are even logical for a custom reducer.
@@ -354,7 +366,7 @@ class _PyTorchTrialController:
                 "train",
                 self.state.batches_trained,
                 avg_metrics,
-                batch_metrics,
+                batch_metrics if log_batch_metrics else None,
             )
 
         self.core_context.train.report_training_metrics(
@@ -694,8 +706,12 @@ class _PyTorchTrialController:
 
     def _train_with_boundaries(
         self, training_enumerator: Iterator, train_boundaries: List[_TrainBoundary]
-    ) -> Tuple[List[_TrainBoundary], List]:
-        training_metrics = []
+    ) -> Tuple[List[_TrainBoundary], Union[List, "pytorch._TrainingMetricAccumulator"]]:
+        training_metrics = []  # type: Union[List, pytorch._TrainingMetricAccumulator]
+        if self.context.experimental._training_metrics_on_device:
+            training_metrics = pytorch._TrainingMetricAccumulator(
+                self.context.experimental._batch_metrics_period
+            )
 
         # Start of train step: tell core API and set model mode
         if self.is_chief:
@@ -722,7 +738,10 @@ class _PyTorchTrialController:
                 self._on_epoch_start(epoch_idx)
 
             batch_metrics = self._train_batch(batch=batch, batch_idx=batch_idx, epoch_idx=epoch_idx)
-            training_metrics.append(batch_metrics)
+            if isinstance(training_metrics, pytorch._TrainingMetricAccumulator):
+                training_metrics.add(batch_metrics)
+            else:
+                training_metrics.append(batch_metrics)
             self._step_batch()
 
             # Batch complete: check if any training periods have been reached and exit if any
@@ -917,14 +936,17 @@ class _PyTorchTrialController:
             for lr_scheduler in self.context.lr_schedulers:
                 self._auto_step_lr_scheduler_per_batch(batch_idx, lr_scheduler)
 
-        with self.prof.record_timing("from_device"):
-            for name, metric in training_metrics.items():
-                # Convert PyTorch metric values to NumPy, so that
-                # `det.util.encode_json` handles them properly without
-                # needing a dependency on PyTorch.
-                if isinstance(metric, torch.Tensor):
-                    metric = metric.cpu().detach().numpy()
-                training_metrics[name] = metric
+        # With metrics accumulated on device, nothing is copied to the host until the end of the
+        # reporting period.
+        if not self.context.experimental._training_metrics_on_device:
+            with self.prof.record_timing("from_device"):
+                for name, metric in training_metrics.items():
+                    # Convert PyTorch metric values to NumPy, so that
+                    # `det.util.encode_json` handles them properly without
+                    # needing a dependency on PyTorch.
+                    if isinstance(metric, torch.Tensor):
+                        metric = metric.cpu().detach().numpy()
+                    training_metrics[name] = metric
 
         batch_dur = time.time() - batch_start_time
         samples_per_second = self.trial.get_batch_length(batch) / batch_dur
@@ -962,6 +984,17 @@ class _PyTorchTrialController:
         if self._evaluate_batch_defined():
             keys = None
             batch_metrics = []
+            accumulator = None  # type: Optional[pytorch._ValidationMetricAccumulator]
+            reduce_on_device = self.context.experimental._validation_metrics_on_device
+            if reduce_on_device and any(
+                util.is_overridden(c.on_validation_epoch_end, pytorch.PyTorchCallback)
+                for c in self.callbacks.values()
+            ):
+                logger.warning(
+                    "Not reducing validation metrics on device, because a callback overrides "
+                    "on_validation_epoch_end, which needs the metrics of every batch."
+                )
+                reduce_on_device = False
 
             assert isinstance(self.validation_loader, torch.utils.data.DataLoader)
             if len(self.validation_loader) == 0:
@@ -995,22 +1028,33 @@ class _PyTorchTrialController:
                         "metrics; "
                         f"got {vld_metrics}.",
                     )
-                # TODO: For performance perform -> cpu() only at the end of validation.
-                batch_metrics.append(pytorch._convert_metrics_to_numpy(vld_metrics))
+                if reduce_on_device:
+                    if accumulator is None:
+                        accumulator = pytorch._ValidationMetricAccumulator(
+                            pytorch._prepare_metrics_reducers(
+                                self.trial.evaluation_reducer(), keys=keys
+                            )
+                        )
+                    accumulator.add(vld_metrics)
+                else:
+                    batch_metrics.append(pytorch._convert_metrics_to_numpy(vld_metrics))
                 if self.test_mode:
                     break
 
-            for callback in self.callbacks.values():
-                callback.on_validation_epoch_end(batch_metrics)
-
-            metrics = pytorch._reduce_metrics(
-                self.context.distributed,
-                batch_metrics=batch_metrics,
-                keys=keys,
-                metrics_reducers=pytorch._prepare_metrics_reducers(
-                    self.trial.evaluation_reducer(), keys=keys
-                ),
-            )
+            if accumulator is not None:
+                metrics = accumulator.reduce(self.context.distributed)
+            else:
+                for callback in self.callbacks.values():
+                    callback.on_validation_epoch_end(batch_metrics)
+
+                metrics = pytorch._reduce_metrics(
+                    self.context.distributed,
+                    batch_metrics=batch_metrics,
+                    keys=keys,
+                    metrics_reducers=pytorch._prepare_metrics_reducers(
+                        self.trial.evaluation_reducer(), keys=keys
+                    ),
+                )
 
             # Gather a list of per-worker (num_inputs, num_batches) tuples.
             input_counts = self.context.distributed.gather((num_inputs, idx + 1))
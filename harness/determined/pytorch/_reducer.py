@@ -1,9 +1,14 @@
 import abc
 import enum
 import itertools
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, overload
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, overload
 
 import numpy as np
+import torch
+import torch.distributed as dist
+
+logger = logging.getLogger("determined.pytorch")
 
 
 class Reducer(enum.Enum):
@@ -267,6 +272,119 @@ class _WrappedReducer:
         return result
 
 
+class _PackedLeaf:
+    """
+    A placeholder for a tensor or ndarray which was removed from a per_slot_reduce() output to be
+    gathered separately, as part of one packed buffer.
+    """
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+# Leaves are packed at offsets aligned for any dtype, so they can be viewed in place once gathered.
+_PACK_ALIGNMENT = 16
+
+# A leaf signature is (is_tensor, dtype, shape); dtypes are strings so they compare across ranks.
+_LeafSignature = Tuple[bool, str, Tuple[int, ...]]
+
+
+def _extract_leaves(obj: Any, leaves: List[Any]) -> Any:
+    """
+    Replace every tensor and numeric ndarray in nested lists, tuples, namedtuples, and dicts with a
+    _PackedLeaf, appending the originals to leaves.  Other containers are left alone.
+    """
+    if isinstance(obj, torch.Tensor) or (isinstance(obj, np.ndarray) and obj.dtype.kind in "biufc"):
+        leaves.append(obj)
+        return _PackedLeaf(len(leaves) - 1)
+    if type(obj) is dict:
+        return {k: _extract_leaves(v, leaves) for k, v in obj.items()}
+    if type(obj) in (list, tuple):
+        return type(obj)(_extract_leaves(v, leaves) for v in obj)
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return type(obj)(*(_extract_leaves(v, leaves) for v in obj))
+    return obj
+
+
+def _restore_leaves(obj: Any, leaves: List[Any]) -> Any:
+    if isinstance(obj, _PackedLeaf):
+        return leaves[obj.index]
+    if type(obj) is dict:
+        return {k: _restore_leaves(v, leaves) for k, v in obj.items()}
+    if type(obj) in (list, tuple):
+        return type(obj)(_restore_leaves(v, leaves) for v in obj)
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return type(obj)(*(_restore_leaves(v, leaves) for v in obj))
+    return obj
+
+
+def _leaf_signature(leaf: Any) -> _LeafSignature:
+    if isinstance(leaf, torch.Tensor):
+        return True, str(leaf.dtype), tuple(leaf.shape)
+    return False, leaf.dtype.str, tuple(leaf.shape)
+
+
+def _leaf_bytes(leaf: Any, device: torch.device) -> torch.Tensor:
+    if isinstance(leaf, torch.Tensor):
+        return leaf.detach().to(device).contiguous().view(-1).view(torch.uint8)
+    return torch.from_numpy(np.ascontiguousarray(leaf).reshape(-1).view(np.uint8)).to(device)
+
+
+def _pack_offsets(signatures: List[_LeafSignature], itemsizes: List[int]) -> Tuple[List[int], int]:
+    offsets = []
+    total = 0
+    for (_, _, shape), itemsize in zip(signatures, itemsizes):
+        offsets.append(total)
+        nbytes = int(np.prod(shape, dtype=np.int64)) * itemsize
+        total += -(-nbytes // _PACK_ALIGNMENT) * _PACK_ALIGNMENT
+    return offsets, total
+
+
+def _torch_distributed_allgather(leaves: List[Any], signatures: List[_LeafSignature]) -> List[Any]:
+    """
+    Gather leaves from every rank with a single torch.distributed.all_gather() of one contiguous
+    byte buffer per rank.  Every rank must pass leaves matching the same signatures.
+
+    Returns a list with the leaves of each rank.  Tensors are returned on the device of the local
+    leaf in the same position; ndarrays are returned as ndarrays.
+    """
+    if dist.get_backend() == "nccl":
+        device = torch.device("cuda", torch.cuda.current_device())
+    else:
+        device = torch.device("cpu")
+
+    itemsizes = [
+        leaf.element_size() if isinstance(leaf, torch.Tensor) else leaf.itemsize for leaf in leaves
+    ]
+    offsets, total = _pack_offsets(signatures, itemsizes)
+    buf = torch.zeros(total, dtype=torch.uint8, device=device)
+    for leaf, offset in zip(leaves, offsets):
+        data = _leaf_bytes(leaf, device)
+        buf[offset : offset + len(data)] = data
+
+    gathered = [torch.empty_like(buf) for _ in range(dist.get_world_size())]
+    dist.all_gather(gathered, buf)
+
+    host = None  # type: Optional[List[np.ndarray]]
+    if any(not isinstance(leaf, torch.Tensor) for leaf in leaves):
+        host = [g.cpu().numpy() for g in gathered]
+
+    all_leaves = []
+    for rank, rank_buf in enumerate(gathered):
+        rank_leaves = []  # type: List[Any]
+        for leaf, offset, itemsize in zip(leaves, offsets, itemsizes):
+            nbytes = leaf.numel() * itemsize if isinstance(leaf, torch.Tensor) else leaf.nbytes
+            if isinstance(leaf, torch.Tensor):
+                chunk = rank_buf[offset : offset + nbytes].view(leaf.dtype).view(leaf.shape)
+                rank_leaves.append(chunk.to(leaf.device))
+            else:
+                assert host is not None
+                array = host[rank][offset : offset + nbytes]
+                rank_leaves.append(array.view(leaf.dtype).reshape(leaf.shape))
+        all_leaves.append(rank_leaves)
+    return all_leaves
+
+
 T = TypeVar("T", bound=MetricReducer)
 
 
@@ -496,6 +614,38 @@ class _PyTorchReducerContext:
                 metrics[wrapped.name] = reduced
         return metrics
 
+    def _packed_allgather(self, gatherables: List[Any]) -> List[Any]:
+        """
+        Allgather per-slot metrics, sending tensors and ndarrays through torch.distributed.
+
+        Everything but the tensors and ndarrays is allgathered as usual, along with a description
+        of the tensors.  If every rank has tensors of the same dtypes and shapes, like the
+        confusion matrices or histograms of most reducers, they are packed into one contiguous
+        buffer per rank and gathered with a single all_gather(), instead of being pickled and
+        routed through the chief.  Otherwise the tensors are allgathered as usual, too.
+        """
+        leaves = []  # type: List[Any]
+        skeleton = _extract_leaves(gatherables, leaves)
+        signatures = [_leaf_signature(leaf) for leaf in leaves]
+        gathered = self._allgather_fn((skeleton, signatures, dist.get_rank()))
+        skeletons, all_signatures, torch_ranks = zip(*gathered)
+
+        if not any(all_signatures):
+            return list(skeletons)
+
+        # Since every rank sees the same gathered metadata, every rank makes the same decision.
+        if len(gathered) == 1:
+            all_leaves = [leaves]
+        elif all(sig == signatures for sig in all_signatures) and list(torch_ranks) == list(
+            range(dist.get_world_size())
+        ):
+            all_leaves = _torch_distributed_allgather(leaves, signatures)
+        else:
+            logger.debug("reducer states differ in shape across ranks, not packing them")
+            all_leaves = self._allgather_fn(leaves)
+
+        return [_restore_leaves(s, rank_leaves) for s, rank_leaves in zip(skeletons, all_leaves)]
+
     def reduce_metrics(self, for_training: bool) -> Dict[str, Any]:
         # Only deal with reducers marked for this type of workload.
         reducables = [
@@ -510,8 +660,11 @@ class _PyTorchReducerContext:
 
         gatherables = [wrapped.per_slot_reduce() for wrapped in reducables]
 
-        # Do one allgather for all metrics to improve .
-        gathered = self._allgather_fn(gatherables)
+        # Do one allgather for all metrics to improve performance.
+        if dist.is_available() and dist.is_initialized():
+            gathered = self._packed_allgather(gatherables)
+        else:
+            gathered = self._allgather_fn(gatherables)
 
         metrics = self.run_cross_slot_reduction(reducables, gathered)
 
@@ -1,12 +1,32 @@
 import abc
+import collections
+import concurrent.futures
+import contextlib
 import json
 import logging
 import math
 import os
 import pathlib
+import queue
+import threading
+import time
 import uuid
 import warnings
-from typing import TYPE_CHECKING, Any, ContextManager, Dict, Optional, Set, Sized, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Sized,
+    Tuple,
+    Type,
+)
 
 import torch
 import torch.distributed as dist
@@ -15,6 +35,7 @@ from torch.utils import data
 
 import determined as det
 from determined import common, core, pytorch
+from determined.pytorch.experimental import _work_queue
 
 if TYPE_CHECKING:
     # These modules are only needed for type checking and
@@ -27,6 +48,219 @@ common.set_logger(False)
 
 DEFAULT_BATCH_SIZE = 1
 
+# Functions passed to TorchBatchProcessorContext.run_in_background() which may be pending at once.
+MAX_PENDING_BACKGROUND_TASKS = 2
+
+
+class _PipelineStats:
+    """
+    _PipelineStats accumulates the time spent in each stage of batch processing between reports.
+    Stages may overlap, so each stage's throughput is the rate it could sustain on its own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seconds = collections.defaultdict(float)  # type: DefaultDict[str, float]
+        self._batches = 0
+        self._start = time.perf_counter()
+
+    def start(self) -> None:
+        self._start = time.perf_counter()
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._seconds[stage] += seconds
+
+    @contextlib.contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def batch_done(self) -> None:
+        self._batches += 1
+
+    def report(self, core_context: core.Context, steps_completed: int) -> None:
+        """
+        Log the throughput of each stage since the last report, and report it to the master from
+        the chief.
+        """
+        with self._lock:
+            seconds, self._seconds = self._seconds, collections.defaultdict(float)
+        batches, self._batches = self._batches, 0
+        now = time.perf_counter()
+        elapsed, self._start = now - self._start, now
+        if batches == 0:
+            return
+
+        metrics = {"batches_per_second": batches / elapsed}
+        for stage, stage_seconds in sorted(seconds.items()):
+            if stage_seconds > 0:
+                metrics[f"{stage}_batches_per_second"] = batches / stage_seconds
+        logger.info(
+            f"Processed {batches} batches in {elapsed:.2f}s: "
+            + ", ".join(f"{stage} {sec:.2f}s" for stage, sec in sorted(seconds.items()))
+        )
+        if core_context.distributed.get_rank() == 0:
+            core_context.train.report_metrics(
+                group="batch_processing", steps_completed=steps_completed, metrics=metrics
+            )
+
+
+class _BackgroundTasks:
+    """
+    _BackgroundTasks runs functions on a background thread, one at a time and in order.
+
+    At most ``max_pending`` functions may be pending at once; submitting another blocks until one
+    of them finishes.  Errors are re-raised in the calling thread by the next call to submit() or
+    wait().
+    """
+
+    def __init__(self, max_pending: int, stats: _PipelineStats) -> None:
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be at least 1, not {max_pending}")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = []  # type: List[concurrent.futures.Future]
+        self._executor = None  # type: Optional[concurrent.futures.ThreadPoolExecutor]
+        self._stats = stats
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._raise_errors(block=False)
+        with self._stats.time("write_wait"):
+            self._slots.acquire()
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="det-batch-process"
+            )
+
+        def run() -> None:
+            with self._stats.time("write"):
+                fn(*args, **kwargs)
+
+        future = self._executor.submit(run)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append(future)
+
+    def wait(self) -> None:
+        with self._stats.time("write_wait"):
+            self._raise_errors(block=True)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _raise_errors(self, block: bool) -> None:
+        if block:
+            concurrent.futures.wait(self._pending)
+        finished = [f for f in self._pending if f.done()]
+        self._pending = [f for f in self._pending if not f.done()]
+        for future in finished:
+            exc = future.exception()
+            if exc is not None:
+                raise exc
+
+
+class _BatchPrefetcher:
+    """
+    _BatchPrefetcher loads the next ``count`` batches (or all of them, if ``count`` is None) from a
+    dataloader iterator on a background thread, keeping up to ``depth`` batches ready ahead of the
+    batch being processed.
+
+    With a CUDA ``device``, prefetched batches are also copied to the device on a separate CUDA
+    stream, so that host-to-device copies overlap with computation on the current stream.
+    """
+
+    _DONE = object()
+
+    def __init__(
+        self,
+        iterator: Iterator[Any],
+        count: Optional[int],
+        depth: int,
+        device: Optional[torch.device] = None,
+    ) -> None:
+        if depth < 1:
+            raise ValueError(f"depth must be at least 1, not {depth}")
+        self._iterator = iterator
+        self._count = count
+        self._device = device
+        self._stream = None  # type: Optional[torch.cuda.Stream]
+        if device is not None and device.type == "cuda":
+            self._stream = torch.cuda.Stream(device)  # type: ignore
+        self._queue = queue.Queue(maxsize=depth)  # type: queue.Queue
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="det-prefetch", daemon=True)
+        self._thread.start()
+
+    def get(self) -> Any:
+        """
+        Return the next batch, or None if the iterator was exhausted early.
+        """
+        item = self._queue.get()
+        if isinstance(item, BaseException):
+            raise item
+        if item is self._DONE:
+            raise RuntimeError("read more batches than were prefetched")
+        if self._stream is not None:
+            # The batch was allocated on the prefetch stream; keep its memory from being reused
+            # until the current stream is done with it.
+            _record_stream(item, torch.cuda.current_stream(self._device))
+        return item
+
+    def close(self) -> None:
+        self._stopped.set()
+        # Unblock the loading thread if it is waiting for room in the queue.
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+    def _run(self) -> None:
+        try:
+            loaded = 0
+            while self._count is None or loaded < self._count:
+                loaded += 1
+                batch = next(self._iterator, None)
+                if batch is not None and self._device is not None:
+                    if self._stream is not None:
+                        with torch.cuda.stream(self._stream):
+                            batch = pytorch.to_device(batch, self._device)
+                        self._stream.synchronize()
+                    else:
+                        batch = pytorch.to_device(batch, self._device)
+                if not self._put(batch):
+                    return
+                if batch is None and self._count is None:
+                    return
+            self._put(self._DONE)
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item: Any) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+
+def _record_stream(data: Any, stream: "torch.cuda.Stream") -> None:
+    if isinstance(data, torch.Tensor):
+        if data.is_cuda:
+            data.record_stream(stream)
+    elif isinstance(data, dict):
+        for value in data.values():
+            _record_stream(value, stream)
+    elif isinstance(data, (list, tuple)):
+        for value in data:
+            _record_stream(value, stream)
+
 
 class TorchBatchProcessorContext(pytorch._PyTorchReducerContext):
     def __init__(self, core_context: core.Context, storage_path: str) -> None:
@@ -38,6 +272,8 @@ class TorchBatchProcessorContext(pytorch._PyTorchReducerContext):
         self._storage_path = storage_path
         self._use_default_storage = False
         self._hparams = None  # type: Optional[Dict[str, Any]]
+        self._stats = _PipelineStats()
+        self._background_tasks = _BackgroundTasks(MAX_PENDING_BACKGROUND_TASKS, self._stats)
 
     def get_hparams(self) -> Dict[str, Any]:
         if self._hparams is None:
@@ -95,6 +331,34 @@ class TorchBatchProcessorContext(pytorch._PyTorchReducerContext):
         self._use_default_storage = True
         return self._core_context.checkpoint._storage_manager.store_path(self._storage_path)
 
+    def run_in_background(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Call ``fn(*args, **kwargs)`` on a background thread, so that writing the outputs of one
+        batch overlaps with processing the next.
+
+        Functions run one at a time, in the order they were submitted.  At most two may be pending
+        at once; calling ``run_in_background()`` again blocks until one of them finishes.  Every
+        pending function finishes before each checkpoint, so a checkpoint never records a batch
+        whose outputs were not written.  Exceptions raised by ``fn`` are re-raised by a later call
+        to ``run_in_background()``, or at the next checkpoint.
+
+        Do not modify ``args`` or ``kwargs`` after passing them to ``run_in_background()``.
+
+        Example:
+
+        .. code-block:: python
+
+            def process_batch(self, batch, batch_idx):
+                pred = self.model(self.context.to_device(batch)).cpu()
+                self.context.run_in_background(torch.save, pred, f"{self.output_dir}/{batch_idx}")
+
+        Arguments:
+            fn: the function to call.
+            args: positional arguments for ``fn``.
+            kwargs: keyword arguments for ``fn``.
+        """
+        self._background_tasks.submit(fn, *args, **kwargs)
+
     def report_metrics(self, group: str, steps_completed: int, metrics: Dict[str, Any]) -> None:
         """
         Report metrics data to the master.
@@ -180,15 +444,15 @@ def _initialize_distributed_backend() -> Optional[core.DistributedContext]:
 
 def _initialize_default_inference_context(
     distributed_context: Optional[core.DistributedContext],
+    preempt_mode: core.PreemptMode = core.PreemptMode.WorkersAskChief,
 ) -> core.Context:
     if distributed_context is None:
         distributed_context = _initialize_distributed_backend()
     # Use WorkerAskChief mode to ensure synchronize correctly across worker
     # Using WorkerAskMaster mode could lead to some workers exiting when others
-    # are waiting for synchronization.
-    return det.core.init(
-        distributed=distributed_context, preempt_mode=core.PreemptMode.WorkersAskChief
-    )
+    # are waiting for synchronization.  With dynamic sharding, workers never check for preemption
+    # in step, so only the chief checks (ChiefOnly) and stops handing out work.
+    return det.core.init(distributed=distributed_context, preempt_mode=preempt_mode)
 
 
 class TorchBatchProcessor(metaclass=abc.ABCMeta):
@@ -218,7 +482,9 @@ class TorchBatchProcessor(metaclass=abc.ABCMeta):
 
     def on_checkpoint_start(self) -> None:  # noqa: B027
         """
-        This function will be called right before each checkpoint
+        This function will be called right before each checkpoint.  With dynamic sharding, it is
+        called whenever this worker finishes a chunk of batches, before the chunk is recorded as
+        complete.
         """
         pass
 
@@ -238,10 +504,14 @@ def _load_state(checkpoint_directory: pathlib.Path) -> Any:
 
 
 def _synchronize_and_checkpoint(
-    core_context: core.Context, steps_completed: int, default_output_uuid: str
+    core_context: core.Context,
+    steps_completed: int,
+    default_output_uuid: str,
+    background: bool = False,
 ) -> None:
     """
-    Synchronize the workers and create checkpoint to record steps completed
+    Synchronize the workers and create checkpoint to record steps completed.  With background=True,
+    the checkpoint is uploaded and reported on a background thread.
     """
     if core_context.distributed.get_rank() == 0:
         steps_completed_list = core_context.distributed.gather(steps_completed)
@@ -253,13 +523,274 @@ def _synchronize_and_checkpoint(
             "steps_completed": min_steps_completed,
             "default_output_uuid": default_output_uuid,
         }
-        with core_context.checkpoint.store_path(checkpoint_metadata) as (path, uuid):
+        with core_context.checkpoint.store_path(checkpoint_metadata, background=background) as (
+            path,
+            uuid,
+        ):
             with open(os.path.join(path, "batch_completed.json"), "w") as file_obj:
                 json.dump({"batch_completed": min_steps_completed}, file_obj)
     else:
         core_context.distributed.gather(steps_completed)
 
 
+def _checkpoint_chunks(
+    core_context: core.Context,
+    completed_chunks: List[int],
+    completed_batches: int,
+    chunk_size: int,
+    default_output_uuid: str,
+    background: bool = False,
+) -> None:
+    """
+    Create a checkpoint recording the chunks completed by all workers, with dynamic sharding.  Only
+    the chief calls this; the workers do not synchronize.
+    """
+    checkpoint_metadata = {
+        "steps_completed": completed_batches,
+        "default_output_uuid": default_output_uuid,
+        "completed_chunks": completed_chunks,
+        "chunk_size": chunk_size,
+    }
+    with core_context.checkpoint.store_path(checkpoint_metadata, background=background) as (
+        path,
+        uuid,
+    ):
+        with open(os.path.join(path, "batch_completed.json"), "w") as file_obj:
+            json.dump({"batch_completed": completed_batches}, file_obj)
+
+
+def _process_shard(
+    core_context: core.Context,
+    batch_processor_context: TorchBatchProcessorContext,
+    per_batch_processor: "TorchBatchProcessor",
+    dataset: data.Dataset,
+    batch_size: int,
+    skip: int,
+    iterate_length: int,
+    total_worker: int,
+    dataset_len: int,
+    checkpoint_interval: int,
+    dataloader_kwargs: Dict[str, Any],
+    default_output_uuid: str,
+    prefetch_batches: int,
+    prefetch_to_device: bool,
+    background_checkpoints: bool,
+    dummy_searcher_op: Optional[core.DummySearcherOperation],
+) -> Tuple[bool, int]:
+    """
+    Process this worker's shard of the dataset, checkpointing in step with the other workers.
+
+    Return whether processing stopped early because of preemption, and the number of batches
+    completed by every worker.
+    """
+    rank = core_context.distributed.get_rank()
+    dataloader = pytorch.DataLoader(
+        dataset=dataset, batch_size=batch_size, shuffle=False, **dataloader_kwargs
+    ).get_data_loader(repeat=False, skip=skip, num_replicas=total_worker, rank=rank)
+    dataloader_iterator = iter(dataloader)
+
+    last_checkpoint_idx = -1
+    batch_idx = skip
+    steps_completed = skip
+    stats = batch_processor_context._stats
+    background_tasks = batch_processor_context._background_tasks
+
+    prefetcher = None
+    if prefetch_batches > 0:
+        prefetcher = _BatchPrefetcher(
+            dataloader_iterator,
+            max(iterate_length - skip, 0),
+            prefetch_batches,
+            batch_processor_context.device if prefetch_to_device else None,
+        )
+
+    stats.start()
+    try:
+        for batch_idx in range(skip, iterate_length):
+            with stats.time("load"):
+                if prefetcher is not None:
+                    X = prefetcher.get()
+                else:
+                    X = next(dataloader_iterator, None)
+            if X is not None:
+                with stats.time("process"):
+                    per_batch_processor.process_batch(batch=X, batch_idx=batch_idx)
+            stats.batch_done()
+            steps_completed = batch_idx + 1
+
+            # Checkpoint and check preemption
+            if (batch_idx + 1) % checkpoint_interval == 0:
+                logger.info(f"Completed steps:  {steps_completed} and checkpointing")
+
+                per_batch_processor.on_checkpoint_start()
+                background_tasks.wait()
+                with stats.time("checkpoint"):
+                    if core_context._tensorboard_manager is not None:
+                        core_context._tensorboard_manager.sync()
+                    _synchronize_and_checkpoint(
+                        core_context,
+                        steps_completed,
+                        default_output_uuid,
+                        background=background_checkpoints,
+                    )
+                last_checkpoint_idx = batch_idx
+                stats.report(core_context, steps_completed)
+
+                # Report progress can only be done accurately with synchronization
+                # when rank == 0, dummy_searcher_op will be initialized, but lint is complaining
+                # therefore, adding additional check here
+                if rank == 0 and dummy_searcher_op is not None:
+                    _report_progress_to_master(
+                        dummy_searcher_op, batch_idx, total_worker, batch_size, dataset_len
+                    )
+
+                # Check preemption
+                if core_context.preempt.should_preempt():
+                    return True, steps_completed
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+
+    if batch_idx > last_checkpoint_idx:
+        per_batch_processor.on_checkpoint_start()
+        background_tasks.wait()
+        logger.info(f"Completed steps:  {steps_completed} and checkpointing")
+        _synchronize_and_checkpoint(
+            core_context, iterate_length, default_output_uuid, background=background_checkpoints
+        )
+    return False, steps_completed
+
+
+def _process_chunks(
+    core_context: core.Context,
+    batch_processor_context: TorchBatchProcessorContext,
+    per_batch_processor: "TorchBatchProcessor",
+    dataset: data.Dataset,
+    dataset_len: int,
+    batch_size: int,
+    num_batches: int,
+    chunk_size: int,
+    completed_chunks: List[int],
+    checkpoint_interval: int,
+    dataloader_kwargs: Dict[str, Any],
+    chief_ip: str,
+    default_output_uuid: str,
+    prefetch_batches: int,
+    prefetch_to_device: bool,
+    background_checkpoints: bool,
+    dummy_searcher_op: Optional[core.DummySearcherOperation],
+) -> Tuple[bool, int]:
+    """
+    Process the dataset in chunks of chunk_size batches, which the chief hands out to workers as
+    they finish their previous chunks.
+
+    Return whether processing stopped early because of preemption, and the number of batches
+    completed by all workers.
+    """
+    dist = core_context.distributed
+    rank = dist.get_rank()
+    sizes = _work_queue.chunk_batches(num_batches, chunk_size)
+    stats = batch_processor_context._stats
+    background_tasks = batch_processor_context._background_tasks
+
+    server = None
+    if rank == 0:
+        server = _work_queue.ChunkServer(sizes, completed_chunks, dist.get_size())
+        dist.broadcast(server.port)
+        url = f"tcp://127.0.0.1:{server.port}"
+    else:
+        url = f"tcp://{chief_ip}:{dist.broadcast(None)}"
+    client = _work_queue.ChunkClient(url, rank)
+
+    sampler = _work_queue.ChunkBatchSampler(
+        client, chunk_size, num_batches, batch_size, dataset_len
+    )
+    dataloader_iterator = iter(data.DataLoader(dataset, batch_sampler=sampler, **dataloader_kwargs))
+    prefetcher = None
+    if prefetch_batches > 0:
+        prefetcher = _BatchPrefetcher(
+            dataloader_iterator,
+            None,
+            prefetch_batches,
+            batch_processor_context.device if prefetch_to_device else None,
+        )
+
+    # The chief checkpoints as often as all workers together would with static sharding.
+    last_checkpoint = sum(sizes[c] for c in completed_chunks)
+
+    def maybe_checkpoint(force: bool = False) -> None:
+        nonlocal last_checkpoint
+        assert server is not None
+        completed, completed_batches = server.snapshot()
+        if completed_batches == last_checkpoint or (
+            not force
+            and completed_batches - last_checkpoint < checkpoint_interval * dist.get_size()
+        ):
+            return
+        logger.info(f"Completed {completed_batches} of {num_batches} batches and checkpointing")
+        with stats.time("checkpoint"):
+            _checkpoint_chunks(
+                core_context,
+                completed,
+                completed_batches,
+                chunk_size,
+                default_output_uuid,
+                background=background_checkpoints,
+            )
+        last_checkpoint = completed_batches
+        if dummy_searcher_op is not None:
+            dummy_searcher_op.report_progress(completed_batches / num_batches)
+        if not server.stopped and core_context.preempt.should_preempt():
+            logger.info("Preemption signal received; not starting any more chunks")
+            server.stop()
+
+    stats.start()
+    processed = 0
+    try:
+        while True:
+            with stats.time("load"):
+                if prefetcher is not None:
+                    X = prefetcher.get()
+                else:
+                    X = next(dataloader_iterator, None)
+            if X is None:
+                break
+            batch_idx, chunk, last_in_chunk = sampler.issued.popleft()
+            with stats.time("process"):
+                per_batch_processor.process_batch(batch=X, batch_idx=batch_idx)
+            stats.batch_done()
+            processed += 1
+
+            if last_in_chunk:
+                per_batch_processor.on_checkpoint_start()
+                background_tasks.wait()
+                if core_context._tensorboard_manager is not None:
+                    core_context._tensorboard_manager.sync()
+                client.done(chunk)
+                stats.report(core_context, processed)
+            if server is not None:
+                maybe_checkpoint()
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+
+    client.finish()
+    if server is not None:
+        # Keep checkpointing the progress of the other workers until they are all done.
+        while not server.wait(timeout=1.0):
+            maybe_checkpoint()
+        maybe_checkpoint(force=True)
+        server.close()
+        completed, completed_batches = server.snapshot()
+        preempted, completed_batches = dist.broadcast(
+            (len(completed) < len(sizes), completed_batches)
+        )
+    else:
+        preempted, completed_batches = dist.broadcast(None)
+    client.close()
+    return preempted, completed_batches
+
+
 def _report_progress_to_master(
     searcher_op: core.DummySearcherOperation,
     batch_idx: int,
@@ -371,11 +902,31 @@ def torch_batch_process(
     checkpoint_interval: int = 5,
     dataloader_kwargs: Optional[Dict[str, Any]] = None,
     distributed_context: Optional[core.DistributedContext] = None,
+    prefetch_batches: int = 0,
+    prefetch_to_device: bool = False,
+    background_checkpoints: bool = False,
+    dynamic_sharding: bool = False,
+    chunk_size: Optional[int] = None,
 ) -> None:
     """
     ```torch_batch_process``` shard and iterate through the provided dataset and process the dataset
     with user-defined logic in ```batch_processor_cls```.
 
+    By default, each batch is loaded and processed in turn, and all workers wait for the chief to
+    upload each checkpoint.  The stages can be pipelined instead: ``prefetch_batches`` loads
+    batches ahead on a background thread, ``prefetch_to_device`` also copies them to the device
+    there, :meth:`TorchBatchProcessorContext.run_in_background` writes outputs while the next batch
+    is processed, and ``background_checkpoints`` uploads checkpoints without blocking.  The
+    throughput of each stage is logged and reported in the ``batch_processing`` metrics group at
+    every checkpoint.
+
+    By default, the dataset is sharded evenly between workers up front, so the slowest worker
+    determines how long processing takes.  With ``dynamic_sharding``, the chief hands out chunks of
+    ``chunk_size`` consecutive batches instead, and each worker asks for another chunk when it
+    finishes one.  The chief checkpoints which chunks are complete, so that a preempted job resumes
+    by processing only the chunks which were not completed.  ``batch_idx`` is then the index of the
+    batch in the whole dataset, rather than its index among this worker's batches.
+
     Arguments:
         batch_processor_cls: A user-defined class extending ```TorchBatchProcessor```
         dataset: A torch dataset class implementing __len__() and __getitem__()
@@ -385,8 +936,23 @@ def torch_batch_process(
             of batches processed)
         dataloader_kwargs: Kwargs to pass to PyTorch dataloader
         distributed_context: Distributed context to initialize core context
+        prefetch_batches: Number of batches to load ahead on a background thread.  Two is enough
+            to keep the next batch ready while the current one is processed.  The default, 0,
+            loads each batch when it is needed.
+        prefetch_to_device: Copy prefetched batches to the default device on the background
+            thread, from pinned memory and on a separate CUDA stream, so ``process_batch`` receives
+            batches which are already on the device.  Requires ``prefetch_batches > 0``.
+        background_checkpoints: Upload checkpoints on a background thread of the chief.
+        dynamic_sharding: Hand out chunks of batches to workers as they ask for them, instead of
+            sharding the dataset evenly up front.  ``max_batches`` then limits the total number of
+            batches to ``max_batches`` times the number of workers.
+        chunk_size: The number of batches in each chunk with ``dynamic_sharding``.  Defaults to
+            ``checkpoint_interval``.
     """
-    with _initialize_default_inference_context(distributed_context) as core_context:
+    preempt_mode = core.PreemptMode.WorkersAskChief
+    if dynamic_sharding:
+        preempt_mode = core.PreemptMode.ChiefOnly
+    with _initialize_default_inference_context(distributed_context, preempt_mode) as core_context:
         """
         (1) Set up necessary variables to run batch processing
         """
@@ -394,6 +960,14 @@ def torch_batch_process(
         # Validate argument inputs
         if checkpoint_interval <= 0:
             raise ValueError("checkpoint_interval should be a positive integer")
+        if prefetch_batches < 0:
+            raise ValueError("prefetch_batches should be a non-negative integer")
+        if prefetch_to_device and prefetch_batches == 0:
+            raise ValueError("prefetch_to_device requires prefetch_batches > 0")
+        if chunk_size is None:
+            chunk_size = checkpoint_interval
+        if chunk_size <= 0:
+            raise ValueError("chunk_size should be a positive integer")
 
         if dataloader_kwargs is None:
             dataloader_kwargs = {}
@@ -426,6 +1000,7 @@ def torch_batch_process(
         rank = core_context.distributed.get_rank()
         latest_checkpoint = info.latest_checkpoint
         skip = 0
+        completed_chunks = []  # type: List[int]
 
         # Synchronize default output uuid
         if rank == 0:
@@ -439,8 +1014,21 @@ def torch_batch_process(
             logger.info("Checkpoint is not none")
             with core_context.checkpoint.restore_path(latest_checkpoint) as path:
                 metadata = _load_state(path)
-                skip = metadata["steps_completed"]
-                logger.info(f"Previous run completed {skip} steps")
+                if ("completed_chunks" in metadata) != dynamic_sharding:
+                    raise ValueError(
+                        "cannot resume from a checkpoint saved with dynamic_sharding="
+                        f"{not dynamic_sharding}"
+                    )
+                if dynamic_sharding:
+                    if metadata["chunk_size"] != chunk_size:
+                        raise ValueError(
+                            f"cannot resume from a checkpoint saved with chunk_size="
+                            f"{metadata['chunk_size']} with chunk_size={chunk_size}"
+                        )
+                    completed_chunks = metadata["completed_chunks"]
+                else:
+                    skip = metadata["steps_completed"]
+                logger.info(f"Previous run completed {metadata['steps_completed']} steps")
                 default_output_uuid = metadata["default_output_uuid"]
 
         output_uuid_with_rank = default_output_uuid + f"/rank_{rank}"
@@ -451,9 +1039,9 @@ def torch_batch_process(
             context=batch_processor_context,
         )
 
-        dataloader = pytorch.DataLoader(
-            dataset=dataset, batch_size=batch_size, shuffle=False, **dataloader_kwargs
-        ).get_data_loader(repeat=False, skip=skip, num_replicas=total_worker, rank=rank)
+        if prefetch_to_device and batch_processor_context.device.type == "cuda":
+            # Copies to the device can only overlap with computation from pinned memory.
+            dataloader_kwargs.setdefault("pin_memory", True)
 
         # Create dummy searcher op to report progress to master
         dummy_searcher_op = None
@@ -461,8 +1049,6 @@ def torch_batch_process(
         if rank == 0:
             dummy_searcher_op = core.DummySearcherOperation(1, True)
 
-        dataloader_iterator = iter(dataloader)
-
         # Enumerate over dataloader directly may cause some workers to iterate for 1 more time
         # than others when drop_last = False. If those workers synchronize on the last batch_idx,
         # they would hang forever as other workers never hit that last batch_idx.
@@ -470,58 +1056,66 @@ def torch_batch_process(
         # all workers iterate for the same number of times.
         dist_dataset_batch_count = math.ceil(dataset_len / batch_size / total_worker)
         iterate_length = _validate_iterate_length(max_batches, dist_dataset_batch_count)
+        background_tasks = batch_processor_context._background_tasks
+
+        if dynamic_sharding:
+            num_batches = min(math.ceil(dataset_len / batch_size), iterate_length * total_worker)
+            preempted, steps_completed = _process_chunks(
+                core_context,
+                batch_processor_context,
+                per_batch_processor,
+                dataset,
+                dataset_len,
+                batch_size,
+                num_batches,
+                chunk_size,
+                completed_chunks,
+                checkpoint_interval,
+                dataloader_kwargs,
+                info.container_addrs[0] if num_nodes > 1 else "127.0.0.1",
+                default_output_uuid,
+                prefetch_batches,
+                prefetch_to_device,
+                background_checkpoints,
+                dummy_searcher_op,
+            )
+        else:
+            preempted, steps_completed = _process_shard(
+                core_context,
+                batch_processor_context,
+                per_batch_processor,
+                dataset,
+                batch_size,
+                skip,
+                iterate_length,
+                total_worker,
+                dataset_len,
+                checkpoint_interval,
+                dataloader_kwargs,
+                default_output_uuid,
+                prefetch_batches,
+                prefetch_to_device,
+                background_checkpoints,
+                dummy_searcher_op,
+            )
 
-        last_checkpoint_idx = -1
-        batch_idx = skip
-        steps_completed = skip
-
-        """
-        (2) Run batch processing
-        """
-        for batch_idx in range(skip, iterate_length):
-            X = next(dataloader_iterator, None)
-            if X is not None:
-                per_batch_processor.process_batch(batch=X, batch_idx=batch_idx)
-            steps_completed = batch_idx + 1
-
-            # Checkpoint and check preemption
-            if (batch_idx + 1) % checkpoint_interval == 0:
-                logger.info(f"Completed steps:  {steps_completed} and checkpointing")
-
-                per_batch_processor.on_checkpoint_start()
-                if core_context._tensorboard_manager is not None:
-                    core_context._tensorboard_manager.sync()
-                _synchronize_and_checkpoint(core_context, steps_completed, default_output_uuid)
-                last_checkpoint_idx = batch_idx
-
-                # Report progress can only be done accurately with synchronization
-                # when rank == 0, dummy_searcher_op will be initialized, but lint is complaining
-                # therefore, adding additional check here
-                if rank == 0 and dummy_searcher_op is not None:
-                    _report_progress_to_master(
-                        dummy_searcher_op, batch_idx, total_worker, batch_size, dataset_len
-                    )
-
-                # Check preemption
-                if core_context.preempt.should_preempt():
-                    # Finish reducing metrics and report to not lose state before preempting
-                    _reduce_metrics(batch_processor_context, core_context, rank, steps_completed)
-                    return
+        if preempted:
+            # Finish reducing metrics and report to not lose state before preempting
+            _reduce_metrics(batch_processor_context, core_context, rank, steps_completed)
+            background_tasks.close()
+            return
 
         """
         (3) Finish up after batch processing
         """
-        if batch_idx > last_checkpoint_idx:
-            per_batch_processor.on_checkpoint_start()
-            logger.info(f"Completed steps:  {steps_completed} and checkpointing")
-            _synchronize_and_checkpoint(core_context, iterate_length, default_output_uuid)
-
         _reduce_metrics(batch_processor_context, core_context, rank, steps_completed)
         # Finish any tensorboard uploads remaining
         if core_context._tensorboard_manager is not None:
             core_context._tensorboard_manager.sync()
 
         per_batch_processor.on_finish()
+        background_tasks.wait()
+        background_tasks.close()
 
         # If user has used default storage, print out the default storage path
         if rank == 0 and batch_processor_context._use_default_storage:
@@ -0,0 +1,193 @@
+import collections
+import json
+import logging
+import threading
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger("determined.pytorch")
+
+# How often the server thread wakes up to check whether it was closed, in milliseconds.
+_POLL_MS = 100
+
+
+class ChunkServer:
+    """
+    ChunkServer runs on the chief and hands out chunks of consecutive batches to ranks as they ask
+    for them, so that faster ranks process more of the dataset than slower ones.
+
+    Requests are served on a background thread over a ZMQ ROUTER socket bound to a random port.
+    The collectives of a DistributedContext are lockstep operations, which cannot serve one rank
+    while others are busy.
+
+    The server tracks which chunks were completed, which is all that is needed to resume exactly:
+    chunks which were handed out but not completed are handed out again after a restart.
+    """
+
+    def __init__(self, chunk_batches: List[int], completed: Iterable[int], num_ranks: int) -> None:
+        import zmq
+
+        self._chunk_batches = chunk_batches
+        self._completed = set(completed)  # type: Set[int]
+        self._pending = collections.deque(
+            c for c in range(len(chunk_batches)) if c not in self._completed
+        )  # type: Deque[int]
+        self._completed_batches = sum(chunk_batches[c] for c in self._completed)
+        self._num_ranks = num_ranks
+        self._finished_ranks = set()  # type: Set[int]
+        self._stopped = False
+        self._lock = threading.Lock()
+        self._all_finished = threading.Event()
+
+        self._socket = zmq.Context.instance().socket(zmq.ROUTER)  # type: zmq.Socket
+        self._socket.setsockopt(zmq.HEARTBEAT_IVL, 60 * 1000)
+        self.port = self._socket.bind_to_random_port("tcp://*")  # type: int
+        self._closing = threading.Event()
+        self._thread = threading.Thread(target=self._serve, name="det-chunk-server", daemon=True)
+        self._thread.start()
+
+    def snapshot(self) -> Tuple[List[int], int]:
+        """
+        Return the completed chunks and the number of batches in them.
+        """
+        with self._lock:
+            return sorted(self._completed), self._completed_batches
+
+    def stop(self) -> None:
+        """
+        Stop handing out chunks, e.g. after a preemption signal.  Ranks finish the chunks they
+        already have.
+        """
+        with self._lock:
+            self._stopped = True
+
+    @property
+    def stopped(self) -> bool:
+        with self._lock:
+            return self._stopped
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every rank has finished, and return whether they all have.
+        """
+        return self._all_finished.wait(timeout)
+
+    def close(self) -> None:
+        self._closing.set()
+        self._thread.join()
+        self._socket.close(linger=0)
+
+    def _serve(self) -> None:
+        import zmq
+
+        while not self._closing.is_set():
+            if not self._socket.poll(_POLL_MS, zmq.POLLIN):
+                continue
+            identity, empty, request = self._socket.recv_multipart()
+            reply = self._handle(json.loads(request))
+            self._socket.send_multipart([identity, empty, json.dumps(reply).encode()])
+
+    def _handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op, rank = request["op"], request["rank"]
+        with self._lock:
+            if op == "next":
+                chunk = None
+                if not self._stopped and self._pending:
+                    chunk = self._pending.popleft()
+                logger.debug(f"Assigned chunk {chunk} to rank {rank}")
+                return {"chunk": chunk, "stopped": self._stopped}
+            if op == "done":
+                chunk = request["chunk"]
+                if chunk not in self._completed:
+                    self._completed.add(chunk)
+                    self._completed_batches += self._chunk_batches[chunk]
+                return {}
+            if op == "finish":
+                self._finished_ranks.add(rank)
+                if len(self._finished_ranks) == self._num_ranks:
+                    self._all_finished.set()
+                return {}
+        raise ValueError(f"unknown request {request}")
+
+
+class ChunkClient:
+    """
+    ChunkClient asks the ChunkServer for chunks and reports them completed.  It may be shared by
+    the thread which loads batches and the thread which processes them.
+    """
+
+    def __init__(self, url: str, rank: int) -> None:
+        import zmq
+
+        self._rank = rank
+        self._lock = threading.Lock()
+        self._socket = zmq.Context.instance().socket(zmq.REQ)  # type: zmq.Socket
+        self._socket.setsockopt(zmq.HEARTBEAT_IVL, 60 * 1000)
+        self._socket.connect(url)
+        # Whether the server stopped handing out chunks before running out of them.
+        self.stopped = False
+
+    def next_chunk(self) -> Optional[int]:
+        reply = self._request({"op": "next"})
+        self.stopped = self.stopped or reply["stopped"]
+        chunk = reply["chunk"]  # type: Optional[int]
+        return chunk
+
+    def done(self, chunk: int) -> None:
+        self._request({"op": "done", "chunk": chunk})
+
+    def finish(self) -> None:
+        self._request({"op": "finish"})
+
+    def close(self) -> None:
+        self._socket.close(linger=0)
+
+    def _request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        request["rank"] = self._rank
+        with self._lock:
+            self._socket.send(json.dumps(request).encode())
+            reply = json.loads(self._socket.recv())  # type: Dict[str, Any]
+        return reply
+
+
+class ChunkBatchSampler:
+    """
+    ChunkBatchSampler is a batch sampler which asks the ChunkClient for a new chunk whenever it runs
+    out of batches, and stops when there are none left.
+
+    Every batch it yields is recorded in ``issued`` as ``(batch_idx, chunk, last_in_chunk)``, in
+    order, so that whoever consumes the batches knows which chunk each of them belongs to.
+    """
+
+    def __init__(
+        self,
+        client: ChunkClient,
+        chunk_size: int,
+        num_batches: int,
+        batch_size: int,
+        dataset_len: int,
+    ) -> None:
+        self._client = client
+        self._chunk_size = chunk_size
+        self._num_batches = num_batches
+        self._batch_size = batch_size
+        self._dataset_len = dataset_len
+        self.issued = collections.deque()  # type: Deque[Tuple[int, int, bool]]
+
+    def __iter__(self) -> Iterator[List[int]]:
+        while True:
+            chunk = self._client.next_chunk()
+            if chunk is None:
+                return
+            first = chunk * self._chunk_size
+            last = min(first + self._chunk_size, self._num_batches)
+            for batch_idx in range(first, last):
+                self.issued.append((batch_idx, chunk, batch_idx == last - 1))
+                start = batch_idx * self._batch_size
+                yield list(range(start, min(start + self._batch_size, self._dataset_len)))
+
+
+def chunk_batches(num_batches: int, chunk_size: int) -> List[int]:
+    """
+    Return the number of batches in each chunk.
+    """
+    return [min(chunk_size, num_batches - first) for first in range(0, num_batches, chunk_size)]
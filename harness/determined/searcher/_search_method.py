@@ -86,7 +86,7 @@ class ExitedReason(Enum):
 
     @classmethod
     def _from_bindings(
-        cls, bindings_exited_reason: bindings.v1TrialExitedEarlyExitedReason
+        cls, bindings_exited_reason: "bindings.v1TrialExitedEarlyExitedReason"
     ) -> "ExitedReason":
         if bindings_exited_reason == bindings.v1TrialExitedEarlyExitedReason.INVALID_HP:
             return cls.INVALID_HP
@@ -103,7 +103,7 @@ class Operation(metaclass=abc.ABCMeta):
     """
 
     @abc.abstractmethod
-    def _to_searcher_operation(self) -> bindings.v1SearcherOperation:
+    def _to_searcher_operation(self) -> "bindings.v1SearcherOperation":
         pass
 
 
@@ -119,7 +119,7 @@ class ValidateAfter(Operation):
         self.request_id = request_id
         self.length = length
 
-    def _to_searcher_operation(self) -> bindings.v1SearcherOperation:
+    def _to_searcher_operation(self) -> "bindings.v1SearcherOperation":
         return bindings.v1SearcherOperation(
             trialOperation=bindings.v1TrialOperation(
                 validateAfter=bindings.v1ValidateAfterOperation(
@@ -138,7 +138,7 @@ class Close(Operation):
         super().__init__()
         self.request_id = request_id
 
-    def _to_searcher_operation(self) -> bindings.v1SearcherOperation:
+    def _to_searcher_operation(self) -> "bindings.v1SearcherOperation":
         return bindings.v1SearcherOperation(
             closeTrial=bindings.v1CloseTrialOperation(requestId=str(self.request_id))
         )
@@ -153,7 +153,7 @@ class Progress(Operation):
         super().__init__()
         self.progress = progress
 
-    def _to_searcher_operation(self) -> bindings.v1SearcherOperation:
+    def _to_searcher_operation(self) -> "bindings.v1SearcherOperation":
         return bindings.v1SearcherOperation(
             setSearcherProgress=bindings.v1SetSearcherProgressOperation(progress=self.progress)
         )
@@ -169,7 +169,7 @@ class Shutdown(Operation):
         self.cancel = cancel
         self.failure = failure
 
-    def _to_searcher_operation(self) -> bindings.v1SearcherOperation:
+    def _to_searcher_operation(self) -> "bindings.v1SearcherOperation":
         return bindings.v1SearcherOperation(
             shutDown=bindings.v1ShutDownOperation(cancel=self.cancel, failure=self.failure)
         )
@@ -191,7 +191,7 @@ class Create(Operation):
         self.hparams = json.dumps(hparams)
         self.checkpoint = checkpoint
 
-    def _to_searcher_operation(self) -> bindings.v1SearcherOperation:
+    def _to_searcher_operation(self) -> "bindings.v1SearcherOperation":
         return bindings.v1SearcherOperation(
             createTrial=bindings.v1CreateTrialOperation(
                 hyperparams=self.hparams, requestId=str(self.request_id)
@@ -1,7 +1,9 @@
+import base64
 import json
 import logging
 import os
 import pickle
+import shutil
 import time
 import uuid
 from pathlib import Path
@@ -13,14 +15,48 @@ from determined.common.api import bindings, errors
 from determined.experimental import client
 
 EXPERIMENT_ID_FILE = "experiment_id.txt"
+JOURNAL_FILE = "journal"
 logger = logging.getLogger("determined.searcher")
 
 
 class _ExperimentInactiveException(Exception):
-    def __init__(self, exp_state: bindings.experimentv1State):
+    def __init__(self, exp_state: "bindings.experimentv1State"):
         self.exp_state = exp_state
 
 
+def _operations_as_json(operations: List[searcher.Operation]) -> List[Dict[str, Any]]:
+    return [op._to_searcher_operation().to_json() for op in operations]
+
+
+class _TurnaroundStats:
+    """
+    Latency between receiving a batch of searcher events from the master and posting the
+    operations for them, in seconds.
+    """
+
+    def __init__(self) -> None:
+        self.batches = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.batches += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.batches if self.batches else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"batches={self.batches} last={self.last * 1000:.1f}ms "
+            f"mean={self.mean * 1000:.1f}ms max={self.max * 1000:.1f}ms"
+        )
+
+
 class SearchRunner:
     def __init__(
         self,
@@ -28,8 +64,9 @@ class SearchRunner:
     ) -> None:
         self.search_method = search_method
         self.state = searcher.SearcherState()
+        self.turnaround = _TurnaroundStats()
 
-    def _get_operations(self, event: bindings.v1SearcherEvent) -> List[searcher.Operation]:
+    def _get_operations(self, event: "bindings.v1SearcherEvent") -> List[searcher.Operation]:
         if event.initialOperations:
             logger.info("initial operations")
             operations = self.search_method.initial_operations(self.state)
@@ -123,73 +160,96 @@ class SearchRunner:
         prior_operations: Optional[List[searcher.Operation]],
         sleep_time: float = 1.0,
     ) -> None:
+        """
+        Handle searcher events until the experiment stops.
+
+        ``GetSearcherEvents`` is a long poll which returns as soon as the master has events, so
+        events are requested again as soon as the previous batch is posted.  All the events in a
+        batch are handled in order, and their operations are posted with a single
+        ``PostSearcherOperations`` call, which acknowledges every event up to the last one.
+        ``sleep_time`` is only used to poll a paused experiment, for which the master responds
+        immediately.
+        """
         experiment_is_active = True
+        paused = False
         try:
             while experiment_is_active:
-                time.sleep(
-                    sleep_time
-                )  # we don't want to call long polling API more often than every second.
                 events = self.get_events(session, experiment_id)
                 if not events:
                     continue
+                received = time.perf_counter()
                 logger.info(json.dumps([SearchRunner._searcher_event_as_dict(e) for e in events]))
-                # the first event is an event we have already processed and told master about it
-                # however, we may not have saved the state after that event if we crashed
-                # after POSTing operations but before saving state
+                # Events up to last_event_id were handled and saved before we restarted, but we may
+                # have crashed before POSTing their operations, in which case the master sends them
+                # again.  prior_operations holds the operations for all of them.
                 last_event_id = self.state.last_event_id
-                first_event = True
+                operations: List[searcher.Operation] = []
+                last_event = None
                 for event in events:
                     if (
-                        first_event
+                        prior_operations is not None
                         and last_event_id != 0
                         and last_event_id >= event.id >= 0
-                        and prior_operations is not None
                     ):
                         logger.info(f"Resubmitting operations for event.id={event.id}")
                         operations = prior_operations
-                    else:
-                        if event.experimentInactive:
-                            logger.info(
-                                f"experiment {self.state.experiment_id} is "
-                                f"inactive; state={event.experimentInactive.experimentState}"
-                            )
-                            if (
-                                event.experimentInactive.experimentState
-                                == bindings.experimentv1State.COMPLETED
-                            ):
-                                self.state.experiment_completed = True
-                            elif (
-                                event.experimentInactive.experimentState
-                                == bindings.experimentv1State.ERROR
-                            ):
-                                self.state.experiment_failed = True
-
-                            if (
-                                event.experimentInactive.experimentState
-                                == bindings.experimentv1State.PAUSED
-                            ):
+                        last_event = event
+                        continue
+
+                    if event.experimentInactive:
+                        logger.info(
+                            f"experiment {self.state.experiment_id} is "
+                            f"inactive; state={event.experimentInactive.experimentState}"
+                        )
+                        if (
+                            event.experimentInactive.experimentState
+                            == bindings.experimentv1State.COMPLETED
+                        ):
+                            self.state.experiment_completed = True
+                        elif (
+                            event.experimentInactive.experimentState
+                            == bindings.experimentv1State.ERROR
+                        ):
+                            self.state.experiment_failed = True
+
+                        if (
+                            event.experimentInactive.experimentState
+                            == bindings.experimentv1State.PAUSED
+                        ):
+                            if not paused:
                                 self._show_experiment_paused_msg()
-                            else:
-                                experiment_is_active = False
-                            break
-
-                        operations = self._get_operations(event)
-
-                        # save state
-                        self.state.last_event_id = event.id
-                        self.save_state(experiment_id, operations)
-
-                    first_event = False
-                    self.post_operations(session, experiment_id, event, operations)
+                            paused = True
+                        else:
+                            experiment_is_active = False
+                        break
+
+                    paused = False
+                    operations = operations + self._get_operations(event)
+                    last_event = event
+
+                    # Save the operations which are not posted yet along with the state, so they
+                    # can be resubmitted if we crash before posting them.
+                    self.state.last_event_id = event.id
+                    self.save_state(experiment_id, operations)
+
+                prior_operations = None
+                if last_event is not None:
+                    self.post_operations(session, experiment_id, last_event, operations)
+                    self.turnaround.record(time.perf_counter() - received)
+                    logger.debug(f"searcher event turnaround: {self.turnaround}")
+                if paused:
+                    time.sleep(sleep_time)
 
         except KeyboardInterrupt:
             print("Runner interrupted")
+        if self.turnaround.batches:
+            logger.info(f"searcher event turnaround: {self.turnaround}")
 
     def post_operations(
         self,
         session: api.Session,
         experiment_id: int,
-        event: bindings.v1SearcherEvent,
+        event: "bindings.v1SearcherEvent",
         operations: List[searcher.Operation],
     ) -> None:
         body = bindings.v1PostSearcherOperationsRequest(
@@ -224,7 +284,7 @@ class SearchRunner:
         self,
         session: api.Session,
         experiment_id: int,
-    ) -> Optional[Sequence[bindings.v1SearcherEvent]]:
+    ) -> Optional[Sequence["bindings.v1SearcherEvent"]]:
         # API is implemented with long polling.
         events = bindings.get_GetSearcherEvents(session, experimentId=experiment_id)
         return events.searcherEvents
@@ -236,7 +296,7 @@ class SearchRunner:
         pass
 
     @staticmethod
-    def _searcher_event_as_dict(event: bindings.v1SearcherEvent) -> dict:
+    def _searcher_event_as_dict(event: "bindings.v1SearcherEvent") -> dict:
         return {k: v for k, v in event.to_json().items() if v is not None}
 
 
@@ -248,15 +308,39 @@ class LocalSearchRunner(SearchRunner):
     reacts to event notifications coming from the running experiments by forwarding
     them to event handler methods in your ``SearchMethod`` implementation and sending
     the returned operations back to the experiment.
+
+    Args:
+        search_method (SearchMethod): the search method to run.
+        searcher_dir (pathlib.Path, optional): directory for the searcher state.
+            (default: the current working directory)
+        snapshot_interval (int): how many searcher events to handle between saving full
+            snapshots of the search method state.  Events in between are appended to a journal,
+            and replayed from the latest snapshot when the searcher is resumed.  Values above 1
+            require a deterministic ``SearchMethod``: replaying the same events after
+            ``load_method_state()`` must return the same operations, including trial request IDs.
+            (default: 1, which snapshots after every event)
+        keep_snapshots (int): how many of the most recent snapshots to keep on disk.
+            (default: 2)
     """
 
     def __init__(
         self,
         search_method: searcher.SearchMethod,
         searcher_dir: Optional[Path] = None,
+        *,
+        snapshot_interval: int = 1,
+        keep_snapshots: int = 2,
     ):
         super().__init__(search_method)
         self.state_path = None
+        if snapshot_interval < 1:
+            raise ValueError(f"snapshot_interval must be at least 1, not {snapshot_interval}")
+        if keep_snapshots < 1:
+            raise ValueError(f"keep_snapshots must be at least 1, not {keep_snapshots}")
+        self.snapshot_interval = snapshot_interval
+        self.keep_snapshots = keep_snapshots
+        self._events_since_snapshot = 0
+        self._journal_event = None  # type: Optional[bindings.v1SearcherEvent]
 
         self.searcher_dir = searcher_dir or Path.cwd()
         if not self.searcher_dir.exists():
@@ -314,6 +398,12 @@ class LocalSearchRunner(SearchRunner):
         self.run_experiment(experiment_id, session, operations)
         return experiment_id
 
+    def _get_operations(self, event: "bindings.v1SearcherEvent") -> List[searcher.Operation]:
+        operations = super()._get_operations(event)
+        # Remember the event, so save_state() can journal it.
+        self._journal_event = event
+        return operations
+
     def load_state(self, experiment_id: int) -> Tuple[int, List[searcher.Operation]]:
         experiment_searcher_dir = self._get_state_path(experiment_id)
         with experiment_searcher_dir.joinpath("event_id").open("r") as event_id_file:
@@ -325,10 +415,36 @@ class LocalSearchRunner(SearchRunner):
         )
         with state_path.joinpath("ops").open("rb") as f:
             operations = pickle.load(f)
+
+        # Replay the events which were journaled after the snapshot.
+        self._events_since_snapshot = 0
+        for event, journaled in self._read_journal(experiment_searcher_dir):
+            if event.id <= last_event_id:
+                continue
+            logger.info(f"Replaying searcher event {event.id} from the journal")
+            # Journaled operations include those of earlier events which were not posted yet.
+            replayed = _operations_as_json(self._get_operations(event))
+            expected = _operations_as_json(journaled)
+            if expected not in (replayed, _operations_as_json(operations) + replayed):
+                raise RuntimeError(
+                    f"Replaying searcher event {event.id} produced different operations than "
+                    "were sent to the master originally.  Resuming a LocalSearchRunner with "
+                    "snapshot_interval > 1 requires a deterministic SearchMethod."
+                )
+            self.state.last_event_id = event.id
+            self._events_since_snapshot += 1
+            operations = journaled
+        self._journal_event = None
         return loaded_experiment_id, operations
 
     def save_state(self, experiment_id: int, operations: List[searcher.Operation]) -> None:
         experiment_searcher_dir = self._get_state_path(experiment_id)
+        event, self._journal_event = self._journal_event, None
+        if event is not None and self._events_since_snapshot + 1 < self.snapshot_interval:
+            self._append_journal(experiment_searcher_dir, event, operations)
+            self._events_since_snapshot += 1
+            return
+
         state_path = experiment_searcher_dir.joinpath(f"event_{self.state.last_event_id}")
 
         if not state_path.exists():
@@ -349,6 +465,61 @@ class LocalSearchRunner(SearchRunner):
             f.write(str(self.state.last_event_id))
         os.replace(event_id_new_path, event_id_path)
 
+        # Compact: every journaled event is part of the new snapshot now.
+        journal_path = experiment_searcher_dir.joinpath(JOURNAL_FILE)
+        if journal_path.exists():
+            journal_path.unlink()
+        self._events_since_snapshot = 0
+        self._prune_snapshots(experiment_searcher_dir)
+
+    def _append_journal(
+        self,
+        experiment_searcher_dir: Path,
+        event: "bindings.v1SearcherEvent",
+        operations: List[searcher.Operation],
+    ) -> None:
+        entry = {
+            "event": event.to_json(),
+            "ops": base64.b64encode(pickle.dumps(operations)).decode("ascii"),
+        }
+        with experiment_searcher_dir.joinpath(JOURNAL_FILE).open("a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def _read_journal(
+        self, experiment_searcher_dir: Path
+    ) -> List[Tuple["bindings.v1SearcherEvent", List[searcher.Operation]]]:
+        journal_path = experiment_searcher_dir.joinpath(JOURNAL_FILE)
+        if not journal_path.exists():
+            return []
+        entries = []
+        good_bytes = 0
+        with journal_path.open("rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete entry")
+                    entry = json.loads(line)
+                except ValueError:
+                    # The searcher crashed while appending this entry, before posting its
+                    # operations, so the master will send the event again.  Drop the entry, so
+                    # that the next one is not appended to it.
+                    logger.warning(f"Truncating a partially-written entry from {journal_path}")
+                    os.truncate(journal_path, good_bytes)
+                    break
+                good_bytes += len(line)
+                event = bindings.v1SearcherEvent.from_json(entry["event"])
+                entries.append((event, pickle.loads(base64.b64decode(entry["ops"]))))
+        return entries
+
+    def _prune_snapshots(self, experiment_searcher_dir: Path) -> None:
+        snapshots = []
+        for path in experiment_searcher_dir.glob("event_*"):
+            suffix = path.name[len("event_") :]
+            if path.is_dir() and suffix.isdigit():
+                snapshots.append((int(suffix), path))
+        for _, path in sorted(snapshots)[: -self.keep_snapshots]:
+            shutil.rmtree(path, ignore_errors=True)
+
     def _get_state_path(self, experiment_id: int) -> Path:
         return self.searcher_dir.joinpath(f"exp_{experiment_id}")
 
@@ -5,10 +5,11 @@ import queue
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Optional
 
 from determined import tensorboard
 from determined.common import util
+from determined.tensorboard import tracker
 
 logger = logging.getLogger("determined.tensorboard")
 
@@ -17,6 +18,9 @@ logger = logging.getLogger("determined.tensorboard")
 class PathUploadInfo:
     path: pathlib.Path
     mangled_relative_path: pathlib.Path
+    # Number of leading bytes of an append-only file which an earlier sync already uploaded.
+    # Backends which can append to an existing file may upload only the rest; others ignore it.
+    offset: int = 0
 
 
 class TensorboardManager(metaclass=abc.ABCMeta):
@@ -41,6 +45,10 @@ class TensorboardManager(metaclass=abc.ABCMeta):
         self.base_path = base_path
         self.sync_path = sync_path
         self.last_sync = 0.0
+        # The change tracker and the offsets it reports are not thread-safe, and checkpoints may be
+        # reported (and thus synced) from more than one thread, so syncs are serialized.
+        self._lock = threading.RLock()
+        self._tracker = None  # type: Optional[tracker.ChangeTracker]
 
         self.upload_thread = None
         if async_upload:
@@ -74,11 +82,20 @@ class TensorboardManager(metaclass=abc.ABCMeta):
         self,
         selector: Callable[[pathlib.Path], bool],
     ) -> List[pathlib.Path]:
-        sync_start = time.time()
-        sync_paths = self.list_tb_files(self.last_sync, selector)
-        self.last_sync = sync_start
+        return [path for path, _ in self._changes(selector)]
 
-        return sync_paths
+    def _changes(self, selector: Callable[[pathlib.Path], bool]) -> List[tracker.Change]:
+        """
+        Return the files which changed since the last sync, and how much of each was synced before.
+
+        Unlike list_tb_files, this does not stat every file under base_path: the change tracker
+        learns which files changed from inotify where it is available.
+        """
+        with self._lock:
+            if self._tracker is None:
+                self._tracker = tracker.build(self.base_path)
+            self.last_sync = time.time()
+            return [(path, offset) for path, offset in self._tracker.changes() if selector(path)]
 
     @abc.abstractmethod
     def _sync_impl(self, path_info_list: List[PathUploadInfo]) -> None:
@@ -93,16 +110,24 @@ class TensorboardManager(metaclass=abc.ABCMeta):
         mangler: Callable[[pathlib.Path, int], pathlib.Path] = lambda p, __: p,
         rank: int = 0,
     ) -> None:
-        paths = self.to_sync(selector)
-        path_list = []
-        for path in paths:
-            relative_path = path.relative_to(self.base_path)
-            mangled_relative_path = mangler(relative_path, rank)
-            path_list.append(PathUploadInfo(path=path, mangled_relative_path=mangled_relative_path))
-        if self.upload_thread is not None and self.upload_thread.is_alive():
-            self.upload_thread.upload(path_list)
-        else:
-            util.preserve_random_state(self._sync_impl)(path_list)
+        with self._lock:
+            path_list = []
+            for path, offset in self._changes(selector):
+                relative_path = path.relative_to(self.base_path)
+                mangled_relative_path = mangler(relative_path, rank)
+                if not tensorboard.util.is_append_only(path):
+                    offset = 0
+                path_list.append(
+                    PathUploadInfo(
+                        path=path, mangled_relative_path=mangled_relative_path, offset=offset
+                    )
+                )
+            # Queue or upload the changes before releasing the lock, so that the uploads of
+            # concurrent syncs happen in the order their offsets were reported.
+            if self.upload_thread is not None and self.upload_thread.is_alive():
+                self.upload_thread.upload(path_list)
+            else:
+                util.preserve_random_state(self._sync_impl)(path_list)
 
     @abc.abstractmethod
     def delete(self) -> None:
@@ -120,6 +145,10 @@ class TensorboardManager(metaclass=abc.ABCMeta):
             self.sync()
         if self.upload_thread is not None and self.upload_thread.is_alive():
             self.upload_thread.close()
+        with self._lock:
+            if self._tracker is not None:
+                self._tracker.close()
+                self._tracker = None
 
     def __enter__(self) -> "TensorboardManager":
         self.start()
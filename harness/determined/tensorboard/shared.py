@@ -38,9 +38,31 @@ class SharedFSTensorboardManager(base.TensorboardManager):
             mangled_relative_path = path_info.mangled_relative_path
             mangled_path = self.shared_fs_base.joinpath(mangled_relative_path)
             pathlib.Path.mkdir(mangled_path.parent, parents=True, exist_ok=True)
+            if path_info.offset and _append_tail(path, mangled_path, path_info.offset):
+                continue
             logger.debug(f"{self.__class__.__name__} saving {path} to {mangled_path}")
 
             shutil.copy(path, mangled_path)
 
     def delete(self) -> None:
         util.rmtree_nfs_safe(self.shared_fs_base, False)
+
+
+def _append_tail(src: pathlib.Path, dst: pathlib.Path, offset: int) -> bool:
+    """
+    Bring dst up to date with the append-only file src by copying only the bytes dst is missing.
+
+    dst must hold at least the first offset bytes from an earlier sync.  Return False if it does
+    not, in which case the caller should copy the whole file.
+    """
+    try:
+        dst_size = dst.stat().st_size
+        if not offset <= dst_size <= src.stat().st_size:
+            return False
+        with src.open("rb") as fsrc, dst.open("ab") as fdst:
+            fsrc.seek(dst_size)
+            shutil.copyfileobj(fsrc, fdst)
+    except FileNotFoundError:
+        return False
+    logger.debug(f"Appended {src} to {dst} from offset {dst_size}")
+    return True
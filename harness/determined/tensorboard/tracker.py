@@ -0,0 +1,247 @@
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import pathlib
+import stat
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger("determined.tensorboard")
+
+# inotify(7) constants, from <sys/inotify.h>.
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+)
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+
+# A change is a file which was created or modified, and the number of bytes of it which had already
+# been reported by an earlier call to changes().
+Change = Tuple[pathlib.Path, int]
+
+
+class ChangeTracker:
+    """
+    ChangeTracker reports files under base_path which were created or modified since the last call
+    to changes(), along with the size each file had when it was last reported.
+
+    It keeps an index of the inode, size and mtime of every file it has reported.  This
+    implementation finds candidates by walking base_path on every call; InotifyChangeTracker instead
+    learns about candidates from the kernel, so that its cost is proportional to the number of
+    changed files rather than the number of files.
+    """
+
+    def __init__(self, base_path: pathlib.Path) -> None:
+        self.base_path = base_path
+        self._index = {}  # type: Dict[str, Tuple[int, int, int]]
+
+    def changes(self) -> List[Change]:
+        if not self.base_path.exists():
+            self._index.clear()
+            return []
+        return self._scan()
+
+    def close(self) -> None:
+        pass
+
+    def _scan(self) -> List[Change]:
+        """
+        Walk all of base_path, and report what changed.
+        """
+        found = list(self._walk(str(self.base_path)))
+        # Forget deleted files, so that they are reported from scratch if they reappear.
+        seen = {path for path, _ in found}
+        for path in [p for p in self._index if p not in seen]:
+            del self._index[path]
+        return self._update(found)
+
+    def _walk(self, top: str) -> Iterator[Tuple[str, Optional[os.stat_result]]]:
+        try:
+            entries = list(os.scandir(top))
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    yield from self._walk(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.stat()
+            except FileNotFoundError:
+                continue
+
+    def _update(self, candidates: Iterable[Tuple[str, Optional[os.stat_result]]]) -> List[Change]:
+        """
+        Compare candidate files (and their stat results, if already known) against the index.
+        """
+        changed = []
+        for path, st in candidates:
+            if st is None:
+                try:
+                    st = os.stat(path)
+                except (FileNotFoundError, NotADirectoryError):
+                    self._index.pop(path, None)
+                    continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            key = (st.st_ino, st.st_size, st.st_mtime_ns)
+            old = self._index.get(path)
+            if old == key:
+                continue
+            self._index[path] = key
+            # A file which was replaced or shrank was rewritten, so none of what was reported
+            # earlier is valid.
+            offset = old[1] if old is not None and old[0] == key[0] and old[1] <= key[1] else 0
+            changed.append((pathlib.Path(path), offset))
+        return sorted(changed)
+
+
+class InotifyChangeTracker(ChangeTracker):
+    """
+    InotifyChangeTracker watches every directory under base_path with inotify(7) and only stats the
+    files named in events.
+
+    The whole tree is walked only when the tracker starts watching base_path, or when the kernel's
+    event queue overflows.  If the watch limit is reached, the tracker falls back to polling.
+    """
+
+    def __init__(self, base_path: pathlib.Path) -> None:
+        super().__init__(base_path)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._watches = {}  # type: Dict[int, str]
+        self._dirty = set()  # type: Set[str]
+        self._rescan = True
+        self._polling = False
+
+    def changes(self) -> List[Change]:
+        if not self._polling and not self._rescan:
+            self._read_events()
+        if self._polling:
+            return super().changes()
+
+        if self._rescan:
+            if not self.base_path.exists():
+                self._index.clear()
+                return []
+            self._rescan = False
+            self._dirty.clear()
+            # Watch before walking, so that files created during the walk are not missed.
+            self._watch_tree(str(self.base_path))
+            if self._polling:
+                return super().changes()
+            # Events may have been lost, so forget files deleted in the meantime like polling does.
+            return self._scan()
+
+        dirty, self._dirty = self._dirty, set()
+        return self._update((path, None) for path in dirty)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _watch_tree(self, top: str) -> None:
+        for dirpath, _, _ in os.walk(top):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), _WATCH_MASK)
+            if wd >= 0:
+                self._watches[wd] = dirpath
+                continue
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:  # Out of watches (fs.inotify.max_user_watches).
+                logger.warning(
+                    f"Could not watch {dirpath} for Tensorboard changes ({os.strerror(err)}); "
+                    "falling back to polling"
+                )
+                self._polling = True
+                self.close()
+                return
+            # The directory was probably removed while we were walking.
+            logger.debug(f"inotify_add_watch({dirpath}) failed: {os.strerror(err)}")
+
+    def _read_events(self) -> None:
+        while not self._polling:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            if not buf:
+                return
+            self._handle_events(buf)
+
+    def _handle_events(self, buf: bytes) -> None:
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(buf[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                self._rescan = True
+                continue
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            dirpath = self._watches.get(wd)
+            if dirpath is None:
+                continue
+            if mask & _IN_DELETE_SELF:
+                if dirpath == str(self.base_path):
+                    self._rescan = True
+                continue
+
+            path = os.path.join(dirpath, name)
+            if not mask & _IN_ISDIR:
+                self._dirty.add(path)
+            elif mask & (_IN_CREATE | _IN_MOVED_TO):
+                # Files may have been written to the new directory before it was watched.
+                self._watch_tree(path)
+                self._dirty.update(p for p, _ in self._walk(path))
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                # No events are sent for the files of a directory which is moved away.
+                self._forget_tree(path)
+
+    def _forget_tree(self, top: str) -> None:
+        prefix = os.path.join(top, "")
+        for path in [p for p in self._index if p.startswith(prefix)]:
+            del self._index[path]
+
+
+def build(base_path: pathlib.Path) -> ChangeTracker:
+    """
+    Return an InotifyChangeTracker where inotify is available, or a polling ChangeTracker otherwise.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyChangeTracker(base_path)
+        except (OSError, AttributeError) as e:
+            logger.debug(f"inotify is unavailable ({e}), polling for Tensorboard changes instead")
+    return ChangeTracker(base_path)
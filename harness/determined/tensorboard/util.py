@@ -55,6 +55,13 @@ def find_tb_files(base_dir: pathlib.Path) -> List[pathlib.Path]:
     return [file for filetype in tb_file_types for file in base_dir.rglob(filetype)]
 
 
+def is_append_only(path: pathlib.Path) -> bool:
+    """
+    tfevents files are only ever appended to, so an upload may skip the bytes uploaded earlier.
+    """
+    return "tfevents" in path.name
+
+
 def get_rank_aware_path(path: pathlib.Path, rank: int) -> pathlib.Path:
     """
     Add suffix "#{rank}" to the names of tensorboard
@@ -0,0 +1,98 @@
+"""
+Compare the latency of DistributedContext collectives in the flat and hierarchical topologies, with
+every rank simulated by a thread on localhost.
+
+Usage (from the harness directory):
+
+    python -m tests.bench_distributed [--sizes 8 64 256] [--local-size 8] [--array-kb 64]
+
+Large sizes need a generous open file limit (ulimit -n).
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from determined import core
+from tests import parallel
+
+
+def bench(
+    pex: parallel.Execution,
+    contexts: List[core.DistributedContext],
+    fn: Callable[[core.DistributedContext], Any],
+    repeat: int,
+) -> float:
+    """
+    Return the median wall time of fn across all ranks, in milliseconds.
+    """
+
+    def run() -> List[float]:
+        context = contexts[pex.rank]
+        times = []
+        for _ in range(repeat):
+            context.allgather(None)
+            start = time.perf_counter()
+            fn(context)
+            times.append(time.perf_counter() - start)
+        return times
+
+    per_rank = pex.run(run)
+    return float(statistics.median(max(times) for times in zip(*per_rank))) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 64, 256])
+    parser.add_argument("--local-size", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--array-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    array_name = f"{args.array_kb}KB numpy"
+    payloads: Dict[str, Callable[[int], Any]] = {
+        "small": lambda rank: {"rank": rank, "loss": 0.5},
+        array_name: lambda rank: np.full(args.array_kb * 128, rank, dtype=np.float64),
+    }
+
+    for size in args.sizes:
+        local_size = min(args.local_size, size)
+        for hierarchical in (False, True):
+            with parallel.Execution(
+                size, local_size=local_size, make_distributed_context=False
+            ) as pex:
+
+                @pex.run
+                def contexts(hierarchical: bool = hierarchical) -> core.DistributedContext:
+                    return core.DistributedContext(
+                        rank=pex.rank,
+                        size=pex.size,
+                        local_rank=pex.local_rank,
+                        local_size=pex.local_size,
+                        cross_rank=pex.cross_rank,
+                        cross_size=pex.cross_size,
+                        chief_ip="localhost",
+                        hierarchical=hierarchical,
+                    )
+
+                mode = "hierarchical" if hierarchical else "flat"
+                for name, payload in payloads.items():
+                    ms = bench(
+                        pex,
+                        contexts,
+                        lambda c, payload=payload: c.allgather(payload(c.rank)),  # type: ignore
+                        args.repeat,
+                    )
+                    print(f"size={size:<4} {mode:>12} allgather {name:>12}: {ms:8.2f}ms")
+                ms = bench(pex, contexts, lambda c: c.broadcast(c.rank), args.repeat)
+                print(f"size={size:<4} {mode:>12} broadcast {'small':>12}: {ms:8.2f}ms")
+
+                for context in contexts:
+                    context.close()
+
+
+if __name__ == "__main__":
+    main()
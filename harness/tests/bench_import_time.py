@@ -0,0 +1,74 @@
+"""
+Measure how long it takes a fresh interpreter to import parts of determined, using the output of
+``python -X importtime``, and show which modules take the most time to import themselves.
+
+Usage (from the harness directory):
+
+    python -m tests.bench_import_time [--repeat 5] [--top 10] [modules ...]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+DEFAULT_MODULES = [
+    "determined.common.api.bindings",
+    "determined",
+    "determined.experimental",
+    "determined.cli.cli",
+]
+
+
+def importtime(module: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Import a module in a new interpreter and return the total time spent importing, and the self
+    time of every module imported, in milliseconds.
+    """
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    total = 0.0
+    self_times = {}
+    for line in p.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        self_times[name.strip()] = int(self_us) / 1000
+        # Nested imports are indented; the outermost ones add up to the whole import.
+        if not name[1:].startswith(" "):
+            total += int(cumulative_us) / 1000
+    return total, self_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to show")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        # The first import writes bytecode caches; don't count it.
+        importtime(module)
+        totals = []  # type: List[float]
+        self_times = {}  # type: Dict[str, List[float]]
+        for _ in range(args.repeat):
+            total, times = importtime(module)
+            totals.append(total)
+            for name, ms in times.items():
+                self_times.setdefault(name, []).append(ms)
+
+        print(f"{module}: {statistics.median(totals):.1f}ms (median of {args.repeat})")
+        slowest = sorted(self_times.items(), key=lambda kv: -statistics.median(kv[1]))
+        for name, times_ms in slowest[: args.top]:
+            print(f"  {statistics.median(times_ms):8.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
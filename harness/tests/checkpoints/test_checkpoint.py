@@ -2,9 +2,11 @@ import io
 import tarfile
 from pathlib import Path
 
+import pytest
 import responses
 from responses import matchers
 
+from determined import errors
 from determined.common import api
 from determined.common.api import authentication
 from determined.experimental import client
@@ -53,29 +55,31 @@ def verify_test_checkpoint(directory: Path) -> None:
                 assert f.read() == v
 
 
-def get_response_raw_tgz(checkpoint_path: Path) -> bytes:
+def get_response_raw_tar(checkpoint_path: Path, compressed: bool) -> bytes:
     buf = io.BytesIO()
-    with tarfile.open(fileobj=buf, mode="w|gz") as tf:
+    with tarfile.open(fileobj=buf, mode="w|gz" if compressed else "w|") as tf:
         for k in mock_content:
             tf.add(checkpoint_path / k, arcname=k)
 
-    return buf.getbuffer()
+    return buf.getvalue()
 
 
+@pytest.mark.parametrize("compressed", [False, True])
 @responses.activate
-def test_checkpoint_download_via_master(tmp_path: Path) -> None:
+def test_checkpoint_download_via_master(tmp_path: Path, compressed: bool) -> None:
     uuid_tgz = "dummy-uuid-123-tgz"
     checkpoint_path = tmp_path / "mock-checkpoint"
 
     setup_mock_checkpoint(checkpoint_path)
 
     # Set up mocks
+    mime_type = "application/gzip" if compressed else "application/x-tar"
     responses.get(
         f"https://dummy-master.none:443/checkpoints/{uuid_tgz}",
-        body=get_response_raw_tgz(checkpoint_path),
+        body=get_response_raw_tar(checkpoint_path, compressed),
         stream=True,
         status=200,
-        match=[matchers.header_matcher({"Accept": "application/gzip"})],
+        match=[matchers.header_matcher({"Accept": mime_type})],
     )
 
     checkpoint_path = tmp_path / uuid_tgz
@@ -84,5 +88,87 @@ def test_checkpoint_download_via_master(tmp_path: Path) -> None:
         api.Session("https://dummy-master.none:443", utp, cert=None),
         uuid_tgz,
         checkpoint_path,
+        compressed=compressed,
     )
     verify_test_checkpoint(checkpoint_path)
+
+
+@responses.activate
+def test_checkpoint_download_via_master_retries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Stream the bigger files straight to disk, and buffer the rest.
+    monkeypatch.setattr(
+        "determined.common.experimental.checkpoint._checkpoint._MASTER_DOWNLOAD_BUFFERED_FILE_SIZE",
+        1024,
+    )
+    uuid = "dummy-uuid-123-tar"
+    checkpoint_path = tmp_path / "mock-checkpoint"
+    setup_mock_checkpoint(checkpoint_path)
+    body = get_response_raw_tar(checkpoint_path, compressed=False)
+
+    # The first response is cut off partway through the archive.
+    url = f"https://dummy-master.none:443/checkpoints/{uuid}"
+    responses.get(url, body=body[: len(body) // 2], stream=True, status=200)
+    responses.get(url, body=body, stream=True, status=200)
+
+    checkpoint_path = tmp_path / uuid
+    utp = authentication.UsernameTokenPair("username", "token")
+    client.Checkpoint._download_via_master(
+        api.Session("https://dummy-master.none:443", utp, cert=None), uuid, checkpoint_path
+    )
+    verify_test_checkpoint(checkpoint_path)
+    assert len(responses.calls) == 2
+
+
+def add_member(
+    tf: tarfile.TarFile, name: str, typ: bytes, data: bytes = b"", link: str = ""
+) -> None:
+    info = tarfile.TarInfo(name)
+    info.type = typ
+    info.linkname = link
+    info.size = len(data)
+    tf.addfile(info, io.BytesIO(data))
+
+
+@pytest.mark.parametrize("kind", ["symlink", "hardlink", "existing-symlink", "dotdot"])
+@responses.activate
+def test_checkpoint_download_via_master_rejects_escapes(tmp_path: Path, kind: str) -> None:
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    outside.joinpath("victim").write_text("safe")
+    checkpoint_path = tmp_path / "ckpt"
+    checkpoint_path.mkdir()
+
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w|") as tf:
+        if kind == "symlink":
+            # A later member written through the symlink would land outside the checkpoint.
+            add_member(tf, "evil", tarfile.SYMTYPE, link=str(outside))
+            add_member(tf, "evil/victim", tarfile.REGTYPE, b"pwned")
+        elif kind == "hardlink":
+            add_member(tf, "evil", tarfile.LNKTYPE, link=str(outside / "victim"))
+            add_member(tf, "evil", tarfile.REGTYPE, b"pwned")
+        elif kind == "existing-symlink":
+            checkpoint_path.joinpath("evil").symlink_to(outside)
+            add_member(tf, "evil/victim", tarfile.REGTYPE, b"pwned")
+        else:
+            add_member(tf, "../outside/victim", tarfile.REGTYPE, b"pwned")
+
+    uuid = "dummy-uuid-evil"
+    responses.get(
+        f"https://dummy-master.none:443/checkpoints/{uuid}",
+        body=buf.getvalue(),
+        stream=True,
+        status=200,
+    )
+    utp = authentication.UsernameTokenPair("username", "token")
+    with pytest.raises(errors.ProxiedDownloadFailed, match="refusing to extract"):
+        client.Checkpoint._download_via_master(
+            api.Session("https://dummy-master.none:443", utp, cert=None), uuid, checkpoint_path
+        )
+    assert outside.joinpath("victim").read_text() == "safe"
+    if kind != "existing-symlink":
+        assert not checkpoint_path.joinpath("evil").exists()
+    # Rejected archives are not retried.
+    assert len(responses.calls) == 1
@@ -13,9 +13,10 @@ import pytest
 import requests
 import requests_mock
 
-from determined.cli import cli, ntsc, render
+from determined.cli import cli, ntsc, render, top_arg_descriptions
 from determined.common import constants, context
 from determined.common.api import bindings
+from determined.common.declarative_argparse import Cmd
 from tests.filetree import FileTree
 
 MINIMAL_CONFIG = '{"description": "test"}'
@@ -407,6 +408,35 @@ def test_cli_args_exist() -> None:
     assert e.value.code == 0
 
 
+@pytest.mark.parametrize("module", list(top_arg_descriptions.lazy_cmds))
+def test_lazy_cmds_match_commands(module: str) -> None:
+    stubs = top_arg_descriptions.lazy_cmds[module]
+    cmds = cli.command_args_description(module)
+    assert [(c.name, c.help_str) for c in stubs] == [
+        (c.name, c.help_str) for c in cmds if isinstance(c, Cmd)
+    ]
+
+
+@pytest.mark.parametrize(
+    "words,module",
+    [
+        ([], None),
+        (["--help"], None),
+        (["preview-search", "config.yaml"], None),
+        (["e", "list"], "determined.cli.experiment"),
+        (["experiment", "list"], "determined.cli.experiment"),
+        (["-m", "localhost:8080", "e", "list"], "determined.cli.experiment"),
+        (["--master", "e", "t"], "determined.cli.trial"),
+        (["--mas", "e", "t"], "determined.cli.trial"),
+        (["--master=e", "t"], "determined.cli.trial"),
+        (["-u", "admin", "rp", "list"], "determined.cli.resource_pool"),
+        (["d", "local", "cluster-up"], "determined.deploy.cli"),
+    ],
+)
+def test_find_command_module(words: List[str], module: Optional[str]) -> None:
+    assert cli.find_command_module(words) == module
+
+
 Case = namedtuple("Case", ["input", "output", "colors"])
 color_test_cases: List[Case] = [
     Case(1, "1", ["PRIMITIVES"]),
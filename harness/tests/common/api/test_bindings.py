@@ -0,0 +1,65 @@
+import copy
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from determined.common.api import bindings
+
+
+def test_unset_fields() -> None:
+    p = bindings.v1Pagination(offset=0, limit=None)
+    assert not hasattr(p, "__dict__")
+    # Unset fields read as None, but only set fields are sent with omit_unset.
+    assert p.total is None
+    assert p.to_json(True) == {"offset": 0, "limit": None}
+    assert p.to_json() == {
+        "endIndex": None,
+        "limit": None,
+        "offset": 0,
+        "startIndex": None,
+        "total": None,
+    }
+    p.total = 10
+    assert p.to_json(True) == {"offset": 0, "limit": None, "total": 10}
+    assert str(p) == "v1Pagination(offset=0, total=10)"
+
+    with pytest.raises(AttributeError):
+        p.no_such_field  # type: ignore
+    with pytest.raises(AttributeError):
+        p.no_such_field = 1  # type: ignore
+
+
+def test_from_json() -> None:
+    obj = {
+        "uuid": "uuid",
+        "resources": {"model.pth": 1},
+        "metadata": {"steps_completed": 100},
+        "state": "STATE_COMPLETED",
+        "training": {"trialId": 1, "trainingMetrics": {"avgMetrics": {"loss": 0.5}}},
+        "reportTime": None,
+    }
+    ckpt = bindings.v1Checkpoint.from_json(obj)
+    assert ckpt.state == bindings.checkpointv1State.COMPLETED
+    assert ckpt.training.trainingMetrics is not None
+    assert ckpt.training.trainingMetrics.avgMetrics == {"loss": 0.5}
+    assert ckpt.to_json(True) == obj
+
+    for ckpt2 in (pickle.loads(pickle.dumps(ckpt)), copy.deepcopy(ckpt)):
+        assert ckpt2.to_json(True) == obj
+
+
+def test_loads_and_dumps() -> None:
+    obj = {"a": [1, 2.5, "x", None, True], "b": {"c": "d"}}
+    assert bindings.loads(bindings.dumps(obj)) == obj
+    assert bindings.loads(json.dumps(obj)) == obj
+
+    # Values which are not plain JSON are encoded like det.util.json_encode does.
+    assert bindings.loads(bindings.dumps({"n": np.int64(3), "f": np.float32("nan")})) == {
+        "n": 3,
+        "f": "NaN",
+    }
+    # Whatever json accepts works, with or without orjson.
+    assert bindings.loads(b"[18446744073709551616]") == [2**64]
+    assert bindings.loads(bindings.dumps(["\udc80"])) == ["\udc80"]
@@ -0,0 +1,120 @@
+import threading
+import time
+from typing import Any, List, Tuple
+
+import pytest
+import requests
+
+from determined.common import api
+from determined.common.api import _multiplex, errors
+
+
+class FakeMaster:
+    """
+    Stand in for the requests sent by Session, holding each one until it is released.
+    """
+
+    def __init__(self) -> None:
+        self.sent = []  # type: List[Tuple[str, str, Any]]
+        self.release = threading.Event()
+        self.fail = 0
+
+    def __call__(self, method: str, path: str, *args: Any) -> Any:
+        self.sent.append((method, path, args[2]))
+        self.release.wait()
+        if self.fail:
+            self.fail -= 1
+            raise errors.MasterNotFoundException("master is down")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = str(len(self.sent)).encode()
+        return response
+
+
+@pytest.fixture
+def fake_master(monkeypatch: pytest.MonkeyPatch) -> FakeMaster:
+    fake = FakeMaster()
+    monkeypatch.setattr(api.Session, "_do_request", fake)
+    return fake
+
+
+def _make_session() -> api.MultiplexedSession:
+    utp = api.UsernameTokenPair("user", "token")
+    return api.MultiplexedSession(api.Session("http://localhost:8080", utp, None))
+
+
+def _wait_for(condition: Any) -> None:
+    deadline = time.time() + 5
+    while not condition():
+        assert time.time() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_multiplexed_session_coalesces(fake_master: FakeMaster) -> None:
+    session = _make_session()
+    progress = "/api/v1/trials/1/progress"
+    replies = {}
+
+    def post(name: str, path: str, data: str) -> None:
+        replies[name] = session.post(path, data=data).text
+
+    threads = [threading.Thread(target=post, args=("first", progress, "0.1"))]
+    threads[0].start()
+    _wait_for(lambda: len(fake_master.sent) == 1)
+
+    # Progress reports waiting behind the one in flight are replaced by the latest one.
+    def queued(value: str) -> bool:
+        return any(s.queued and s.queued.args[4] == value for s in session._slots.values())
+
+    for i, value in enumerate(["0.2", "0.3", "0.4"]):
+        threads.append(threading.Thread(target=post, args=(f"queued{i}", progress, value)))
+        threads[-1].start()
+        _wait_for(lambda: queued(value))  # noqa: B023
+
+    # Other requests are never coalesced.
+    for i in range(2):
+        threads.append(threading.Thread(target=post, args=(f"logs{i}", "task-logs", "line")))
+        threads[-1].start()
+    _wait_for(lambda: len(fake_master.sent) == 3)
+
+    fake_master.release.set()
+    for t in threads:
+        t.join()
+
+    progress_sent = [data for _, path, data in fake_master.sent if path == progress]
+    assert progress_sent == ["0.1", "0.4"]
+    assert replies["queued0"] == replies["queued1"] == replies["queued2"] != replies["first"]
+    assert session._slots == {}
+
+    stats = session.stats()
+    assert stats["POST /api/v1/trials/{id}/progress"]["requests"] == 2
+    assert stats["POST /api/v1/trials/{id}/progress"]["coalesced"] == 2
+    assert stats["POST /task-logs"]["requests"] == 2
+    assert stats["POST /task-logs"]["requests_per_second"] > 0
+
+
+def test_multiplexed_session_backs_off_together(
+    fake_master: FakeMaster, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_multiplex, "INITIAL_BACKOFF", 0.2)
+    session = _make_session()
+    fake_master.release.set()
+    fake_master.fail = 1
+
+    with pytest.raises(errors.MasterNotFoundException):
+        session.post("task-logs", data="line")
+
+    # Any request sent during the backoff, from any thread, waits for it to end.
+    start = time.time()
+    result = []
+    t = threading.Thread(target=lambda: result.append(session.get("/api/v1/me")))
+    t.start()
+    t.join()
+    assert time.time() - start >= 0.15
+    assert result[0].status_code == 200
+    assert session.stats()["POST /task-logs"]["errors"] == 1
+
+    # A successful request ends the backoff.
+    start = time.time()
+    session.get("/api/v1/me")
+    assert time.time() - start < 0.15
@@ -1,10 +1,16 @@
 import contextlib
 import json
+import socket
 import ssl
 import threading
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import (
+    BaseHTTPRequestHandler,
+    HTTPServer,
+    SimpleHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import determined
 from determined.common.api import bindings
@@ -187,3 +193,54 @@ def run_api_server(
     finally:
         server.shutdown()
         thread.join()
+
+
+@contextlib.contextmanager
+def run_stub_server(ssl_keys: Optional[Dict[str, Path]] = None) -> Iterator[Tuple[str, List[int]]]:
+    """
+    Run a threaded HTTP/1.1 server on a random port, which answers every request with an empty
+    JSON object and keeps connections open between requests.  It serves https if ssl_keys are
+    given.
+
+    Yields the server's url, and a list of the client ports of every connection it accepted.
+    """
+    connections = []  # type: List[int]
+
+    class RequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            # Like the master, answer without waiting to coalesce the headers and the body.
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connections.append(self.client_address[1])
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def _respond(self) -> None:
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        do_GET = do_POST = _respond
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+    server.daemon_threads = True
+    protocol = "http"
+    if ssl_keys is not None:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(str(ssl_keys["certfile"]), str(ssl_keys["keyfile"]))
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        protocol = "https"
+    thread = threading.Thread(target=server.serve_forever, args=[0.1], daemon=True)
+    thread.start()
+    try:
+        yield f"{protocol}://localhost:{server.server_address[1]}", connections
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
@@ -0,0 +1,96 @@
+"""
+Measure decoding and encoding a large list response with the generated api bindings: the time to
+parse the json, to build the binding objects, and to turn them back into json, and the memory the
+objects take.
+
+Usage (from the harness directory):
+
+    python -m tests.common.bench_bindings [--checkpoints 50000] [--repeat 3]
+
+The json codec is orjson when it is installed, and json otherwise.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from determined.common.api import bindings
+
+
+def make_checkpoint(i: int) -> Dict[str, Any]:
+    # Like the master, emit every field, with null for the unset ones.
+    metrics = {"loss": 0.5 / (i + 1), "accuracy": 0.9, "lr": 1e-4}
+    return {
+        "uuid": f"00000000-0000-0000-0000-{i:012d}",
+        "taskId": f"{i // 10}.task",
+        "allocationId": f"{i // 10}.task.1",
+        "reportTime": "2023-06-01T00:00:00.000000Z",
+        "resources": {f"state_dict_{n}.pth": 1 << 20 for n in range(8)},
+        "metadata": {"steps_completed": i * 100, "framework": "torch-2.0.1", "format": "pickle"},
+        "state": "STATE_COMPLETED",
+        "training": {
+            "trialId": i // 10,
+            "experimentId": 1,
+            "experimentConfig": None,
+            "hparams": {"global_batch_size": 64, "lr": 1e-4, "n_filters": 32},
+            "trainingMetrics": {"avgMetrics": metrics, "batchMetrics": None},
+            "validationMetrics": {"avgMetrics": metrics, "batchMetrics": None},
+            "searcherMetric": 0.5 / (i + 1),
+        },
+        "storageId": None,
+    }
+
+
+def best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    """
+    Return the fastest of several runs of fn, in milliseconds.
+    """
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checkpoints", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    response = {
+        "checkpoints": [make_checkpoint(i) for i in range(args.checkpoints)],
+        "pagination": {"offset": 0, "limit": args.checkpoints, "total": args.checkpoints},
+    }
+    content = json.dumps(response).encode("utf8")
+    obj = bindings.loads(content)
+    resp = bindings.v1GetExperimentCheckpointsResponse.from_json(obj)
+    out = resp.to_json()
+
+    print(f"{args.checkpoints} checkpoints, {len(content) / 2**20:.1f} MB of json")
+    results = {
+        "json.loads": lambda: json.loads(content),
+        "bindings.loads": lambda: bindings.loads(content),
+        "from_json": lambda: bindings.v1GetExperimentCheckpointsResponse.from_json(obj),
+        "to_json": lambda: resp.to_json(),
+        "json.dumps": lambda: json.dumps(out),
+        "bindings.dumps": lambda: bindings.dumps(out),
+    }
+    for name, fn in results.items():
+        print(f"  {name:>15}: {best_of(args.repeat, fn):8.1f} ms")
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = bindings.v1GetExperimentCheckpointsResponse.from_json(obj)
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(
+        f"  {'objects':>15}: {size / 2**20:8.1f} MB ({size // len(kept.checkpoints)} B/checkpoint)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Measure how many requests per second an api.Session makes against a local stub server, with and
+without keep-alive connections.
+
+Usage (from the harness directory):
+
+    python -m tests.common.bench_session [--calls 2000] [--threads 1,4] [--tls]
+"""
+
+import argparse
+import concurrent.futures
+import time
+
+import urllib3
+
+from determined.common import api
+from determined.common.api import certs
+from tests.common import api_server
+
+
+def bench(sess: api.Session, calls: int, threads: int) -> float:
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+        for response in pool.map(lambda _: sess.get("/api/v1/me"), range(calls)):
+            assert response.status_code == 200
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", default="1,4")
+    parser.add_argument("--tls", action="store_true", help="serve https")
+    args = parser.parse_args()
+
+    utp = api.UsernameTokenPair("user", "token")
+    ssl_keys = api_server.CERTS1 if args.tls else None
+    # The test certificates have no subjectAltName, so skip verification; the handshake is the same.
+    cert = certs.Cert(noverify=True) if args.tls else None
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    with api_server.run_stub_server(ssl_keys) as (master_url, connections):
+        for threads in (int(t) for t in args.threads.split(",")):
+            print(f"{args.calls} calls from {threads} threads")
+            for keep_alive in (False, True):
+                sess = api.Session(master_url, utp, cert, keep_alive=keep_alive)
+                before = len(connections)
+                rate = bench(sess, args.calls, threads)
+                name = "keep-alive" if keep_alive else "no pool"
+                print(
+                    f"  {name:>10}: {rate:8.0f} calls/s "
+                    f"({len(connections) - before} connections)"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,15 @@
+import itertools
+import threading
+import time
+import types
+from typing import Iterator, List
+
 import pytest
+import requests
 
 from determined.common import api
+from determined.common.api import bindings, errors
+from tests.common import api_server
 
 
 @pytest.mark.parametrize(
@@ -42,3 +51,103 @@ def test_canonicalize_master_url_valid(url: str, exp: str) -> None:
 def test_canonicalize_master_url_invalid(url: str, exp: str) -> None:
     with pytest.raises(ValueError, match=exp):
         api.canonicalize_master_url(url)
+
+
+def test_session_keeps_connections_alive() -> None:
+    utp = api.UsernameTokenPair("user", "token")
+    with api_server.run_stub_server() as (master_url, connections):
+        sess = api.Session(master_url, utp, None)
+        for _ in range(10):
+            sess.get("/api/v1/me")
+        assert len(connections) == 1
+
+        # Sessions with the same master, cert and retry policy share their connections.
+        other = api.UnauthSession(master_url, None)
+        assert other._transport is sess._transport
+        other.post("/api/v1/auth/login", json={})
+        assert len(connections) == 1
+
+        # A different retry policy gets its own pool.
+        assert api.Session(master_url, utp, None, max_retries=0)._transport is not sess._transport
+
+        # Without keep-alive, every request opens a new connection.
+        sess = api.Session(master_url, utp, None, keep_alive=False)
+        assert sess._transport is None
+        for _ in range(3):
+            sess.get("/api/v1/me")
+        assert len(connections) == 4
+
+
+class PagedIds:
+    """
+    Serve a list of ids in pages, recording the offset of every request.
+    """
+
+    def __init__(self, total: int, page_size: int, short_page_at: int = -1) -> None:
+        self.total = total
+        self.page_size = page_size
+        self.short_page_at = short_page_at
+        self.offsets = []  # type: List[int]
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, offset: int) -> bindings.v1ListWorkspacesBoundToRPResponse:
+        with self.lock:
+            self.offsets.append(offset)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        end = min(offset + self.page_size, self.total)
+        if offset == self.short_page_at:
+            end = offset + 1
+        with self.lock:
+            self.in_flight -= 1
+        return bindings.v1ListWorkspacesBoundToRPResponse(
+            workspaceIds=list(range(offset, end)),
+            pagination=bindings.v1Pagination(startIndex=offset, endIndex=end, total=self.total),
+        )
+
+
+def _ids(resps: Iterator[bindings.v1ListWorkspacesBoundToRPResponse]) -> List[int]:
+    return [i for r in resps for i in r.workspaceIds or []]
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_read_paginated(concurrency: int) -> None:
+    get_ids = PagedIds(total=25, page_size=4)
+    ids = _ids(api.read_paginated(get_ids, concurrency=concurrency))
+    assert ids == list(range(25))
+    assert sorted(get_ids.offsets) == list(range(0, 25, 4))
+    assert get_ids.max_in_flight == concurrency
+
+
+def test_read_paginated_concurrently_streams() -> None:
+    # No more than concurrency pages are requested ahead of the one being read.
+    get_ids = PagedIds(total=100, page_size=10)
+    resps = api.read_paginated(get_ids, concurrency=2)
+    assert _ids(itertools.islice(resps, 2)) == list(range(20))
+    assert len(get_ids.offsets) <= 4
+    assert isinstance(resps, types.GeneratorType)
+    resps.close()
+
+
+def test_read_paginated_concurrently_recovers_from_short_pages() -> None:
+    get_ids = PagedIds(total=25, page_size=4, short_page_at=8)
+    ids = _ids(api.read_paginated(get_ids, concurrency=3))
+    assert ids == list(range(25))
+    assert 9 in get_ids.offsets
+
+
+def test_read_paginated_concurrently_raises_in_order() -> None:
+    def get_ids(offset: int) -> bindings.v1ListWorkspacesBoundToRPResponse:
+        if offset == 8:
+            raise errors.APIException(requests.Response())
+        return PagedIds(total=25, page_size=4)(offset)
+
+    with pytest.raises(errors.APIException):
+        resps = api.read_paginated(get_ids, concurrency=3)
+        ids = []  # type: List[int]
+        for r in resps:
+            ids.extend(r.workspaceIds or [])
+    assert ids == list(range(8))
@@ -1,5 +1,10 @@
+import concurrent.futures
 import contextlib
+import json
+import os
 import pathlib
+import tempfile
+import threading
 from typing import Any, Callable, Dict, Iterator, List, Optional
 from unittest import mock
 
@@ -7,6 +12,7 @@ import pytest
 import requests
 
 from determined import core
+from determined.common import storage
 from tests import parallel
 
 
@@ -146,6 +152,325 @@ def test_checkpoint_context(dummy: bool, mode: core.DownloadMode, tmp_path: path
             storage_manager.restore_path.reset_mock()
 
 
+def test_upload_dedup(tmp_path: pathlib.Path) -> None:
+    ckpt_dir = tmp_path.joinpath("ckpt-dir")
+    ckpt_dir.mkdir()
+    ckpt_dir.joinpath("frozen").write_text("frozen weights")
+    ckpt_dir.joinpath("trained").write_text("step 1")
+
+    storage_manager = make_mock_storage_manager(tmp_path)
+    storage_manager._list_directory.return_value = {"frozen": 14, "trained": 6}
+    checkpoint_context = core.DummyCheckpointContext(
+        core.DummyDistributedContext(), storage_manager
+    )
+
+    # The first upload has nothing to compare against.
+    first = checkpoint_context.upload(ckpt_dir, dedup=True)
+    storage_manager.copy.assert_not_called()
+    storage_manager.upload.assert_called_once_with(
+        src=str(ckpt_dir), dst=first, paths={"frozen", "trained", "dedup_manifest.0.json"}
+    )
+    storage_manager.upload.reset_mock()
+    # The manifest is stored with the checkpoint.
+    manifest = json.loads(ckpt_dir.joinpath("dedup_manifest.0.json").read_text())
+    assert set(manifest) == {"frozen", "trained"}
+
+    # Unchanged files are copied from the previous checkpoint instead of uploaded.
+    ckpt_dir.joinpath("trained").write_text("step 2")
+    storage_manager._list_directory.return_value["dedup_manifest.0.json"] = 1
+    second = checkpoint_context.upload(ckpt_dir, dedup=True)
+    storage_manager.copy.assert_called_once_with(src=first, dst=second, paths={"frozen"})
+    storage_manager.upload.assert_called_once_with(
+        src=str(ckpt_dir), dst=second, paths={"trained", "dedup_manifest.0.json"}
+    )
+    storage_manager.copy.reset_mock()
+    storage_manager.upload.reset_mock()
+
+    # Backends without server-side copies fall back to uploading everything.
+    storage_manager.copy.side_effect = NotImplementedError()
+    third = checkpoint_context.upload(ckpt_dir, dedup=True)
+    storage_manager.copy.assert_called_once_with(src=second, dst=third, paths={"frozen", "trained"})
+    storage_manager.upload.assert_called_once_with(
+        src=str(ckpt_dir), dst=third, paths={"frozen", "trained", "dedup_manifest.0.json"}
+    )
+
+
+def test_upload_dedup_resume(tmp_path: pathlib.Path) -> None:
+    ckpt_dir = tmp_path.joinpath("ckpt-dir")
+    ckpt_dir.mkdir()
+    ckpt_dir.joinpath("frozen").write_text("frozen weights")
+    ckpt_dir.joinpath("trained").write_text("step 1")
+
+    storage_manager = make_mock_storage_manager(tmp_path)
+    storage_manager._list_directory.return_value = {"frozen": 14, "trained": 6}
+    checkpoint_context = core.DummyCheckpointContext(
+        core.DummyDistributedContext(), storage_manager
+    )
+    first = checkpoint_context.upload(ckpt_dir, dedup=True)
+
+    # "Upload" the checkpoint, so that restore_path finds its manifest.
+    restore_path = tmp_path.joinpath("restore-path")
+    restore_path.mkdir()
+    for name in ("frozen", "trained", "dedup_manifest.0.json"):
+        restore_path.joinpath(name).write_bytes(ckpt_dir.joinpath(name).read_bytes())
+    storage_manager.upload.reset_mock()
+
+    # A new context resuming from the checkpoint reuses its files from the first upload on.
+    checkpoint_context = core.DummyCheckpointContext(
+        core.DummyDistributedContext(), storage_manager, latest_checkpoint=first
+    )
+    ckpt_dir.joinpath("trained").write_text("step 2")
+    second = checkpoint_context.upload(ckpt_dir, dedup=True)
+    storage_manager.restore_path.assert_called_once_with(first, mock.ANY)
+    storage_manager.copy.assert_called_once_with(src=first, dst=second, paths={"frozen"})
+    storage_manager.upload.assert_called_once_with(
+        src=str(ckpt_dir), dst=second, paths={"trained", "dedup_manifest.0.json"}
+    )
+    storage_manager.copy.reset_mock()
+    storage_manager.restore_path.reset_mock()
+
+    # Resuming from a checkpoint without a manifest uploads everything.
+    restore_path.joinpath("dedup_manifest.0.json").unlink()
+    checkpoint_context = core.DummyCheckpointContext(
+        core.DummyDistributedContext(), storage_manager, latest_checkpoint=first
+    )
+    checkpoint_context.upload(ckpt_dir, dedup=True)
+    storage_manager.restore_path.assert_called_once()
+    storage_manager.copy.assert_not_called()
+
+
+def test_upload_dedup_sharded(tmp_path: pathlib.Path) -> None:
+    with parallel.Execution(2) as pex:
+
+        @pex.run
+        def do_test() -> None:
+            ckpt_dir = tmp_path.joinpath(f"ckpt-dir-{pex.rank}")
+            ckpt_dir.mkdir()
+            ckpt_dir.joinpath(f"shard-{pex.rank}").write_text("weights")
+
+            storage_manager = make_mock_storage_manager(tmp_path)
+            storage_manager._list_directory.side_effect = storage.StorageManager._list_directory
+            checkpoint_context = core.DummyCheckpointContext(pex.distributed, storage_manager)
+            with mock.patch.object(checkpoint_context, "_report_checkpoint") as report:
+                storage_id = checkpoint_context.upload(ckpt_dir, shard=True, dedup=True)
+
+            # Each rank stores its own manifest, and all of them are reported.
+            uploaded = storage_manager.upload.call_args.kwargs["paths"]
+            assert f"dedup_manifest.{pex.rank}.json" in uploaded
+            if pex.rank == 0:
+                resources = report.call_args.args[1]
+                assert set(resources) == {
+                    "metadata.json",
+                    "shard-0",
+                    "shard-1",
+                    "dedup_manifest.0.json",
+                    "dedup_manifest.1.json",
+                }
+                report.assert_called_once_with(storage_id, resources, {})
+
+
+def test_upload_background(tmp_path: pathlib.Path) -> None:
+    ckpt_dir = tmp_path.joinpath("ckpt-dir")
+    ckpt_dir.joinpath("subdir").mkdir(parents=True)
+    ckpt_dir.joinpath("subdir", "model").write_text("step 1")
+
+    storage_manager = make_mock_storage_manager(tmp_path)
+    storage_manager._list_directory.side_effect = storage.StorageManager._list_directory
+    unblock = threading.Event()
+    uploaded = {}  # type: Dict[str, str]
+    snapshots = []
+
+    def upload(src: str, dst: str, paths: Any = None) -> None:
+        assert unblock.wait(10)
+        assert set(storage.StorageManager._list_directory(src)) == {
+            "metadata.json",
+            "subdir/",
+            "subdir/model",
+        }
+        uploaded[dst] = pathlib.Path(src, "subdir", "model").read_text()
+        snapshots.append(src)
+
+    storage_manager.upload.side_effect = upload
+    checkpoint_context = core.DummyCheckpointContext(
+        core.DummyDistributedContext(), storage_manager, max_background_uploads=1
+    )
+
+    storage_id = checkpoint_context.upload(ckpt_dir, background=True)
+    # The upload is from a snapshot, so ckpt_dir may be modified immediately.
+    ckpt_dir.joinpath("subdir", "model").write_text("step 2")
+
+    # A second checkpoint must wait for the first to finish.
+    second = threading.Thread(
+        target=checkpoint_context.upload, args=(ckpt_dir,), kwargs={"background": True}
+    )
+    second.start()
+    second.join(0.1)
+    assert second.is_alive()
+    assert not uploaded
+
+    unblock.set()
+    second.join(10)
+    checkpoint_context.wait()
+    assert len(uploaded) == 2
+    assert uploaded[storage_id] == "step 1"
+    # Snapshots are cleaned up after uploading.
+    assert not any(os.path.exists(p) for p in snapshots)
+
+    # Errors are raised by wait().
+    storage_manager.upload.side_effect = ValueError("upload failed")
+    checkpoint_context.upload(ckpt_dir, background=True)
+    with pytest.raises(ValueError, match="upload failed"):
+        checkpoint_context.wait()
+    checkpoint_context.wait()
+
+    with pytest.raises(ValueError, match="shard=True, background=True"):
+        checkpoint_context.upload(ckpt_dir, shard=True, background=True)
+
+
+def test_upload_background_error_cleans_up_snapshot(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ckpt_dir = tmp_path.joinpath("ckpt-dir")
+    ckpt_dir.mkdir()
+    ckpt_dir.joinpath("model").write_text("weights")
+    snapshots = tmp_path.joinpath("snapshots")
+    snapshots.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(snapshots))
+
+    storage_manager = make_mock_storage_manager(tmp_path)
+    storage_manager._list_directory.side_effect = storage.StorageManager._list_directory
+    storage_manager.upload.side_effect = ValueError("upload failed")
+    checkpoint_context = core.DummyCheckpointContext(
+        core.DummyDistributedContext(), storage_manager
+    )
+
+    checkpoint_context.upload(ckpt_dir, background=True)
+    concurrent.futures.wait([f for _, f in checkpoint_context._background._pending])
+
+    # The next upload re-raises the earlier error, and its own snapshot is not left behind.
+    storage_manager.upload.side_effect = None
+    with pytest.raises(ValueError, match="upload failed"):
+        checkpoint_context.upload(ckpt_dir, background=True)
+    assert list(snapshots.iterdir()) == []
+    storage_manager.upload.assert_called_once()
+
+
+def test_upload_background_skips_tensorboard_sync(tmp_path: pathlib.Path) -> None:
+    ckpt_dir = tmp_path.joinpath("ckpt-dir")
+    ckpt_dir.mkdir()
+    storage_manager = make_mock_storage_manager(tmp_path)
+    storage_manager._list_directory.side_effect = storage.StorageManager._list_directory
+    session = mock.MagicMock()
+    response = requests.Response()
+    response.status_code = 200
+    session._do_request.return_value = response
+    tensorboard_manager = mock.MagicMock()
+    checkpoint_context = core.CheckpointContext(
+        core.DummyDistributedContext(),
+        storage_manager,
+        session=session,
+        task_id="task-id",
+        allocation_id="allocation-id",
+        tbd_sync_mode=core.TensorboardMode.AUTO,
+        tensorboard_manager=tensorboard_manager,
+        storage_backend_id=None,
+    )
+
+    # Tensorboard is only ever synced from the main thread.
+    checkpoint_context.upload(ckpt_dir, metadata={"steps_completed": 1}, background=True)
+    checkpoint_context.wait()
+    session._do_request.assert_called_once()
+    tensorboard_manager.sync.assert_not_called()
+
+    checkpoint_context.upload(ckpt_dir, metadata={"steps_completed": 2})
+    tensorboard_manager.sync.assert_called_once()
+
+
+def test_store_path_background(tmp_path: pathlib.Path) -> None:
+    storage_manager = make_mock_storage_manager(tmp_path)
+    storage_manager.pre_store_path.return_value = tmp_path.joinpath("store-path")
+    tmp_path.joinpath("store-path").mkdir()
+    checkpoint_context = core.DummyCheckpointContext(
+        core.DummyDistributedContext(), storage_manager
+    )
+
+    with checkpoint_context.store_path(background=True) as (path, storage_id):
+        path.joinpath("model").write_text("weights")
+    checkpoint_context.wait()
+
+    storage_manager.store_path.assert_not_called()
+    storage_manager.post_store_path.assert_called_once_with(path, storage_id)
+
+    # A store path which is never uploaded is cleaned up, whether the body of the with raises...
+    with pytest.raises(ValueError, match="training failed"):
+        with checkpoint_context.store_path(background=True) as (path, _):
+            path.joinpath("model").write_text("weights")
+            raise ValueError("training failed")
+    assert not path.exists()
+
+    # ... or submitting it re-raises the error of an earlier upload.
+    path.mkdir()
+    with mock.patch.object(
+        checkpoint_context._background, "submit", side_effect=ValueError("upload failed")
+    ):
+        with pytest.raises(ValueError, match="upload failed"):
+            with checkpoint_context.store_path(background=True) as (path, _):
+                path.joinpath("model").write_text("weights")
+    assert not path.exists()
+
+    # A failed upload cleans up after itself too.
+    path.mkdir()
+    storage_manager.post_store_path.side_effect = ValueError("upload failed")
+    with checkpoint_context.store_path(background=True) as (path, _):
+        path.joinpath("model").write_text("weights")
+    with pytest.raises(ValueError, match="upload failed"):
+        checkpoint_context.wait()
+    assert not path.exists()
+
+
+def test_upload_dedup_background(tmp_path: pathlib.Path) -> None:
+    ckpt_dir = tmp_path.joinpath("ckpt-dir")
+    ckpt_dir.mkdir()
+    ckpt_dir.joinpath("frozen").write_text("frozen weights")
+    ckpt_dir.joinpath("trained").write_text("step 1")
+
+    storage_manager = make_mock_storage_manager(tmp_path)
+    storage_manager._list_directory.return_value = {"frozen": 14, "trained": 6}
+    unblock = threading.Event()
+    uploaded = []  # type: List[str]
+
+    def upload(src: str, dst: str, paths: Any = None) -> None:
+        if not uploaded:
+            assert unblock.wait(10)
+        uploaded.append(dst)
+
+    storage_manager.upload.side_effect = upload
+    checkpoint_context = core.DummyCheckpointContext(
+        core.DummyDistributedContext(), storage_manager
+    )
+
+    first = checkpoint_context.upload(ckpt_dir, background=True, dedup=True)
+
+    # A foreground upload must not reuse files from a checkpoint which is still uploading, nor
+    # upload everything because the previous manifest is not recorded yet; it waits instead.
+    second_id = []  # type: List[str]
+    second = threading.Thread(
+        target=lambda: second_id.append(checkpoint_context.upload(ckpt_dir, dedup=True))
+    )
+    second.start()
+    second.join(0.1)
+    assert second.is_alive()
+    storage_manager.copy.assert_not_called()
+
+    unblock.set()
+    second.join(10)
+    checkpoint_context.wait()
+    assert uploaded == [first, second_id[0]]
+    storage_manager.copy.assert_called_once_with(
+        src=first, dst=second_id[0], paths={"frozen", "trained"}
+    )
+
+
 @pytest.mark.parametrize(
     "resources,expected_merged,expected_conflicts",
     [
@@ -0,0 +1,110 @@
+import gzip
+import json
+from typing import Any, Dict, List
+from unittest import mock
+
+import pytest
+
+from determined.core import _log_shipper
+
+
+def decode_posts(session: mock.MagicMock) -> List[Dict[str, Any]]:
+    batches = []
+    for call in session.post.call_args_list:
+        assert call.args == ("task-logs",)
+        body = call.kwargs["data"]
+        if call.kwargs["headers"].get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        batches.append(json.loads(body))
+    return batches
+
+
+def test_log_sender_batches_lines() -> None:
+    session = mock.MagicMock()
+    sender = _log_shipper._LogSender(session, {"task_id": "task"})
+    sender.start()
+    sender.write("hello ")
+    sender.write("world\nsecond line\nthird")
+    for i in range(2000):
+        sender.write(f"step {i}\n")
+    sender.write(" line")
+    sender.close()
+
+    batches = decode_posts(session)
+    assert all(b["metadata"] == {"task_id": "task"} for b in batches)
+    assert all(len(b["logs"]) <= _log_shipper.LOG_BATCH_MAX_SIZE for b in batches)
+    lines = [line for b in batches for line in b["logs"]]
+    assert lines[:2] == ["hello world\n", "second line\n"]
+    assert lines[2] == "thirdstep 0\n"
+    assert lines[-2:] == ["step 1999\n", " line"]
+    assert len(lines) == 2003
+    assert any(
+        c.kwargs["headers"].get("Content-Encoding") == "gzip" for c in session.post.mock_calls
+    )
+
+
+@pytest.mark.parametrize("overflow", ["drop", "sample"])
+def test_log_sender_does_not_block_when_full(overflow: str) -> None:
+    session = mock.MagicMock()
+    sender = _log_shipper._LogSender(session, {"task_id": "task"}, overflow=overflow)
+
+    # The sender thread is not running yet, so nothing drains the queue.
+    n = 2 * _log_shipper.SHIP_QUEUE_MAX_SIZE
+    for i in range(n):
+        sender.write(f"{i}\n")
+    kept = sender._queue.qsize()
+    assert sender.dropped_writes == n - kept
+    if overflow == "drop":
+        assert kept == _log_shipper.SHIP_QUEUE_MAX_SIZE
+    else:
+        assert kept < _log_shipper.SHIP_QUEUE_MAX_SIZE
+
+    sender.start()
+    sender.close()
+
+    lines = [line for b in decode_posts(session) for line in b["logs"]]
+    assert len(lines) == kept + 1
+    summaries = [line for line in lines if "were not shipped" in line]
+    assert len(summaries) == 1
+    assert summaries[0].startswith(f"[determined] {n - kept} writes to stdout/stderr")
+    assert sender.shipped == kept + 1
+    assert sender.dropped_writes == 0
+
+
+def test_log_sender_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_log_shipper, "SHIPPER_FAILURE_BACKOFF_SECONDS", 0)
+    session = mock.MagicMock()
+    session.post.side_effect = [ConnectionError("master unavailable"), None, None]
+    sender = _log_shipper._LogSender(session, {"task_id": "task"})
+
+    sender._append("a\nb\n")
+    sender.ship()
+    assert session.post.call_count == 2
+    assert sender.shipped == 2
+    assert sender._flush_interval == _log_shipper.SHIPPER_FLUSH_INTERVAL
+
+    # Only one attempt is made during shutdown, and failed lines are counted as dropped.
+    session.post.side_effect = ConnectionError("master unavailable")
+    sender._append("c\nd\n")
+    sender.ship(final=True)
+    assert sender.dropped_lines == 2
+    assert sender.dropped_writes == 0
+    assert sender._flush_interval > _log_shipper.SHIPPER_FLUSH_INTERVAL
+
+    # Dropped lines and dropped writes are summarized separately, each in their own unit.
+    session.post.side_effect = None
+    session.post.reset_mock()
+    sender.dropped_writes = 3
+    sender.ship()
+    assert decode_posts(session)[0]["logs"] == [
+        "[determined] 3 writes to stdout/stderr were not shipped because logs were produced "
+        "faster than they could be sent to the master\n",
+        "[determined] 2 lines of stdout/stderr were not shipped because the master did not "
+        "accept them\n",
+    ]
+    assert sender.dropped_lines == sender.dropped_writes == 0
+
+
+def test_log_sender_rejects_bad_overflow_policy() -> None:
+    with pytest.raises(ValueError, match="overflow must be one of"):
+        _log_shipper._LogSender(mock.MagicMock(), {}, overflow="ignore")
@@ -107,8 +107,9 @@ class MockMasterSearchRunner(searcher.LocalSearchRunner):
         search_method: searcher.SearchMethod,
         mock_master_object: MockMaster,
         searcher_dir: Optional[Path] = None,
+        **kwargs: Any,
     ):
-        super(MockMasterSearchRunner, self).__init__(search_method, searcher_dir)
+        super(MockMasterSearchRunner, self).__init__(search_method, searcher_dir, **kwargs)
         self.mock_master_obj = mock_master_object
         initial_ops = bindings.v1InitialOperations()
         event_obj = bindings.v1SearcherEvent(id=1, initialOperations=initial_ops)
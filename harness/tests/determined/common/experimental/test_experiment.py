@@ -125,6 +125,28 @@ def test_iter_trials_iterates_through_all_trials(
     assert len(list(trials)) == len(tr_resp.trials)
 
 
+@responses.activate
+def test_iter_trials_concurrently_yields_trials_in_order(
+    make_expref: Callable[[int], experiment.Experiment]
+) -> None:
+    expref = make_expref(1)
+
+    tr_resp = api_responses.sample_get_experiment_trials()
+    for trial in tr_resp.trials:
+        trial.experimentId = expref.id
+
+    responses.add_callback(
+        responses.GET,
+        f"{_MASTER}/api/v1/experiments/{expref.id}/trials",
+        callback=api_responses.serve_by_page(tr_resp, "trials", max_page_size=1),
+    )
+
+    trials = expref.iter_trials(limit=1, concurrency=3)
+
+    assert [t.id for t in trials] == [t.id for t in tr_resp.trials]
+    assert len(responses.calls) == len(tr_resp.trials)
+
+
 @responses.activate
 def test_iter_trials_requests_pages_lazily(
     make_expref: Callable[[int], experiment.Experiment]
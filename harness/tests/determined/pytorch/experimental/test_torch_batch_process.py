@@ -1,6 +1,7 @@
 import math
+import time
 import unittest.mock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import pytest
 import torch
@@ -8,6 +9,8 @@ from torch.utils import data
 
 from determined import core, pytorch
 from determined.pytorch import experimental
+from determined.pytorch.experimental import _torch_batch_process, _work_queue
+from tests import parallel
 from tests.launch import test_util
 
 DEFAULT_SLOT_IDS = [0]
@@ -676,3 +679,297 @@ def test_get_default_device(
 
     default_device = experimental.get_default_device(core_context)
     assert expected_device == default_device
+
+
+class RecordingProcessor(experimental.TorchBatchProcessor):
+    """
+    Write every batch in the background, and record the order in which batches are processed,
+    written, and checkpointed.
+    """
+
+    events: List[str] = []
+
+    def __init__(self, context: experimental.TorchBatchProcessorContext) -> None:
+        self.context = context
+
+    def process_batch(self, batch: Any, batch_idx: int) -> None:
+        assert isinstance(batch, torch.Tensor)
+        self.events.append(f"process {batch.tolist()}")
+        self.context.run_in_background(self.write, batch_idx)
+
+    def write(self, batch_idx: int) -> None:
+        time.sleep(0.01)
+        self.events.append(f"write {batch_idx}")
+
+
+@unittest.mock.patch(
+    "determined.pytorch.experimental._torch_batch_process._initialize_default_inference_context"
+)
+@unittest.mock.patch(
+    "determined.pytorch.experimental._torch_batch_process._synchronize_and_checkpoint"
+)
+@pytest.mark.parametrize("prefetch_batches", [0, 1, 3])
+def test_torch_batch_process_pipeline(
+    mock_synchronize_and_checkpoint: unittest.mock.MagicMock,
+    mock_initialize_default_inference_context: unittest.mock.MagicMock,
+    prefetch_batches: int,
+) -> None:
+    with test_util.set_mock_cluster_info(DEFAULT_ADDRS, 0, 1):
+        mock_core_context = _get_core_context(rank=0)
+        mock_initialize_default_inference_context.return_value = mock_core_context
+        RecordingProcessor.events = []
+        mock_synchronize_and_checkpoint.side_effect = (
+            lambda core_context, steps_completed, *args, **kwargs: RecordingProcessor.events.append(
+                f"checkpoint {steps_completed}"
+            )
+        )
+
+        experimental.torch_batch_process(
+            dataset=IndexData(10),
+            batch_processor_cls=RecordingProcessor,
+            batch_size=2,
+            checkpoint_interval=2,
+            prefetch_batches=prefetch_batches,
+            prefetch_to_device=prefetch_batches > 0,
+            background_checkpoints=True,
+        )
+
+        # Batches are processed in order, and every write finishes before the next checkpoint.
+        events = RecordingProcessor.events
+        assert [e for e in events if e.startswith("process")] == [
+            f"process {[i, i + 1]}" for i in range(0, 10, 2)
+        ]
+        checkpoints = [i for i, e in enumerate(events) if e.startswith("checkpoint")]
+        assert [events[i] for i in checkpoints] == ["checkpoint 2", "checkpoint 4", "checkpoint 5"]
+        for batch_idx in range(5):
+            assert events.index(f"write {batch_idx}") < checkpoints[batch_idx // 2]
+        for call in mock_synchronize_and_checkpoint.call_args_list:
+            assert call.kwargs["background"] is True
+
+        # The chief reports the throughput of each stage at every checkpoint.
+        report_metrics = mock_core_context.__enter__().train.report_metrics
+        assert report_metrics.call_count == 2
+        metrics = report_metrics.call_args.kwargs["metrics"]
+        assert {
+            "batches_per_second",
+            "process_batches_per_second",
+            "write_batches_per_second",
+        } <= set(metrics)
+
+
+@unittest.mock.patch(
+    "determined.pytorch.experimental._torch_batch_process._initialize_default_inference_context"
+)
+@unittest.mock.patch(
+    "determined.pytorch.experimental._torch_batch_process._synchronize_and_checkpoint"
+)
+def test_torch_batch_process_background_error(
+    mock_synchronize_and_checkpoint: unittest.mock.MagicMock,
+    mock_initialize_default_inference_context: unittest.mock.MagicMock,
+) -> None:
+    class FailingProcessor(experimental.TorchBatchProcessor):
+        def __init__(self, context: experimental.TorchBatchProcessorContext) -> None:
+            self.context = context
+
+        def process_batch(self, batch: Any, batch_idx: int) -> None:
+            def fail() -> None:
+                raise OSError(f"failed to write batch {batch_idx}")
+
+            self.context.run_in_background(fail)
+
+    with test_util.set_mock_cluster_info(DEFAULT_ADDRS, 0, 1):
+        mock_initialize_default_inference_context.return_value = _get_core_context(rank=0)
+        with pytest.raises(OSError, match="failed to write batch 0"):
+            experimental.torch_batch_process(
+                dataset=IndexData(10),
+                batch_processor_cls=FailingProcessor,
+                batch_size=2,
+                checkpoint_interval=5,
+                prefetch_batches=2,
+            )
+        # The checkpoint after the failed write must not be saved.
+        assert mock_synchronize_and_checkpoint.call_count == 0
+
+
+def test_batch_prefetcher() -> None:
+    def batches() -> Iterator[torch.Tensor]:
+        for i in range(3):
+            yield torch.tensor([i])
+        raise ValueError("bad batch")
+
+    # Batches past the end of the iterator are None, like next(iterator, None).
+    prefetcher = _torch_batch_process._BatchPrefetcher(iter([1, 2]), 3, 2)
+    assert [prefetcher.get() for _ in range(3)] == [1, 2, None]
+    prefetcher.close()
+
+    # Errors are raised from get(), in order.
+    prefetcher = _torch_batch_process._BatchPrefetcher(batches(), 5, 2, torch.device("cpu"))
+    assert [prefetcher.get().tolist() for _ in range(3)] == [[0], [1], [2]]
+    with pytest.raises(ValueError, match="bad batch"):
+        prefetcher.get()
+    prefetcher.close()
+
+    # Closing a prefetcher which is blocked on a full queue stops it.
+    prefetcher = _torch_batch_process._BatchPrefetcher(iter(range(100)), 100, 1)
+    assert prefetcher.get() == 0
+    prefetcher.close()
+    assert not prefetcher._thread.is_alive()
+
+
+def test_synchronize_and_checkpoint_background() -> None:
+    core_context = _get_core_context(rank=0).__enter__()
+    core_context.distributed.gather.return_value = [4, 3]
+    store_path = core_context.checkpoint.store_path
+    store_path.return_value.__enter__.return_value = ("/tmp", "uuid")
+    with unittest.mock.patch("builtins.open", unittest.mock.mock_open()):
+        _torch_batch_process._synchronize_and_checkpoint(core_context, 4, "abc", background=True)
+    store_path.assert_called_once_with(
+        {"steps_completed": 3, "default_output_uuid": "abc"}, background=True
+    )
+
+
+def test_chunk_server() -> None:
+    sizes = _work_queue.chunk_batches(num_batches=7, chunk_size=3)
+    assert sizes == [3, 3, 1]
+
+    # Completed chunks are not handed out again after a restart.
+    server = _work_queue.ChunkServer(sizes, completed=[1], num_ranks=2)
+    clients = [_work_queue.ChunkClient(f"tcp://127.0.0.1:{server.port}", rank) for rank in range(2)]
+    try:
+        assert clients[0].next_chunk() == 0
+        assert clients[1].next_chunk() == 2
+        clients[1].done(2)
+        assert server.snapshot() == ([1, 2], 4)
+
+        # Once stopped, no more chunks are handed out, but ranks still finish their own.
+        server.stop()
+        assert clients[1].next_chunk() is None
+        assert clients[1].stopped
+        clients[0].done(0)
+        assert server.snapshot() == ([0, 1, 2], 7)
+
+        clients[0].finish()
+        assert not server.wait(timeout=0)
+        clients[1].finish()
+        assert server.wait(timeout=1)
+    finally:
+        for client in clients:
+            client.close()
+        server.close()
+
+
+class SlowRankProcessor(experimental.TorchBatchProcessor):
+    """
+    Record which batches each rank processes, with rank 1 much slower than the others.
+    """
+
+    processed: Dict[int, List[int]] = {}
+
+    def __init__(self, context: experimental.TorchBatchProcessorContext) -> None:
+        self.rank = context.get_distributed_rank()
+        self.processed[self.rank] = []
+
+    def process_batch(self, batch: Any, batch_idx: int) -> None:
+        assert batch.tolist() == list(range(batch_idx * 2, min(batch_idx * 2 + 2, 41)))
+        if self.rank == 1:
+            time.sleep(0.05)
+        self.processed[self.rank].append(batch_idx)
+
+
+@unittest.mock.patch(
+    "determined.pytorch.experimental._torch_batch_process._initialize_default_inference_context"
+)
+@unittest.mock.patch("determined.pytorch.experimental._torch_batch_process._checkpoint_chunks")
+@pytest.mark.parametrize("prefetch_batches", [0, 2])
+def test_torch_batch_process_dynamic_sharding(
+    mock_checkpoint_chunks: unittest.mock.MagicMock,
+    mock_initialize_default_inference_context: unittest.mock.MagicMock,
+    prefetch_batches: int,
+) -> None:
+    size = 3
+    with parallel.Execution(size) as pex:
+        mock_initialize_default_inference_context.side_effect = lambda *args, **kwargs: (
+            core._dummy_init(distributed=pex.distributed, preempt_mode=core.PreemptMode.ChiefOnly)
+        )
+        SlowRankProcessor.processed = {}
+
+        with test_util.set_mock_cluster_info(DEFAULT_ADDRS, 0, size):
+
+            @pex.run
+            def run() -> None:
+                experimental.torch_batch_process(
+                    dataset=IndexData(41),
+                    batch_processor_cls=SlowRankProcessor,
+                    batch_size=2,
+                    checkpoint_interval=1,
+                    dynamic_sharding=True,
+                    chunk_size=2,
+                    prefetch_batches=prefetch_batches,
+                )
+
+    # Every batch is processed exactly once, and the slow rank takes on fewer of them.
+    processed = SlowRankProcessor.processed
+    assert sorted(sum(processed.values(), [])) == list(range(21))
+    assert len(processed[1]) < len(processed[0])
+
+    # Only the chief checkpoints, and the last checkpoint covers every chunk.
+    assert mock_checkpoint_chunks.call_count > 1
+    _, completed_chunks, completed_batches, chunk_size, _ = mock_checkpoint_chunks.call_args.args
+    assert completed_chunks == list(range(11))
+    assert completed_batches == 21
+    assert chunk_size == 2
+
+
+@unittest.mock.patch("determined.pytorch.experimental._torch_batch_process._load_state")
+@unittest.mock.patch(
+    "determined.pytorch.experimental._torch_batch_process._initialize_default_inference_context"
+)
+@unittest.mock.patch("determined.pytorch.experimental._torch_batch_process._checkpoint_chunks")
+def test_torch_batch_process_dynamic_sharding_resume(
+    mock_checkpoint_chunks: unittest.mock.MagicMock,
+    mock_initialize_default_inference_context: unittest.mock.MagicMock,
+    mock_load_state: unittest.mock.MagicMock,
+) -> None:
+    metadata = {
+        "steps_completed": 4,
+        "default_output_uuid": "abc",
+        "completed_chunks": [0, 2],
+        "chunk_size": 2,
+    }
+    mock_load_state.return_value = metadata
+    with test_util.set_mock_cluster_info(DEFAULT_ADDRS, 0, 1, latest_checkpoint="ckpt"):
+        mock_core_context = _get_core_context(rank=0)
+        mock_core_context.__enter__().distributed = core.DummyDistributedContext()
+        mock_initialize_default_inference_context.return_value = mock_core_context
+        my_processor_instance = unittest.mock.Mock()
+        experimental.torch_batch_process(
+            dataset=IndexData(10),
+            batch_processor_cls=unittest.mock.Mock(return_value=my_processor_instance),
+            batch_size=1,
+            checkpoint_interval=2,
+            dynamic_sharding=True,
+        )
+        # Only the batches of chunks 1, 3 and 4 are processed.
+        batch_idxs = [
+            call.kwargs["batch_idx"] for call in my_processor_instance.process_batch.call_args_list
+        ]
+        assert batch_idxs == [2, 3, 6, 7, 8, 9]
+        assert mock_checkpoint_chunks.call_args.args[1:3] == ([0, 1, 2, 3, 4], 10)
+
+        # Static and dynamic sharding checkpoints are not interchangeable.
+        with pytest.raises(ValueError, match="dynamic_sharding"):
+            experimental.torch_batch_process(
+                dataset=IndexData(10),
+                batch_processor_cls=unittest.mock.Mock(),
+                batch_size=1,
+                checkpoint_interval=2,
+            )
+        with pytest.raises(ValueError, match="chunk_size"):
+            experimental.torch_batch_process(
+                dataset=IndexData(10),
+                batch_processor_cls=unittest.mock.Mock(),
+                batch_size=1,
+                checkpoint_interval=2,
+                dynamic_sharding=True,
+                chunk_size=3,
+            )
@@ -155,6 +155,12 @@ class BaseOneVarTrial(pytorch.PyTorchTrial):
         self.checkpoint_callback = CheckpointCallback()
         if self.hparams.get("disable_dataset_reproducibility_checks"):
             self.context.experimental.disable_dataset_reproducibility_checks()
+        if self.hparams.get("training_metrics_on_device"):
+            self.context.experimental.accumulate_training_metrics_on_device(
+                self.hparams.get("batch_metrics_period")
+            )
+        if self.hparams.get("validation_metrics_on_device"):
+            self.context.experimental.reduce_validation_metrics_on_device()
 
     def train_batch(
         self, batch: pytorch.TorchData, epoch_idx: int, batch_idx: int
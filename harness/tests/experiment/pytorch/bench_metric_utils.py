@@ -0,0 +1,98 @@
+"""
+Compare _average_training_metrics against the previous approach of building and averaging an array
+for every metric in every batch.
+
+Usage (from the harness directory):
+
+    python -m tests.experiment.pytorch.bench_metric_utils [--processes 64] [--batches 500]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from determined.pytorch import _metric_utils
+
+
+def average_each_batch(
+    combined_timeseries: Dict[str, Any], combined_num_batches: List[int]
+) -> List[Dict[str, Any]]:
+    averaged = {}
+    for name, process_batches in combined_timeseries.items():
+        averages = _metric_utils._average_each_batch(process_batches, combined_num_batches[0])
+        if isinstance(process_batches[0][0], np.ndarray):
+            averages = [np.array(avg) for avg in averages]
+        averaged[name] = averages
+    return [{name: averaged[name][i] for name in averaged} for i in range(combined_num_batches[0])]
+
+
+def make_timeseries(processes: int, batches: int, metrics: int) -> Dict[str, Any]:
+    """
+    Make metrics in the shapes which reach the chief: python floats from .item(), 0-d arrays from
+    tensors converted to numpy, and metrics which only some processes or batches report.
+    """
+    rng = np.random.default_rng(0)
+    timeseries = {}  # type: Dict[str, Any]
+    for m in range(metrics):
+        kind = m % 4
+        if kind == 0:
+            values = rng.random((processes, batches)).tolist()
+        elif kind == 1:
+            values = [[np.array(v) for v in row] for row in rng.random((processes, batches))]
+        elif kind == 2:
+            values = [list(row) for row in rng.random((processes, batches, 4))]
+        else:
+            values = [
+                [None if v < 0.2 else float(v) for v in row]
+                for row in rng.random((processes, batches))
+            ]
+        timeseries[f"metric{m}"] = values
+    return timeseries
+
+
+def bench(
+    name: str,
+    fn: Callable[[Dict[str, Any], List[int]], List[Dict[str, Any]]],
+    timeseries: Dict[str, Any],
+    num_batches: List[int],
+    repeat: int,
+) -> List[Dict[str, Any]]:
+    best = float("inf")
+    result = []  # type: List[Dict[str, Any]]
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(timeseries, num_batches)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:>10}: {best:8.3f}s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--processes", type=int, nargs="+", default=[8, 64])
+    parser.add_argument("--batches", type=int, default=500)
+    parser.add_argument("--metrics", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for processes in args.processes:
+        print(f"{processes} processes, {args.batches} batches, {args.metrics} metrics")
+        timeseries = make_timeseries(processes, args.batches, args.metrics)
+        num_batches = [args.batches] * processes
+        per_batch = bench("per batch", average_each_batch, timeseries, num_batches, args.repeat)
+        stacked = bench(
+            "stacked",
+            _metric_utils._average_training_metrics,
+            timeseries,
+            num_batches,
+            args.repeat,
+        )
+        for old, new in zip(per_batch, stacked):
+            for name in old:
+                assert np.allclose(old[name], new[name]), name
+
+
+if __name__ == "__main__":
+    main()
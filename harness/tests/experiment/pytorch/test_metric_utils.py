@@ -1,13 +1,15 @@
 import logging
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pytest
 import torch
 
+import determined as det
 import determined.errors
 import determined.pytorch._metric_utils as metric_utils
 from determined import pytorch
+from tests import parallel
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +87,172 @@ def test_average_training_metrics() -> None:
     assert averaged_metrics == expected_metrics
 
 
+def test_average_training_metrics_with_missing_values() -> None:
+    rng = np.random.default_rng(0)
+    num_processes, num_batches = 4, 6
+
+    def values(make: Any, missing: float = 0.0) -> List[List[Any]]:
+        return [
+            [None if rng.random() < missing else make() for _ in range(num_batches)]
+            for _ in range(num_processes)
+        ]
+
+    combined_timeseries: Dict[str, Any] = {
+        "scalar": values(lambda: float(rng.random())),
+        "int": values(lambda: int(rng.integers(10))),
+        "sparse": values(lambda: float(rng.random()), missing=0.5),
+        "array": values(lambda: rng.random(3), missing=0.3),
+        "single": values(lambda: np.array(rng.random())),
+        "absent": values(lambda: 1.0, missing=1.0),
+        # Metrics whose shape changes between batches cannot be stacked, so they are averaged
+        # one batch at a time.
+        "ragged": [[rng.random(b + 1) for b in range(num_batches)] for _ in range(num_processes)],
+    }
+
+    averaged_metrics = metric_utils._average_training_metrics(
+        combined_timeseries, [num_batches] * num_processes
+    )
+
+    assert len(averaged_metrics) == num_batches
+    for batch_idx, metrics in enumerate(averaged_metrics):
+        for name, process_batches in combined_timeseries.items():
+            batch = [v for v in (p[batch_idx] for p in process_batches) if v is not None]
+            if not batch:
+                assert np.isnan(metrics[name])
+                continue
+            expected = np.mean(np.concatenate([np.ravel(v) for v in batch]))
+            assert metrics[name] == pytest.approx(expected)
+            is_array = isinstance(process_batches[0][0], np.ndarray)
+            assert isinstance(metrics[name], np.ndarray) == is_array
+
+
+def make_batch_metrics(rank: int, num_batches: int, strings: bool) -> List[Dict[str, Any]]:
+    batches = [
+        {
+            "loss": torch.tensor(float(rank * 100 + i)),
+            "output": torch.tensor([[float(i)], [float(rank)]]),
+            "lr": 0.1,
+            "maybe": None if i % 2 else float(i),
+        }
+        for i in range(num_batches)
+    ]  # type: List[Dict[str, Any]]
+    if strings:
+        for batch in batches:
+            batch["note"] = "hello"
+    return batches
+
+
+@pytest.mark.parametrize("size", [1, 3])
+@pytest.mark.parametrize("period", [None, 1, 4])
+def test_training_metric_accumulator(size: int, period: Optional[int]) -> None:
+    num_batches = 8
+    # Combining string metrics across ranks is not supported.
+    strings = size == 1
+    with parallel.Execution(size) as pex:
+
+        @pex.run
+        def results() -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+            accumulator = metric_utils._TrainingMetricAccumulator(period)
+            for metrics in make_batch_metrics(pex.rank, num_batches, strings):
+                accumulator.add(metrics)
+            assert len(accumulator) == num_batches
+
+            # The reference path converts every batch to numpy and averages on the chief.
+            expected = [
+                metric_utils._convert_metrics_to_numpy(m)
+                for m in make_batch_metrics(pex.rank, num_batches, strings)
+            ]
+            if size > 1:
+                expected = metric_utils._combine_and_average_training_metrics(
+                    pex.distributed, expected
+                )
+            return accumulator.reduce(pex.distributed), expected
+
+    metrics, expected_batches = results[0]
+    expected = det.util.make_metrics(None, expected_batches)
+    assert metrics["avg_metrics"].keys() == expected["avg_metrics"].keys()
+    for name, value in expected["avg_metrics"].items():
+        if name == "maybe":
+            # The accumulator averages over every reported value, rather than averaging across
+            # ranks per batch first, which only differs when some values are missing.
+            assert metrics["avg_metrics"][name] == pytest.approx(3)
+        elif value is None:
+            assert metrics["avg_metrics"][name] is None
+        else:
+            assert metrics["avg_metrics"][name] == pytest.approx(value)
+
+    kept = [] if period is None else expected_batches[period - 1 :: period]
+    assert len(metrics["batch_metrics"]) == len(kept)
+    for got, want in zip(metrics["batch_metrics"], kept):
+        assert got["loss"] == pytest.approx(want["loss"])
+
+    # Only the chief gets the results.
+    assert all(r[0] == {} for r in results[1:])
+
+
+def test_training_metric_accumulator_unsummable_on_one_rank() -> None:
+    with parallel.Execution(2) as pex:
+
+        @pex.run
+        def results() -> Dict[str, Any]:
+            accumulator = metric_utils._TrainingMetricAccumulator()
+            for i in range(4):
+                # The output changes shape from batch to batch only on the second rank.
+                size = 2 + i * pex.rank
+                accumulator.add({"loss": float(i), "output": torch.ones(size)})
+            return accumulator.reduce(pex.distributed)
+
+    assert results[0]["avg_metrics"] == {"loss": pytest.approx(1.5), "output": None}
+
+
+@pytest.mark.parametrize("size", [1, 3])
+@pytest.mark.parametrize("reducer", list(pytorch.Reducer))
+def test_validation_metric_accumulator(size: int, reducer: pytorch.Reducer) -> None:
+    with parallel.Execution(size) as pex:
+
+        @pex.run
+        def results() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+            # Give each rank a different number of batches, so that AVG weights them.
+            num_batches = 3 + pex.rank
+            rng = np.random.default_rng(pex.rank)
+            batches = [
+                {
+                    "loss": torch.tensor(rng.random(), dtype=torch.float32),
+                    "output": torch.tensor(rng.random(4)),
+                    "count": int(rng.integers(10)),
+                }
+                for _ in range(num_batches)
+            ]
+            reducers = {name: reducer for name in batches[0]}
+
+            accumulator = metric_utils._ValidationMetricAccumulator(reducers)
+            for batch in batches:
+                accumulator.add(dict(batch))
+            assert len(accumulator) == num_batches
+
+            expected = metric_utils._reduce_metrics(
+                pex.distributed,
+                batch_metrics=[metric_utils._convert_metrics_to_numpy(dict(b)) for b in batches],
+                keys=batches[0].keys(),
+                metrics_reducers=reducers,
+            )
+            return accumulator.reduce(pex.distributed), expected
+
+    metrics, expected = results[0]
+    assert metrics.keys() == expected.keys()
+    for name, value in expected.items():
+        assert metrics[name] == pytest.approx(value, rel=1e-6)
+    # Only the chief gets the results.
+    assert all(r == ({}, {}) for r in results[1:])
+
+
+def test_validation_metric_accumulator_shape_change() -> None:
+    accumulator = metric_utils._ValidationMetricAccumulator({"output": pytorch.Reducer.AVG})
+    accumulator.add({"output": torch.zeros(4)})
+    with pytest.raises(ValueError, match="changed shape"):
+        accumulator.add({"output": torch.zeros(3)})
+
+
 def test_prepare_metric_reducers() -> None:
     metrics_dict = {"loss1": 1, "loss2": 2}
 
@@ -126,6 +126,40 @@ class TestPyTorchTrial:
         for metric in metrics:
             assert "mse" in metric
 
+    def test_training_metrics_on_device(self, tmp_path: pathlib.Path) -> None:
+        def train(hparams: typing.Dict[str, typing.Any]) -> typing.Any:
+            trial, trial_controller = pytorch_utils.create_trial_and_trial_controller(
+                trial_class=pytorch_onevar_model.OneVarTrialWithTrainingMetrics,
+                hparams=hparams,
+                trial_seed=self.trial_seed,
+                tensorboard_path=tmp_path.joinpath("tensorboard"),
+            )
+            _, metrics = trial_controller._train_with_boundaries(
+                training_enumerator=enumerate(trial_controller.training_iterator),
+                train_boundaries=[
+                    pytorch._TrainBoundary(
+                        step_type=pytorch._TrainBoundaryType.TRAIN, unit=pytorch.Batch(20)
+                    )
+                ],
+            )
+            return metrics
+
+        expected = det.util.make_metrics(None, train(self.hparams))
+
+        accumulator = train(
+            {**self.hparams, "training_metrics_on_device": True, "batch_metrics_period": 5}
+        )
+        assert isinstance(accumulator, pytorch._TrainingMetricAccumulator)
+        assert len(accumulator) == 20
+        metrics = accumulator.reduce(det.core.DummyDistributedContext())
+
+        assert metrics["avg_metrics"].keys() == expected["avg_metrics"].keys()
+        for name, value in expected["avg_metrics"].items():
+            assert metrics["avg_metrics"][name] == pytest.approx(value)
+        assert len(metrics["batch_metrics"]) == 4
+        for got, want in zip(metrics["batch_metrics"], expected["batch_metrics"][4::5]):
+            assert got["loss"] == pytest.approx(want["loss"])
+
     def test_nonscalar_validation(self, tmp_path: pathlib.Path) -> None:
         tensorboard_path = tmp_path.joinpath("tensorboard")
 
@@ -398,6 +432,23 @@ class TestPyTorchTrial:
         )
         trial_controller.run()
 
+    def test_validation_metrics_on_device(self, tmp_path: pathlib.Path) -> None:
+        def validate(hparams: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+            _, trial_controller = pytorch_utils.create_trial_and_trial_controller(
+                trial_class=pytorch_onevar_model.OneVarTrialPerMetricReducers,
+                hparams=hparams,
+                trial_seed=self.trial_seed,
+                tensorboard_path=tmp_path.joinpath("tensorboard"),
+            )
+            return trial_controller._validate()
+
+        expected = validate(self.hparams)
+        metrics = validate({**self.hparams, "validation_metrics_on_device": True})
+
+        assert metrics.keys() == expected.keys()
+        for name, value in expected.items():
+            assert metrics[name] == pytest.approx(value)
+
     def test_callbacks(self, tmp_path: pathlib.Path) -> None:
         checkpoint_dir = tmp_path.joinpath("checkpoint")
         tensorboard_path = tmp_path.joinpath("tensorboard")
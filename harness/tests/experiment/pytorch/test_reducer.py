@@ -1,15 +1,19 @@
 import itertools
 import logging
+import pathlib
 import sys
 import threading
 import traceback
 from collections import namedtuple
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, List
 
 import numpy as np
 import pytest
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
 
-from determined import core
+from determined import core, pytorch
 from determined.pytorch import Reducer, _PyTorchReducerContext, _simple_reduce_metrics
 
 logger = logging.getLogger(__name__)
@@ -136,3 +140,113 @@ def test_custom_reducer_slot_order(cross_size: int, local_size: int) -> None:
         assert all(
             i == v for i, v in enumerate(result["values"])
         ), f"result[{i}]={result} is not in original order"
+
+
+class HistogramReducer(pytorch.MetricReducer):
+    """
+    A reducer whose per-slot state is a mix of tensors, ndarrays, and python objects.
+    """
+
+    def __init__(self, rank: int, same_shapes: bool) -> None:
+        self.rank = rank
+        self.same_shapes = same_shapes
+        self.reset()
+
+    def reset(self) -> None:
+        bins = 4 if self.same_shapes else 4 + self.rank
+        self.hist = torch.zeros(bins, dtype=torch.int64)
+        self.confusion = np.zeros((2, 2), dtype=np.float32)
+        self.count = 0
+
+    def update(self, value: int) -> None:
+        self.hist[value % len(self.hist)] += 1
+        self.confusion[value % 2, (value // 2) % 2] += 0.5
+        self.count += 1
+
+    def per_slot_reduce(self) -> Any:
+        return {"hist": self.hist, "extra": (self.confusion, self.count, "label")}
+
+    def cross_slot_reduce(self, per_slot_metrics: List) -> Any:
+        assert all(isinstance(m["hist"], torch.Tensor) for m in per_slot_metrics)
+        assert all(isinstance(m["extra"][0], np.ndarray) for m in per_slot_metrics)
+        assert all(m["extra"][2] == "label" for m in per_slot_metrics)
+        return {
+            "hist": [m["hist"].tolist() for m in per_slot_metrics],
+            "confusion": sum(m["extra"][0] for m in per_slot_metrics).tolist(),
+            "count": sum(m["extra"][1] for m in per_slot_metrics),
+        }
+
+
+def test_extract_and_restore_leaves() -> None:
+    Pair = namedtuple("Pair", "a b")
+    obj = {
+        "t": torch.ones(2),
+        "n": [np.zeros(3), Pair(np.arange(2), "x")],
+        "s": np.array(["a"]),
+    }  # type: Dict[str, Any]
+    leaves = []  # type: List[Any]
+    skeleton = pytorch._reducer._extract_leaves(obj, leaves)
+
+    # String arrays are not numeric, so they stay in the skeleton.
+    assert len(leaves) == 3
+    assert isinstance(skeleton["n"][1], Pair)
+    assert skeleton["s"] is obj["s"]
+
+    restored = pytorch._reducer._restore_leaves(skeleton, leaves)
+    assert restored["t"] is obj["t"]
+    assert restored["n"][0] is obj["n"][0]
+    assert restored["n"][1].a is obj["n"][1].a and restored["n"][1].b == "x"
+
+
+def run_packed_allgather(rank: int, size: int, init_file: str) -> None:
+    dist.init_process_group("gloo", init_method=f"file://{init_file}", rank=rank, world_size=size)
+    # Use the real ZMQ allgather for everything torch.distributed does not carry.
+    distributed_context = core.DistributedContext(
+        rank=rank,
+        size=size,
+        local_rank=rank,
+        local_size=size,
+        cross_rank=0,
+        cross_size=1,
+        chief_ip="localhost",
+    )
+    packed_calls = []
+    torch_allgather = pytorch._reducer._torch_distributed_allgather
+
+    def record_allgather(*args: Any) -> Any:
+        packed_calls.append(args)
+        return torch_allgather(*args)
+
+    pytorch._reducer._torch_distributed_allgather = record_allgather  # type: ignore
+    try:
+        for same_shapes in (True, False):
+            packed_calls.clear()
+            reducer_context = _PyTorchReducerContext(distributed_context.allgather)
+            reducer = reducer_context.wrap_reducer(HistogramReducer(rank, same_shapes))
+            for value in range(rank, 20, size):
+                reducer.update(value)
+            metrics = reducer_context.reduce_metrics(for_training=False)
+
+            expected = HistogramReducer(0, same_shapes)
+            hists = []
+            for r in range(size):
+                hist = HistogramReducer(r, same_shapes)
+                for value in range(r, 20, size):
+                    hist.update(value)
+                    expected.update(value)
+                hists.append(hist.hist.tolist())
+            assert metrics["hist"] == hists
+            assert metrics["confusion"] == expected.confusion.tolist()
+            assert metrics["count"] == 20
+            # Reducer states only go through torch.distributed if they match across ranks.
+            assert len(packed_calls) == int(same_shapes)
+    finally:
+        distributed_context.close()
+        dist.destroy_process_group()
+
+
+def test_packed_allgather(tmp_path: pathlib.Path) -> None:
+    size = 3
+    mp.spawn(  # type: ignore
+        run_packed_allgather, args=(size, str(tmp_path.joinpath("init"))), nprocs=size
+    )
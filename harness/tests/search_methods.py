@@ -202,6 +202,76 @@ class RandomSearchMethod(searcher.SearchMethod):
             raise ex
 
 
+class SequentialSearchMethod(searcher.SearchMethod):
+    """
+    A deterministic search method, which numbers its trials instead of generating random request
+    ids, so that replaying events from its saved state returns the same operations.
+    """
+
+    def __init__(self, max_trials: int, max_concurrent_trials: int, max_length: int) -> None:
+        self.max_trials = max_trials
+        self.max_concurrent_trials = max_concurrent_trials
+        self.max_length = max_length
+        self.created_trials = 0
+        self.closed_trials = 0
+
+    def _create(self) -> List[searcher.Operation]:
+        request_id = uuid.UUID(int=self.created_trials)
+        hparams = {"global_batch_size": 10 + self.created_trials}
+        self.created_trials += 1
+        return [
+            searcher.Create(request_id=request_id, hparams=hparams, checkpoint=None),
+            searcher.ValidateAfter(request_id=request_id, length=self.max_length),
+        ]
+
+    def initial_operations(self, _: searcher.SearcherState) -> List[searcher.Operation]:
+        ops: List[searcher.Operation] = []
+        while self.created_trials < min(self.max_trials, self.max_concurrent_trials):
+            ops.extend(self._create())
+        return ops
+
+    def on_trial_created(
+        self, _: searcher.SearcherState, request_id: uuid.UUID
+    ) -> List[searcher.Operation]:
+        return []
+
+    def on_validation_completed(
+        self, _: searcher.SearcherState, request_id: uuid.UUID, metric: Any, train_length: int
+    ) -> List[searcher.Operation]:
+        return [searcher.Close(request_id=request_id)]
+
+    def on_trial_closed(
+        self, _: searcher.SearcherState, request_id: uuid.UUID
+    ) -> List[searcher.Operation]:
+        self.closed_trials += 1
+        if self.created_trials < self.max_trials:
+            return self._create()
+        if self.closed_trials == self.max_trials:
+            return [searcher.Shutdown()]
+        return []
+
+    def on_trial_exited_early(
+        self,
+        _: searcher.SearcherState,
+        request_id: uuid.UUID,
+        exited_reason: searcher.ExitedReason,
+    ) -> List[searcher.Operation]:
+        return self.on_trial_closed(_, request_id)
+
+    def progress(self, _: searcher.SearcherState) -> float:
+        return self.closed_trials / self.max_trials
+
+    def save_method_state(self, path: Path) -> None:
+        with path.joinpath("method_state").open("w") as f:
+            json.dump({"created": self.created_trials, "closed": self.closed_trials}, f)
+
+    def load_method_state(self, path: Path) -> None:
+        with path.joinpath("method_state").open("r") as f:
+            state = json.load(f)
+        self.created_trials = state["created"]
+        self.closed_trials = state["closed"]
+
+
 @dataclasses.dataclass
 class TrialMetric:
     request_id: uuid.UUID
@@ -0,0 +1,67 @@
+"""
+Compare StorageManager._apply_globs_to_resources against the previous approach of creating every
+resource on disk and running glob.glob over it.
+
+Usage (from the harness directory):
+
+    python -m tests.storage.bench_apply_globs [--files 100000] [--repeat 3]
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+from determined.common import storage
+from tests.storage import util
+
+
+def make_resources(n_files: int) -> Dict[str, int]:
+    resources = {"prefix/": 0}
+    files_per_dir = 100
+    for d in range(max(1, n_files // files_per_dir)):
+        resources[f"prefix/shard{d}/"] = 0
+        for f in range(files_per_dir):
+            suffix = "pt" if f % 2 else "json"
+            resources[f"prefix/shard{d}/file{f}.{suffix}"] = 1024
+    return resources
+
+
+def bench(
+    name: str,
+    fn: Callable[[Dict[str, int], str, List[str]], Dict[str, int]],
+    resources: Dict[str, int],
+    globs: List[str],
+    repeat: int,
+) -> Dict[str, int]:
+    best = float("inf")
+    result = {}  # type: Dict[str, int]
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(resources, "prefix", globs)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:>10}: {best:8.3f}s ({len(result)} remaining)")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    resources = make_resources(args.files)
+    for globs in (["**/*.pt"], ["shard1*/"], ["*/file1?.json", "shard0"]):
+        print(f"{len(resources)} resources, globs={globs}")
+        on_disk = bench("on disk", util.apply_globs_on_disk, resources, globs, args.repeat)
+        in_memory = bench(
+            "in memory",
+            storage.StorageManager._apply_globs_to_resources,
+            resources,
+            globs,
+            args.repeat,
+        )
+        assert on_disk == in_memory
+
+
+if __name__ == "__main__":
+    main()
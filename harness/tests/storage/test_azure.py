@@ -1,13 +1,17 @@
 import io
 import os
+import posixpath
 import tempfile
+import threading
 import uuid
 from pathlib import Path
-from typing import Dict, List
+from typing import IO, Any, Callable, Dict, List, Optional, Set
 
 import pytest
+import requests.adapters
 
 from determined.common import storage
+from determined.common.storage import transfer
 from determined.tensorboard.fetchers.azure import AzureFetcher
 from tests.storage import util
 
@@ -123,3 +127,177 @@ def test_tensorboard_fetcher_azure(require_secrets: bool, tmp_path: Path) -> Non
             blob_client.delete_blob()
 
     util.run_tensorboard_fetcher_test(local_sync_dir, fetcher, storage_relpath, put_files, rm_files)
+
+
+class FakeBlobService:
+    """
+    An in-memory Azure Blob Storage account, which records the concurrency of its transfers.
+    """
+
+    def __init__(self) -> None:
+        self.blobs = {}  # type: Dict[str, bytes]
+        self.transport = None  # type: Any
+        self.max_concurrency = set()  # type: Set[int]
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.hook = None  # type: Optional[Callable[[str], Any]]
+
+    def create_container(self, name: str) -> None:
+        pass
+
+    def get_blob_client(self, container: str, blob: str) -> "FakeBlobClient":
+        return FakeBlobClient(self, posixpath.join(container, blob))
+
+    def get_container_client(self, container: str) -> "FakeContainerClient":
+        return FakeContainerClient(self, container)
+
+    def transfer(self, name: str, max_concurrency: int) -> None:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.max_concurrency.add(max_concurrency)
+        try:
+            if self.hook is not None:
+                self.hook(name)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class FakeBlobClient:
+    def __init__(self, service: FakeBlobService, name: str) -> None:
+        self.service = service
+        self.name = name
+
+    def upload_blob(self, data: IO[bytes], overwrite: bool, max_concurrency: int) -> None:
+        assert overwrite
+        self.service.transfer(self.name, max_concurrency)
+        self.service.blobs[self.name] = data.read()
+
+    def download_blob(self, max_concurrency: int) -> "FakeDownloader":
+        self.service.transfer(self.name, max_concurrency)
+        return FakeDownloader(self.service.blobs[self.name])
+
+    def delete_blob(self) -> None:
+        del self.service.blobs[self.name]
+
+
+class FakeDownloader:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def readinto(self, stream: IO[bytes]) -> int:
+        return stream.write(self.data)
+
+
+class FakeContainerClient:
+    def __init__(self, service: FakeBlobService, container: str) -> None:
+        self.service = service
+        self.container = container
+
+    def list_blobs(self, name_starts_with: str) -> List[Dict[str, Any]]:
+        prefix = f"{self.container}/"
+        return [
+            {"name": name[len(prefix) :], "size": len(data)}
+            for name, data in sorted(self.service.blobs.items())
+            if name.startswith(prefix + name_starts_with)
+        ]
+
+
+@pytest.fixture
+def fake_azure(monkeypatch: pytest.MonkeyPatch) -> FakeBlobService:
+    from azure.storage import blob
+
+    service = FakeBlobService()
+
+    def from_connection_string(connection_string: str, transport: Any) -> FakeBlobService:
+        service.transport = transport
+        return service
+
+    monkeypatch.setattr(blob.BlobServiceClient, "from_connection_string", from_connection_string)
+    return service
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_mock_azure_lifecycle(
+    fake_azure: FakeBlobService, tmp_path: Path, max_concurrency: int
+) -> None:
+    manager = storage.AzureStorageManager(
+        CONTAINER_NAME, "connection-string", max_concurrency=max_concurrency
+    )
+
+    def post_delete_cb(storage_id: str) -> None:
+        assert not manager.client.list_files(CONTAINER_NAME, storage_id)
+
+    util.run_storage_lifecycle_test(manager, post_delete_cb)
+    assert fake_azure.peak <= max_concurrency
+
+
+def test_mock_azure_config(fake_azure: FakeBlobService, tmp_path: Path) -> None:
+    config = {"type": "azure", "container": CONTAINER_NAME, "connection_string": "conn"}
+    manager = storage.build({**config, "max_concurrency": 32}, container_path=None)
+    assert isinstance(manager, storage.AzureStorageManager)
+    assert manager.engine.max_concurrency == 32
+    # The connection pool has room for every transfer thread.
+    adapter = fake_azure.transport.session.get_adapter("https://account.blob.core.windows.net")
+    assert adapter._pool_connections == adapter._pool_maxsize == 32
+
+    # Large blobs are split across the same number of connections.
+    tmp_path.joinpath("model").write_text("weights")
+    manager.upload(tmp_path, "ckpt", paths={"model"})
+    manager.download("ckpt", tmp_path.joinpath("dst"))
+    assert fake_azure.max_concurrency == {32}
+
+    # The pool is never smaller than requests' default.
+    manager = storage.build({**config, "max_concurrency": 2}, container_path=None)
+    assert isinstance(manager, storage.AzureStorageManager)
+    assert manager.engine.max_concurrency == 2
+    adapter = fake_azure.transport.session.get_adapter("https://account.blob.core.windows.net")
+    assert adapter._pool_maxsize == requests.adapters.DEFAULT_POOLSIZE
+
+    manager = storage.build(config, container_path=None)
+    assert isinstance(manager, storage.AzureStorageManager)
+    assert manager.engine.max_concurrency == transfer.DEFAULT_MAX_CONCURRENCY
+
+
+def test_mock_azure_transfers_concurrently(fake_azure: FakeBlobService, tmp_path: Path) -> None:
+    src = tmp_path.joinpath("src")
+    src.mkdir()
+    for i in range(8):
+        src.joinpath(f"file{i}").write_text(f"file {i}")
+    manager = storage.AzureStorageManager(CONTAINER_NAME, "conn", max_concurrency=4)
+
+    # Every transfer waits for three others to be in flight, which only a pool of four can do.
+    barrier = threading.Barrier(4, timeout=10)
+    fake_azure.hook = lambda name: barrier.wait()
+    manager.upload(src, "ckpt")
+    manager.download("ckpt", tmp_path.joinpath("dst"))
+    assert fake_azure.peak == 4
+    assert storage.StorageManager._list_directory(tmp_path.joinpath("dst")) == {
+        f"file{i}": 6 for i in range(8)
+    }
+
+
+def test_mock_azure_errors(fake_azure: FakeBlobService, tmp_path: Path) -> None:
+    src = tmp_path.joinpath("src")
+    src.mkdir()
+    for i in range(20):
+        src.joinpath(f"file{i:02}").write_text("data")
+    manager = storage.AzureStorageManager(CONTAINER_NAME, "conn", max_concurrency=4)
+
+    def fail(name: str) -> None:
+        if name.endswith("file03"):
+            raise ValueError("transfer failed")
+
+    # A failure in a transfer thread is re-raised in the calling thread.
+    fake_azure.hook = fail
+    with pytest.raises(ValueError, match="transfer failed"):
+        manager.upload(src, "ckpt")
+    assert f"{CONTAINER_NAME}/ckpt/file03" not in fake_azure.blobs
+
+    fake_azure.hook = None
+    manager.upload(src, "ckpt")
+    fake_azure.hook = fail
+    with pytest.raises(ValueError, match="transfer failed"):
+        manager.download("ckpt", tmp_path.joinpath("dst"))
@@ -1,14 +1,17 @@
 import os
+import threading
 import uuid
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import google.auth.exceptions
 import google.cloud.storage
 import pytest
+import requests.adapters
 
 from determined import errors
 from determined.common import storage
+from determined.common.storage import transfer
 from determined.tensorboard.fetchers.gcs import GCSFetcher
 from tests.storage import util
 
@@ -139,3 +142,187 @@ def test_tensorboard_fetcher_gcs(
             fetcher.client.bucket(BUCKET_NAME).blob(filepath).delete()
 
     util.run_tensorboard_fetcher_test(local_sync_dir, fetcher, storage_relpath, put_files, rm_files)
+
+
+class FakeBlob:
+    def __init__(self, bucket: "FakeBucket", name: str) -> None:
+        self.bucket = bucket
+        self.name = name
+        self.chunk_size = None  # type: Optional[int]
+
+    @property
+    def size(self) -> int:
+        return len(self.bucket.blobs[self.name])
+
+    def upload_from_string(self, data: bytes) -> None:
+        self.bucket.put(self, bytes(data))
+
+    def upload_from_filename(self, filename: str) -> None:
+        with open(filename, "rb") as f:
+            self.bucket.put(self, f.read())
+
+    def download_to_filename(self, filename: str) -> None:
+        self.bucket.transfer(self)
+        with open(filename, "wb") as f:
+            f.write(self.bucket.blobs[self.name])
+
+    def delete(self) -> None:
+        del self.bucket.blobs[self.name]
+
+    def rewrite(self, source: "FakeBlob", token: Optional[str] = None) -> Tuple[None, int, int]:
+        self.bucket.blobs[self.name] = self.bucket.blobs[source.name]
+        return None, self.size, self.size
+
+
+class FakeBucket:
+    """
+    An in-memory GCS bucket, which records the concurrency of its transfers.
+    """
+
+    def __init__(self) -> None:
+        self.blobs = {}  # type: Dict[str, bytes]
+        self.chunk_sizes = {}  # type: Dict[str, Optional[int]]
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.hook = None  # type: Optional[Callable[[str], Any]]
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self, name)
+
+    def get_blob(self, name: str) -> Optional[FakeBlob]:
+        return FakeBlob(self, name) if name in self.blobs else None
+
+    def list_blobs(self, prefix: str) -> List[FakeBlob]:
+        return [FakeBlob(self, name) for name in sorted(self.blobs) if name.startswith(prefix)]
+
+    def put(self, blob: FakeBlob, data: bytes) -> None:
+        self.transfer(blob)
+        self.blobs[blob.name] = data
+        self.chunk_sizes[blob.name] = blob.chunk_size
+
+    def transfer(self, blob: FakeBlob) -> None:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            if self.hook is not None:
+                self.hook(blob.name)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self._http = requests.Session()
+        self.fake_bucket = FakeBucket()
+
+    def bucket(self, name: str) -> FakeBucket:
+        return self.fake_bucket
+
+
+@pytest.fixture
+def fake_gcs(monkeypatch: pytest.MonkeyPatch) -> FakeClient:
+    client = FakeClient()
+    monkeypatch.setattr(google.cloud.storage, "Client", lambda: client)
+    return client
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_mock_gcs_lifecycle(fake_gcs: FakeClient, tmp_path: Path, max_concurrency: int) -> None:
+    manager = storage.GCSStorageManager(
+        bucket=BUCKET_NAME,
+        prefix="my/test/prefix",
+        temp_dir=str(tmp_path),
+        max_concurrency=max_concurrency,
+    )
+
+    def post_delete_cb(storage_id: str) -> None:
+        assert not fake_gcs.fake_bucket.list_blobs(manager.get_storage_prefix(storage_id))
+
+    util.run_storage_lifecycle_test(manager, post_delete_cb)
+    assert fake_gcs.fake_bucket.peak <= max_concurrency
+
+
+def test_mock_gcs_config(fake_gcs: FakeClient) -> None:
+    manager = storage.build(
+        {"type": "gcs", "bucket": BUCKET_NAME, "max_concurrency": 32}, container_path=None
+    )
+    assert isinstance(manager, storage.GCSStorageManager)
+    assert manager.engine.max_concurrency == 32
+    # The shared session keeps a connection for every transfer thread.
+    adapter = fake_gcs._http.get_adapter("https://storage.googleapis.com")
+    assert isinstance(adapter, requests.adapters.HTTPAdapter)
+    assert adapter._pool_connections == adapter._pool_maxsize == 32
+
+    manager = storage.build({"type": "gcs", "bucket": BUCKET_NAME}, container_path=None)
+    assert isinstance(manager, storage.GCSStorageManager)
+    assert manager.engine.max_concurrency == transfer.DEFAULT_MAX_CONCURRENCY
+
+
+def test_mock_gcs_transfers_concurrently(fake_gcs: FakeClient, tmp_path: Path) -> None:
+    src = tmp_path.joinpath("src")
+    src.mkdir()
+    for i in range(8):
+        src.joinpath(f"file{i}").write_text(f"file {i}")
+    manager = storage.GCSStorageManager(bucket=BUCKET_NAME, max_concurrency=4)
+
+    # Every transfer waits for three others to be in flight, which only a pool of four can do.
+    barrier = threading.Barrier(4, timeout=10)
+    fake_gcs.fake_bucket.hook = lambda name: barrier.wait()
+    manager.upload(src, "ckpt")
+    manager.download("ckpt", tmp_path.joinpath("dst"))
+    manager.copy("ckpt", "ckpt2", {f"file{i}" for i in range(8)})
+    assert fake_gcs.fake_bucket.peak == 4
+    assert storage.StorageManager._list_directory(tmp_path.joinpath("dst")) == {
+        f"file{i}": 6 for i in range(8)
+    }
+    assert len(fake_gcs.fake_bucket.list_blobs("ckpt2/")) == 8
+
+
+def test_mock_gcs_chunked_upload(
+    fake_gcs: FakeClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(transfer, "DEFAULT_MULTIPART_CHUNKSIZE", 1024)
+    src = tmp_path.joinpath("src")
+    src.mkdir()
+    src.joinpath("small").write_bytes(b"x" * 1024)
+    src.joinpath("large").write_bytes(b"x" * 1025)
+    manager = storage.GCSStorageManager(bucket=BUCKET_NAME)
+
+    manager.upload(src, "ckpt")
+    # Only files larger than a chunk are sent as chunked resumable uploads.
+    assert fake_gcs.fake_bucket.chunk_sizes == {"ckpt/large": 1024, "ckpt/small": None}
+    assert fake_gcs.fake_bucket.blobs["ckpt/large"] == b"x" * 1025
+
+
+def test_mock_gcs_errors(fake_gcs: FakeClient, tmp_path: Path) -> None:
+    from google.api_core import exceptions
+
+    src = tmp_path.joinpath("src")
+    src.mkdir()
+    for i in range(20):
+        src.joinpath(f"file{i:02}").write_text("data")
+    manager = storage.GCSStorageManager(bucket=BUCKET_NAME, max_concurrency=4)
+
+    def fail(name: str) -> None:
+        if name.endswith("file03"):
+            raise ValueError("upload failed")
+
+    # A failure in a transfer thread is re-raised in the calling thread.
+    fake_gcs.fake_bucket.hook = fail
+    with pytest.raises(ValueError, match="upload failed"):
+        manager.upload(src, "ckpt")
+    assert "ckpt/file03" not in fake_gcs.fake_bucket.blobs
+
+    # Errors from transfer threads are translated just like serial ones.
+    fake_gcs.fake_bucket.hook = None
+    manager.upload(src, "ckpt")
+
+    def forbid(name: str) -> None:
+        raise exceptions.Forbidden("no access")  # type: ignore
+
+    fake_gcs.fake_bucket.hook = forbid
+    with pytest.raises(errors.NoDirectStorageAccess):
+        manager.download("ckpt", tmp_path.joinpath("dst"))
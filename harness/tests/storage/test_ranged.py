@@ -0,0 +1,71 @@
+import io
+import random
+from typing import List, Tuple
+
+import pytest
+
+from determined.common.storage import ranged
+
+
+def make_reader(
+    data: bytes, block_size: int, cache_blocks: int
+) -> Tuple[io.BufferedReader, List[Tuple[int, int]]]:
+    requests = []  # type: List[Tuple[int, int]]
+
+    def read_range(start: int, length: int) -> bytes:
+        requests.append((start, length))
+        return data[start : start + length]
+
+    raw = ranged.RangedReader("test", len(data), read_range, block_size, cache_blocks)
+    return io.BufferedReader(raw, buffer_size=1), requests
+
+
+def test_ranged_reader_random_access() -> None:
+    rng = random.Random(0)
+    data = bytes(rng.getrandbits(8) for _ in range(10000))
+    f, _ = make_reader(data, block_size=64, cache_blocks=4)
+
+    assert f.read() == data
+    for _ in range(500):
+        pos = rng.randrange(len(data) + 10)
+        n = rng.randrange(300)
+        f.seek(pos)
+        assert f.read(n) == data[pos : pos + n]
+        assert f.tell() == max(pos, min(pos + n, len(data)))
+
+    f.seek(-10, io.SEEK_END)
+    assert f.read() == data[-10:]
+
+
+def test_ranged_reader_fetches_only_what_is_read() -> None:
+    data = bytes(range(256)) * 40
+    f, requests = make_reader(data, block_size=100, cache_blocks=4)
+
+    f.seek(250)
+    assert f.read(200) == data[250:450]
+    # Adjacent missing blocks are fetched with one request.
+    assert requests == [(200, 300)]
+
+    # Cached blocks are not fetched again.
+    f.seek(300)
+    assert f.read(50) == data[300:350]
+    assert len(requests) == 1
+
+    # The last block may be short.
+    f.seek(len(data) - 5)
+    assert f.read(100) == data[-5:]
+    assert requests[-1] == (10200, 40)
+
+    # The least recently used blocks are evicted.
+    f.seek(0)
+    f.read(100)
+    f.seek(200)
+    f.read(1)
+    assert requests[-1] == (200, 100)
+    assert f.raw.bytes_fetched == sum(length for _, length in requests)  # type: ignore
+
+
+def test_ranged_reader_rejects_short_reads() -> None:
+    raw = ranged.RangedReader("test", 100, lambda start, length: b"x", block_size=10)
+    with pytest.raises(IOError, match="expected 10 bytes"):
+        raw.read(5)
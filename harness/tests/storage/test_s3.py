@@ -5,9 +5,12 @@ import uuid
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+import boto3
 import botocore.exceptions
+import moto
 import pytest
 
+from determined import errors
 from determined.common import storage
 from determined.common.storage.s3 import normalize_prefix
 from determined.tensorboard.fetchers.s3 import S3Fetcher
@@ -106,6 +109,81 @@ def test_live_s3_lifecycle(require_secrets: bool, tmp_path: Path, prefix: Option
     util.run_storage_lifecycle_test(live_manager, post_delete_cb)
 
 
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_mock_s3_lifecycle(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, max_concurrency: int
+) -> None:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_s3():
+        boto3.client("s3").create_bucket(Bucket=BUCKET_NAME)
+        manager = storage.S3StorageManager(
+            bucket=BUCKET_NAME,
+            prefix="my/test/prefix",
+            temp_dir=str(tmp_path),
+            max_concurrency=max_concurrency,
+        )
+
+        def post_delete_cb(storage_id: str) -> None:
+            storage_prefix = manager.get_storage_prefix(storage_id)
+            assert not list(manager.bucket.objects.filter(Prefix=storage_prefix))
+
+        util.run_storage_lifecycle_test(manager, post_delete_cb)
+
+
+def test_mock_s3_copy(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_s3():
+        boto3.client("s3").create_bucket(Bucket=BUCKET_NAME)
+        manager = storage.S3StorageManager(
+            bucket=BUCKET_NAME, prefix="my/test/prefix", temp_dir=str(tmp_path)
+        )
+
+        src = tmp_path.joinpath("src")
+        src.joinpath("subdir").mkdir(parents=True)
+        src.joinpath("subdir", "file").write_text("contents")
+        src.joinpath("other").write_text("other contents")
+        manager.upload(src, "src-id")
+
+        manager.copy("src-id", "dst-id", {"subdir/", "subdir/file"})
+
+        dst = tmp_path.joinpath("dst")
+        manager.download("dst-id", str(dst))
+        assert dst.joinpath("subdir", "file").read_text() == "contents"
+        assert not dst.joinpath("other").exists()
+
+
+def test_mock_s3_open(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_s3():
+        boto3.client("s3").create_bucket(Bucket=BUCKET_NAME)
+        manager = storage.S3StorageManager(
+            bucket=BUCKET_NAME, prefix="my/test/prefix", temp_dir=str(tmp_path)
+        )
+
+        data = os.urandom(100000)
+        src = tmp_path.joinpath("src")
+        src.joinpath("subdir").mkdir(parents=True)
+        src.joinpath("subdir", "weights").write_bytes(data)
+        manager.upload(src, "src-id")
+
+        with manager.open("src-id", "subdir/weights", block_size=1000) as f:
+            f.seek(4500)
+            assert f.read(1000) == data[4500:5500]
+            # Only the blocks under the reader's 8KB buffer were downloaded.
+            assert f.raw.bytes_fetched == 9000  # type: ignore
+            f.seek(-10, io.SEEK_END)
+            assert f.read() == data[-10:]
+
+        with pytest.raises(errors.CheckpointNotFound):
+            manager.open("src-id", "missing")
+
+
 def get_tensorboard_fetcher_s3(
     require_secrets: bool, local_sync_dir: str, paths_to_sync: List[str]
 ) -> S3Fetcher:
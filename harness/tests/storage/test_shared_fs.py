@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 
 import pytest
 
+from determined import errors
 from determined.common import check, storage
 from determined.common.storage import shared
 from determined.tensorboard.fetchers.shared import SharedFSFetcher
@@ -202,3 +203,56 @@ def test_copytree(tmp_path: Path, manager: storage.SharedFSStorageManager) -> No
             "subdir/file_nested": "nested file",
         },
     )
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+@pytest.mark.parametrize("hardlink", [False, True])
+def test_copytree_concurrency_and_hardlink(
+    tmp_path: Path, max_concurrency: int, hardlink: bool
+) -> None:
+    expected_files = {f"dir{d}/": None for d in range(5)}  # type: Dict[str, Any]
+    expected_files.update({f"dir{d}/file{f}": f"{d} {f}" for d in range(5) for f in range(10)})
+    src_dir = tmp_path.joinpath("src")
+    util.create_checkpoint(src_dir, expected_files)
+    os.utime(src_dir.joinpath("dir0"), (1000000, 1000000))
+
+    dst_dir = tmp_path.joinpath("dst")
+    shared.copytree(str(src_dir), str(dst_dir), max_concurrency=max_concurrency, hardlink=hardlink)
+    util.validate_checkpoint(dst_dir, expected_files=expected_files)
+
+    # Directory stats are copied after the files inside them.
+    assert dst_dir.joinpath("dir0").stat().st_mtime == 1000000
+
+    src_file = src_dir.joinpath("dir1", "file1")
+    dst_file = dst_dir.joinpath("dir1", "file1")
+    assert os.path.samefile(src_file, dst_file) == hardlink
+    assert dst_file.stat().st_mtime == src_file.stat().st_mtime
+
+
+def test_copytree_collects_errors(tmp_path: Path) -> None:
+    src_dir = tmp_path.joinpath("src")
+    util.create_checkpoint(src_dir, {f"file{i}": str(i) for i in range(10)})
+    os.symlink(tmp_path.joinpath("missing"), src_dir.joinpath("dangling"))
+
+    dst_dir = tmp_path.joinpath("dst")
+    with pytest.raises(shutil.Error) as e:
+        shared.copytree(str(src_dir), str(dst_dir), max_concurrency=4)
+    assert [err[0] for err in e.value.args[0]] == [str(src_dir.joinpath("dangling"))]
+
+    # Every other file is still copied.
+    for i in range(10):
+        assert dst_dir.joinpath(f"file{i}").read_text() == str(i)
+
+
+def test_open(tmp_path: Path, manager: storage.SharedFSStorageManager) -> None:
+    src = tmp_path.joinpath("src")
+    src.joinpath("subdir").mkdir(parents=True)
+    src.joinpath("subdir", "weights").write_bytes(b"0123456789")
+    manager.upload(src, "ckpt")
+
+    with manager.open("ckpt", "subdir/weights") as f:
+        f.seek(3)
+        assert f.read(4) == b"3456"
+
+    with pytest.raises(errors.CheckpointNotFound):
+        manager.open("ckpt", "missing")
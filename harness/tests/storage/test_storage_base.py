@@ -1,11 +1,13 @@
 import os
-from typing import Optional
+import random
+from typing import Dict, List, Optional
 from unittest import mock
 
 import pytest
 
 from determined import core
 from determined.common import storage
+from tests.storage import util
 
 
 def test_unknown_type() -> None:
@@ -139,3 +141,83 @@ def test_shared_fs_shortcut_dict() -> None:
     shortcut = {"type": "shared_fs", "base_path": "test_base_path"}
     with pytest.raises(ValueError):
         _ = core._context._get_storage_manager(checkpoint_storage=shortcut)
+
+
+GLOB_RESOURCES = {
+    "prefix/": 0,
+    "prefix/metadata.json": 10,
+    "prefix/model.pt": 100,
+    "prefix/.hidden": 1,
+    "prefix/.hiddendir/": 0,
+    "prefix/.hiddendir/file.pt": 2,
+    "prefix/subdir/": 0,
+    "prefix/subdir/file1.txt": 3,
+    "prefix/subdir/file2.pt": 4,
+    "prefix/subdir/nested/": 0,
+    "prefix/subdir/nested/deep.pt": 5,
+    "prefix/implicit/only/file.txt": 6,
+    "prefix/empty/": 0,
+    "prefix/[weird].txt": 7,
+    "other/model.pt": 8,
+}
+
+
+@pytest.mark.parametrize(
+    "globs",
+    [
+        ["model.pt"],
+        ["*.pt"],
+        ["**/*.pt"],
+        ["**/*"],
+        ["**"],
+        ["*"],
+        ["*/"],
+        ["**/"],
+        [".*"],
+        ["subdir"],
+        ["subdir/"],
+        ["subdir/*"],
+        ["subdir/**"],
+        ["subdir/**/*.pt"],
+        ["sub*/nested"],
+        ["implicit"],
+        ["implicit/*/"],
+        ["model.pt/"],
+        ["model.pt/**"],
+        ["?odel.pt", "[ms]*.json"],
+        ["[[]weird].txt"],
+        ["./model.pt", "subdir/../metadata.json"],
+        ["missing", "missing/*", "missing/**/x"],
+        ["subdir//file1.txt"],
+        ["empty"],
+    ],
+)
+def test_apply_globs_to_resources(globs: List[str]) -> None:
+    expected = util.apply_globs_on_disk(GLOB_RESOURCES, "prefix", globs)
+    actual = storage.StorageManager._apply_globs_to_resources(GLOB_RESOURCES, "prefix", globs)
+    assert actual == expected
+
+
+def test_apply_globs_to_resources_random() -> None:
+    rng = random.Random(0)
+    names = ["a", "b", "ab", ".h", "x.pt", "y.txt"]
+    patterns = ["*", "**", "a*", "?", "*.pt", ".*", "[ab]", "x.pt", "b", "**/"]
+    for _ in range(200):
+        resources = {}  # type: Dict[str, int]
+        for _ in range(rng.randint(1, 12)):
+            parts = [rng.choice(names) for _ in range(rng.randint(1, 4))]
+            if rng.random() < 0.3:
+                resources["p/" + "/".join(parts) + "/"] = 0
+            else:
+                resources["p/" + "/".join(parts)] = rng.randint(1, 100)
+        # Skip trees that can't exist on disk, where a name is both a file and a directory.
+        files = {k for k in resources if not k.endswith("/")}
+        if any(k.startswith(f + "/") for k in resources for f in files):
+            continue
+        globs = [
+            "/".join(rng.choice(patterns) for _ in range(rng.randint(1, 3))) + rng.choice(["", "/"])
+            for _ in range(rng.randint(1, 2))
+        ]
+        expected = util.apply_globs_on_disk(resources, "p", globs)
+        actual = storage.StorageManager._apply_globs_to_resources(resources, "p", globs)
+        assert actual == expected, (resources, globs)
@@ -0,0 +1,66 @@
+import threading
+import time
+from typing import List, Tuple
+
+import pytest
+
+from determined.common.storage import transfer
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_transfer_engine_runs_everything(max_concurrency: int) -> None:
+    progress = []  # type: List[Tuple[str, int]]
+    engine = transfer.TransferEngine(max_concurrency, progress=lambda n, b: progress.append((n, b)))
+
+    names = [f"file{i}" for i in range(20)]
+    total = engine.run("Uploaded", lambda name: len(name), names)
+
+    assert total == sum(len(n) for n in names)
+    assert sorted(progress) == sorted((n, len(n)) for n in names)
+
+
+def test_transfer_engine_bounds_concurrency() -> None:
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def fn(name: str) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return 0
+
+    transfer.TransferEngine(3).run("Uploaded", fn, [str(i) for i in range(30)])
+    assert 1 < peak <= 3
+
+
+def test_transfer_engine_reraises_first_error() -> None:
+    started = []
+
+    def fn(name: str) -> int:
+        started.append(name)
+        if name == "0":
+            raise ValueError("transfer failed")
+        time.sleep(0.01)
+        return 0
+
+    with pytest.raises(ValueError, match="transfer failed"):
+        transfer.TransferEngine(2).run("Uploaded", fn, [str(i) for i in range(100)])
+
+    # Pending transfers are cancelled once a failure is observed.
+    assert len(started) < 100
+
+
+def test_transfer_engine_rejects_bad_concurrency() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        transfer.TransferEngine(0)
+
+
+def test_split_directories() -> None:
+    dirs, files = transfer.split_directories({"b/", "b/x", "a", "c/d/", "c/d/e"})
+    assert dirs == ["b/", "c/d/"]
+    assert files == ["a", "b/x", "c/d/e"]
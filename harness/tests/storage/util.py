@@ -1,6 +1,8 @@
+import glob
 import os
 import pathlib
 import shutil
+import tempfile
 import time
 import uuid
 from typing import Any, Callable, Dict, List, Optional, Tuple
@@ -75,6 +77,46 @@ def validate_checkpoint(checkpoint_dir: pathlib.Path, expected_files: Dict) -> N
                 assert text == expected_files[found], (text, expected_files[found])
 
 
+def apply_globs_on_disk(
+    file_paths_to_sizes: Dict[str, int], prefix: str, globs: List[str]
+) -> Dict[str, int]:
+    """
+    A reference for StorageManager._apply_globs_to_resources, which creates the resources as empty
+    files on disk and deletes the matches of glob.glob for real.
+    """
+    temp_dir = tempfile.mkdtemp()
+    try:
+        for f in file_paths_to_sizes:
+            path = pathlib.Path(temp_dir).joinpath(f)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if f.endswith("/"):
+                path.mkdir(exist_ok=True)
+            else:
+                path.touch()
+
+        to_delete_dirs = {}
+        to_delete_files = {}
+        for g in globs:
+            for path_str in glob.glob(
+                f"{pathlib.Path(temp_dir).joinpath(prefix)}/{g}", recursive=True
+            ):
+                if os.path.isfile(path_str):
+                    to_delete_files[path_str] = True
+                elif os.path.isdir(path_str):
+                    to_delete_dirs[path_str] = True
+
+        for path_str in to_delete_files:
+            os.remove(path_str)
+        for path_str in to_delete_dirs:
+            # A directory may already be gone if one of its parents matched too.
+            shutil.rmtree(path_str, ignore_errors=True)
+
+        remaining = storage.StorageManager._list_directory(temp_dir)
+        return {k: v for k, v in file_paths_to_sizes.items() if k in remaining}
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 def sync_and_clean(
     pex: parallel.Execution,
     clean_up: Optional[Callable],
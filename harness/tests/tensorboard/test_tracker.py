@@ -0,0 +1,176 @@
+import os
+import pathlib
+import shutil
+import sys
+import threading
+import time
+from typing import Any, List, Type
+from unittest import mock
+
+import pytest
+
+from determined import tensorboard
+from determined.tensorboard import tracker
+
+TRACKERS = [tracker.ChangeTracker]
+if sys.platform.startswith("linux"):
+    TRACKERS.append(tracker.InotifyChangeTracker)
+
+
+@pytest.mark.parametrize("tracker_cls", TRACKERS)
+def test_change_tracker(tmp_path: pathlib.Path, tracker_cls: Type[tracker.ChangeTracker]) -> None:
+    base = tmp_path.joinpath("tb")
+    t = tracker_cls(base)
+    try:
+        # The base path does not need to exist yet.
+        assert t.changes() == []
+
+        base.joinpath("run").mkdir(parents=True)
+        events = base.joinpath("run", "events.out.tfevents.1")
+        events.write_bytes(b"a" * 10)
+        assert t.changes() == [(events, 0)]
+        assert t.changes() == []
+
+        # Appends report how much was seen before.
+        with events.open("ab") as f:
+            f.write(b"b" * 5)
+        assert t.changes() == [(events, 10)]
+
+        # Rewrites which shrink the file start over.
+        events.write_bytes(b"c")
+        assert t.changes() == [(events, 0)]
+
+        # Files in new directories are found, even if written before the directory is watched.
+        nested = base.joinpath("new", "deeper")
+        nested.mkdir(parents=True)
+        nested.joinpath("a.pb").write_bytes(b"a")
+        nested.joinpath("b.pb").write_bytes(b"b")
+        assert t.changes() == [(nested.joinpath("a.pb"), 0), (nested.joinpath("b.pb"), 0)]
+
+        # Deleted files are forgotten, and reported again if they come back.
+        events.unlink()
+        assert t.changes() == []
+        events.write_bytes(b"d")
+        assert t.changes() == [(events, 0)]
+
+        # Touching a file reports it again.
+        os.utime(events, ns=(0, 0))
+        assert t.changes() == [(events, 1)]
+
+        # The files of a directory which is moved away are forgotten too.
+        base.joinpath("new").rename(tmp_path.joinpath("moved"))
+        assert t.changes() == []
+        tmp_path.joinpath("moved").rename(base.joinpath("new"))
+        assert t.changes() == [(nested.joinpath("a.pb"), 0), (nested.joinpath("b.pb"), 0)]
+    finally:
+        t.close()
+
+
+def test_inotify_tracker_falls_back_to_polling(tmp_path: pathlib.Path) -> None:
+    if not sys.platform.startswith("linux"):
+        pytest.skip("inotify is only available on linux")
+    t = tracker.InotifyChangeTracker(tmp_path)
+    t._libc = mock.MagicMock()
+    t._libc.inotify_add_watch.return_value = -1
+    with mock.patch("ctypes.get_errno", return_value=28):
+        tmp_path.joinpath("file").write_bytes(b"a")
+        assert t.changes() == [(tmp_path.joinpath("file"), 0)]
+    assert t._polling
+
+    tmp_path.joinpath("file").write_bytes(b"ab")
+    assert t.changes() == [(tmp_path.joinpath("file"), 1)]
+
+
+def test_inotify_tracker_rescan_forgets_deleted_files(tmp_path: pathlib.Path) -> None:
+    if not sys.platform.startswith("linux"):
+        pytest.skip("inotify is only available on linux")
+    t = tracker.InotifyChangeTracker(tmp_path)
+    try:
+        path = tmp_path.joinpath("file")
+        path.write_bytes(b"a")
+        assert t.changes() == [(path, 0)]
+
+        # After the kernel's event queue overflows, the deletion is only noticed by the rescan.
+        path.unlink()
+        t._handle_events(tracker._EVENT_HEADER.pack(-1, tracker._IN_Q_OVERFLOW, 0, 0))
+        assert t.changes() == []
+        assert t._index == {}
+    finally:
+        t.close()
+
+
+def test_shared_fs_sync_appends_tails(tmp_path: pathlib.Path) -> None:
+    base = tmp_path.joinpath("tb")
+    base.mkdir()
+    manager = tensorboard.SharedFSTensorboardManager(
+        str(tmp_path.joinpath("storage")), base, pathlib.Path("sync"), async_upload=False
+    )
+    events = base.joinpath("events.out.tfevents.1")
+    other = base.joinpath("profile.pb")
+    events.write_bytes(b"first")
+    other.write_bytes(b"first")
+    manager.sync()
+
+    events.write_bytes(b"first second")
+    other.write_bytes(b"second")
+    with mock.patch("shutil.copy", wraps=tensorboard.shared.shutil.copy) as copy:
+        manager.sync()
+    # Only the file which is not append-only was copied in full.
+    assert [c.args[0] for c in copy.call_args_list] == [other]
+
+    assert manager.shared_fs_base.joinpath(events.name).read_bytes() == b"first second"
+    assert manager.shared_fs_base.joinpath(other.name).read_bytes() == b"second"
+
+    with mock.patch("shutil.copy") as copy:
+        manager.sync()
+    copy.assert_not_called()
+    manager.close()
+
+
+def test_shared_fs_concurrent_syncs(tmp_path: pathlib.Path) -> None:
+    base = tmp_path.joinpath("tb")
+    base.mkdir()
+    manager = tensorboard.SharedFSTensorboardManager(
+        str(tmp_path.joinpath("storage")), base, pathlib.Path("sync"), async_upload=False
+    )
+    events = base.joinpath("events.out.tfevents.1")
+    events.write_bytes(b"")
+    done = threading.Event()
+    errors = []  # type: List[Exception]
+
+    def append() -> None:
+        try:
+            for i in range(200):
+                with events.open("ab") as f:
+                    f.write(b"%d\n" % i)
+                time.sleep(0.0005)
+        finally:
+            done.set()
+
+    def sync() -> None:
+        try:
+            while not done.is_set():
+                manager.sync()
+        except Exception as e:
+            errors.append(e)
+
+    copyfileobj = shutil.copyfileobj
+
+    def slow_copyfileobj(*args: Any, **kwargs: Any) -> None:
+        # Widen the window in which unserialized syncs would append the same tail twice.
+        time.sleep(0.005)
+        copyfileobj(*args, **kwargs)
+
+    threads = [threading.Thread(target=t) for t in (append, sync, sync)]
+    with mock.patch("shutil.copyfileobj", slow_copyfileobj):
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert errors == []
+
+    # Every appended byte was uploaded exactly once.
+    manager.sync()
+    expected = b"".join(b"%d\n" % i for i in range(200))
+    assert manager.shared_fs_base.joinpath(events.name).read_bytes() == expected
+    manager.close()
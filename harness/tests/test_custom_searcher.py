@@ -1,8 +1,14 @@
 import tempfile
 from pathlib import Path
+from typing import List
+from unittest.mock import Mock
 
+import pytest
+
+from determined import searcher
+from determined.common.api import bindings
 from tests.custom_search_mocks import MockMasterSearchRunner, SimulateMaster
-from tests.search_methods import ASHASearchMethod, RandomSearchMethod
+from tests.search_methods import ASHASearchMethod, RandomSearchMethod, SequentialSearchMethod
 
 
 def test_run_random_searcher_exp_mock_master() -> None:
@@ -39,3 +45,147 @@ def test_run_asha_batches_exp_mock_master(tmp_path: Path) -> None:
     assert len(search_runner.state.trials_closed) == len(
         search_method.asha_search_state.closed_trials
     )
+
+
+def saved_state(search_runner: searcher.LocalSearchRunner) -> dict:
+    state = search_runner.state.to_dict()
+    # The runner only learns that the experiment completed after saving its last state.
+    del state["experimentCompleted"]
+    return state
+
+
+def test_searcher_snapshot_retention(tmp_path: Path) -> None:
+    search_method = RandomSearchMethod(max_trials=5, max_concurrent_trials=2, max_length=500)
+    search_runner = MockMasterSearchRunner(
+        search_method, SimulateMaster(metric=1.0), tmp_path, keep_snapshots=3
+    )
+    search_runner.run(exp_config={}, context_dir="", includes=None)
+
+    # Every event was snapshotted, but only the newest snapshots were kept.
+    exp_dir = tmp_path.joinpath("exp_4")
+    snapshots = sorted(int(p.name[len("event_") :]) for p in exp_dir.glob("event_*") if p.is_dir())
+    assert snapshots == [
+        search_runner.state.last_event_id - 2,
+        search_runner.state.last_event_id - 1,
+        search_runner.state.last_event_id,
+    ]
+    assert not exp_dir.joinpath("journal").exists()
+
+
+@pytest.mark.parametrize("snapshot_interval", [1, 4, 100])
+def test_searcher_journal_replay(tmp_path: Path, snapshot_interval: int) -> None:
+    search_method = SequentialSearchMethod(max_trials=7, max_concurrent_trials=2, max_length=500)
+    search_runner = MockMasterSearchRunner(
+        search_method,
+        SimulateMaster(metric=1.0),
+        tmp_path,
+        snapshot_interval=snapshot_interval,
+    )
+    search_runner.run(exp_config={}, context_dir="", includes=None)
+    assert search_method.closed_trials == 7
+
+    exp_dir = tmp_path.joinpath("exp_4")
+    journal = exp_dir.joinpath("journal")
+    num_journaled = len(journal.read_text().splitlines()) if journal.exists() else 0
+    assert num_journaled < snapshot_interval
+    if snapshot_interval == 1:
+        assert num_journaled == 0
+    assert len([p for p in exp_dir.glob("event_*") if p.is_dir()]) <= 2
+
+    # A new runner recovers the same state from the latest snapshot and the journal.
+    resumed_method = SequentialSearchMethod(max_trials=7, max_concurrent_trials=2, max_length=500)
+    resumed_runner = searcher.LocalSearchRunner(
+        resumed_method, tmp_path, snapshot_interval=snapshot_interval
+    )
+    experiment_id, operations = resumed_runner.load_state(4)
+    assert experiment_id == 4
+    assert saved_state(resumed_runner) == saved_state(search_runner)
+    assert resumed_method.created_trials == search_method.created_trials
+    assert resumed_method.closed_trials == search_method.closed_trials
+    assert [type(op) for op in operations] == [searcher.Shutdown, searcher.Progress]
+
+
+def test_searcher_journal_replay_mismatch(tmp_path: Path) -> None:
+    search_method = SequentialSearchMethod(max_trials=7, max_concurrent_trials=2, max_length=500)
+    search_runner = MockMasterSearchRunner(
+        search_method, SimulateMaster(metric=1.0), tmp_path, snapshot_interval=100
+    )
+    search_runner.run(exp_config={}, context_dir="", includes=None)
+
+    # A search method which makes different decisions cannot be replayed.
+    resumed_method = SequentialSearchMethod(max_trials=9, max_concurrent_trials=2, max_length=500)
+    resumed_runner = searcher.LocalSearchRunner(resumed_method, tmp_path, snapshot_interval=100)
+    with pytest.raises(RuntimeError, match="produced different operations"):
+        resumed_runner.load_state(4)
+
+
+def test_searcher_journal_partial_entry(tmp_path: Path) -> None:
+    search_method = SequentialSearchMethod(max_trials=3, max_concurrent_trials=1, max_length=500)
+    search_runner = MockMasterSearchRunner(
+        search_method, SimulateMaster(metric=1.0), tmp_path, snapshot_interval=100
+    )
+    search_runner.run(exp_config={}, context_dir="", includes=None)
+
+    # Simulate a crash in the middle of appending to the journal.
+    journal = tmp_path.joinpath("exp_4", "journal")
+    complete = journal.read_bytes()
+    with journal.open("ab") as f:
+        f.write(b'{"event": {"id": 99')
+
+    resumed_runner = searcher.LocalSearchRunner(
+        SequentialSearchMethod(max_trials=3, max_concurrent_trials=1, max_length=500),
+        tmp_path,
+        snapshot_interval=100,
+    )
+    resumed_runner.load_state(4)
+    assert saved_state(resumed_runner) == saved_state(search_runner)
+    assert journal.read_bytes() == complete
+
+
+class CrashingMaster(SimulateMaster):
+    """
+    SimulateMaster which records every post, and fails the post numbered crash_at.
+    """
+
+    def __init__(self, crash_at: int) -> None:
+        super().__init__(metric=1.0)
+        self.crash_at = crash_at
+        self.posts: List[List[searcher.Operation]] = []
+
+    def handle_post_operations(
+        self, event: bindings.v1SearcherEvent, operations: List[searcher.Operation]
+    ) -> None:
+        if len(self.posts) + 1 == self.crash_at:
+            self.crash_at = 0
+            raise RuntimeError("searcher crashed before posting")
+        self.posts.append(operations)
+        super().handle_post_operations(event, operations)
+
+
+def test_searcher_batches_events_and_resumes(tmp_path: Path) -> None:
+    search_method = SequentialSearchMethod(max_trials=7, max_concurrent_trials=2, max_length=500)
+    master = CrashingMaster(crash_at=2)
+    search_runner = MockMasterSearchRunner(search_method, master, tmp_path)
+    with pytest.raises(RuntimeError, match="crashed before posting"):
+        search_runner.run(exp_config={}, context_dir="", includes=None)
+    # The failed post was for a batch of several events, handled and saved one at a time.
+    assert len(master.posts) == 1
+    assert len(master.events_queue) > 1
+    assert search_runner.state.last_event_id == master.events_queue[-1].id
+
+    # Every event handled before the crash is resubmitted in one post, without handling it again.
+    resumed_method = SequentialSearchMethod(max_trials=7, max_concurrent_trials=2, max_length=500)
+    resumed_runner = MockMasterSearchRunner(resumed_method, SimulateMaster(metric=1.0), tmp_path)
+    resumed_runner.mock_master_obj = master
+    experiment_id, operations = resumed_runner.load_state(4)
+    assert resumed_method.created_trials == search_method.created_trials
+    resumed_runner.run_experiment(experiment_id, Mock(), operations, sleep_time=0.0)
+
+    assert resumed_method.closed_trials == 7
+    created = [
+        op.request_id for ops in master.posts for op in ops if isinstance(op, searcher.Create)
+    ]
+    assert sorted(created) == sorted(set(created))
+    assert len(created) == 7
+    assert resumed_runner.turnaround.batches == len(master.posts) - 1
+    assert resumed_runner.turnaround.max >= resumed_runner.turnaround.mean > 0
@@ -49,6 +49,8 @@ def test_import_side_effects() -> None:
                 "^keras\\.*",
                 "^pytorch\\.*",
                 "zmq\\.*",
+                # Only the helpers and enums of the api bindings are needed up front.
+                "^determined\\.common\\.api\\.bindings\\._(?!base$|enums$)",
             }
 
             # Detect modules we identified as too expensive...
@@ -66,6 +68,67 @@ def test_import_side_effects() -> None:
     subprocess.run([sys.executable, "-c", textwrap.dedent(script)], check=True)
 
 
+def test_cli_help_imports_no_commands() -> None:
+    # `det --help` should only need the stubs of the top-level commands, and none of the heavy
+    # dependencies of the commands themselves.
+    script = """
+        import re
+        import sys
+
+        from determined.cli import cli
+
+        try:
+            cli.main(["--help"])
+        except SystemExit:
+            pass
+
+        bad = [
+            "^determined\\.cli\\.(?!cli$|top_arg_descriptions$)",
+            "^determined\\.deploy",
+            "^determined\\.common\\.api\\.(?!_master_url$)",
+            "^OpenSSL",
+            "^requests$",
+            "^tabulate$",
+            "^termcolor$",
+        ]
+        found = [m for p in bad for m in sys.modules if re.match(p, m)]
+        assert not found, found
+    """
+    subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(script)], check=True, stdout=subprocess.DEVNULL
+    )
+
+
+def test_bindings_import_lazily() -> None:
+    script = """
+        import sys
+
+        from determined.common.api import bindings
+
+        def loaded():
+            return sorted(m for m in sys.modules if m.startswith("determined.common.api.bindings."))
+
+        # Nothing but the base classes is loaded until a binding is used.
+        assert loaded() == ["determined.common.api.bindings._base"], loaded()
+
+        assert bindings.v1Checkpoint.__module__ == "determined.common.api.bindings._shared"
+        assert "determined.common.api.bindings._experiments" not in loaded(), loaded()
+
+        from determined.common.api.bindings import get_GetExperiment
+
+        assert get_GetExperiment.__module__ == "determined.common.api.bindings._experiments"
+        assert "post_CreateExperiment" in dir(bindings)
+
+        try:
+            bindings.v1NoSuchThing
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("expected AttributeError")
+    """
+    subprocess.run([sys.executable, "-c", textwrap.dedent(script)], check=True)
+
+
 def test_import_from_path() -> None:
     @contextlib.contextmanager
     def prepend_sys_path(path: str) -> Iterator:
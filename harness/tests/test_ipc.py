@@ -7,6 +7,7 @@ import time
 import traceback
 from typing import Any, List, Optional, cast
 
+import numpy as np
 import pytest
 
 import determined as det
@@ -117,7 +118,10 @@ def test_broadcast_server_client() -> None:
 @pytest.mark.parametrize("cross_size", [1, 4])
 @pytest.mark.parametrize("local_size", [1, 4])
 @pytest.mark.parametrize("force_tcp", [False, True])
-def test_distributed_context(cross_size: int, local_size: int, force_tcp: bool) -> None:
+@pytest.mark.parametrize("hierarchical", [False, True])
+def test_distributed_context(
+    cross_size: int, local_size: int, force_tcp: bool, hierarchical: bool
+) -> None:
     size = cross_size * local_size
 
     # Make sure `make test` doesn't hang on macbook's default values.  Avoid skipping on linux
@@ -143,6 +147,7 @@ def test_distributed_context(cross_size: int, local_size: int, force_tcp: bool)
                 cross_size=pex.cross_size,
                 chief_ip="localhost",
                 force_tcp=force_tcp,
+                hierarchical=hierarchical,
             )
 
         # Perform a broadcast.
@@ -182,6 +187,19 @@ def test_distributed_context(cross_size: int, local_size: int, force_tcp: bool)
         ]
         assert results == expect, "not all threads ran allgather_local correctly"
 
+        # Perform an allgather of numpy arrays, which are sent as out-of-band buffers.
+        results = pex.run(
+            lambda: contexts[pex.rank].allgather(np.full(1000, pex.rank, dtype=np.int64))
+        )
+        for result in results:
+            assert [int(a[0]) for a in result] == list(range(size))
+            assert all(a.flags.writeable and a.sum() == 1000 * a[0] for a in result)
+
+        # In hierarchical mode, only the local chiefs talk to the chief.
+        if size > 1:
+            expect_connections = cross_size - 1 if hierarchical else size - 1
+            assert contexts[0]._chief_zmq._num_connections == expect_connections
+
         # Close all contexts.
         for context in contexts:
             context.close()
@@ -2,6 +2,8 @@ package internal
 
 import (
 	"bufio"
+	"bytes"
+	"compress/gzip"
 	"context"
 	"crypto/tls"
 	"crypto/x509"
@@ -945,9 +947,41 @@ func (m *Master) checkIfRMDefaultsAreUnbound(rmConfig *config.ResourceManagerCon
 	return fmt.Errorf("no Resource Manager found")
 }
 
+// taskLogBatch is the columnar form of a POST /task-logs body: the fields shared by every log are
+// sent once in Metadata, and Logs holds only the log lines.
+type taskLogBatch struct {
+	Metadata model.TaskLog `json:"metadata"`
+	Logs     []string      `json:"logs"`
+}
+
 func (m *Master) postTaskLogs(c echo.Context) (interface{}, error) {
+	body := io.Reader(c.Request().Body)
+	if c.Request().Header.Get("Content-Encoding") == "gzip" {
+		gz, err := gzip.NewReader(body)
+		if err != nil {
+			return "", fmt.Errorf("decompressing task logs: %w", err)
+		}
+		defer gz.Close()
+		body = gz
+	}
+	raw, err := io.ReadAll(body)
+	if err != nil {
+		return "", fmt.Errorf("reading task logs: %w", err)
+	}
+
 	var logs []*model.TaskLog
-	if err := json.NewDecoder(c.Request().Body).Decode(&logs); err != nil {
+	if trimmed := bytes.TrimLeft(raw, " \t\r\n"); len(trimmed) > 0 && trimmed[0] == '{' {
+		var batch taskLogBatch
+		if err := json.Unmarshal(raw, &batch); err != nil {
+			return "", fmt.Errorf("decoding task logs: %w", err)
+		}
+		logs = make([]*model.TaskLog, 0, len(batch.Logs))
+		for _, line := range batch.Logs {
+			taskLog := batch.Metadata
+			taskLog.Log = line
+			logs = append(logs, &taskLog)
+		}
+	} else if err := json.Unmarshal(raw, &logs); err != nil {
 		return "", fmt.Errorf("decoding task logs: %w", err)
 	}
 	if err := m.taskLogBackend.AddTaskLogs(logs); err != nil {
@@ -0,0 +1,125 @@
+package internal
+
+import (
+	"bytes"
+	"compress/gzip"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+
+	"github.com/labstack/echo/v4"
+	"github.com/stretchr/testify/require"
+
+	"github.com/determined-ai/determined/master/pkg/model"
+	"github.com/determined-ai/determined/master/pkg/ptrs"
+)
+
+// recordingTaskLogBackend keeps the task logs it is given; its other methods are not implemented.
+type recordingTaskLogBackend struct {
+	TaskLogBackend
+	logs []*model.TaskLog
+}
+
+func (b *recordingTaskLogBackend) AddTaskLogs(logs []*model.TaskLog) error {
+	b.logs = append(b.logs, logs...)
+	return nil
+}
+
+func postTaskLogsBody(t *testing.T, body []byte, gzipped bool) []*model.TaskLog {
+	if gzipped {
+		var buf bytes.Buffer
+		gz := gzip.NewWriter(&buf)
+		_, err := gz.Write(body)
+		require.NoError(t, err)
+		require.NoError(t, gz.Close())
+		body = buf.Bytes()
+	}
+
+	req := httptest.NewRequest(http.MethodPost, "/task-logs", bytes.NewReader(body))
+	req.Header.Set(echo.HeaderContentType, echo.MIMEApplicationJSON)
+	if gzipped {
+		req.Header.Set("Content-Encoding", "gzip")
+	}
+	c := echo.New().NewContext(req, httptest.NewRecorder())
+
+	backend := &recordingTaskLogBackend{}
+	m := &Master{taskLogBackend: backend}
+	_, err := m.postTaskLogs(c)
+	require.NoError(t, err)
+	return backend.logs
+}
+
+func TestPostTaskLogsColumnar(t *testing.T) {
+	body := []byte(`{
+		"metadata": {
+			"task_id": "task-1",
+			"allocation_id": "task-1.1",
+			"rank_id": 2,
+			"level": "INFO",
+			"stdtype": "stdout",
+			"source": "master"
+		},
+		"logs": ["first line\n", "second line\n"]
+	}`)
+	expected := []*model.TaskLog{
+		{
+			TaskID:       "task-1",
+			AllocationID: ptrs.Ptr("task-1.1"),
+			RankID:       ptrs.Ptr(2),
+			Level:        ptrs.Ptr("INFO"),
+			StdType:      ptrs.Ptr("stdout"),
+			Source:       ptrs.Ptr("master"),
+			Log:          "first line\n",
+		},
+		{
+			TaskID:       "task-1",
+			AllocationID: ptrs.Ptr("task-1.1"),
+			RankID:       ptrs.Ptr(2),
+			Level:        ptrs.Ptr("INFO"),
+			StdType:      ptrs.Ptr("stdout"),
+			Source:       ptrs.Ptr("master"),
+			Log:          "second line\n",
+		},
+	}
+
+	for _, gzipped := range []bool{false, true} {
+		logs := postTaskLogsBody(t, body, gzipped)
+		require.Equal(t, expected, logs, "gzipped=%v", gzipped)
+		// Each log gets its own copy of the metadata.
+		require.NotSame(t, logs[0], logs[1])
+	}
+}
+
+func TestPostTaskLogsLegacyArray(t *testing.T) {
+	body := []byte(`[
+		{"task_id": "task-1", "log": "first line\n", "rank_id": 0},
+		{"task_id": "task-1", "log": "second line\n", "rank_id": 1}
+	]`)
+	logs := postTaskLogsBody(t, body, false)
+	require.Equal(t, []*model.TaskLog{
+		{TaskID: "task-1", Log: "first line\n", RankID: ptrs.Ptr(0)},
+		{TaskID: "task-1", Log: "second line\n", RankID: ptrs.Ptr(1)},
+	}, logs)
+}
+
+func TestPostTaskLogsErrors(t *testing.T) {
+	m := &Master{taskLogBackend: &recordingTaskLogBackend{}}
+	for name, tc := range map[string]struct {
+		body     string
+		encoding string
+	}{
+		"not gzip":           {body: `{"logs": []}`, encoding: "gzip"},
+		"bad columnar body":  {body: `{"logs": "not a list"}`},
+		"bad legacy body":    {body: `[{"log": 1}]`},
+		"neither form":       {body: `"a string"`},
+		"truncated columnar": {body: `{"metadata": {`},
+	} {
+		req := httptest.NewRequest(http.MethodPost, "/task-logs", bytes.NewReader([]byte(tc.body)))
+		if tc.encoding != "" {
+			req.Header.Set("Content-Encoding", tc.encoding)
+		}
+		c := echo.New().NewContext(req, httptest.NewRecorder())
+		_, err := m.postTaskLogs(c)
+		require.Error(t, err, name)
+	}
+}
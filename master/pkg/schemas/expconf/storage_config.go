@@ -106,6 +106,9 @@ type SharedFSConfigV0 struct {
 	RawTensorboardPath *string `json:"tensorboard_path,omitempty"`
 	RawStoragePath     *string `json:"storage_path"`
 	RawPropagation     *string `json:"propagation"`
+
+	RawMaxConcurrency *int  `json:"max_concurrency,omitempty"`
+	RawHardlink       *bool `json:"hardlink,omitempty"`
 }
 
 // PathInContainer caclulates where the full StoragePath will be inside the container.
@@ -166,6 +169,9 @@ type S3ConfigV0 struct {
 	RawSecretKey   *string `json:"secret_key"`
 	RawEndpointURL *string `json:"endpoint_url"`
 	RawPrefix      *string `json:"prefix"`
+
+	RawMaxConcurrency     *int `json:"max_concurrency,omitempty"`
+	RawMultipartChunksize *int `json:"multipart_chunksize,omitempty"`
 }
 
 // Validate implements the check.Validatable interface.
@@ -194,6 +200,8 @@ func validateStoragePrefix(prefix *string) error {
 type GCSConfigV0 struct {
 	RawBucket *string `json:"bucket"`
 	RawPrefix *string `json:"prefix"`
+
+	RawMaxConcurrency *int `json:"max_concurrency,omitempty"`
 }
 
 // Validate implements the check.Validatable interface.
@@ -216,6 +224,7 @@ type AzureConfigV0 struct {
 	RawConnectionString *string `json:"connection_string,omitempty"`
 	RawAccountURL       *string `json:"account_url,omitempty"`
 	RawCredential       *string `json:"credential,omitempty"`
+	RawMaxConcurrency   *int    `json:"max_concurrency,omitempty"`
 }
 
 // Merge implements schemas.Mergeable.
@@ -232,6 +241,7 @@ func (c AzureConfigV0) Merge(other AzureConfigV0) AzureConfigV0 {
 		RawConnectionString: schemas.Copy(credSource.RawConnectionString),
 		RawAccountURL:       schemas.Copy(credSource.RawAccountURL),
 		RawCredential:       schemas.Copy(credSource.RawCredential),
+		RawMaxConcurrency:   schemas.Merge(c.RawMaxConcurrency, other.RawMaxConcurrency),
 	}
 }
 
@@ -88,6 +88,14 @@ var (
             ],
             "default": null
         },
+        "max_concurrency": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": null,
+            "minimum": 1
+        },
         "save_experiment_best": {
             "type": [
                 "integer",
@@ -312,6 +320,9 @@ var (
         "container_path": true,
         "credential": true,
         "endpoint_url": true,
+        "hardlink": true,
+        "max_concurrency": true,
+        "multipart_chunksize": true,
         "prefix": true,
         "host_path": true,
         "propagation": true,
@@ -1070,6 +1081,14 @@ var (
             },
             "default": null
         },
+        "max_concurrency": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": null,
+            "minimum": 1
+        },
         "save_experiment_best": {
             "type": [
                 "integer",
@@ -1973,6 +1992,22 @@ var (
             },
             "default": null
         },
+        "max_concurrency": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": null,
+            "minimum": 1
+        },
+        "multipart_chunksize": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": null,
+            "minimum": 5242880
+        },
         "save_experiment_best": {
             "type": [
                 "integer",
@@ -2944,6 +2979,21 @@ var (
             ],
             "default": null
         },
+        "max_concurrency": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": null,
+            "minimum": 1
+        },
+        "hardlink": {
+            "type": [
+                "boolean",
+                "null"
+            ],
+            "default": null
+        },
         "save_experiment_best": {
             "type": [
                 "integer",